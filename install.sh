@@ -1186,6 +1186,7 @@ install_disk2iso_files() {
         # Setze Ausführungsrechte für Service-Skripte
         chmod +x "$INSTALL_DIR/services/disk2iso/daemon.sh" 2>/dev/null || true
         chmod +x "$INSTALL_DIR/services/disk2iso-updater/updater.sh" 2>/dev/null || true
+        chmod +x "$INSTALL_DIR/services/disk2iso-batch/batch.sh" 2>/dev/null || true
     fi
     
     # Kopiere Installations- und Deinstallations-Skripte (für Updates und Deinstallation)
@@ -1225,6 +1226,14 @@ install_disk2iso_files() {
     ln -sf "$INSTALL_DIR/services/disk2iso/daemon.sh" "$BIN_LINK"
 }
 
+# Entferne den früheren 30s-Timer des Updaters (seit 1.3.0 residenter Dienst)
+remove_legacy_updater_timer() {
+    if [[ -f /etc/systemd/system/disk2iso-updater.timer ]]; then
+        systemctl disable --now disk2iso-updater.timer >/dev/null 2>&1 || true
+        rm -f /etc/systemd/system/disk2iso-updater.timer
+    fi
+}
+
 # Konfiguriere und installiere alle Services (disk2iso, disk2iso-web, disk2iso-updater)
 configure_all_services() {
     local output_dir="${SERVICE_OUTPUT_DIR:-/media/iso}"
@@ -1286,18 +1295,18 @@ configure_all_services() {
             echo "XXX"
             echo "Richte API-Updater ein..."
             echo "XXX"
+            remove_legacy_updater_timer
             cp -f "$SCRIPT_DIR/services/disk2iso-updater.service" /etc/systemd/system/
-            cp -f "$SCRIPT_DIR/services/disk2iso-updater.timer" /etc/systemd/system/
             systemctl daemon-reload
-            systemctl enable disk2iso-updater.timer >/dev/null 2>&1
+            systemctl enable disk2iso-updater.service >/dev/null 2>&1
             sleep 0.3
             
-            # Schritt 6: Updater-Timer starten (100%)
+            # Schritt 6: Updater (residenter Collector) starten (100%)
             echo "83"
             echo "XXX"
-            echo "Starte API-Updater Timer..."
+            echo "Starte API-Updater..."
             echo "XXX"
-            systemctl start disk2iso-updater.timer
+            systemctl restart disk2iso-updater.service
             sleep 0.3
             
             echo "100"
@@ -1332,11 +1341,11 @@ configure_all_services() {
         systemctl start disk2iso-web.service
         
         print_success "Installiere API-Updater..."
+        remove_legacy_updater_timer
         cp -f "$SCRIPT_DIR/services/disk2iso-updater.service" /etc/systemd/system/
-        cp -f "$SCRIPT_DIR/services/disk2iso-updater.timer" /etc/systemd/system/
         systemctl daemon-reload
-        systemctl enable disk2iso-updater.timer >/dev/null 2>&1
-        systemctl start disk2iso-updater.timer
+        systemctl enable disk2iso-updater.service >/dev/null 2>&1
+        systemctl restart disk2iso-updater.service
         
         print_success "Alle Services erfolgreich installiert!"
         print_info "  • disk2iso Service: aktiv"
@@ -33,9 +33,29 @@ readonly MSG_FIX_PERMISSIONS="Ejecute: sudo chmod -R 777"
 
 readonly MSG_STATE_MACHINE_STARTED="Máquina de estados iniciada"
 readonly MSG_ERROR_UNKNOWN_STATE="ERROR: Estado desconocido:"
+readonly MSG_DRIVE_SUPERVISOR_STARTED="Modo multiunidad iniciado"
+readonly MSG_DRIVE_WORKER_STARTED="Máquina de estados iniciada para la unidad:"
+readonly MSG_DRIVE_WORKER_ENDED="Máquina de estados finalizada para la unidad:"
+readonly MSG_WARNING_POSTPROCESS_NOT_QUEUED="No se pudo poner en cola el postprocesamiento"
 
 # ============================================================================
 # CONTROL DEL SERVICIO
 # ============================================================================
 
 readonly MSG_SERVICE_STOPPING="El servicio se está deteniendo"
+
+# ============================================================================
+# BATCH IMPORT
+# ============================================================================
+
+readonly MSG_BATCH_SOURCE_SKIPPED="Fuente omitida (no encontrada):"
+readonly MSG_BATCH_NO_SOURCES="No se encontraron fuentes de imagen"
+readonly MSG_BATCH_STARTED="Importación por lotes iniciada:"
+readonly MSG_BATCH_JOB_STARTED="Trabajo iniciado:"
+readonly MSG_BATCH_JOB_COMPLETED="Trabajo completado:"
+readonly MSG_BATCH_JOB_FAILED="Trabajo fallido:"
+readonly MSG_BATCH_SUMMARY="Importación por lotes finalizada:"
+readonly MSG_BATCH_LOGBENCH_STARTED="Benchmark de logging iniciado:"
+readonly MSG_BATCH_LOGBENCH_RESULT="Nivel de log %-7s: %s ms/disco (+%s ms frente a off), %s líneas/disco"
+
+readonly MSG_ARCHIVED_DISC_NOT_COPIED="Disco ya archivado - no se copia de nuevo"
\ No newline at end of file
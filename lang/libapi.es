@@ -21,3 +21,27 @@ readonly MSG_INFO_REPAIR_INSTALLATION="Repare la instalación con: sudo"
 
 readonly MSG_DEBUG_API_FILE_NOT_FOUND="api_get_section_json: archivo no encontrado"
 readonly MSG_ERROR_API_READ_FAILED="api_get_section_json: Error al leer"
+
+# ============================================================================
+# MODO RAM (API_RAM_DIR)
+# ============================================================================
+
+readonly MSG_API_RAM_DIR_ACTIVE="Archivos API en RAM:"
+readonly MSG_WARNING_API_RAM_DIR_FAILED="No se pudo crear API_RAM_DIR, se usa el directorio API persistente:"
+readonly MSG_WARNING_API_RAM_DIR_NOT_TMPFS="API_RAM_DIR no está en RAM (no es tmpfs):"
+readonly MSG_WARNING_API_PERSIST_FAILED="Error al guardar el archivo API:"
+readonly MSG_DEBUG_API_PERSISTED="Archivo API guardado:"
+
+# ============================================================================
+# HISTORIAL (DIARIO)
+# ============================================================================
+
+readonly MSG_WARNING_API_HISTORY_IMPORT_FAILED="Error al importar el antiguo history.json al diario (¿falta jq?)"
+
+# ============================================================================
+# BUS DE OBSERVADORES
+# ============================================================================
+
+readonly MSG_API_BUS_STARTED="Bus de observadores iniciado, destinos:"
+readonly MSG_WARNING_API_OBSERVER_CALLBACK_MISSING="Callback de observador no encontrado, destino no registrado -"
+readonly MSG_DEBUG_API_BUS_STOPPED="Bus de observadores detenido"
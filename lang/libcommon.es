@@ -135,6 +135,11 @@ readonly MSG_INFO_COPY_WITH_DDRESCUE="Copiando disco de datos con ddrescue (robu
 readonly MSG_INFO_COPY_WITH_DD="Copiando disco de datos con dd (estándar)"
 readonly MSG_WARNING_DDRESCUE_FALLBACK="ddrescue falló - intentando alternativa con dd"
 readonly MSG_ERROR_DD_COPY_FAILED="La copia del disco de datos con dd falló"
+readonly MSG_INFO_COPY_WITH_ZSTD="Copiando disco de datos con dd y compresión zstd (seekable)"
+readonly MSG_METHOD_DD_ZSTD="Método: dd + zstd (comprimido, índice de frames)"
+readonly MSG_WARNING_ZSTD_FALLBACK="La copia comprimida falló - intentando sin comprimir con dd"
+readonly MSG_ERROR_ZSTD_COPY_FAILED="La copia comprimida (dd + zstd) falló"
+readonly MSG_INFO_ZSTD_RATIO="Comprimido:"
 
 # ============================================================================
 # SEGUIMIENTO DE ERRORES
@@ -154,3 +159,38 @@ readonly MSG_DEBUG_NO_FAILURE_HISTORY="No hay historial de fallos para"
 readonly MSG_DEBUG_NO_DEVICE_TO_EJECT="No hay dispositivo disponible para expulsar:"
 readonly MSG_DEBUG_STATUS_AUTO_FAILURE="Estado determinado automáticamente: fallo (el seguimiento de errores tiene entradas)"
 readonly MSG_DEBUG_STATUS_AUTO_UNKNOWN="Estado determinado automáticamente: desconocido (sin estado explícito, sin entradas de error)"
+
+# ============================================================================
+# SCHREIB-SLOTS (MULTI-DRIVE)
+# ============================================================================
+
+readonly MSG_INFO_WAITING_FOR_WRITE_SLOT="Esperando una ranura de escritura libre"
+readonly MSG_DEBUG_WRITE_SLOT_ACQUIRED="Ranura de escritura ocupada:"
+readonly MSG_DEBUG_WRITE_SLOT_RELEASED="Ranura de escritura liberada"
+readonly MSG_ERROR_WRITE_SLOT_FAILED="No hay ranura de escritura disponible - copia cancelada"
+
+# ============================================================================
+# POSTPROCESAMIENTO
+# ============================================================================
+
+readonly MSG_INFO_POSTPROCESS_QUEUED="Postprocesamiento en cola:"
+readonly MSG_INFO_POSTPROCESS_DONE="Postprocesamiento completado:"
+readonly MSG_DEBUG_POSTPROCESS_STARTED="Trabajadores de postprocesamiento iniciados (PID):"
+readonly MSG_ERROR_POSTPROCESS_ISO_MISSING="Archivo ISO para postprocesamiento no encontrado:"
+readonly MSG_ERROR_POSTPROCESS_SIZE_MISMATCH="Archivo ISO más pequeño de lo esperado (incompleto):"
+readonly MSG_ERROR_POSTPROCESS_MD5_FAILED="No se pudo crear la suma MD5:"
+readonly MSG_INFO_MIGRATION_START="Migrando al archivo:"
+readonly MSG_INFO_MIGRATION_DONE="Migración completada:"
+readonly MSG_WARNING_MIGRATION_RETRY="Migración fallida, reintentando"
+readonly MSG_WARNING_MIGRATION_COPY_FAILED="Copia al archivo fallida:"
+readonly MSG_WARNING_MIGRATION_CHECKSUM="Verificación MD5 en el destino fallida:"
+readonly MSG_ERROR_MIGRATION_GAVE_UP="Migración fallida definitivamente (imagen conservada en staging):"
+
+# Archiv-Register (bereits archivierte Discs)
+readonly MSG_INFO_ARCHIVED_DISC_FOUND="Disco ya archivado:"
+readonly MSG_INFO_ARCHIVED_DISC_SKIPPED="Copia omitida, imagen existente:"
+readonly MSG_INFO_ARCHIVED_DISC_VERIFY="Verificando disco con la imagen existente:"
+readonly MSG_INFO_ARCHIVED_DISC_VERIFIED="Disco idéntico a la imagen existente:"
+readonly MSG_WARNING_ARCHIVED_DISC_MISMATCH="El disco difiere de la imagen existente, copiando de nuevo:"
+readonly MSG_WARNING_ARCHIVED_VERIFY_UNSUPPORTED="Verificación imposible (no es copia 1:1), copia omitida - método:"
+readonly MSG_DEBUG_ARCHIVED_DISC_STALE="Registro de archivo: la imagen ya no existe:"
@@ -172,6 +172,8 @@ readonly MSG_DEBUG_INIT_SUCCESS="Análisis del disco completado exitosamente"
 readonly MSG_DEBUG_ANALYSE_START="discinfo_analyze: Iniciando análisis del disco"
 readonly MSG_ERROR_NO_DISC="No hay disco insertado"
 readonly MSG_ERROR_ANALYSE_FAILED="Análisis del disco fallido"
+readonly MSG_DEBUG_PROBE_RESULT="Sondeo del disco: estado=%s, ISO9660=%s, UDF=%s (%s ms)"
+readonly MSG_INFO_ANALYSIS_TIME="Análisis del disco (%s) completado en %s ms (sondeo: %s ms)"
 
 # Debug Messages - Software Collection
 readonly MSG_DEBUG_COLLECT_SOFTWARE_START="Recopilando información de software"
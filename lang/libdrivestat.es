@@ -90,3 +90,28 @@ readonly MSG_DEBUG_COLLECT_SOFTWARE_SUCCESS="Información de software recopilada
 # Monitor
 readonly MSG_DEBUG_MONITOR_STARTED="Monitor de unidad iniciado (PID: %s)"
 readonly MSG_DEBUG_MONITOR_STOPPED="Monitor de unidad detenido"
+readonly MSG_WARNING_MONITOR_ALREADY_RUNNING="El monitor de unidad ya está en ejecución (PID: %s)"
+readonly MSG_WARNING_DRIVE_EVENTS_UNAVAILABLE="Eventos udev no disponibles - la unidad se supervisa por sondeo"
+readonly MSG_WARNING_DRIVE_EVENTS_LOST="Escucha udev terminada - cambiando a sondeo"
+readonly MSG_DEBUG_DRIVE_EVENT="Evento de unidad: %s %s (medio: %s)"
+readonly MSG_DEBUG_DRIVE_EVENT_LATENCY="Evento de medio hasta análisis: %s ms"
+
+# Calibración
+readonly MSG_DEBUG_CALIBRATION_GET="Calibración para '%s': '%s'"
+readonly MSG_DEBUG_CALIBRATION_BACKOFF="La calibración para '%s' falló la última vez, próximo intento en %s h"
+readonly MSG_INFO_CALIBRATION_START="Calibrando parámetros de lectura para la unidad '%s' (muestra: %s MB por zona)"
+readonly MSG_DEBUG_CALIBRATION_RESULT="Calibración: readahead=%s, petición=%s bytes → %s KB/s"
+readonly MSG_INFO_CALIBRATION_COMPLETE="Calibración completada: petición=%s bytes, readahead=%s sectores (%s KB/s)"
+readonly MSG_ERROR_CALIBRATION_NO_DRIVE="Calibración imposible: ninguna unidad disponible"
+readonly MSG_ERROR_CALIBRATION_NO_KEY="Calibración imposible: modelo de unidad desconocido"
+readonly MSG_ERROR_CALIBRATION_TOOL_MISSING="Calibración imposible: 'blockdev' no instalado"
+readonly MSG_ERROR_CALIBRATION_SIZE="Calibración imposible: tamaño del medio desconocido"
+readonly MSG_ERROR_CALIBRATION_FAILED="Calibración fallida: ninguna medición válida"
+readonly MSG_WARNING_CALIBRATION_SKIPPED="Calibración omitida, copia con parámetros de lectura estándar"
+readonly MSG_INFO_READ_PARAMS_APPLIED="Parámetros de lectura aplicados: readahead=%s sectores (antes: %s)"
+readonly MSG_DEBUG_READ_PARAMS_RESTORED="Readahead restaurado: %s sectores"
+
+# Fuente de imagen (lote)
+readonly MSG_ERROR_IMAGE_NOT_READABLE="Fuente de imagen no legible: '%s'"
+readonly MSG_INFO_IMAGE_ATTACHED="Fuente de imagen '%s' conectada como '%s'"
+readonly MSG_DEBUG_IMAGE_DETACHED="Dispositivo loop liberado: '%s'"
@@ -31,6 +31,10 @@ readonly MSG_ERROR_TEMP_DIR_PARENT_MISSING="¡No se puede crear el directorio te
 readonly MSG_ERROR_TEMP_DIR_CREATE_FAILED="No se pudo crear el directorio temporal:"
 readonly MSG_INFO_TEMP_DIR_CREATED="Directorio temporal creado automáticamente:"
 
+# Staging Directory
+readonly MSG_ERROR_STAGING_DIR_CREATE_FAILED="No se pudo crear el directorio de staging:"
+readonly MSG_INFO_STAGING_DIR_CREATED="Directorio de staging creado automáticamente:"
+
 # Log Directory
 readonly MSG_WARNING_LOG_DIR_MISSING="Directorio de registro faltante:"
 readonly MSG_ERROR_LOG_DIR_PARENT_MISSING="¡No se puede crear el directorio de registro! Falta el directorio padre:"
@@ -35,3 +35,20 @@ readonly MSG_DEBUG_CHECK_START="check_module_dependencies: Iniciando para módul
 readonly MSG_DEBUG_DB_LOADED="Archivo DB cargado"
 readonly MSG_DEBUG_CHECK_COMPLETE="check_module_dependencies: Completado para módulo"
 readonly MSG_DEBUG_ALL_DEPS_MET="todas las dependencias satisfechas"
+
+# Module Loader (integrity_load_modules)
+readonly MSG_SCANNING_MODULES="Buscando manifiestos de módulos"
+readonly MSG_NO_OPTIONAL_MODULES="No se encontraron módulos opcionales"
+readonly MSG_MODULE_PLAN="Orden de carga"
+readonly MSG_LOADING_MODULE="Cargando módulo"
+readonly MSG_MODULE_LIB_MISSING="Falta la biblioteca del módulo"
+readonly MSG_MODULE_LOAD_FAILED="No se pudo cargar el módulo"
+readonly MSG_MODULE_CHECK_FUNC_MISSING="Falta la función check_dependencies()"
+readonly MSG_MODULE_LOADED="Módulo cargado"
+readonly MSG_MODULE_DEPS_NOT_MET="Dependencias no satisfechas - módulo desactivado"
+readonly MSG_MODULE_SUMMARY="Módulos"
+readonly MSG_LOADED="cargados"
+readonly MSG_FAILED="fallidos"
+readonly MSG_WARNING_DEPENDENCY_CYCLE="Dependencia circular de módulos, se cargan juntos:"
+readonly MSG_DEBUG_PLAN_FROM_CACHE="Plan de carga de módulos desde caché"
+readonly MSG_DEBUG_PLAN_PARSED="Plan de carga de módulos recalculado, módulos"
@@ -0,0 +1,15 @@
+#!/bin/bash
+################################################################################
+# disk2iso - Archivo de idioma español para liblogging.sh
+# Filepath: lang/liblogging.es
+#
+# Descripción:
+#   Mensajes para logging y gestión de logs de copia
+#
+################################################################################
+
+# ============================================================================
+# LOGS DE COPIA (CATÁLOGO, RETENCIÓN)
+# ============================================================================
+
+readonly MSG_LOG_RETENTION_DELETED="Logs de copia fuera del período de retención eliminados:"
@@ -18,6 +18,9 @@ MSG_DISK_SPACE_MB_REQUIRED="MB requeridos"
 MSG_DISK_SPACE_MB_AVAILABLE_SHORT="MB disponibles"
 MSG_WARNING_DISK_SPACE_CHECK_FAILED="⚠ Comprobación de espacio en disco falló (continuando)"
 MSG_ERROR_INSUFFICIENT_DISK_SPACE="✗ ¡Espacio en disco insuficiente! Requerido:"
+MSG_DISK_SPACE_MB_RESERVED="MB reservados (copias en curso)"
+MSG_DEBUG_SPACE_RESERVED="Espacio en disco reservado:"
+MSG_DEBUG_SPACE_RELEASED="Reserva liberada:"
 
 # Cambio de medio
 MSG_CONTAINER_MANUAL_EJECT="⚠ Entorno de contenedor: Expulse manualmente el medio e inserte uno nuevo"
@@ -32,3 +35,9 @@ MSG_TIMEOUT_WAITING_FOR_MEDIUM="✗ Tiempo de espera agotado para el cambio de m
 # Errores de dependencias del sistema
 MSG_ERROR_SYSTEM_TOOLS_MISSING="ERROR: Faltan herramientas del sistema:"
 MSG_INSTALLATION_SYSTEM_TOOLS="Instalación: apt-get install lsblk findmnt"
+
+# Recolector residente
+MSG_SYSTEMINFO_COLLECTOR_STARTED="Recolector iniciado, directorio de demanda:"
+MSG_WARNING_SYSTEMINFO_COLLECT_FAILED="Recolector: fallo en la métrica:"
+MSG_DEBUG_SYSTEMINFO_COLLECTOR_DEMAND="Recolector: demanda detectada, intervalos cortos - motivo:"
+MSG_DEBUG_SYSTEMINFO_COLLECTOR_MISSING="Ningún recolector activo - copia sin marcador de demanda"
@@ -52,6 +52,9 @@ readonly MSG_ARCHIVE_NAME="Nombre"
 readonly MSG_ARCHIVE_PATH="Ruta"
 readonly MSG_ARCHIVE_DELETE="Eliminar"
 readonly MSG_ARCHIVE_CONFIRM_DELETE="¿Realmente desea eliminar este medio del archivo?"
+readonly MSG_ARCHIVE_STAGING="Staging"
+readonly MSG_ARCHIVE_STAGING_HINT="Todavía en el directorio de staging, migración al archivo pendiente"
+readonly MSG_ARCHIVE_COMPRESSED_HINT="comprimido con zstd, {size} en disco"
 
 # Página de registros
 readonly MSG_LOGS_TITLE="Registros del Sistema"
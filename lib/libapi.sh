@@ -8,7 +8,15 @@
 #   API-Schnittstelle für Status-Informationen via JSON-Dateien
 #   - Schreibt JSON für Web-UI und externe Tools
 #   - api_set_file_json(), api_set_section_json(), api_update_status(), api_update_progress()
+#   - Live-Status als ein versioniertes Dokument (live.json, "seq"),
+#     gebündelte Updates via api_live_set() / api_live_flush()
 #   - api_add_history()
+#   - History als Journal (append-only, api/history/), Index + Tagesstatistik
+#   - Optional RAM-Betrieb (API_RAM_DIR, tmpfs) mit periodischer Sicherung
+#     der History via api_persist()
+#   - Observer-Bus: notify_api_update() blockiert nie, ein residenter
+#     Dispatcher fasst Änderungen zusammen und beliefert die Senken
+#     (api_register_observer(), api_bus_start())
 #
 #
 # -----------------------------------------------------------------------------
@@ -66,26 +74,168 @@ API_DIR=""
 # .........  1 = Nicht verfügbar (API deaktiviert)
 # ===========================================================================
 api_init() {
-    # Hole API-Verzeichnis (erstellt automatisch falls nicht vorhanden)
+    # RAM-Betrieb vorbereiten (API_RAM_DIR anlegen, History übernehmen)
+    _api_init_ram_dir
+    
+    # Hole API-Verzeichnis (RAM falls aktiv, sonst dauerhaft)
     API_DIR=$(folders_get_api_dir) || return 1
     
-    # Erstelle leere/default JSONs falls nicht vorhanden
-    if [[ ! -f "${API_DIR}/status.json" ]]; then
+    # Alte Einzeldateien (vor live.json) entfernen, damit kein veralteter
+    # Stand mehr gelesen wird
+    rm -f "${API_DIR}"/{status,attributes,progress}.json \
+          "${API_DIR}"/drives/*/{status,attributes,progress}.json 2>/dev/null
+    
+    # Erstelle Live-Dokument falls nicht vorhanden
+    if [[ ! -f "${API_DIR}/${API_LIVE_FILE}" ]]; then
         api_update_status "idle"
     fi
     
-    if [[ ! -f "${API_DIR}/progress.json" ]]; then
-        api_update_progress 0 0 0 ""
-    fi
+    # Alte History (history.json) einmalig ins Journal übernehmen
+    _api_history_import_legacy || log_warning "$MSG_WARNING_API_HISTORY_IMPORT_FAILED"
     
-    if [[ ! -f "${API_DIR}/history.json" ]]; then
-        echo "[]" > "${API_DIR}/history.json"
-        chmod 644 "${API_DIR}/history.json" 2>/dev/null || true
+    return 0
+}
+
+# ============================================================================
+# RAM-BETRIEB (API_RAM_DIR) UND PERSISTENZ
+# ============================================================================
+# Flüchtige API-Dateien (Live-Status, Uptime, Speicherplatz, Service-Status)
+# werden laufend neu geschrieben. Auf SD-Karten/USB-Sticks verursacht das
+# Latenzspitzen und Verschleiß → mit API_RAM_DIR liegen sie im tmpfs.
+# Neue History-Einträge werden alle API_PERSIST_INTERVAL Sekunden und beim
+# Beenden ins Journal im dauerhaften API-Verzeichnis übernommen.
+# Gelernte Werte (API_DURABLE_FILES: Kompressionsraten, Analysedauer, ...)
+# werden beim Start aus dem dauerhaften Verzeichnis in den RAM kopiert und
+# im selben Takt zurückgeschrieben - sie überstehen so einen Neustart.
+# Das Fehler-Register (.failed_discs.d) liegt ohnehin im Ausgabeverzeichnis.
+
+readonly API_DURABLE_FILES="compression.json analysis.json logbench.json"
+
+_API_STORE_DIR=""                       # Dauerhaftes Verzeichnis (RAM-Betrieb)
+_API_LAST_PERSIST=0                     # Letzte Sicherung (EPOCHSECONDS)
+
+# ===========================================================================
+# _api_init_ram_dir
+# ---------------------------------------------------------------------------
+# Funktion.: Legt das RAM-Verzeichnis an und setzt den Verweis für alle
+# .........  Leser (api/.ram_dir)
+# Parameter: keine
+# Rückgabe.: 0 = RAM-Betrieb aktiv, 1 = nicht konfiguriert/nicht möglich
+# Hinweis..: Warnt, wenn API_RAM_DIR nicht im RAM (tmpfs/ramfs) liegt
+# ===========================================================================
+_api_init_ram_dir() {
+    local ram_dir store_dir fs_type
+    store_dir=$(folders_get_api_store_dir) || return 1
+    local ram_link="${store_dir}/${MODULE_API_RAM_LINK}"
+
+    settings_get_conf_field ram_dir "disk2iso" "API_RAM_DIR" ""
+    if [[ -z "$ram_dir" ]] || [[ "$ram_dir" -ef "$store_dir" ]]; then
+        rm -f "$ram_link" 2>/dev/null
+        return 1
     fi
-    
+
+    if ! mkdir -p "$ram_dir" 2>/dev/null; then
+        log_warning "$MSG_WARNING_API_RAM_DIR_FAILED $ram_dir"
+        rm -f "$ram_link" 2>/dev/null
+        return 1
+    fi
+    chmod 755 "$ram_dir" 2>/dev/null
+
+    fs_type=$(stat -f -c %T "$ram_dir" 2>/dev/null)
+    if [[ "$fs_type" != "tmpfs" ]] && [[ "$fs_type" != "ramfs" ]]; then
+        log_warning "$MSG_WARNING_API_RAM_DIR_NOT_TMPFS $ram_dir ($fs_type)"
+    fi
+
+    #-- Verweis für alle Leser (folders_get_api_dir, Web-UI) ----------------
+    local current=""
+    [[ -f "$ram_link" ]] && IFS= read -r current < "$ram_link"
+    if [[ "$current" != "$ram_dir" ]]; then
+        printf '%s\n' "$ram_dir" > "$ram_link" 2>/dev/null || return 1
+        chmod 644 "$ram_link" 2>/dev/null
+    fi
+
+    #-- Gelernte Werte übernehmen (neuere Kopie gewinnt, z.B. nach einem --
+    #-- Neustart des Service ohne Reboot liegt der RAM-Stand noch vor) ------
+    local file
+    for file in $API_DURABLE_FILES; do
+        if [[ -f "${store_dir}/${file}" ]] && [[ ! -f "${ram_dir}/${file}" || "${store_dir}/${file}" -nt "${ram_dir}/${file}" ]]; then
+            cp -p "${store_dir}/${file}" "${ram_dir}/${file}" 2>/dev/null \
+                || log_warning "$MSG_WARNING_API_PERSIST_FAILED ${store_dir}/${file}"
+        fi
+    done
+
+    _API_STORE_DIR="$store_dir"
+    _API_LAST_PERSIST=$EPOCHSECONDS
+    log_info "$MSG_API_RAM_DIR_ACTIVE $ram_dir"
     return 0
 }
 
+# ===========================================================================
+# _api_persist_durable_files
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt geänderte gelernte Werte (API_DURABLE_FILES) aus dem
+# .........  RAM-Verzeichnis ins dauerhafte Verzeichnis zurück
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg/nichts zu tun, 1 = mindestens eine Datei fehlgeschlagen
+# Hinweis..: Nur geänderte Dateien (-nt), atomar via temp-file + mv
+# ===========================================================================
+_api_persist_durable_files() {
+    local file src dst rc=0
+
+    for file in $API_DURABLE_FILES; do
+        src="${API_DIR}/${file}"
+        dst="${_API_STORE_DIR}/${file}"
+        [[ -f "$src" ]] || continue
+        [[ -f "$dst" && ! "$src" -nt "$dst" ]] && continue
+        if cp -p "$src" "${dst}.tmp.${BASHPID}" 2>/dev/null && mv -f "${dst}.tmp.${BASHPID}" "$dst" 2>/dev/null; then
+            log_debug "$MSG_DEBUG_API_PERSISTED $src"
+        else
+            rm -f "${dst}.tmp.${BASHPID}" 2>/dev/null
+            log_warning "$MSG_WARNING_API_PERSIST_FAILED $src"
+            rc=1
+        fi
+    done
+    return $rc
+}
+
+# ===========================================================================
+# api_persist
+# ---------------------------------------------------------------------------
+# Funktion.: Übernimmt gesammelte History-Einträge aus dem RAM-Verzeichnis
+# .........  (history.pending.jsonl) ins Journal im dauerhaften Verzeichnis
+# .........  und sichert die gelernten Werte (API_DURABLE_FILES)
+# Parameter: $1 = "force" (optional, Intervall ignorieren - Service-Ende)
+# Rückgabe.: 0 = Erfolg/nichts zu tun, 1 = Fehler beim Sichern
+# Hinweis..: Ohne RAM-Betrieb sofort return 0. Sonst nur alle
+# .........  API_PERSIST_INTERVAL Sekunden aktiv → günstig genug für jeden
+# .........  Durchlauf der Hauptschleife
+# ===========================================================================
+api_persist() {
+    local mode="${1:-}"
+    [[ -n "$_API_STORE_DIR" ]] || return 0
+
+    if [[ "$mode" != "force" ]]; then
+        local interval
+        settings_get_conf_field interval "disk2iso" "API_PERSIST_INTERVAL" "300"
+        [[ "$interval" =~ ^[0-9]+$ ]] || interval=300
+        (( EPOCHSECONDS - _API_LAST_PERSIST >= interval )) || return 0
+    fi
+    _API_LAST_PERSIST=$EPOCHSECONDS
+
+    local rc=0
+    _api_persist_durable_files || rc=1
+
+    local pending="${API_DIR}/${API_HISTORY_PENDING}"
+    [[ -s "$pending" ]] || return $rc
+
+    if ! _api_history_commit "$pending" truncate; then
+        log_warning "$MSG_WARNING_API_PERSIST_FAILED $pending"
+        return 1
+    fi
+    log_debug "$MSG_DEBUG_API_PERSISTED $pending"
+    return $rc
+}
+
 # ===========================================================================
 # UNIFIED API - SINGLE VALUE OPERATIONS (.json FORMAT)
 # ===========================================================================
@@ -491,185 +641,719 @@ api_create_json() {
 
 
 # ============================================================================
-# LOW-LEVEL HELPER
+# OBSERVER-BUS (NICHT-BLOCKIERENDE BENACHRICHTIGUNG)
 # ============================================================================
+# notify_api_update() markiert nur die geänderte Datei im Bus-Verzeichnis
+# (eine Marker-Datei je API-Datei, ohne Fork, blockiert nie). Ein residenter
+# Dispatcher verteilt die Marker alle API_BUS_INTERVAL_MS an die Senken →
+# schnelle Folge-Updates derselben Datei ergeben EINE Benachrichtigung.
+# Jede Senke (Observer) läuft als eigener Prozess mit eigener Warteschlange
+# und hält ihre Verbindung (z.B. zum MQTT-Broker) dauerhaft offen. Eine
+# langsame Senke bremst weder den Daemon noch andere Senken: liegt sie mehr
+# als API_BUS_MAX_BACKLOG Ereignisse zurück, werden neue Ereignisse für sie
+# verworfen. Zähler und Latenzen stehen in api/observers.json.
+# Jeder Prozess (Daemon, Batch) hat sein eigenes Bus-Verzeichnis
+# <API_BUS_DIR>/<pid> - ein zweiter Bus löscht oder teilt keine fremden Marker.
+
+readonly API_BUS_DIR="/run/disk2iso/bus"     # Basis, je Prozess <pid>/
+readonly API_BUS_INTERVAL_MS=250        # Zusammenfassungs-Fenster
+readonly API_BUS_MAX_BACKLOG=64         # Max. offene Ereignisse je Senke
+readonly API_BUS_STATS_SECONDS=2        # Intervall für observers.json
+
+declare -gA API_OBSERVERS=()            # Name → "Callback [Open-Funktion]"
+_API_BUS_PATH=""                        # Aktives Bus-Verzeichnis (leer = aus)
+_API_BUS_PID=""                         # PID des Dispatchers
+
+# ===========================================================================
+# api_register_observer
+# ---------------------------------------------------------------------------
+# Funktion.: Registriert eine Senke für API-Änderungen (Observer Pattern)
+# Parameter: $1 = Name der Senke (z.B. "mqtt")
+# .........  $2 = Callback, wird mit dem Pfad der geänderten Datei
+# .........       aufgerufen (Rückgabe != 0 zählt als Fehler)
+# .........  $3 = Open-Funktion (optional), einmal beim Start der Senke -
+# .........       baut die dauerhafte Verbindung auf (z.B. Coprozess
+# .........       "mosquitto_pub -l")
+# Rückgabe.: 0 = Erfolg, 1 = Callback fehlt
+# Hinweis..: Vor api_bus_start() aufrufen (z.B. im Modul-Init)
+# Beispiel.: api_register_observer "mqtt" "mqtt_publish_from_api" "mqtt_connect"
+# ===========================================================================
+api_register_observer() {
+    local name="$1"
+    local callback="$2"
+    local open_fn="${3:-}"
+
+    if [[ -z "$name" ]] || ! declare -f "$callback" >/dev/null 2>&1; then
+        log_warning "$MSG_WARNING_API_OBSERVER_CALLBACK_MISSING ${name}: ${callback}"
+        return 1
+    fi
+    API_OBSERVERS[$name]="${callback} ${open_fn}"
+    return 0
+}
 
 # ===========================================================================
 # notify_api_update
 # ---------------------------------------------------------------------------
-# Funktion.: Benachrichtige Observer über API-Änderungen (Observer Pattern)
-# Parameter: $1 = Dateiname der geänderten JSON (z.B. "status.json")
+# Funktion.: Meldet eine API-Änderung an den Observer-Bus
+# Parameter: $1 = Dateiname oder Pfad der geänderten Datei
 # Rückgabe.: 0
-# Beschr...: Ruft registrierte Observer-Callbacks auf (MQTT, WebSocket, etc.)
-#            Observer müssen eine Funktion *_publish_from_api() bereitstellen
+# Hinweis..: Nur ein Marker im Bus-Verzeichnis (tmpfs), kein Fork und kein
+# .........  Warten auf Senken. Existiert der Marker schon, wird das
+# .........  Ereignis zusammengefasst (gezählt). Ohne laufenden Bus No-Op.
 # ===========================================================================
 notify_api_update() {
-    local changed_file="$1"
-    
-    # Benachrichtige MQTT (falls Funktion verfügbar)
-    if declare -f mqtt_publish_from_api >/dev/null 2>&1; then
-        mqtt_publish_from_api "$changed_file"
+    [[ -n "$_API_BUS_PATH" ]] || return 0
+    local marker="${_API_BUS_PATH}/queue/${1//\//|}"
+
+    if [[ -e "$marker" ]]; then
+        printf '.' >> "$marker" 2>/dev/null
+    else
+        printf '%s ' "$EPOCHREALTIME" > "$marker" 2>/dev/null
     fi
-    
-    # Weitere Observer können hier hinzugefügt werden
-    # Beispiel: WebSocket-Modul
-    # if declare -f websocket_publish_from_api >/dev/null 2>&1; then
-    #     websocket_publish_from_api "$changed_file"
-    # fi
-    
+    return 0
+}
+
+# ===========================================================================
+# _api_bus_sink
+# ---------------------------------------------------------------------------
+# Funktion.: Residenter Prozess einer Senke: liest Ereignisse aus seiner
+# .........  Warteschlange und ruft den Callback auf
+# Parameter: $1 = Name, $2 = Callback, $3 = Open-Funktion (optional)
+# Rückgabe.: läuft bis die Warteschlange geschlossen wird
+# Hinweis..: Schreibt "zugestellt fehler latenz_us max_latenz_us" nach
+# .........  <bus>/<name>.stat (vom Dispatcher ausgewertet)
+# ===========================================================================
+_api_bus_sink() {
+    local name="$1"
+    local callback="$2"
+    local open_fn="${3:-}"
+    local stat_file="${_API_BUS_PATH}/${name}.stat"
+    local path enqueued processed=0 failed=0 lag_us=0 max_lag_us=0
+
+    [[ -n "$open_fn" ]] && "$open_fn"
+    printf '0 0 0 0\n' > "$stat_file"
+
+    while IFS=$'\t' read -r path enqueued; do
+        "$callback" "$path" || (( failed++ ))
+        (( processed++ ))
+        lag_us=$(( ${EPOCHREALTIME//[.,]/} - ${enqueued//[.,]/} ))
+        (( lag_us > max_lag_us )) && max_lag_us=$lag_us
+        printf '%d %d %d %d\n' "$processed" "$failed" "$lag_us" "$max_lag_us" > "$stat_file"
+    done
+}
+
+# ===========================================================================
+# _api_bus_dispatcher
+# ---------------------------------------------------------------------------
+# Funktion.: Residenter Dispatcher: sammelt Marker im Intervall und verteilt
+# .........  sie an die Warteschlangen der Senken
+# Parameter: keine
+# Rückgabe.: läuft endlos (Ende via api_bus_stop)
+# ===========================================================================
+_api_bus_dispatcher() {
+    local -A sink_fd=() sent=() dropped=() coalesced=()
+    local name callback open_fn fd
+
+    #-- Geschlossene Warteschlange (Senke beendet) zählt als verworfen -------
+    trap '' PIPE
+
+    #-- Eine Warteschlange (Pipe) und ein Prozess je Senke -------------------
+    for name in "${!API_OBSERVERS[@]}"; do
+        read -r callback open_fn <<< "${API_OBSERVERS[$name]}"
+        exec {fd}> >(_api_bus_sink "$name" "$callback" "$open_fn")
+        sink_fd[$name]=$fd
+        sent[$name]=0; dropped[$name]=0; coalesced[$name]=0
+    done
+
+    #-- Warten ohne Fork: read -t auf eine eigene FIFO -----------------------
+    local wait_fd interval
+    [[ -p "${_API_BUS_PATH}/wait" ]] || mkfifo "${_API_BUS_PATH}/wait"
+    exec {wait_fd}<>"${_API_BUS_PATH}/wait"
+    printf -v interval '%d.%03d' $(( API_BUS_INTERVAL_MS / 1000 )) $(( API_BUS_INTERVAL_MS % 1000 ))
+
+    local -a markers
+    local -A processed=() failed=() lag=() max_lag=()
+    local marker enqueued dots path stats last_stats="" next_stats=0
+    while true; do
+        read -r -t "$interval" -u "$wait_fd" _
+
+        #-- Fortschritt der Senken (Rückstand = gesendet - zugestellt) -------
+        for name in "${!sink_fd[@]}"; do
+            read -r "processed[$name]" "failed[$name]" "lag[$name]" "max_lag[$name]" \
+                < "${_API_BUS_PATH}/${name}.stat" 2>/dev/null
+        done
+
+        #-- Marker verteilen (je Datei EIN Ereignis) -------------------------
+        #-- Marker vor dem Lesen atomar übernehmen (EIN mv nach processing/):
+        #-- ein notify_api_update danach legt einen neuen Marker an, statt
+        #-- an einen bereits gelesenen anzuhängen, der dann gelöscht würde --
+        markers=("${_API_BUS_PATH}/queue/"*)
+        if [[ -e "${markers[0]}" ]]; then
+            mv -f -t "${_API_BUS_PATH}/processing" -- "${markers[@]}" 2>/dev/null
+            markers=("${_API_BUS_PATH}/processing/"*)
+        fi
+        if [[ -e "${markers[0]}" ]]; then
+            for marker in "${markers[@]}"; do
+                enqueued=""; dots=""
+                read -r enqueued dots < "$marker" 2>/dev/null    # ohne Newline
+                [[ -n "$enqueued" ]] || continue
+                #-- Nur "." : Anhängen traf den Marker gerade nach dem mv -----
+                if [[ "$enqueued" == .* ]]; then
+                    dots="${enqueued#.}"
+                    enqueued="$EPOCHREALTIME"
+                fi
+                path="${marker##*/}"
+                path="${path//|//}"
+                for name in "${!sink_fd[@]}"; do
+                    coalesced[$name]=$(( ${coalesced[$name]} + ${#dots} ))
+                    if (( ${sent[$name]} - ${processed[$name]:-0} >= API_BUS_MAX_BACKLOG )) \
+                       || ! printf '%s\t%s\n' "$path" "$enqueued" >&"${sink_fd[$name]}" 2>/dev/null; then
+                        dropped[$name]=$(( ${dropped[$name]} + 1 ))
+                        continue
+                    fi
+                    sent[$name]=$(( ${sent[$name]} + 1 ))
+                done
+            done
+            rm -f "${markers[@]}"
+        fi
+
+        #-- Zähler nach api/observers.json (nur bei Änderung) ----------------
+        (( EPOCHSECONDS >= next_stats )) || continue
+        next_stats=$(( EPOCHSECONDS + API_BUS_STATS_SECONDS ))
+        stats=""
+        for name in "${!sink_fd[@]}"; do
+            stats+="${stats:+,}"$'\n'"    \"${name}\": {\"delivered\": ${processed[$name]:-0}, \"failed\": ${failed[$name]:-0}, \"coalesced\": ${coalesced[$name]}, \"dropped\": ${dropped[$name]}, \"backlog\": $(( ${sent[$name]} - ${processed[$name]:-0} )), \"lag_ms\": $(( ${lag[$name]:-0} / 1000 )), \"max_lag_ms\": $(( ${max_lag[$name]:-0} / 1000 ))}"
+        done
+        [[ "$stats" == "$last_stats" ]] && continue
+        last_stats="$stats"
+        printf '{\n  "interval_ms": %d,\n  "max_backlog": %d,\n  "sinks": {%s\n  }\n}\n' \
+            "$API_BUS_INTERVAL_MS" "$API_BUS_MAX_BACKLOG" "$stats" > "${API_DIR}/observers.json.tmp.${BASHPID}" \
+            && mv -f "${API_DIR}/observers.json.tmp.${BASHPID}" "${API_DIR}/observers.json"
+    done
+}
+
+# ===========================================================================
+# api_bus_start
+# ---------------------------------------------------------------------------
+# Funktion.: Startet den Observer-Bus (Dispatcher + ein Prozess je Senke)
+# Parameter: keine
+# Rückgabe.: 0 = gestartet/keine Senke registriert, 1 = Fehler
+# Hinweis..: Nach dem Laden aller Module und VOR dem Start weiterer
+# .........  Prozesse (Worker erben das Bus-Verzeichnis). Ohne Senke
+# .........  bleibt notify_api_update() ein No-Op.
+# .........  Bus-Verzeichnis je Prozess (<API_BUS_DIR>/<pid>), Reste
+# .........  beendeter Prozesse werden beim Start entfernt.
+# .........  Kompatibilität: ein vorhandenes mqtt_publish_from_api() wird
+# .........  automatisch als Senke "mqtt" registriert.
+# ===========================================================================
+api_bus_start() {
+    [[ -n "$_API_BUS_PID" ]] && return 0
+
+    if [[ -z "${API_OBSERVERS[mqtt]:-}" ]] && declare -f mqtt_publish_from_api >/dev/null 2>&1; then
+        api_register_observer "mqtt" "mqtt_publish_from_api"
+    fi
+    (( ${#API_OBSERVERS[@]} > 0 )) || return 0
+
+    #-- Bus-Verzeichnis im RAM, sonst neben den API-Dateien -----------------
+    local bus_base="$API_BUS_DIR"
+    if ! mkdir -p "${bus_base}/${BASHPID}/queue" "${bus_base}/${BASHPID}/processing" 2>/dev/null; then
+        bus_base="${API_DIR}/.bus"
+        mkdir -p "${bus_base}/${BASHPID}/queue" "${bus_base}/${BASHPID}/processing" 2>/dev/null || return 1
+    fi
+    local bus_dir="${bus_base}/${BASHPID}"
+    rm -f "${bus_dir:?}"/queue/* "${bus_dir:?}"/processing/* "${bus_dir:?}"/*.stat 2>/dev/null
+
+    #-- Verzeichnisse beendeter Prozesse aufräumen (laufende bleiben) -------
+    local stale
+    for stale in "${bus_base}"/*/; do
+        stale="${stale%/}"
+        [[ "${stale##*/}" =~ ^[0-9]+$ ]] || continue
+        kill -0 "${stale##*/}" 2>/dev/null || rm -rf "${stale:?}"
+    done
+
+    _API_BUS_PATH="$bus_dir"
+    _api_bus_dispatcher &
+    _API_BUS_PID=$!
+    log_info "$MSG_API_BUS_STARTED ${!API_OBSERVERS[*]}"
+    return 0
+}
+
+# ===========================================================================
+# api_bus_stop
+# ---------------------------------------------------------------------------
+# Funktion.: Beendet Dispatcher und Senken-Prozesse und entfernt das
+# .........  Bus-Verzeichnis des Prozesses
+# Parameter: keine
+# Rückgabe.: 0
+# ===========================================================================
+api_bus_stop() {
+    [[ -n "$_API_BUS_PID" ]] || return 0
+    pkill -P "$_API_BUS_PID" 2>/dev/null
+    kill "$_API_BUS_PID" 2>/dev/null
+    wait "$_API_BUS_PID" 2>/dev/null
+    rm -rf "${_API_BUS_PATH:?}"
+    log_debug "$MSG_DEBUG_API_BUS_STOPPED"
+    _API_BUS_PID=""
+    _API_BUS_PATH=""
     return 0
 }
 
+# ============================================================================
+# LIVE-STATE (EIN VERSIONIERTES DOKUMENT)
+# ============================================================================
+# Status, Disc-Attribute und Fortschritt liegen gemeinsam in live.json
+# (bisher: status.json + attributes.json + progress.json). Jeder Schreib-
+# vorgang erhöht "seq" → Leser erhalten immer einen konsistenten Stand und
+# erkennen Änderungen über einen einfachen Vergleich der Sequenznummer.
+#
+# Felder werden im Speicher (API_LIVE) gesammelt und gebündelt geschrieben,
+# höchstens API_LIVE_MAX_RATE mal pro Sekunde. Zurückgestellte Änderungen
+# schreibt der nächste api_live_flush (State Machine Hauptschleife).
+
+readonly API_LIVE_FILE="live.json"
+readonly API_LIVE_MAX_RATE=4            # Max. Schreibvorgänge pro Sekunde
+readonly API_LIVE_FIELDS="status timestamp disc_label disc_type disc_size_mb filename method container_type error_message percent copied_mb total_mb total_tracks eta progress_timestamp"
+readonly API_LIVE_NUMERIC=" disc_size_mb percent copied_mb total_mb total_tracks "
+
+declare -gA API_LIVE=()                 # Aktuelle Feldwerte (Schlüssel → Wert)
+API_LIVE_SEQ=0                          # Sequenznummer des letzten Schreibens
+API_LIVE_DIRTY=0                        # 1 = ungeschriebene Änderungen
+_API_LIVE_PATH=""                       # Zieldatei (je Laufwerks-Instanz)
+_API_LIVE_SCOPE="-"                     # DRIVESTAT_INSTANCE zu _API_LIVE_PATH
+_API_LIVE_LAST_WRITE=0                  # Zeitpunkt letztes Schreiben (µs)
+_API_LIVE_CHMOD=0                       # 1 = umask zu restriktiv → chmod 644
+
+# ===========================================================================
+# _api_live_bind
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt die Zieldatei des Live-Dokuments für die aktuelle
+# .........  Laufwerks-Instanz und übernimmt deren Sequenznummer
+# Parameter: keine
+# Rückgabe.: 0 = OK, 1 = API-Verzeichnis nicht verfügbar
+# Hinweis..: Nur bei Wechsel von DRIVESTAT_INSTANCE (Multi-Drive Worker)
+# .........  wird neu ermittelt, sonst ohne Subshell
+# ===========================================================================
+_api_live_bind() {
+    [[ "$_API_LIVE_SCOPE" == "${DRIVESTAT_INSTANCE:-}" ]] && [[ -n "$_API_LIVE_PATH" ]] && return 0
+
+    local filepath line
+    filepath=$(get_module_api_path "$API_LIVE_FILE") || return 1
+
+    #-- Worker erbt Werte des Supervisors nicht -----------------------------
+    if [[ "$_API_LIVE_SCOPE" != "-" ]]; then
+        API_LIVE=()
+    fi
+    _API_LIVE_PATH="$filepath"
+    _API_LIVE_SCOPE="${DRIVESTAT_INSTANCE:-}"
+
+    #-- Sequenz fortsetzen (bleibt über Neustarts monoton) ------------------
+    API_LIVE_SEQ=0
+    while IFS= read -r line; do
+        if [[ "$line" =~ \"seq\":\ *([0-9]+) ]]; then
+            API_LIVE_SEQ=${BASH_REMATCH[1]}
+            break
+        fi
+    done < "$filepath"
+
+    #-- chmod nur nötig, wenn umask Lesen für group/other verhindert --------
+    (( 8#$(umask) & 8#044 )) && _API_LIVE_CHMOD=1 || _API_LIVE_CHMOD=0
+
+    return 0
+}
+
+# ===========================================================================
+# _api_json_escape
+# ---------------------------------------------------------------------------
+# Funktion.: Maskiert einen String für JSON (ohne Subshell)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = Wert
+# Rückgabe.: 0
+# ===========================================================================
+_api_json_escape() {
+    local _api_json="${2//\\/\\\\}"
+    _api_json="${_api_json//\"/\\\"}"
+    _api_json="${_api_json//$'\t'/\\t}"
+    _api_json="${_api_json//$'\r'/\\r}"
+    _api_json="${_api_json//$'\n'/\\n}"
+    printf -v "$1" '%s' "$_api_json"
+    return 0
+}
+
+# ===========================================================================
+# _api_live_write
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt das Live-Dokument atomar (temp-file + mv) mit neuer
+# .........  Sequenznummer und benachrichtigt die Observer
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# ===========================================================================
+_api_live_write() {
+    _api_live_bind || return 1
+
+    local json field value
+    (( API_LIVE_SEQ++ ))
+    printf -v json '{\n  "seq": %d' "$API_LIVE_SEQ"
+    for field in $API_LIVE_FIELDS; do
+        value="${API_LIVE[$field]:-}"
+        if [[ "$API_LIVE_NUMERIC" == *" $field "* ]]; then
+            [[ "$value" =~ ^[0-9]+$ ]] || value=0
+            json+=$',\n'"  \"${field}\": ${value}"
+        elif [[ "$field" == "error_message" ]] && [[ -z "$value" ]]; then
+            json+=$',\n'"  \"${field}\": null"
+        else
+            _api_json_escape value "$value"
+            json+=$',\n'"  \"${field}\": \"${value}\""
+        fi
+    done
+    json+=$'\n}'
+
+    printf '%s\n' "$json" > "${_API_LIVE_PATH}.tmp" 2>/dev/null || return 1
+    mv -f "${_API_LIVE_PATH}.tmp" "$_API_LIVE_PATH" 2>/dev/null || return 1
+    (( _API_LIVE_CHMOD )) && chmod 644 "$_API_LIVE_PATH" 2>/dev/null
+
+    API_LIVE_DIRTY=0
+    _API_LIVE_LAST_WRITE=${EPOCHREALTIME//[.,]/}
+
+    # Benachrichtige Observer über Änderung (einmal pro Bündel)
+    notify_api_update "$_API_LIVE_PATH"
+    return 0
+}
+
+# ===========================================================================
+# api_live_set
+# ---------------------------------------------------------------------------
+# Funktion.: Setzt Felder des Live-Dokuments und schreibt gebündelt
+# Parameter: $1 = Modus für api_live_flush ("" = bündeln, "wait", "force")
+# .........  $2.. = Paare aus Feldname und Wert
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Hinweis..: Unbekannte Felder werden ignoriert (siehe API_LIVE_FIELDS)
+# Beispiel.: api_live_set "" percent 42 eta "00:12:00"
+# ===========================================================================
+api_live_set() {
+    local mode="$1"
+    shift
+    _api_live_bind || return 1
+
+    while (( $# >= 2 )); do
+        if [[ " $API_LIVE_FIELDS " == *" $1 "* ]] && [[ "${API_LIVE[$1]-<unset>}" != "$2" ]]; then
+            API_LIVE[$1]="$2"
+            API_LIVE_DIRTY=1
+        fi
+        shift 2
+    done
+
+    api_live_flush "$mode"
+}
+
+# ===========================================================================
+# api_live_flush
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt zurückgestellte Änderungen des Live-Dokuments
+# Parameter: $1 = Modus (optional):
+# .........       ""      = nur schreiben wenn das Ratenlimit es erlaubt,
+# .........                 sonst beim nächsten Aufruf (Fortschritt)
+# .........       "wait"  = auf den nächsten freien Zeitschlitz warten
+# .........                 (max. 1/API_LIVE_MAX_RATE s, Status-Wechsel)
+# .........       "force" = sofort schreiben (Service-Ende)
+# Rückgabe.: 0 = Erfolg/nichts zu tun, 1 = Fehler beim Schreiben
+# Hinweis..: Günstig genug für jeden Durchlauf der Hauptschleife
+# ===========================================================================
+api_live_flush() {
+    local mode="${1:-}"
+    (( API_LIVE_DIRTY )) || return 0
+
+    if [[ "$mode" != "force" ]]; then
+        local interval=$(( 1000000 / API_LIVE_MAX_RATE ))
+        local remaining=$(( _API_LIVE_LAST_WRITE + interval - ${EPOCHREALTIME//[.,]/} ))
+        if (( remaining > 0 )); then
+            [[ "$mode" == "wait" ]] || return 0
+            local pause
+            printf -v pause '%d.%06d' $(( remaining / 1000000 )) $(( remaining % 1000000 ))
+            sleep "$pause"
+        fi
+    fi
+
+    _api_live_write
+}
+
 # ============================================================================
 # STATUS UPDATES
 # ============================================================================
 
-# Funktion: Update Status
-# Parameter:
-#   $1 = Status (idle/waiting/copying/completed/error)
-#   $2 = Disc-Label (optional)
-#   $3 = Disc-Type (optional, z.B. "dvd-video", "audio-cd", "bluray")
-#   $4 = Error-Message (optional, nur bei status=error)
-# Schreibt: status.json, attributes.json
+# ===========================================================================
+# api_update_status
+# ---------------------------------------------------------------------------
+# Funktion.: Aktualisiert Status und Disc-Attribute im Live-Dokument
+# Parameter: $1 = Status (idle/waiting/copying/completed/error)
+# .........  $2 = Disc-Label (optional)
+# .........  $3 = Disc-Type (optional, z.B. "dvd-video", "audio-cd")
+# .........  $4 = Error-Message (optional, nur bei status=error)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Hinweis..: Bei idle/waiting wird der Fortschritt im selben Schreib-
+# .........  vorgang zurückgesetzt (ein Schreibvorgang statt drei)
+# ===========================================================================
 api_update_status() {
     local status="$1"
     local label="${2:-}"
     local type="${3:-}"
     local error_msg="${4:-}"
-    
-    local timestamp=$(date '+%Y-%m-%dT%H:%M:%S')
-    
-    # Schreibe status.json
-    local status_json=$(cat <<EOF
-{
-  "status": "${status}",
-  "timestamp": "${timestamp}"
-}
-EOF
-)
-    api_set_file_json "status.json" "${status_json}"
-    
-    # Hole Werte über Getter aus libdiskinfos
-    local disc_size_mb=$(discinfo_get_size_mb)
-    local container=$(discinfo_get_container_type)
-    local method=$(discinfo_get_copy_method)
-    local filename=$(discinfo_get_iso_basename)
-    
-    # Schreibe attributes.json
-    local attr_json=$(cat <<EOF
-{
-  "disc_label": "${label}",
-  "disc_type": "${type}",
-  "disc_size_mb": ${disc_size_mb},
-  "progress_percent": 0,
-  "progress_mb": 0,
-  "total_mb": ${disc_size_mb},
-  "total_tracks": 0,
-  "eta": "",
-  "filename": "${filename}",
-  "method": "${method}",
-  "container_type": "${container}",
-  "error_message": ${error_msg:+"\"${error_msg}\""}${error_msg:-null}
-}
-EOF
-)
-    api_set_file_json "attributes.json" "${attr_json}"
-    
+    local timestamp
+    printf -v timestamp '%(%Y-%m-%dT%H:%M:%S)T' -1
+
+    # Hole Werte aus libdiskinfos (ohne Subshell, siehe discinfo_get_field)
+    local disc_size_mb=0 method="" filename=""
+    if declare -f discinfo_get_field >/dev/null 2>&1; then
+        discinfo_get_field disc_size_mb size_mb 0
+        discinfo_get_field method copy_method
+        discinfo_get_field filename iso_basename
+    fi
+
     # Bei idle/waiting: Reset progress auf 0
+    local -a progress=()
     if [[ "$status" == "idle" ]] || [[ "$status" == "waiting" ]]; then
-        api_update_progress 0 0 0 ""
+        progress=(percent 0 copied_mb 0 total_mb 0 total_tracks 0 eta "" progress_timestamp "$timestamp")
     fi
-    
-    return 0
+
+    # Ein Schreibvorgang für Status, Attribute und ggf. Fortschritt
+    # (Container-Umgebung des Hosts aus libsysteminfo)
+    api_live_set wait \
+        status "$status" \
+        timestamp "$timestamp" \
+        disc_label "$label" \
+        disc_type "$type" \
+        disc_size_mb "$disc_size_mb" \
+        filename "$filename" \
+        method "$method" \
+        container_type "${SYSTEM_INFO[container_type]:-none}" \
+        error_message "$error_msg" \
+        "${progress[@]}"
 }
 
 # ============================================================================
 # PROGRESS UPDATES
 # ============================================================================
 
-# Funktion: Update Fortschritt
-# Parameter:
-#   $1 = Prozent (0-100)
-#   $2 = Kopierte MB
-#   $3 = Gesamt MB
-#   $4 = ETA (Format: "HH:MM:SS" oder leer)
-# Schreibt: progress.json
+# ===========================================================================
+# api_update_progress
+# ---------------------------------------------------------------------------
+# Funktion.: Aktualisiert den Fortschritt im Live-Dokument (gebündelt)
+# Parameter: $1 = Prozent (0-100)
+# .........  $2 = Kopierte MB
+# .........  $3 = Gesamt MB
+# .........  $4 = ETA (Format: "HH:MM:SS" oder leer)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Hinweis..: Zu schnelle Folge-Updates werden zusammengefasst, der letzte
+# .........  Stand wird beim nächsten api_live_flush geschrieben
+# ===========================================================================
 api_update_progress() {
-    local percent="$1"
-    local copied_mb="${2:-0}"
-    local total_mb="${3:-0}"
-    local eta="${4:-}"
-    
-    local timestamp=$(date '+%Y-%m-%dT%H:%M:%S')
-    
-    # Schreibe progress.json
-    local progress_json=$(cat <<EOF
-{
-  "percent": ${percent},
-  "copied_mb": ${copied_mb},
-  "total_mb": ${total_mb},
-  "eta": "${eta}",
-  "timestamp": "${timestamp}"
-}
-EOF
-)
-    api_set_file_json "progress.json" "${progress_json}"
-    
-    return 0
+    local timestamp
+    printf -v timestamp '%(%Y-%m-%dT%H:%M:%S)T' -1
+
+    api_live_set "" \
+        percent "$1" \
+        copied_mb "${2:-0}" \
+        total_mb "${3:-0}" \
+        eta "${4:-}" \
+        progress_timestamp "$timestamp"
 }
 
 # ============================================================================
-# HISTORY
+# HISTORY (APPEND-ONLY JOURNAL)
 # ============================================================================
+# Ein Eintrag = eine JSON-Zeile, angehängt an das aktuelle Segment
+# api/history/journal.NNNNNN.jsonl im dauerhaften API-Verzeichnis. Volle
+# Segmente (API_HISTORY_SEGMENT_BYTES) werden nie mehr verändert → keine
+# Obergrenze für Einträge, Anhängen kostet O(1) statt O(n).
+#   index.tsv : Segment, Anzahl, erster/letzter Zeitstempel (Blättern)
+#   days.tsv  : Tag, Typ, Ergebnis, Anzahl, Bytes (vorberechnete Statistik)
+# Im RAM-Betrieb sammelt api/history.pending.jsonl (tmpfs) neue Einträge
+# bis zum nächsten api_persist.
+
+readonly API_HISTORY_DIR="history"
+readonly API_HISTORY_PENDING="history.pending.jsonl"
+readonly API_HISTORY_SEGMENT_BYTES=1048576
+
+_API_HISTORY_PATH=""                    # Journal-Verzeichnis (dauerhaft)
+
+# ===========================================================================
+# _api_history_get_dir
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert das Journal-Verzeichnis (legt es bei Bedarf an)
+# Parameter: $1 = Name der Zielvariable
+# Rückgabe.: 0 = OK, 1 = dauerhaftes API-Verzeichnis fehlt
+# ===========================================================================
+_api_history_get_dir() {
+    if [[ -z "$_API_HISTORY_PATH" ]]; then
+        local store_dir
+        store_dir=$(folders_get_api_store_dir) || return 1
+        mkdir -p "${store_dir}/${API_HISTORY_DIR}" 2>/dev/null || return 1
+        _API_HISTORY_PATH="${store_dir}/${API_HISTORY_DIR}"
+    fi
+    printf -v "$1" '%s' "$_API_HISTORY_PATH"
+    return 0
+}
+
+# ===========================================================================
+# _api_history_commit
+# ---------------------------------------------------------------------------
+# Funktion.: Hängt Einträge an das Journal an und aktualisiert Index und
+# .........  Tagesstatistik (ein awk-Durchlauf, unter flock)
+# Parameter: $1 = Datei mit JSON-Zeilen ("-" = stdin)
+# .........  $2 = "truncate" (optional, Quelldatei danach leeren - pending)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Hinweis..: Rotation: neues Segment, sobald das aktuelle Segment mit dem
+# .........  nächsten Eintrag API_HISTORY_SEGMENT_BYTES überschreiten würde
+# ===========================================================================
+_api_history_commit() {
+    local source_file="$1"
+    local mode="${2:-}"
+    local history_dir
+    _api_history_get_dir history_dir || return 1
+
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+
+        #-- Aktuelles Segment aus dem Index (letzte Zeile) ------------------
+        local segment=1 size=0 name rest current
+        [[ -f "${history_dir}/index.tsv" ]] || : > "${history_dir}/index.tsv"
+        [[ -f "${history_dir}/days.tsv" ]] || : > "${history_dir}/days.tsv"
+        while IFS=$'\t' read -r name rest; do
+            [[ "$name" =~ ^[0-9]+$ ]] && segment=$((10#$name))
+        done < "${history_dir}/index.tsv"
+        printf -v current '%s/journal.%06d.jsonl' "$history_dir" "$segment"
+        [[ -f "$current" ]] && size=$(stat -c %s "$current" 2>/dev/null)
+
+        LC_ALL=C awk -F'\t' -v dir="$history_dir" -v segment="$segment" \
+            -v size="${size:-0}" -v max="$API_HISTORY_SEGMENT_BYTES" '
+            function field(name,   m) {
+                if (match($0, "\"" name "\":\"[^\"]*\""))
+                    return substr($0, RSTART + length(name) + 4, RLENGTH - length(name) - 5)
+                return ""
+            }
+            function number(name) {
+                if (match($0, "\"" name "\":[0-9]+"))
+                    return substr($0, RSTART + length(name) + 3, RLENGTH - length(name) - 3) + 0
+                return 0
+            }
+            FILENAME == ARGV[1] {
+                count[$1] = $2; first[$1] = $3; last[$1] = $4; order[++n] = $1
+                next
+            }
+            FILENAME == ARGV[2] {
+                key = $1 FS $2 FS $3; days[key] = $4; bytes[key] = $5
+                next
+            }
+            /^\{/ {
+                if (size > 0 && size + length($0) + 1 > max) { segment++; size = 0 }
+                seg = sprintf("%06d", segment)
+                print >> (dir "/journal." seg ".jsonl")
+                size += length($0) + 1
+
+                ts = field("timestamp")
+                if (!(seg in count)) { count[seg] = 0; first[seg] = ts; order[++n] = seg }
+                count[seg]++; last[seg] = ts
+
+                key = substr(ts, 1, 10) FS field("type") FS field("result")
+                days[key]++; bytes[key] += number("bytes")
+            }
+            END {
+                for (i = 1; i <= n; i++)
+                    printf "%s\t%d\t%s\t%s\n", order[i], count[order[i]], first[order[i]], last[order[i]] > (dir "/index.tsv.tmp")
+                for (key in days)
+                    printf "%s\t%d\t%.0f\n", key, days[key], bytes[key] | ("sort > \"" dir "/days.tsv.tmp\"")
+            }' "${history_dir}/index.tsv" "${history_dir}/days.tsv" "$source_file" || exit 1
+
+        [[ -f "${history_dir}/index.tsv.tmp" ]] || : > "${history_dir}/index.tsv.tmp"
+        [[ -f "${history_dir}/days.tsv.tmp" ]] || : > "${history_dir}/days.tsv.tmp"
+        mv -f "${history_dir}/index.tsv.tmp" "${history_dir}/index.tsv" || exit 1
+        mv -f "${history_dir}/days.tsv.tmp" "${history_dir}/days.tsv" || exit 1
+        [[ "$mode" == "truncate" ]] && : > "$source_file"
+        exit 0
+    ) 9>"${history_dir}/.lock" || return 1
 
-# Funktion: Füge History-Eintrag hinzu
-# Parameter:
-#   $1 = Status (completed/error)
-#   $2 = Label
-#   $3 = Typ
-#   $4 = Ergebnis (success/error)
-#   $5 = Fehlermeldung (optional, bei error)
-# Schreibt: history.json (append)
+    # Benachrichtige Observer über Änderung
+    notify_api_update "${history_dir}/index.tsv"
+    return 0
+}
+
+# ===========================================================================
+# _api_history_import_legacy
+# ---------------------------------------------------------------------------
+# Funktion.: Übernimmt eine alte history.json (max. 50 Einträge, neueste
+# .........  zuerst) einmalig ins Journal und entfernt sie danach
+# Parameter: keine
+# Rückgabe.: 0 = nichts zu tun/übernommen, 1 = Fehler (Datei bleibt)
+# ===========================================================================
+_api_history_import_legacy() {
+    local legacy store_dir entries
+    store_dir=$(folders_get_api_store_dir) || return 1
+
+    for legacy in "${store_dir}/history.json" "${API_DIR}/history.json"; do
+        [[ -f "$legacy" ]] || continue
+        command -v jq >/dev/null 2>&1 || return 1
+        entries=$(jq -c 'reverse[] | {timestamp: .timestamp, type: .type, result: .result,
+            status: .status, bytes: 0, label: .label, error_message: .error_message}' "$legacy" 2>/dev/null) || return 1
+        if [[ -n "$entries" ]]; then
+            _api_history_commit - <<< "$entries" || return 1
+        fi
+        rm -f "$legacy"
+    done
+    return 0
+}
+
+# ===========================================================================
+# api_add_history
+# ---------------------------------------------------------------------------
+# Funktion.: Fügt einen Eintrag an die History an (Journal, append-only)
+# Parameter: $1 = Status (completed/error)
+# .........  $2 = Label
+# .........  $3 = Typ (z.B. "dvd-video", "audio-cd")
+# .........  $4 = Ergebnis (success/error/skipped/verified)
+# .........  $5 = Fehlermeldung (optional, bei error)
+# .........  $6 = Größe in Bytes (optional, für Bytes/Tag)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Hinweis..: Im RAM-Betrieb nur Anhängen an history.pending.jsonl, das
+# .........  Journal schreibt api_persist
+# ===========================================================================
 api_add_history() {
     local status="$1"
     local label="$2"
     local type="$3"
     local result="$4"
     local error_msg="${5:-}"
-    
-    local timestamp=$(date '+%Y-%m-%dT%H:%M:%S')
-    
-    # Lese bestehende History (max 50 Einträge)
-    local history_file="${API_DIR}/history.json"
-    local history="[]"
-    if [[ -f "$history_file" ]]; then
-        history=$(cat "$history_file" 2>/dev/null || echo "[]")
+    local bytes="${6:-0}"
+    [[ "$bytes" =~ ^[0-9]+$ ]] || bytes=0
+
+    local timestamp entry error_json="null"
+    printf -v timestamp '%(%Y-%m-%dT%H:%M:%S)T' -1
+    _api_json_escape status "$status"
+    _api_json_escape label "$label"
+    _api_json_escape type "$type"
+    _api_json_escape result "$result"
+    if [[ -n "$error_msg" ]]; then
+        _api_json_escape error_msg "$error_msg"
+        error_json="\"${error_msg}\""
     fi
-    
-    # Neuer Eintrag
-    local entry=$(cat <<EOF
-{
-  "timestamp": "${timestamp}",
-  "label": "${label}",
-  "type": "${type}",
-  "status": "${status}",
-  "result": "${result}",
-  "error_message": ${error_msg:+"\"${error_msg}\""}${error_msg:-null}
-}
-EOF
-)
-    
-    # Füge Eintrag hinzu (am Anfang, neueste zuerst)
-    # Nutze jq falls verfügbar, sonst einfaches JSON-Array-Append
-    if command -v jq >/dev/null 2>&1; then
-        history=$(echo "$history" | jq ". |= [${entry}] + . | .[0:50]" 2>/dev/null || echo "[]")
-    else
-        # Fallback ohne jq: Einfaches Prepend (nicht schön aber funktioniert)
-        history="[${entry}]"
+
+    # Feste Reihenfolge: timestamp/type/result vor label (awk-Auswertung)
+    printf -v entry '{"timestamp":"%s","type":"%s","result":"%s","status":"%s","bytes":%s,"label":"%s","error_message":%s}' \
+        "$timestamp" "$type" "$result" "$status" "$bytes" "$label" "$error_json"
+
+    #-- Ohne RAM-Betrieb direkt ins Journal ---------------------------------
+    if [[ -z "$_API_STORE_DIR" ]]; then
+        _api_history_commit - <<< "$entry"
+        return
     fi
-    
-    api_set_file_json "history.json" "${history}"
-    
+
+    #-- RAM-Betrieb: sammeln bis api_persist (Lock wie beim Übernehmen) -----
+    local history_dir
+    _api_history_get_dir history_dir || return 1
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        printf '%s\n' "$entry" >> "${API_DIR}/${API_HISTORY_PENDING}"
+    ) 9>"${history_dir}/.lock" || return 1
+
+    notify_api_update "${API_DIR}/${API_HISTORY_PENDING}"
     return 0
 }
 
@@ -690,8 +1374,9 @@ EOF
 api_update_from_state() {
     local state="$1"
     local error_msg="${2:-}"
-    local disc_label="$(discinfo_get_label 2>/dev/null || echo '')"
-    local disc_type="$(discinfo_get_type 2>/dev/null || echo '')"
+    local disc_label disc_type
+    discinfo_get_field disc_label label
+    discinfo_get_field disc_type type
 
     # Mappe State Machine States auf API-Status
     case "$state" in
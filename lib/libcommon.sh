@@ -9,6 +9,7 @@
 #   - common_copy_data_disc(), common_copy_data_disc_ddrescue()
 #   - common_cleanup_disc_operation(), common_monitor_copy_progress()
 #   - Fehler-Tracking: common_register_disc_failure(), common_clear_disc_failures()
+#   - Archiv-Register: common_check_archived_disc() (bereits archivierte Discs)
 #   
 #   Hinweis: systeminfo_check_disk_space() ist in libsysteminfo.sh
 #            init_copy_log(), finish_copy_log() sind in liblogging.sh
@@ -73,7 +74,8 @@ common_check_dependencies() {
 # ===========================================================================
 common_copy_data_disc() {
     #-- Prüfe Disc-Typ: Audio-CDs können nicht als ISO kopiert werden -------
-    local disc_type="$(discinfo_get_type)"
+    local disc_type
+    discinfo_get_field disc_type type
     if [[ "$disc_type" == "audio-cd" ]]; then
         log_error "$MSG_ERROR_AUDIO_CD_AS_DATA"
         log_error "$MSG_ERROR_AUDIO_MODULE_NOT_INSTALLED"
@@ -84,29 +86,63 @@ common_copy_data_disc() {
     #-- Prüfe ob diese Disc bereits fehlgeschlagen ist ----------------------
     local failure_count=$(common_get_disc_failure_count)
     
+    #-- Kalibrierte Leseparameter des Laufwerks (Request-Größe, Readahead) --
+    #-- Die Request-Größe nutzt nur ddrescue (-c, liest Fehlerbereiche -----
+    #-- sektorweise nach). dd mit conv=noerror,sync liest immer sektor- -----
+    #-- weise, sonst füllt ein Lesefehler den ganzen Request mit Nullen -----
+    local block_size iso_filename
+    discinfo_get_field block_size block_size 2048
+    local request_size=$(drivestat_get_request_size "$block_size")
+    drivestat_apply_read_params
+    
+    #-- Komprimierte Ausgabe (.iso.zst): dd → zstd, ddrescue braucht eine --
+    #-- beschreibbare Zieldatei und entfällt hier ---------------------------
+    local attempt_start
+    if common_compression_enabled; then
+        log_info "$MSG_INFO_COPY_WITH_ZSTD"
+        attempt_start=$EPOCHSECONDS
+        if common_copy_data_disc_zstd; then
+            drivestat_restore_read_params
+            [[ $failure_count -gt 0 ]] && common_clear_disc_failures
+            return 0
+        fi
+        #-- Fehlgeschlagen: unkomprimiert mit dd weiter ---------------------
+        common_register_disc_failure "$(( EPOCHSECONDS - attempt_start ))"
+        log_warning "$MSG_WARNING_ZSTD_FALLBACK"
+        discinfo_get_field iso_filename iso_filename
+        systeminfo_release_disk_space "$iso_filename"
+        _common_set_image_filename "$(get_image_stem "$iso_filename").iso"
+        failure_count=1
+    fi
+
     #-- Prüfe ob ddrescue vorhanden, es ist optional ------------------------
     if command -v ddrescue >/dev/null 2>&1 && [[ $failure_count -eq 0 ]]; then
         log_info "$MSG_INFO_COPY_WITH_DDRESCUE"
         #-- 1. Versuch: ddrescue verwenden ----------------------------------
-        if common_copy_data_disc_ddrescue; then
+        attempt_start=$EPOCHSECONDS
+        if common_copy_data_disc_ddrescue "$request_size"; then
+            drivestat_restore_read_params
             return 0
         else
             #-- Kopiervorgang fehlgeschlagen - registriere Fehler -----------
-            common_register_disc_failure
+            common_register_disc_failure "$(( EPOCHSECONDS - attempt_start ))"
             log_warning "$MSG_WARNING_DDRESCUE_FALLBACK"
         fi
     fi
     
     #-- 2. Versuch: dd verwenden --------------------------------------------
     log_info "$MSG_INFO_COPY_WITH_DD"
+    attempt_start=$EPOCHSECONDS
     if common_copy_data_disc_dd; then
+        drivestat_restore_read_params
         #-- Erfolg - lüsche Fehler-Historie falls vorhanden -----------------
         [[ $failure_count -gt 0 ]] && common_clear_disc_failures
         return 0
     else
+        drivestat_restore_read_params
         #-- Kopiervorgang fehlgeschlagen - registriere Fehler ---------------
         log_error "$MSG_ERROR_DD_COPY_FAILED"
-        common_register_disc_failure
+        common_register_disc_failure "$(( EPOCHSECONDS - attempt_start ))"
         return 1
     fi
 }
@@ -117,7 +153,8 @@ common_copy_data_disc() {
 # Funktion.: Kopiert Daten-Discs mit ddrescue (robust, mit Fehlerkorrektur)
 # .........  Nutzt vorberechnete DISC_INFO-Werte und zeitgesteuertes
 # .........  Fortschritts-Monitoring (alle 60 Sekunden).
-# Parameter: keine (nutzt DISC_INFO Array)
+# Parameter: $1 = Request-Größe in Bytes (optional, aus Laufwerks-
+# .........       Kalibrierung, wird als Cluster-Größe -c übergeben)
 # Rückgabe.: 0 = Erfolg
 # .........  1 = Fehler (Speicherplatz, Kopiervorgang fehlgeschlagen)
 # Extras...: Schneller und robuster als dd, erfordert ddrescue-Installation
@@ -125,19 +162,28 @@ common_copy_data_disc() {
 # .........  Sendet Fortschritt via API, MQTT und systemd-notify
 # ===========================================================================
 common_copy_data_disc_ddrescue() {
+    local request_size="${1:-}"
+
     #-- Initialisiere Kopiervorgang-Log -------------------------------------
-    init_copy_log "$(discinfo_get_label)" "data"
+    local label
+    discinfo_get_field label label
+    init_copy_log "$label" "data"
     log_copying "$MSG_METHOD_DDRESCUE"
     
     #-- Setze verwendete Kopiermethode --------------------------------------
     discinfo_set_copy_method "ddrescue"
     
     #-- Lese aus DISC_INFO Array die benütigten Werte -----------------------
-    local iso_filename=$(discinfo_get_iso_filename)
-    local temp_pathname=$(discinfo_get_temp_pathname)
-    local copy_log_filename=$(discinfo_get_log_filename)
-    local size_mb=$(discinfo_get_size_mb)
-    local block_size=$(discinfo_get_block_size)
+    local iso_filename temp_pathname copy_log_filename size_mb block_size
+    local size_sectors estimated_size_mb drive
+    discinfo_get_field iso_filename iso_filename
+    discinfo_get_field temp_pathname temp_pathname
+    discinfo_get_field copy_log_filename log_filename
+    discinfo_get_field size_mb size_mb 0
+    discinfo_get_field block_size block_size 2048
+    discinfo_get_field size_sectors size_sectors 0
+    discinfo_get_field estimated_size_mb estimated_size_mb 0
+    drivestat_get_field drive drive
     local total_bytes=$((size_mb * 1024 * 1024))
     
     #-- ddrescue benütigt Map-Datei (im .temp Ordner, wird auto-gelüscht) ---
@@ -146,20 +192,24 @@ common_copy_data_disc_ddrescue() {
     #-- Speicherplatz Prüfung (falls Größe bekannt) -------------------------    
     if [[ $size_mb -gt 0 ]]; then
         #-- Logge erkannte Disc-Größe ---------------------------------------
-        log_copying "$MSG_ISO_VOLUME_DETECTED $(discinfo_get_size_sectors) $MSG_ISO_BLOCKS_SIZE 2048 $MSG_ISO_BYTES (${size_mb} $MSG_PROGRESS_MB)"
+        log_copying "$MSG_ISO_VOLUME_DETECTED $size_sectors $MSG_ISO_BLOCKS_SIZE 2048 $MSG_ISO_BYTES (${size_mb} $MSG_PROGRESS_MB)"
         
-        #-- Prüfe Speicherplatz mit vorberechneter Größe (inkl. Overhead) ---
-        if ! systeminfo_check_disk_space "$(discinfo_get_estimated_size_mb)"; then
+        #-- Prüfe und reserviere Speicherplatz (inkl. Overhead, vorab -------
+        #-- allokiert, Freigabe in common_cleanup_disc_operation) -----------
+        if ! systeminfo_check_disk_space "$estimated_size_mb" "$iso_filename"; then
             return 1
         fi
     fi
     
-    #-- Starte ddrescue im Hintergrund (mit oder ohne Größenbeschränkung) ---
-    if [[ $total_bytes -gt 0 ]]; then
-        ddrescue -b "${block_size:-2048}" -r "$DDRESCUE_RETRIES" -s "$total_bytes" "$(drivestat_get_drive)" "$iso_filename" "$mapfile" &>>"$copy_log_filename" &
-    else
-        ddrescue -b "${block_size:-2048}" -r "$DDRESCUE_RETRIES" "$(drivestat_get_drive)" "$iso_filename" "$mapfile" &>>"$copy_log_filename" &
+    #-- ddrescue Optionen (Sektorgröße, Retries, ggf. Cluster und Größe) ----
+    local ddrescue_opts=(-b "$block_size" -r "$DDRESCUE_RETRIES")
+    if [[ "$request_size" =~ ^[0-9]+$ ]] && [[ $request_size -gt $block_size ]]; then
+        ddrescue_opts+=(-c "$(( request_size / block_size ))")
     fi
+    [[ $total_bytes -gt 0 ]] && ddrescue_opts+=(-s "$total_bytes")
+    
+    #-- Starte ddrescue im Hintergrund --------------------------------------
+    ddrescue "${ddrescue_opts[@]}" "$drive" "$iso_filename" "$mapfile" &>>"$copy_log_filename" &
     local ddrescue_pid=$!
     
     #-- überwache Fortschritt (alle 60 Sekunden) ----------------------------
@@ -196,18 +246,24 @@ common_copy_data_disc_ddrescue() {
 # ===========================================================================
 common_copy_data_disc_dd() {
     #-- Initialisiere Kopiervorgang-Log -------------------------------------
-    init_copy_log "$(discinfo_get_label)" "data"    
+    local label
+    discinfo_get_field label label
+    init_copy_log "$label" "data"
     log_copying "$MSG_METHOD_DD"
 
     #-- Setze verwendete Kopiermethode --------------------------------------
     discinfo_set_copy_method "dd"
 
     #-- Lese aus DISC_INFO Array die benütigten Werte -----------------------
-    local iso_filename=$(discinfo_get_iso_filename)
-    local copy_log_filename=$(discinfo_get_log_filename)
-    local size_mb=$(discinfo_get_size_mb)
-    local volume_size=$(discinfo_get_size_sectors)
-    local block_size=$(discinfo_get_block_size)
+    local iso_filename copy_log_filename size_mb volume_size block_size
+    local estimated_size_mb drive
+    discinfo_get_field iso_filename iso_filename
+    discinfo_get_field copy_log_filename log_filename
+    discinfo_get_field size_mb size_mb 0
+    discinfo_get_field volume_size size_sectors 0
+    discinfo_get_field block_size block_size 2048
+    discinfo_get_field estimated_size_mb estimated_size_mb 0
+    drivestat_get_field drive drive
     local total_bytes=$((size_mb * 1024 * 1024))
 
     #-- Speicherplatz Prüfung (falls Größe bekannt) -------------------------    
@@ -215,17 +271,22 @@ common_copy_data_disc_dd() {
         #-- Logge erkannte Disc-Größe ---------------------------------------
         log_copying "$MSG_ISO_VOLUME_DETECTED $volume_size $MSG_ISO_BLOCKS_SIZE $block_size $MSG_ISO_BYTES (${size_mb} $MSG_PROGRESS_MB)"
         
-        #-- Prüfe Speicherplatz mit vorberechneter Größe (inkl. Overhead) ---
-        if ! systeminfo_check_disk_space "$(discinfo_get_estimated_size_mb)"; then
+        #-- Prüfe und reserviere Speicherplatz (inkl. Overhead, vorab -------
+        #-- allokiert, Freigabe in common_cleanup_disc_operation) -----------
+        if ! systeminfo_check_disk_space "$estimated_size_mb" "$iso_filename"; then
             return 1
         fi
     fi
     
+    local volume_bytes=$(( volume_size * block_size ))
+    
     #-- Starte dd im Hintergrund (mit oder ohne count-Parameter) ------------
+    #-- bs = Sektorgröße: conv=noerror,sync füllt bei Lesefehlern nur den ---
+    #-- defekten Sektor auf; notrunc erhält die vorab allokierten Blöcke ----
     if [[ $volume_size -gt 0 ]]; then
-        dd if="$(drivestat_get_drive)" of="$iso_filename" bs="$block_size" count="$volume_size" conv=noerror,sync status=progress 2>>"$copy_log_filename" &
+        dd if="$drive" of="$iso_filename" bs="$block_size" count="$volume_size" conv=noerror,sync,notrunc status=progress 2>>"$copy_log_filename" &
     else
-        dd if="$(drivestat_get_drive)" of="$iso_filename" bs="$block_size" conv=noerror,sync status=progress 2>>"$copy_log_filename" &
+        dd if="$drive" of="$iso_filename" bs="$block_size" conv=noerror,sync status=progress 2>>"$copy_log_filename" &
     fi
     local dd_pid=$!
     
@@ -238,6 +299,8 @@ common_copy_data_disc_dd() {
     
     #-- Prüfe Ergebnis ------------------------------------------------------
     if [[ $dd_exit -eq 0 ]]; then
+        #-- Exakte Volume-Größe (Reste eines vorherigen Versuchs kappen) ----
+        [[ $volume_size -gt 0 ]] && truncate -s "$volume_bytes" "$iso_filename" 2>/dev/null
         finish_copy_log
         return 0
     else
@@ -247,84 +310,398 @@ common_copy_data_disc_dd() {
 }
 
 
+# ============================================================================
+# KOMPRIMIERTE AUSGABE (SEEKABLE ZSTD)
+# ============================================================================
+# Das Image wird in Frames fester Größe (COMPRESSION_FRAME_MB) zerlegt, jeder
+# Frame ist ein eigenständiger zstd-Frame (Multi-Threaded komprimiert). Die
+# Frames werden hintereinander in <name>.iso.zst geschrieben - "zstd -dc"
+# liefert daher das vollständige ISO. Der Frame-Index <name>.idx erlaubt
+# wahlfreien Lesezugriff (nur betroffene Frames werden dekomprimiert):
+#
+#   # disk2iso seekable-zstd 1
+#   # frame_bytes=<Bytes pro Frame>
+#   <Offset unkomprimiert> <Offset komprimiert>      (eine Zeile pro Frame)
+#   # total_bytes=<Größe des unkomprimierten ISO>
+# ============================================================================
+
+# ===========================================================================
+# common_compression_enabled
+# ---------------------------------------------------------------------------
+# Funktion.: Prüft ob komprimierte Ausgabe konfiguriert und möglich ist
+# Parameter: keine
+# Rückgabe.: 0 = OUTPUT_COMPRESSION=zstd und zstd installiert, 1 = nein
+# ===========================================================================
+common_compression_enabled() {
+    [[ "${OUTPUT_COMPRESSION:-none}" == "zstd" ]] || return 1
+    command -v zstd >/dev/null 2>&1 && command -v split >/dev/null 2>&1
+}
+
+# ===========================================================================
+# _common_set_image_filename
+# ---------------------------------------------------------------------------
+# Funktion.: Setzt den Image-Dateinamen (DISC_INFO und Legacy-Globals) neu,
+# .........  z.B. beim Wechsel zwischen .iso und .iso.zst
+# Parameter: $1 = neuer Pfad
+# Rückgabe.: 0 = Erfolg
+# ===========================================================================
+_common_set_image_filename() {
+    local image_path="$1"
+
+    discinfo_set_iso_filename "$image_path"
+    discinfo_set_iso_basename "$(basename "$image_path")"
+    iso_filename="$image_path"
+    iso_basename="$(basename "$image_path")"
+    return 0
+}
+
+# ===========================================================================
+# _common_compress_frame
+# ---------------------------------------------------------------------------
+# Funktion.: Filter für "split --filter": komprimiert einen Frame (stdin)
+# .........  und hängt ihn samt Index-Eintrag an Image und Index an
+# Parameter: keine (Umgebung: FILE von split, COMPRESS_OUTPUT,
+# .........  COMPRESS_INDEX, COMPRESS_FRAME_BYTES, COMPRESS_LEVEL)
+# Rückgabe.: Exit-Code von zstd
+# Hinweis..: Läuft in einer eigenen Shell (export -f), split ruft die
+# .........  Frames strikt nacheinander auf
+# ===========================================================================
+_common_compress_frame() {
+    local frame_no=$(( 10#${FILE##*.} ))
+    local compressed_offset
+    compressed_offset=$(stat -c %s "$COMPRESS_OUTPUT") || return 1
+
+    zstd -q -c -T0 "-${COMPRESS_LEVEL}" >> "$COMPRESS_OUTPUT" || return 1
+    echo "$(( frame_no * COMPRESS_FRAME_BYTES )) ${compressed_offset}" >> "$COMPRESS_INDEX"
+}
+
+# ===========================================================================
+# common_copy_data_disc_zstd
+# ---------------------------------------------------------------------------
+# Funktion.: Kopiert Daten-Discs mit dd und komprimiert während des Lesens
+# .........  in Frames (seekable zstd, siehe Sektions-Kopf)
+# Parameter: keine (nutzt DISC_INFO Array)
+# Rückgabe.: 0 = Erfolg
+# .........  1 = Fehler (Speicherplatz, Kopier- oder Kompressionsfehler)
+# Extras...: Stellt den Dateinamen auf <name>.iso.zst um, schreibt den
+# .........  Frame-Index und erfasst Kompressionsrate und CPU-Zeit pro
+# .........  Disc-Typ (api/compression.json)
+# ===========================================================================
+common_copy_data_disc_zstd() {
+    #-- Initialisiere Kopiervorgang-Log -------------------------------------
+    local label
+    discinfo_get_field label label
+    init_copy_log "$label" "data"
+    log_copying "$MSG_METHOD_DD_ZSTD"
+
+    #-- Setze verwendete Kopiermethode --------------------------------------
+    discinfo_set_copy_method "dd+zstd"
+
+    #-- Zieldatei auf .iso.zst umstellen (leeren Namens-Platzhalter lösen) --
+    local image_filename
+    discinfo_get_field image_filename iso_filename
+    local plain_filename="$(get_image_stem "$image_filename").iso"
+    [[ -f "$plain_filename" ]] && [[ ! -s "$plain_filename" ]] && rm -f "$plain_filename"
+    _common_set_image_filename "${plain_filename}.zst"
+
+    #-- Lese aus DISC_INFO Array die benötigten Werte -----------------------
+    local temp_pathname copy_log_filename size_mb volume_size block_size
+    local estimated_size_mb drive disc_type
+    discinfo_get_field image_filename iso_filename
+    local index_filename="$(get_image_stem "$image_filename").idx"
+    discinfo_get_field temp_pathname temp_pathname
+    discinfo_get_field copy_log_filename log_filename
+    discinfo_get_field size_mb size_mb 0
+    discinfo_get_field volume_size size_sectors 0
+    discinfo_get_field block_size block_size 2048
+    discinfo_get_field estimated_size_mb estimated_size_mb 0
+    discinfo_get_field disc_type type
+    drivestat_get_field drive drive
+    local total_bytes=$((size_mb * 1024 * 1024))
+
+    #-- Frame-Größe und Level prüfen ----------------------------------------
+    local frame_mb="${COMPRESSION_FRAME_MB:-32}"
+    [[ "$frame_mb" =~ ^[1-9][0-9]*$ ]] || frame_mb=32
+    local level="${COMPRESSION_LEVEL:-3}"
+    [[ "$level" =~ ^[0-9]+$ ]] && [[ $level -ge 1 ]] && [[ $level -le 19 ]] || level=3
+    local frame_bytes=$(( frame_mb * 1024 * 1024 ))
+
+    #-- Image und Index anlegen ---------------------------------------------
+    : > "$image_filename" || return 1
+    printf '# disk2iso seekable-zstd 1\n# frame_bytes=%s\n' "$frame_bytes" > "$index_filename" || return 1
+
+    #-- Speicherplatz prüfen und reservieren (Schätzung berücksichtigt die --
+    #-- Kompressionsrate, Frames werden angehängt → Vorab-Allokation bleibt)
+    if [[ $size_mb -gt 0 ]]; then
+        log_copying "$MSG_ISO_VOLUME_DETECTED $volume_size $MSG_ISO_BLOCKS_SIZE $block_size $MSG_ISO_BYTES (${size_mb} $MSG_PROGRESS_MB)"
+        if ! systeminfo_check_disk_space "$estimated_size_mb" "$image_filename"; then
+            rm -f "$image_filename" "$index_filename"
+            return 1
+        fi
+    fi
+
+    #-- bs = Sektorgröße: Lesefehler füllen nur den defekten Sektor auf ----
+    local dd_opts=(if="$drive" bs="$block_size" conv=noerror,sync status=progress)
+    [[ $volume_size -gt 0 ]] && dd_opts+=(count="$volume_size")
+
+    #-- Arbeitsverzeichnis für Frames (wird beim Cleanup entfernt) ----------
+    if ! mkdir -p "$temp_pathname" 2>/dev/null; then
+        rm -f "$image_filename" "$index_filename"
+        return 1
+    fi
+
+    #-- dd → split (Frames) → zstd, CPU-Zeit der Kindprozesse festhalten ---
+    local cpu_file="${temp_pathname}/$(basename "$image_filename").cpu"
+    (
+        export COMPRESS_OUTPUT="$image_filename" COMPRESS_INDEX="$index_filename"
+        export COMPRESS_FRAME_BYTES="$frame_bytes" COMPRESS_LEVEL="$level"
+        export -f _common_compress_frame
+        dd "${dd_opts[@]}" 2>>"$copy_log_filename" | \
+            SHELL=/bin/bash split -b "$frame_bytes" -d -a 8 \
+                --filter=_common_compress_frame - "${temp_pathname}/frame." 2>>"$copy_log_filename"
+        pipe_status=("${PIPESTATUS[@]}")
+        times > "$cpu_file"
+        [[ ${pipe_status[0]} -eq 0 ]] && [[ ${pipe_status[1]} -eq 0 ]]
+    ) &
+    local copy_pid=$!
+
+    #-- Überwache Fortschritt (Frames × Frame-Größe) ------------------------
+    common_monitor_copy_progress "$copy_pid" "$total_bytes" "$image_filename" "$index_filename"
+
+    wait "$copy_pid"
+    local copy_exit=$?
+
+    if [[ $copy_exit -ne 0 ]]; then
+        log_error "$MSG_ERROR_ZSTD_COPY_FAILED"
+        rm -f "$image_filename" "$index_filename" "$cpu_file"
+        finish_copy_log
+        return 1
+    fi
+
+    #-- Index abschließen: unkomprimierte Größe aus dem letzten Frame -------
+    local last_offset last_compressed image_bytes raw_bytes
+    read -r last_offset last_compressed < <(grep -v '^#' "$index_filename" | tail -n 1)
+    image_bytes=$(stat -c %s "$image_filename")
+    raw_bytes=$(( ${last_offset:-0} + $(tail -c +$(( ${last_compressed:-0} + 1 )) "$image_filename" | zstd -dcq | wc -c) ))
+    echo "# total_bytes=${raw_bytes}" >> "$index_filename"
+
+    #-- Kompressionsrate und CPU-Kosten erfassen ----------------------------
+    local cpu_ms
+    cpu_ms=$(tail -n 1 "$cpu_file" 2>/dev/null | awk '{ t = 0; for (i = 1; i <= NF; i++) { split($i, p, /[ms]/); t += p[1] * 60 + p[2] } printf "%d", t * 1000 }')
+    rm -f "$cpu_file"
+    common_record_compression_stats "$disc_type" "$raw_bytes" "$image_bytes" "${cpu_ms:-0}"
+
+    log_copying "$MSG_INFO_ZSTD_RATIO $(( raw_bytes / 1048576 )) $MSG_PROGRESS_MB → $(( image_bytes / 1048576 )) $MSG_PROGRESS_MB ($(( raw_bytes > 0 ? image_bytes * 100 / raw_bytes : 0 ))%)"
+    finish_copy_log
+    return 0
+}
+
+# ===========================================================================
+# common_get_image_size
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert die unkomprimierte Größe eines Images
+# Parameter: $1 = Pfad zum Image (.iso oder .iso.zst)
+# Ausgabe..: Größe in Bytes (stdout)
+# Rückgabe.: 0 = Erfolg, 1 = Datei oder Index fehlt
+# ===========================================================================
+common_get_image_size() {
+    local image_path="$1"
+
+    if [[ "$image_path" == *.zst ]]; then
+        local total
+        total=$(sed -n 's/^# total_bytes=\([0-9]\+\)$/\1/p' "$(get_image_stem "$image_path").idx" 2>/dev/null)
+        [[ -n "$total" ]] || return 1
+        echo "$total"
+        return 0
+    fi
+
+    stat -c %s "$image_path" 2>/dev/null
+}
+
+# ===========================================================================
+# common_record_compression_stats
+# ---------------------------------------------------------------------------
+# Funktion.: Summiert Kompressionsrate und CPU-Kosten pro Disc-Typ in
+# .........  api/compression.json (.by_type.<typ>)
+# Parameter: $1 = Disc-Typ
+# .........  $2 = Bytes unkomprimiert
+# .........  $3 = Bytes komprimiert
+# .........  $4 = CPU-Zeit in Millisekunden (dd, split, zstd)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# ===========================================================================
+common_record_compression_stats() {
+    local disc_type="${1:-unknown}"
+    local input_bytes="$2"
+    local output_bytes="$3"
+    local cpu_ms="$4"
+
+    [[ "$input_bytes" =~ ^[0-9]+$ ]] && [[ $input_bytes -gt 0 ]] || return 1
+    [[ "$output_bytes" =~ ^[0-9]+$ ]] || return 1
+    [[ "$cpu_ms" =~ ^[0-9]+$ ]] || cpu_ms=0
+
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        local stats
+        stats=$(api_get_section_json "compression" ".by_type" "{}")
+        stats=$(jq --arg type "$disc_type" \
+            --argjson input "$input_bytes" --argjson output "$output_bytes" --argjson cpu "$cpu_ms" '
+            .[$type] = ((.[$type] // {discs: 0, input_bytes: 0, output_bytes: 0, cpu_ms: 0})
+                | .discs += 1 | .input_bytes += $input | .output_bytes += $output | .cpu_ms += $cpu
+                | .ratio = ((.output_bytes / .input_bytes * 1000 | floor) / 1000)
+                | .cpu_seconds_per_gb = ((.cpu_ms / (.input_bytes / 1073741824) / 100 | floor) / 10))' \
+            <<< "$stats") || exit 1
+        api_set_section_json "compression" ".by_type" "$stats"
+    ) 9>"$(folders_get_temp_dir)/.compression.lock"
+}
+
+# ===========================================================================
+# common_get_compression_ratio
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert die bisher gemessene Kompressionsrate eines Disc-Typs
+# Parameter: $1 = Disc-Typ
+# Ausgabe..: Rate in Promille (komprimiert / unkomprimiert × 1000, stdout)
+# Rückgabe.: 0 = Erfolg, 1 = weniger als 3 Messungen (keine Aussage)
+# ===========================================================================
+common_get_compression_ratio() {
+    local disc_type="$1"
+    local ratio
+
+    ratio=$(api_get_section_json "compression" ".by_type" "{}" 2>/dev/null | jq -r --arg type "$disc_type" \
+        '.[$type] | select(. != null and .discs >= 3) | (.output_bytes * 1000 / .input_bytes | ceil)' 2>/dev/null)
+    [[ "$ratio" =~ ^[0-9]+$ ]] || return 1
+
+    echo "$ratio"
+    return 0
+}
+
 # ============================================================================
 # FEHLER-TRACKING SYSTEM (für alle Disc-Typen)
 # ============================================================================
+# Pro Disc eine Datei in .failed_discs.d/ (Dateiname = Schlüssel aus Disc-Typ
+# und Identifier), eine TAB-separierte Zeile pro Fehlversuch:
+#   timestamp  type  identifier  method  bytes_recovered  duration_s  drive
+# Lookup = ein Dateizugriff, Update = eine angehängte Zeile (O_APPEND, atomar),
+# Löschen = rm. Die Kosten bleiben damit auch bei Tausenden Discs konstant.
+# Anzahl der Fehlversuche = Anzahl der Zeilen. Discs mit wiederholten
+# Fehlversuchen listet die Web-API (/api/failures).
+
+# Verzeichnis des Fehler-Trackings (Cache, einmal pro Prozess ermittelt)
+_COMMON_FAILED_DIR=""
+
+# ===========================================================================
+# _common_get_failure_file
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt die Fehler-Datei der aktuellen Disc
+# Parameter: $1 = Name der Zielvariable für den Dateipfad
+# .........  $2 = Name der Zielvariable für den Disc-Identifier (optional)
+# Rückgabe.: 0 = Erfolg, 1 = Verzeichnis nicht verfügbar / kein Identifier
+# Hinweis..: Schlüssel wie drivestat_get_calibration_key: Sonderzeichen
+# .........  werden durch '_' ersetzt, der exakte Identifier steht in jeder
+# .........  Zeile und wird beim Zählen verglichen
+# ===========================================================================
+_common_get_failure_file() {
+    local _identifier _disc_type _key
+
+    #-- Verzeichnis einmalig ermitteln (get_failed_disc_path forkt) ---------
+    if [[ -z "$_COMMON_FAILED_DIR" ]] || [[ ! -d "$_COMMON_FAILED_DIR" ]]; then
+        _COMMON_FAILED_DIR=$(get_failed_disc_path) || {
+            _COMMON_FAILED_DIR=""
+            return 1
+        }
+    fi
+
+    discinfo_get_field _identifier disc_identifier || return 1
+    discinfo_get_field _disc_type type unknown
+
+    _key="${_disc_type}__${_identifier}"
+    printf -v "$1" '%s/%s' "$_COMMON_FAILED_DIR" "${_key//[^A-Za-z0-9._-]/_}"
+    [[ -n "$2" ]] && printf -v "$2" '%s' "$_identifier"
+    return 0
+}
 
 # ===========================================================================
 # common_get_disc_failure_count
 # ---------------------------------------------------------------------------
 # Funktion.: Prüft ob Disc bereits fehlgeschlagen ist und gibt die Anzahl
 # .........  der bisherigen Fehlversuche zurück.
-# Parameter: $1 = Disc-Identifier (deprecaded, nutzt discinfo_get_identifier())
+# Parameter: $1 = Disc-Identifier (deprecaded, nutzt DISC_INFO)
 # Rückgabe.: Anzahl der Fehlversuche (0-N) via echo
 # .........  Return-Code: 0 = Erfolg (Anzahl ermittelt)
-# .........  ............ 1 = Fehler (Datei nicht verfügbar, Fallback auf 0)
-# Extras...: Nutzt INI-Format mit disc_type als Section ([data], [audio], etc.)
-# .........  Format: UUID:LABEL:SIZE_MB=timestamp|method|retry_count
+# .........  ............ 1 = Fehler (Verzeichnis nicht verfügbar, Fallback 0)
+# Extras...: Liest nur die Datei dieser Disc (siehe Sektions-Kopf)
 # ===========================================================================
 common_get_disc_failure_count() {
     #-- Debug-Log Eintrag ---------------------------------------------------
     log_debug "$MSG_DEBUG_FAILURE_COUNT_START"
 
-    #-- Pfad zur Ausgabes-Datei ermitteln -----------------------------------
-    local failed_file
-    failed_file=$(get_failed_disc_path) || {
+    #-- Fehler-Datei der Disc ermitteln -------------------------------------
+    local failed_file identifier
+    _common_get_failure_file failed_file identifier || {
         echo 0  # Fallback: Keine Fehler bekannt
         return 1
     }
 
-    #-- Alle notwendigen Werte ermitteln ------------------------------------
-    local identifier=$(discinfo_get_identifier)
-    local disc_type=$(discinfo_get_type)
-    
-    #-- Lese Wert aus INI (Format: timestamp|method|retry_count) ------------
-    local value=$(config_get_value_ini "failed_discs" "$disc_type" "$identifier")
-    
-    #-- Prüfe ob Eintrag vorhanden ist --------------------------------------
-    if [[ -n "$value" ]]; then
-        #-- Extrahiere retry_count (3. Feld) --------------------------------
-        echo "$value" | cut -d'|' -f3
-        return 0
-    else
-        #-- Kein Eintrag = Keine Fehler -------------------------------------
+    #-- Kein Eintrag = Keine Fehler -----------------------------------------
+    if [[ ! -f "$failed_file" ]]; then
         echo 0
         return 0
     fi
+
+    #-- Fehlversuche dieser Disc zählen (3. Feld = Identifier) --------------
+    local line fields count=0
+    local -a attempts
+    mapfile -t attempts < "$failed_file"
+    for line in "${attempts[@]}"; do
+        IFS=$'\t' read -r -a fields <<< "$line"
+        [[ "${fields[2]}" == "$identifier" ]] && (( count++ ))
+    done
+
+    echo "$count"
+    return 0
 }
 
 # ===========================================================================
 # common_register_disc_failure
 # ---------------------------------------------------------------------------
-# Funktion.: Registriert einen Disc-Fehlschlag im INI-basierten Error-
-# .........  Tracking-System und inkrementiert automatisch den retry_count.
-# Parameter: $1 = Disc-Identifier (deprecaded, nutzt discinfo_get_identifier())
+# Funktion.: Registriert einen Fehlversuch der aktuellen Disc im Error-
+# .........  Tracking-System (eine Zeile pro Versuch)
+# Parameter: $1 = Dauer des Versuchs in Sekunden (optional, Standard: 0)
 # Rückgabe.: 0 = Erfolg (Fehler registriert)
-# .........  1 = Fehler (Datei nicht verfügbar)
-# Extras...: Format: UUID:LABEL:SIZE_MB=timestamp|method|retry_count
-# .........  Methode wird aus DISC_INFO[copy_method] gelesen
-# .........  Nutzt INI-Format mit disc_type als Section 
+# .........  1 = Fehler (Verzeichnis nicht verfügbar)
+# Extras...: Methode aus DISC_INFO[copy_method], gerettete Bytes = Größe
+# .........  der (unvollständigen) Image-Datei, Laufwerk = Instanz bzw.
+# .........  Device-Name
 # ===========================================================================
 common_register_disc_failure() {
+    local duration="${1:-0}"
+    [[ "$duration" =~ ^[0-9]+$ ]] || duration=0
+
     #-- Debug-Log Eintrag ---------------------------------------------------
     log_debug "$MSG_DEBUG_REGISTER_FAILURE_START"
 
-    #-- Pfad zur Ausgabes-Datei ermitteln -----------------------------------
-    local failed_file=$(get_failed_disc_path) || return 1
+    #-- Fehler-Datei der Disc ermitteln -------------------------------------
+    local failed_file identifier
+    _common_get_failure_file failed_file identifier || return 1
 
     #-- Alle notwendigen Werte ermitteln ------------------------------------
-    local identifier=$(discinfo_get_identifier)
-    local method=$(discinfo_get_copy_method)
-    local disc_type=$(discinfo_get_type)
-    local timestamp=$(date '+%Y-%m-%d %H:%M:%S')
-    
-    #-- Lese aktuellen retry_count und inkrementiere ------------------------
+    local method disc_type iso_filename drive timestamp
+    discinfo_get_field method copy_method unknown
+    discinfo_get_field disc_type type unknown
+    discinfo_get_field iso_filename iso_filename
+    drivestat_get_field drive drive
+    printf -v timestamp '%(%Y-%m-%d %H:%M:%S)T' -1
+
+    local bytes=0
+    [[ -f "$iso_filename" ]] && bytes=$(stat -c %s "$iso_filename" 2>/dev/null)
+
+    #-- Versuch anhängen (einzelner write mit O_APPEND ist atomar) ----------
+    printf '%s\t%s\t%s\t%s\t%s\t%s\t%s\n' "$timestamp" "$disc_type" "$identifier" \
+        "$method" "${bytes:-0}" "$duration" "${DRIVESTAT_INSTANCE:-${drive##*/}}" \
+        >> "$failed_file" || return 1
+
     local retry_count=$(common_get_disc_failure_count)
-    retry_count=$((retry_count + 1))
-    
-    #-- Schreibe/Aktualisiere Eintrag: timestamp|method|retry_count ---------
-    config_set_value_ini "failed_discs" "$disc_type" "$identifier" "${timestamp}|${method}|${retry_count}"
     log_warning "$MSG_WARNING_DISC_FAILURE_REGISTERED $identifier ($method, Versuch #${retry_count})"
+    return 0
 }
 
 # ===========================================================================
@@ -333,28 +710,21 @@ common_register_disc_failure() {
 # Funktion.: Entfernt Disc-Fehlschlag aus dem Error-Tracking-System nach
 # .........  erfolgreichem Kopieren.
 # Parameter: keine (nutzt DISC_INFO Array)
-# Rückgabe.: 0 = Erfolg (Eintrag gelüscht oder nicht vorhanden)
-# .........  1 = Fehler (Datei nicht verfügbar)
-# Extras...: Loggt nur wenn tatsüchlich ein Eintrag gelüscht wurde
-# .........  Nutzt get_ini_value zur Existenzprüfung vor dem löschen
+# Rückgabe.: 0 = Erfolg (Eintrag gelöscht oder nicht vorhanden)
+# .........  1 = Fehler (Verzeichnis nicht verfügbar)
+# Extras...: Loggt nur wenn tatsächlich ein Eintrag gelöscht wurde
 # ===========================================================================
 common_clear_disc_failures() {
     #-- Debug-Log Eintrag ---------------------------------------------------
     log_debug "$MSG_DEBUG_CLEAR_FAILURES_START"
 
-    #-- Pfad zur Ausgabes-Datei ermitteln -----------------------------------
-    local failed_file=$(get_failed_disc_path) || return 1
+    #-- Fehler-Datei der Disc ermitteln -------------------------------------
+    local failed_file identifier
+    _common_get_failure_file failed_file identifier || return 1
 
-    #-- Alle notwendigen Werte ermitteln ------------------------------------
-    local identifier=$(discinfo_get_identifier)
-    local disc_type=$(discinfo_get_type)
-    
-    #-- Prüfe ob Eintrag existiert ------------------------------------------
-    local value=$(config_get_value_ini "failed_discs" "$disc_type" "$identifier")
-    
-    if [[ -n "$value" ]]; then
-        #-- Lüsche existierenden Eintrag ------------------------------------
-        config_del_value_ini "failed_discs" "$disc_type" "$identifier"
+    if [[ -f "$failed_file" ]]; then
+        #-- Lösche existierenden Eintrag ------------------------------------
+        rm -f "$failed_file"
         log_info "$MSG_INFO_FAILURE_HISTORY_CLEARED $identifier"
         return 0
     else
@@ -364,6 +734,745 @@ common_clear_disc_failures() {
     fi
 }
 
+# ============================================================================
+# ARCHIV-REGISTER (BEREITS ARCHIVIERTE DISCS)
+# ============================================================================
+# Nach jeder erfolgreichen Nachbearbeitung wird die Disc mit Identifier
+# (UUID:LABEL:SIZE_MB), Fingerabdruck der Volume Descriptors, Größe, Pfad
+# und MD5 registriert. Direkt nach der Analyse prüft der Service, ob die
+# eingelegte Disc bereits archiviert ist, und entscheidet gemäß
+# ARCHIVED_DISC_ACTION:
+#   skip   = nicht erneut kopieren, Disc sofort auswerfen
+#   verify = Disc nur lesen und gegen die MD5 des Archivs prüfen,
+#            bei Abweichung neu kopieren
+#   recopy = immer neu kopieren
+# Der Treffer wird in api/discinfos.json (.archived) gemeldet.
+
+# ===========================================================================
+# common_registry_add_disc
+# ---------------------------------------------------------------------------
+# Funktion.: Trägt eine archivierte Disc ins Archiv-Register ein (ersetzt
+# .........  einen vorhandenen Eintrag derselben Disc)
+# Parameter: $1 = Disc-Identifier
+# .........  $2 = Fingerabdruck der Volume Descriptors (optional)
+# .........  $3 = Größe in Sektoren
+# .........  $4 = Disc-Typ
+# .........  $5 = Kopiermethode
+# .........  $6 = MD5 der Image-Datei
+# .........  $7 = Pfad der Image-Datei im Archiv
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# ===========================================================================
+common_registry_add_disc() {
+    local identifier="$1"
+    local vd_hash="$2"
+    local size_sectors="${3:-0}"
+    local disc_type="$4"
+    local method="$5"
+    local md5="$6"
+    local iso_path="$7"
+
+    [[ -n "$identifier" ]] && [[ -n "$iso_path" ]] || return 1
+
+    local registry_file
+    registry_file=$(get_archive_registry_path) || return 1
+
+    #-- Eintrag ersetzen: alte Zeile derselben Disc entfernen, neue anhängen
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        awk -F'\t' -v id="$identifier" -v hash="$vd_hash" \
+            '/^#/ || !($1 == id && $2 == hash)' "$registry_file" > "${registry_file}.tmp" || exit 1
+        printf '%s\t%s\t%s\t%s\t%s\t%s\t%s\t%s\n' "$identifier" "$vd_hash" "$size_sectors" \
+            "$disc_type" "$method" "$md5" "$(date '+%Y-%m-%dT%H:%M:%S')" "$iso_path" >> "${registry_file}.tmp"
+        mv -f "${registry_file}.tmp" "$registry_file"
+    ) 9>"${registry_file}.lock"
+}
+
+# ===========================================================================
+# common_registry_lookup_disc
+# ---------------------------------------------------------------------------
+# Funktion.: Sucht die eingelegte Disc im Archiv-Register
+# Parameter: keine (nutzt DISC_INFO und Fingerabdruck aus DISC_PROBE)
+# Ausgabe..: Register-Zeile (TAB-separiert, stdout)
+# Rückgabe.: 0 = Disc archiviert (Image vorhanden), 1 = nicht archiviert
+# Extras...: Identifier und Größe müssen übereinstimmen, der Fingerabdruck
+# .........  sofern auf beiden Seiten vorhanden. Einträge deren Image nicht
+# .........  mehr existiert werden ignoriert.
+# ===========================================================================
+common_registry_lookup_disc() {
+    local registry_file
+    registry_file=$(get_archive_registry_path) || return 1
+
+    local identifier size_sectors vd_hash
+    discinfo_get_field identifier disc_identifier
+    discinfo_get_field size_sectors size_sectors 0
+    discinfo_get_field vd_hash vd_hash
+    [[ -n "$identifier" ]] || return 1
+
+    local entry
+    entry=$(awk -F'\t' -v id="$identifier" -v size="$size_sectors" -v hash="$vd_hash" '
+        /^#/ { next }
+        $1 == id && $3 == size && ($2 == hash || $2 == "" || hash == "") { match_line = $0 }
+        END { if (match_line != "") print match_line }' "$registry_file" 2>/dev/null)
+    [[ -n "$entry" ]] || return 1
+
+    #-- Image muss noch im Archiv liegen ------------------------------------
+    local iso_path="${entry##*$'\t'}"
+    if [[ ! -f "$iso_path" ]]; then
+        log_debug "$MSG_DEBUG_ARCHIVED_DISC_STALE $iso_path"
+        return 1
+    fi
+
+    echo "$entry"
+    return 0
+}
+
+# ===========================================================================
+# common_verify_archived_disc
+# ---------------------------------------------------------------------------
+# Funktion.: Liest die eingelegte Disc und vergleicht sie mit dem Image im
+# .........  Archiv (ohne zu schreiben)
+# Parameter: $1 = Pfad der Image-Datei (.iso oder .iso.zst)
+# .........  $2 = MD5 aus dem Register
+# .........  $3 = Kopiermethode aus dem Register
+# Rückgabe.: 0 = identisch, 1 = Abweichung, 2 = nicht prüfbar
+# Extras...: Nur für 1:1-Kopien (dd, ddrescue) möglich. Bei komprimierten
+# .........  Images wird das Archiv parallel zum Lesen der Disc entpackt.
+# ===========================================================================
+common_verify_archived_disc() {
+    local iso_path="$1"
+    local registry_md5="$2"
+    local method="$3"
+
+    case "$method" in
+        dd|ddrescue|dd+zstd) ;;
+        *) return 2 ;;
+    esac
+
+    local size_sectors block_size drive
+    discinfo_get_field size_sectors size_sectors 0
+    discinfo_get_field block_size block_size 2048
+    drivestat_get_field drive drive
+    [[ "$size_sectors" =~ ^[0-9]+$ ]] && [[ $size_sectors -gt 0 ]] || return 2
+
+    #-- Referenz: unkomprimiert = MD5 aus dem Register, sonst entpacken -----
+    local archive_md5_file="$(folders_get_temp_dir)/.verify.${BASHPID}.md5"
+    local archive_pid=""
+    if [[ "$iso_path" == *.zst ]]; then
+        command -v zstd >/dev/null 2>&1 || return 2
+        ( zstd -dcq "$iso_path" 2>/dev/null | md5sum > "$archive_md5_file" ) &
+        archive_pid=$!
+    else
+        echo "$registry_md5" > "$archive_md5_file"
+    fi
+
+    #-- Disc lesen (kalibrierte Request-Größe) ------------------------------
+    local request_size=$(drivestat_get_request_size "$block_size")
+    local volume_bytes=$(( size_sectors * block_size ))
+    local disc_md5
+    disc_md5=$(dd if="$drive" bs="$request_size" \
+        count="$(( (volume_bytes + request_size - 1) / request_size ))" iflag=fullblock status=none 2>/dev/null \
+        | head -c "$volume_bytes" | md5sum)
+
+    [[ -n "$archive_pid" ]] && wait "$archive_pid"
+    local archive_md5=$(< "$archive_md5_file")
+    rm -f "$archive_md5_file"
+
+    [[ "${disc_md5%% *}" == "${archive_md5%% *}" ]] && [[ -n "${archive_md5%% *}" ]]
+}
+
+# ===========================================================================
+# common_check_archived_disc
+# ---------------------------------------------------------------------------
+# Funktion.: Prüft nach der Analyse ob die Disc bereits archiviert ist und
+# .........  wendet ARCHIVED_DISC_ACTION an (skip, verify, recopy)
+# Parameter: keine (nutzt DISC_INFO)
+# Rückgabe.: 0 = Disc erledigt (nicht kopieren)
+# .........  1 = Disc kopieren (nicht archiviert, recopy oder Abweichung)
+# Extras...: Meldet Treffer und Ergebnis in api/discinfos.json (.archived)
+# ===========================================================================
+common_check_archived_disc() {
+    local entry
+    if ! entry=$(common_registry_lookup_disc); then
+        api_set_section_json "discinfos" ".archived" "null"
+        return 1
+    fi
+
+    local identifier vd_hash size_sectors disc_type method md5 archived_at iso_path
+    IFS=$'\t' read -r identifier vd_hash size_sectors disc_type method md5 archived_at iso_path <<< "$entry"
+
+    local action="${ARCHIVED_DISC_ACTION:-skip}"
+    local result
+    log_info "$MSG_INFO_ARCHIVED_DISC_FOUND $(basename "$iso_path") ($archived_at)"
+
+    case "$action" in
+        recopy)
+            result="recopy"
+            ;;
+        verify)
+            log_info "$MSG_INFO_ARCHIVED_DISC_VERIFY $(basename "$iso_path")"
+            common_verify_archived_disc "$iso_path" "$md5" "$method"
+            case $? in
+                0)  result="verified"
+                    log_info "$MSG_INFO_ARCHIVED_DISC_VERIFIED $(basename "$iso_path")" ;;
+                2)  result="skipped"
+                    log_warning "$MSG_WARNING_ARCHIVED_VERIFY_UNSUPPORTED $method" ;;
+                *)  result="mismatch"
+                    log_warning "$MSG_WARNING_ARCHIVED_DISC_MISMATCH $(basename "$iso_path")" ;;
+            esac
+            ;;
+        *)
+            action="skip"
+            result="skipped"
+            log_info "$MSG_INFO_ARCHIVED_DISC_SKIPPED $(basename "$iso_path")"
+            ;;
+    esac
+
+    #-- Treffer und Ergebnis in der API melden ------------------------------
+    local report
+    report=$(jq -n --arg iso "$iso_path" --arg md5 "$md5" --arg archived "$archived_at" \
+        --arg method "$method" --arg action "$action" --arg result "$result" \
+        '{iso: $iso, md5: $md5, archived_at: $archived, method: $method,
+          action: $action, result: $result, offered: ["skip", "verify", "recopy"]}')
+    api_set_section_json "discinfos" ".archived" "$report"
+
+    case "$result" in
+        skipped|verified)
+            local label disc_type
+            discinfo_get_field label label
+            discinfo_get_field disc_type type
+            api_add_history "completed" "$label" "$disc_type" "$result"
+            return 0
+            ;;
+    esac
+    return 1
+}
+
+# ============================================================================
+# SCHREIB-SLOTS (Multi-Drive: Begrenzung paralleler Kopiervorgänge)
+# ============================================================================
+
+# File-Descriptor des belegten Schreib-Slots (leer = kein Slot belegt)
+_COMMON_WRITE_SLOT_FD=""
+
+# ===========================================================================
+# common_acquire_write_slot
+# ---------------------------------------------------------------------------
+# Funktion.: Belegt einen von MAX_CONCURRENT_WRITES Schreib-Slots, damit
+# .........  mehrere Laufwerke die Ziel-Disk nicht gleichzeitig überlasten.
+# .........  Blockiert bis ein Slot frei wird.
+# Parameter: keine
+# Rückgabe.: 0 = Slot belegt (oder Single-Drive-Betrieb, kein Slot nötig)
+# .........  1 = Fehler (Temp-Verzeichnis oder Slot-Dateien nicht verfügbar)
+# Extras...: Slots sind Lock-Dateien im Temp-Verzeichnis (flock), werden
+# .........  vom Kernel freigegeben falls der Prozess abstürzt
+# ===========================================================================
+common_acquire_write_slot() {
+    #-- Single-Drive-Betrieb: keine Begrenzung nötig ------------------------
+    [[ -z "${DRIVESTAT_INSTANCE:-}" ]] && return 0
+    [[ -n "$_COMMON_WRITE_SLOT_FD" ]] && return 0
+
+    local max_slots="${MAX_CONCURRENT_WRITES:-2}"
+    [[ "$max_slots" =~ ^[1-9][0-9]*$ ]] || max_slots=2
+
+    local temp_dir
+    temp_dir=$(folders_get_temp_dir) || return 1
+
+    #-- Freien Slot suchen (non-blocking), sonst warten ---------------------
+    local slot fd opened waiting=false
+    while true; do
+        opened=0
+        for ((slot = 1; slot <= max_slots; slot++)); do
+            { exec {fd}>>"${temp_dir}/.write_slot.${slot}"; } 2>/dev/null || continue
+            opened=$(( opened + 1 ))
+            if flock -n "$fd"; then
+                _COMMON_WRITE_SLOT_FD="$fd"
+                log_debug "$MSG_DEBUG_WRITE_SLOT_ACQUIRED ${slot}/${max_slots}"
+                return 0
+            fi
+            exec {fd}>&-
+        done
+
+        #-- Keine Slot-Datei anlegbar: Warten wäre endlos -------------------
+        (( opened > 0 )) || return 1
+
+        if [[ "$waiting" == "false" ]]; then
+            log_info "$MSG_INFO_WAITING_FOR_WRITE_SLOT (max. ${max_slots})"
+            waiting=true
+        fi
+        sleep 5
+    done
+}
+
+# ===========================================================================
+# common_release_write_slot
+# ---------------------------------------------------------------------------
+# Funktion.: Gibt den mit common_acquire_write_slot() belegten Slot frei
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg (auch wenn kein Slot belegt war)
+# ===========================================================================
+common_release_write_slot() {
+    [[ -z "$_COMMON_WRITE_SLOT_FD" ]] && return 0
+
+    flock -u "$_COMMON_WRITE_SLOT_FD" 2>/dev/null
+    exec {_COMMON_WRITE_SLOT_FD}>&-
+    _COMMON_WRITE_SLOT_FD=""
+    log_debug "$MSG_DEBUG_WRITE_SLOT_RELEASED"
+    return 0
+}
+
+# ============================================================================
+# NACHBEARBEITUNG (POST-PROCESSING-QUEUE)
+# ============================================================================
+# Nach dem reinen Lesevorgang wird die Disc sofort ausgeworfen. Verifikation,
+# MD5-Checksumme, Metadaten (.nfo) und ggf. die Migration aus dem Staging ins
+# Archiv laufen entkoppelt in Hintergrund-Workern. Jobs liegen als Dateien im
+# Spool-Verzeichnis (.temp/postprocess/):
+#   queue/   → wartende Jobs (Zustellung per atomarem mv)
+#   running/ → in Bearbeitung (ein mv pro Worker, dadurch keine Doppelung)
+#   failed/  → fehlgeschlagene Jobs (zur manuellen Prüfung)
+
+# PIDs der laufenden Nachbearbeitungs-Worker
+_COMMON_POSTPROCESS_PIDS=()
+
+# ===========================================================================
+# common_get_postprocess_dir
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert das Spool-Verzeichnis der Nachbearbeitung und legt die
+# .........  Unterordner queue/running/failed bei Bedarf an
+# Parameter: keine
+# Ausgabe..: Pfad zum Spool-Verzeichnis (stdout)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler (Temp-Verzeichnis nicht verfügbar)
+# ===========================================================================
+common_get_postprocess_dir() {
+    local temp_dir
+    temp_dir=$(folders_get_temp_dir) || return 1
+
+    local spool_dir="${temp_dir}/postprocess"
+    mkdir -p "${spool_dir}/queue" "${spool_dir}/running" "${spool_dir}/failed" 2>/dev/null || return 1
+    echo "$spool_dir"
+    return 0
+}
+
+# ===========================================================================
+# common_enqueue_postprocess
+# ---------------------------------------------------------------------------
+# Funktion.: Legt für das gerade kopierte ISO einen Nachbearbeitungs-Job an
+# Parameter: keine (nutzt DISC_INFO Array)
+# Rückgabe.: 0 = Job angelegt, 1 = Fehler
+# Extras...: Muss vor common_cleanup_disc_operation() aufgerufen werden,
+# .........  da danach DISC_INFO zurückgesetzt ist
+# ===========================================================================
+common_enqueue_postprocess() {
+    local spool_dir
+    spool_dir=$(common_get_postprocess_dir) || return 1
+
+    local iso_filename
+    discinfo_get_field iso_filename iso_filename
+    [[ -n "$iso_filename" ]] && [[ -f "$iso_filename" ]] || return 1
+
+    #-- Erwartete Größe (Sektoren × Blockgröße), 0 = unbekannt --------------
+    local size_sectors block_size drive
+    discinfo_get_field size_sectors size_sectors 0
+    discinfo_get_field block_size block_size 2048
+    drivestat_get_field drive drive
+    local expected_bytes=0
+    [[ "$size_sectors" =~ ^[0-9]+$ ]] && [[ "$block_size" =~ ^[0-9]+$ ]] && expected_bytes=$(( size_sectors * block_size ))
+
+    #-- Übrige Disc-Werte für die Job-Datei ---------------------------------
+    local md5_filename label disc_type method disc_id created_at identifier vd_hash
+    discinfo_get_field md5_filename md5_filename
+    discinfo_get_field label label
+    discinfo_get_field disc_type type
+    discinfo_get_field method copy_method
+    discinfo_get_field disc_id disc_id
+    discinfo_get_field created_at created_at
+    discinfo_get_field identifier disc_identifier
+    discinfo_get_field vd_hash vd_hash
+
+    #-- Job-Datei schreiben (erst .tmp, dann atomar in die Queue) -----------
+    local job_id="$(date +%s)_${BASHPID}"
+    local job_tmp="${spool_dir}/${job_id}.tmp"
+    {
+        echo "id=${job_id}"
+        echo "iso_filename=${iso_filename}"
+        echo "md5_filename=${md5_filename}"
+        echo "label=${label}"
+        echo "type=${disc_type}"
+        echo "method=${method}"
+        echo "disc_id=${disc_id}"
+        echo "created_at=${created_at}"
+        echo "expected_bytes=${expected_bytes}"
+        echo "size_sectors=${size_sectors}"
+        echo "identifier=${identifier}"
+        echo "vd_hash=${vd_hash}"
+        echo "final_filename=$(get_archive_path "$iso_filename")"
+        echo "retries=0"
+        echo "retry_at=0"
+        echo "drive=${DRIVESTAT_INSTANCE:-${drive##*/}}"
+        echo "enqueued=$(date '+%Y-%m-%dT%H:%M:%S')"
+    } > "$job_tmp" 2>/dev/null || return 1
+    mv -f "$job_tmp" "${spool_dir}/queue/${job_id}.job" || return 1
+
+    _common_postprocess_set_status "$job_id" "queued" "$(basename "$iso_filename")"
+    log_info "$MSG_INFO_POSTPROCESS_QUEUED $(basename "$iso_filename")"
+    return 0
+}
+
+# ===========================================================================
+# _common_postprocess_set_status
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt den Status eines Jobs nach api/postprocess.json
+# Parameter: $1 = Job-ID
+# .........  $2 = Status (queued, running, done, failed)
+# .........  $3 = ISO-Dateiname
+# .........  $4 = Meldung (optional)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Hinweis..: Mehrere Worker schreiben dieselbe Datei → flock (falls vorhanden),
+# .........  es werden nur die letzten 50 Jobs behalten
+# ===========================================================================
+_common_postprocess_set_status() {
+    local job_id="$1"
+    local status="$2"
+    local iso_name="$3"
+    local message="${4:-}"
+
+    local entry
+    entry=$(jq -n --arg status "$status" --arg iso "$iso_name" --arg msg "$message" \
+        --arg updated "$(date '+%Y-%m-%dT%H:%M:%S')" \
+        '{status: $status, iso: $iso, message: $msg, updated: $updated}') || return 1
+
+    local spool_dir
+    spool_dir=$(common_get_postprocess_dir) || return 1
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        local jobs
+        jobs=$(api_get_section_json "postprocess" ".jobs" "{}")
+        jobs=$(jq --arg id "$job_id" --argjson entry "$entry" \
+            '.[$id] = $entry | to_entries | sort_by(.value.updated) | .[-50:] | from_entries' <<< "$jobs") || exit 1
+        api_set_section_json "postprocess" ".jobs" "$jobs"
+    ) 9>"${spool_dir}/.status.lock"
+}
+
+# ===========================================================================
+# common_run_postprocess_job
+# ---------------------------------------------------------------------------
+# Funktion.: Führt einen Nachbearbeitungs-Job aus: Größe verifizieren,
+# .........  MD5-Checksumme erstellen, Metadaten (.nfo) schreiben bzw.
+# .........  eine vorhandene .nfo um fehlende Schlüssel ergänzen,
+# .........  Berechtigungen setzen, ggf. aus dem Staging ins Archiv
+# .........  migrieren, im Archiv-Register eintragen und History-Eintrag
+# .........  anlegen
+# Parameter: $1 = Pfad zur Job-Datei (bereits nach running/ verschoben)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# .........  2 = Migration fehlgeschlagen (später erneut versuchen)
+# ===========================================================================
+common_run_postprocess_job() {
+    local job_file="$1"
+    local -A job=()
+    local key value
+
+    #-- Job-Datei einlesen (key=value) --------------------------------------
+    while IFS='=' read -r key value; do
+        [[ -n "$key" ]] && job[$key]="$value"
+    done < "$job_file"
+
+    local iso_filename="${job[iso_filename]}"
+    local iso_name="$(basename "$iso_filename")"
+    _common_postprocess_set_status "${job[id]}" "running" "$iso_name"
+
+    local image_stem="$(get_image_stem "$iso_filename")"
+
+    #-- 1. Verifikation: ISO vorhanden und vollständig ----------------------
+    #--    (komprimierte Images: unkomprimierte Größe aus dem Frame-Index) --
+    local actual_bytes
+    actual_bytes=$(common_get_image_size "$iso_filename") || {
+        _common_postprocess_set_status "${job[id]}" "failed" "$iso_name" "$MSG_ERROR_POSTPROCESS_ISO_MISSING"
+        log_error "$MSG_ERROR_POSTPROCESS_ISO_MISSING $iso_filename"
+        return 1
+    }
+    if [[ ${job[expected_bytes]:-0} -gt 0 ]] && [[ $actual_bytes -lt ${job[expected_bytes]} ]]; then
+        _common_postprocess_set_status "${job[id]}" "failed" "$iso_name" "$MSG_ERROR_POSTPROCESS_SIZE_MISMATCH"
+        log_error "$MSG_ERROR_POSTPROCESS_SIZE_MISMATCH $iso_name (${actual_bytes}/${job[expected_bytes]})"
+        api_add_history "error" "${job[label]}" "${job[type]}" "error" "$MSG_ERROR_POSTPROCESS_SIZE_MISMATCH" "$actual_bytes"
+        return 1
+    fi
+
+    #-- 2. MD5-Checksumme (Format kompatibel zu "md5sum -c") ----------------
+    local md5_filename="${job[md5_filename]:-${image_stem}.md5}"
+    local md5
+    md5=$(md5sum "$iso_filename" 2>/dev/null | cut -d' ' -f1)
+    if [[ -z "$md5" ]]; then
+        _common_postprocess_set_status "${job[id]}" "failed" "$iso_name" "$MSG_ERROR_POSTPROCESS_MD5_FAILED"
+        log_error "$MSG_ERROR_POSTPROCESS_MD5_FAILED $iso_name"
+        return 1
+    fi
+    echo "${md5}  ${iso_name}" > "$md5_filename"
+
+    #-- 3. Metadaten neben dem ISO ablegen (.nfo, vom Web-Archiv gelesen) ---
+    #--    Vorhandene .nfo (Audio-/DVD-/Blu-ray-Module) bleibt erhalten, ----
+    #--    ergänzt werden nur fehlende Schlüssel ------------------------------
+    local nfo_file="${image_stem}.nfo"
+    local -A nfo_keys=()
+    local -a nfo_lines=(
+        "TITLE=${job[label]}"
+        "TYPE=${job[type]}"
+        "DISC_ID=${job[disc_id]}"
+        "CREATED=${job[created_at]}"
+        "ARCHIVED=${job[enqueued]}"
+        "METHOD=${job[method]}"
+        "DRIVE=${job[drive]}"
+        "SIZE=${actual_bytes}"
+        "MD5=${md5}"
+    )
+    [[ "$iso_filename" == *.zst ]] && nfo_lines+=("COMPRESSED_SIZE=$(stat -c %s "$iso_filename" 2>/dev/null)")
+    if [[ -s "$nfo_file" ]]; then
+        while IFS='=' read -r key value; do
+            [[ -n "$key" ]] && nfo_keys[$key]=1
+        done < "$nfo_file"
+        #-- Letzte Zeile ohne Zeilenumbruch nicht mit neuer Zeile verbinden
+        [[ -n "$(tail -c 1 "$nfo_file")" ]] && echo >> "$nfo_file"
+    fi
+    local nfo_line
+    for nfo_line in "${nfo_lines[@]}"; do
+        [[ -n "${nfo_keys[${nfo_line%%=*}]:-}" ]] || printf '%s\n' "$nfo_line"
+    done >> "$nfo_file"
+
+    #-- 4. Finale Ablage: Berechtigungen für Archiv-Zugriff -----------------
+    chmod 644 "$iso_filename" "$md5_filename" "$nfo_file" "${image_stem}.idx" 2>/dev/null
+
+    #-- 5. Staging: ins Archiv migrieren (Bandbreiten-Limit, MD5-geprüft) --
+    if [[ -n "${job[final_filename]}" ]]; then
+        _common_postprocess_set_status "${job[id]}" "migrating" "$iso_name"
+        if ! common_migrate_to_archive "$iso_filename" "${job[final_filename]}" "$md5"; then
+            _common_postprocess_set_status "${job[id]}" "staged" "$iso_name" "$MSG_WARNING_MIGRATION_RETRY"
+            return 2
+        fi
+    fi
+
+    #-- 6. Im Archiv-Register eintragen (Erkennung bei erneutem Einlegen) ---
+    common_registry_add_disc "${job[identifier]}" "${job[vd_hash]}" "${job[size_sectors]}" \
+        "${job[type]}" "${job[method]}" "$md5" "${job[final_filename]:-$iso_filename}"
+
+    _common_postprocess_set_status "${job[id]}" "done" "$iso_name"
+    api_add_history "completed" "${job[label]}" "${job[type]}" "success" "" "$actual_bytes"
+    log_info "$MSG_INFO_POSTPROCESS_DONE $iso_name"
+    return 0
+}
+
+# ===========================================================================
+# _common_postprocess_worker
+# ---------------------------------------------------------------------------
+# Funktion.: Hintergrund-Worker: übernimmt Jobs aus queue/ (ältester zuerst)
+# .........  und führt sie aus. Läuft bis er beendet wird.
+# Parameter: keine
+# Rückgabe.: keine (Endlosschleife)
+# ===========================================================================
+_common_postprocess_worker() {
+    local spool_dir job_file job_name
+
+    while true; do
+        spool_dir=$(common_get_postprocess_dir) || { sleep 30; continue; }
+
+        #-- Ältesten Job übernehmen (mv ist atomar → genau ein Worker) ------
+        #-- Jobs mit Wartezeit (retry_at) nach Migrationsfehler überspringen
+        job_file=""
+        local now=$(date +%s) retry_at
+        for job_name in $(ls -1 "${spool_dir}/queue" 2>/dev/null | sort); do
+            retry_at=$(grep -m1 '^retry_at=' "${spool_dir}/queue/${job_name}" 2>/dev/null | cut -d'=' -f2)
+            [[ ${retry_at:-0} -gt $now ]] && continue
+            if mv "${spool_dir}/queue/${job_name}" "${spool_dir}/running/${job_name}" 2>/dev/null; then
+                job_file="${spool_dir}/running/${job_name}"
+                break
+            fi
+        done
+
+        if [[ -z "$job_file" ]]; then
+            sleep 5
+            continue
+        fi
+
+        common_run_postprocess_job "$job_file"
+        case $? in
+            0)  rm -f "$job_file" ;;
+            2)  _common_postprocess_retry "$job_file" "$spool_dir" ;;
+            *)  mv -f "$job_file" "${spool_dir}/failed/" 2>/dev/null ;;
+        esac
+    done
+}
+
+# ===========================================================================
+# _common_postprocess_retry
+# ---------------------------------------------------------------------------
+# Funktion.: Reiht einen Job nach Migrationsfehler mit wachsender Wartezeit
+# .........  (1, 2, 4 ... max. 60 Minuten) erneut ein. Nach MIGRATION_RETRIES
+# .........  Versuchen landet der Job in failed/, das Image bleibt im Staging.
+# Parameter: $1 = Job-Datei (in running/)
+# .........  $2 = Spool-Verzeichnis
+# Rückgabe.: 0 = erneut eingereiht, 1 = endgültig fehlgeschlagen
+# ===========================================================================
+_common_postprocess_retry() {
+    local job_file="$1"
+    local spool_dir="$2"
+    local max_retries="${MIGRATION_RETRIES:-10}"
+
+    local retries=$(grep -m1 '^retries=' "$job_file" | cut -d'=' -f2)
+    retries=$(( ${retries:-0} + 1 ))
+
+    if [[ $retries -gt $max_retries ]]; then
+        log_error "$MSG_ERROR_MIGRATION_GAVE_UP $(basename "$job_file")"
+        mv -f "$job_file" "${spool_dir}/failed/" 2>/dev/null
+        return 1
+    fi
+
+    local delay_min=$(( 1 << (retries - 1) ))
+    [[ $delay_min -gt 60 ]] && delay_min=60
+
+    sed -i -e "s/^retries=.*/retries=${retries}/" \
+           -e "s/^retry_at=.*/retry_at=$(( $(date +%s) + delay_min * 60 ))/" "$job_file"
+    mv -f "$job_file" "${spool_dir}/queue/" 2>/dev/null
+    log_warning "$MSG_WARNING_MIGRATION_RETRY ${retries}/${max_retries} (${delay_min} min)"
+    return 0
+}
+
+# ===========================================================================
+# common_migrate_to_archive
+# ---------------------------------------------------------------------------
+# Funktion.: Verschiebt ein Image samt .md5/.nfo aus dem Staging in das
+# .........  Ausgabe-Verzeichnis. Kopiert mit Bandbreiten-Limit in eine
+# .........  .part-Datei, prüft die MD5-Summe am Ziel und benennt erst dann
+# .........  um - das Archiv enthält nie halbe Images.
+# Parameter: $1 = Image im Staging
+# .........  $2 = Ziel-Pfad im Archiv
+# .........  $3 = erwartete MD5-Summe
+# Rückgabe.: 0 = migriert (Staging-Dateien gelöscht), 1 = Fehler
+# Extras...: MIGRATION_BWLIMIT_KB (0 = unbegrenzt), rsync bevorzugt (setzt
+# .........  abgebrochene Übertragungen fort), sonst pv oder cp
+# ===========================================================================
+common_migrate_to_archive() {
+    local staged_file="$1"
+    local final_file="$2"
+    local expected_md5="$3"
+    local part_file="${final_file}.part"
+    local bwlimit="${MIGRATION_BWLIMIT_KB:-0}"
+    [[ "$bwlimit" =~ ^[0-9]+$ ]] || bwlimit=0
+
+    log_info "$MSG_INFO_MIGRATION_START $(basename "$staged_file") → $(dirname "$final_file")"
+    mkdir -p "$(dirname "$final_file")" 2>/dev/null || return 1
+
+    #-- Platz am Ziel reservieren (konkurriert mit laufenden Kopien) --------
+    local staged_mb=$(( ($(stat -c %s "$staged_file" 2>/dev/null || echo 0) + 1048575) / 1048576 ))
+    systeminfo_check_disk_space "$staged_mb" "$part_file" || return 1
+
+    #-- Übertragen (mit Bandbreiten-Limit) ----------------------------------
+    local copy_ok=1
+    if command -v rsync >/dev/null 2>&1; then
+        local rsync_opts=(--partial --inplace)
+        [[ $bwlimit -gt 0 ]] && rsync_opts+=(--bwlimit="$bwlimit")
+        rsync "${rsync_opts[@]}" "$staged_file" "$part_file" 2>/dev/null && copy_ok=0
+    elif [[ $bwlimit -gt 0 ]] && command -v pv >/dev/null 2>&1; then
+        pv -q -L "${bwlimit}k" "$staged_file" > "$part_file" 2>/dev/null && copy_ok=0
+    else
+        cp -f "$staged_file" "$part_file" 2>/dev/null && copy_ok=0
+    fi
+    systeminfo_release_disk_space "$part_file"
+    if [[ $copy_ok -ne 0 ]]; then
+        log_warning "$MSG_WARNING_MIGRATION_COPY_FAILED $(basename "$staged_file")"
+        return 1
+    fi
+
+    #-- Am Ziel verifizieren ------------------------------------------------
+    local actual_md5
+    actual_md5=$(md5sum "$part_file" 2>/dev/null | cut -d' ' -f1)
+    if [[ "$actual_md5" != "$expected_md5" ]]; then
+        log_warning "$MSG_WARNING_MIGRATION_CHECKSUM $(basename "$final_file")"
+        rm -f "$part_file"
+        return 1
+    fi
+
+    #-- Freigeben: umbenennen, Begleitdateien kopieren, Staging aufräumen --
+    mv -f "$part_file" "$final_file" || return 1
+    local staged_stem="$(get_image_stem "$staged_file")"
+    local final_stem="$(get_image_stem "$final_file")"
+    local ext
+    for ext in md5 nfo idx; do
+        [[ -f "${staged_stem}.${ext}" ]] && cp -f "${staged_stem}.${ext}" "${final_stem}.${ext}"
+    done
+    chmod 644 "$final_file" "${final_stem}.md5" "${final_stem}.nfo" "${final_stem}.idx" 2>/dev/null
+    rm -f "$staged_file" "${staged_stem}.md5" "${staged_stem}.nfo" "${staged_stem}.idx"
+
+    log_info "$MSG_INFO_MIGRATION_DONE $final_file"
+    return 0
+}
+
+# ===========================================================================
+# common_start_postprocess_workers
+# ---------------------------------------------------------------------------
+# Funktion.: Startet POSTPROCESS_WORKERS Hintergrund-Worker mit niedriger
+# .........  CPU/IO-Priorität (Lesevorgänge der Laufwerke haben Vorrang)
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg
+# Extras...: Jobs aus running/ (z.B. nach Absturz) werden erneut eingereiht
+# ===========================================================================
+common_start_postprocess_workers() {
+    [[ ${#_COMMON_POSTPROCESS_PIDS[@]} -gt 0 ]] && return 0
+
+    local workers="${POSTPROCESS_WORKERS:-1}"
+    [[ "$workers" =~ ^[1-9][0-9]*$ ]] || workers=1
+
+    #-- Unterbrochene Jobs wieder einreihen ---------------------------------
+    local spool_dir
+    if spool_dir=$(common_get_postprocess_dir); then
+        mv -f "${spool_dir}"/running/*.job "${spool_dir}/queue/" 2>/dev/null
+    fi
+
+    local i pid
+    for ((i = 1; i <= workers; i++)); do
+        _common_postprocess_worker &
+        pid=$!
+        renice -n 10 -p "$pid" >/dev/null 2>&1
+        command -v ionice >/dev/null 2>&1 && ionice -c 3 -p "$pid" >/dev/null 2>&1
+        _COMMON_POSTPROCESS_PIDS+=("$pid")
+    done
+
+    log_debug "$MSG_DEBUG_POSTPROCESS_STARTED ${_COMMON_POSTPROCESS_PIDS[*]}"
+    return 0
+}
+
+# ===========================================================================
+# common_stop_postprocess_workers
+# ---------------------------------------------------------------------------
+# Funktion.: Beendet alle Nachbearbeitungs-Worker. Laufende Jobs bleiben in
+# .........  running/ und werden beim nächsten Start erneut eingereiht.
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg
+# ===========================================================================
+common_stop_postprocess_workers() {
+    local pid
+    for pid in "${_COMMON_POSTPROCESS_PIDS[@]}"; do
+        pkill -P "$pid" 2>/dev/null
+        kill "$pid" 2>/dev/null
+    done
+    _COMMON_POSTPROCESS_PIDS=()
+    return 0
+}
+
+# ===========================================================================
+# common_wait_postprocess_idle
+# ---------------------------------------------------------------------------
+# Funktion.: Wartet bis Queue und laufende Jobs abgearbeitet sind
+# Parameter: keine
+# Rückgabe.: 0 = keine offenen Jobs mehr
+# ===========================================================================
+common_wait_postprocess_idle() {
+    local spool_dir
+    spool_dir=$(common_get_postprocess_dir) || return 0
+
+    while compgen -G "${spool_dir}/queue/*.job" >/dev/null || compgen -G "${spool_dir}/running/*.job" >/dev/null; do
+        sleep 2
+    done
+    return 0
+}
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -372,7 +1481,7 @@ common_clear_disc_failures() {
 # common_calculate_and_log_progress
 # ---------------------------------------------------------------------------
 # Funktion.: Berechnet und loggt Kopierfortschritt (zentral für alle Methoden)
-# .........  Sendet Updates an API, MQTT und systemd-notify
+# .........  Sendet Updates an API (→ Observer-Bus, MQTT) und systemd-notify
 # Parameter: $1 = Aktuell kopierte Bytes
 # .........  $2 = GesamtGröße in Bytes (0 = unbekannt)
 # .........  $3 = Start-Zeit (Unix-Timestamp)
@@ -402,7 +1511,7 @@ common_calculate_and_log_progress() {
         if [[ $percent -gt 100 ]]; then percent=100; fi
         
         # Berechne geschützte Restzeit
-        local current_time=$(date +%s)
+        local current_time=$EPOCHSECONDS
         local total_elapsed=$((current_time - start_time))
         if [[ $percent -gt 0 ]]; then
             local estimated_total=$((total_elapsed * 100 / percent))
@@ -410,7 +1519,7 @@ common_calculate_and_log_progress() {
             local hours=$((remaining / 3600))
             local minutes=$(((remaining % 3600) / 60))
             local seconds=$((remaining % 60))
-            eta=$(printf "%02d:%02d:%02d" $hours $minutes $seconds)
+            printf -v eta "%02d:%02d:%02d" $hours $minutes $seconds
         fi
         
         # Log-Nachricht mit Prüfix
@@ -421,10 +1530,8 @@ common_calculate_and_log_progress() {
             api_update_progress "$percent" "$current_mb" "$total_mb" "$eta"
         fi
         
-        # MQTT: Fortschritt senden (optional)
-        if is_mqtt_ready && declare -f mqtt_publish_progress >/dev/null 2>&1; then
-            mqtt_publish_progress "$percent" "$current_mb" "$total_mb" "$eta"
-        fi
+        # MQTT: über den Observer-Bus (common_mqtt_progress_sink), nie
+        # synchron im Kopierpfad - ein langsamer Broker bremst die Kopie nicht
         
         # systemd-notify: Status aktualisieren (wenn verfügbar)
         if command -v systemd-notify >/dev/null 2>&1; then
@@ -436,6 +1543,60 @@ common_calculate_and_log_progress() {
     fi
 }
 
+# ===========================================================================
+# common_mqtt_progress_sink
+# ---------------------------------------------------------------------------
+# Funktion.: Senke des Observer-Bus: veröffentlicht den Fortschritt aus
+# .........  live.json per mqtt_publish_progress
+# Parameter: $1 = Pfad der geänderten API-Datei
+# Rückgabe.: 0 = Erfolg/nichts zu tun, 1 = Fehler beim Veröffentlichen
+# Hinweis..: Läuft im Prozess der Senke (nicht im Kopierpfad). Status-
+# .........  Wechsel ohne neuen Fortschritt werden nicht veröffentlicht.
+# .........  Registrierung: common_register_observers (vor api_bus_start)
+# ===========================================================================
+declare -gA _COMMON_MQTT_LAST_PROGRESS=()   # live.json → zuletzt gesendet
+
+common_mqtt_progress_sink() {
+    local path="$1"
+    [[ "${path##*/}" == "live.json" ]] || return 0
+    is_mqtt_ready || return 0
+
+    #-- Fortschrittsfelder aus live.json lesen (ohne Fork) ------------------
+    local line percent="" copied_mb="" total_mb="" eta=""
+    while IFS= read -r line; do
+        case "$line" in
+            *'"percent": '*)   percent="${line##*: }";   percent="${percent%,}" ;;
+            *'"copied_mb": '*) copied_mb="${line##*: }"; copied_mb="${copied_mb%,}" ;;
+            *'"total_mb": '*)  total_mb="${line##*: }";  total_mb="${total_mb%,}" ;;
+            *'"eta": '*)       eta="${line##*: \"}";    eta="${eta%\"*}" ;;
+        esac
+    done < "$path" 2>/dev/null
+    [[ "${total_mb:-0}" =~ ^[1-9][0-9]*$ ]] || return 0
+
+    #-- Nur neuen Fortschritt senden ----------------------------------------
+    local current="${percent} ${copied_mb} ${eta}"
+    [[ "${_COMMON_MQTT_LAST_PROGRESS[$path]:-}" == "$current" ]] && return 0
+    _COMMON_MQTT_LAST_PROGRESS[$path]="$current"
+
+    mqtt_publish_progress "$percent" "$copied_mb" "$total_mb" "$eta"
+}
+
+# ===========================================================================
+# common_register_observers
+# ---------------------------------------------------------------------------
+# Funktion.: Registriert die Senken der Kopier-Pipeline am Observer-Bus
+# Parameter: keine
+# Rückgabe.: 0
+# Hinweis..: Nach daemon_load_modules und vor api_bus_start aufrufen;
+# .........  ohne geladenes MQTT-Modul wird keine Senke registriert
+# ===========================================================================
+common_register_observers() {
+    if declare -f mqtt_publish_progress >/dev/null 2>&1 && declare -f is_mqtt_ready >/dev/null 2>&1; then
+        api_register_observer "mqtt_progress" "common_mqtt_progress_sink"
+    fi
+    return 0
+}
+
 # ===========================================================================
 # common_monitor_copy_progress
 # ---------------------------------------------------------------------------
@@ -444,6 +1605,8 @@ common_calculate_and_log_progress() {
 # Parameter: $1 = PID des Kopierprozesses
 # .........  $2 = GesamtGröße in Bytes (für Prozentberechnung)
 # .........  $3 = ISO-Dateiname (zur Größenermittlung via stat)
+# .........  $4 = Frame-Index (optional, komprimierte Ausgabe: Fortschritt
+# .........       = geschriebene Frames × Frame-Größe)
 # Rückgabe.: keine (blockiert bis Prozess beendet ist)
 # Extras...: Nutzt common_calculate_and_log_progress() für Fortschrittsberechnung
 # .........  Konsistent mit Web-UI (60 Sekunden Intervall)
@@ -453,19 +1616,23 @@ common_monitor_copy_progress() {
     local copy_pid=$1
     local total_bytes=$2
     local iso_file=$3
-    local start_time=$(date +%s)
+    local index_file="${4:-}"
+    local start_time=$EPOCHSECONDS
     local last_log_time=$start_time
     
     while kill -0 "$copy_pid" 2>/dev/null; do
         sleep 30
         
-        local current_time=$(date +%s)
+        local current_time=$EPOCHSECONDS
         local elapsed=$((current_time - last_log_time))
         
         # Log alle 60 Sekunden
         if [[ $elapsed -ge 60 ]]; then
             local current_bytes=0
-            if [[ -f "$iso_file" ]]; then
+            if [[ -n "$index_file" ]] && [[ -f "$index_file" ]]; then
+                local frame_bytes=$(sed -n 's/^# frame_bytes=//p' "$index_file")
+                current_bytes=$(( $(grep -vc '^#' "$index_file") * ${frame_bytes:-0} ))
+            elif [[ -f "$iso_file" ]]; then
                 current_bytes=$(stat -c %s "$iso_file" 2>/dev/null || echo 0)
             fi
             
@@ -502,7 +1669,7 @@ common_eject_and_wait() {
     local wait_for_new="${1:-false}"
     local device
     
-    device=$(discinfo_get_device)
+    drivestat_get_field device drive
     
     # Prüfe ob Device verfügbar ist
     if [[ ! -b "$device" ]]; then
@@ -560,7 +1727,7 @@ common_cleanup_disc_operation() {
     fi
     
     # 1. Temp-Verzeichnis aufrüumen (falls vorhanden)
-    temp_dir=$(discinfo_get_temp_pathname)
+    discinfo_get_field temp_dir temp_pathname
     if [[ -n "$temp_dir" ]] && [[ -d "$temp_dir" ]]; then
         # Unmount alle eventuellen Mountpoints im Temp-Verzeichnis
         if command -v findmnt >/dev/null 2>&1; then
@@ -586,13 +1753,24 @@ common_cleanup_disc_operation() {
         }
     fi
     
-    # 2. unvollständige ISO-Datei löschen (nur bei Fehler)
+    # 2. Speicherplatz-Reservierung freigeben (ungenutzte Vorab-Allokation
+    #    wird gekürzt), unvollständige ISO-Datei löschen (nur bei Fehler)
+    discinfo_get_field iso_file iso_filename
+    systeminfo_release_disk_space "$iso_file"
     if [[ "$status" == "failure" ]]; then
-        iso_file=$(discinfo_get_iso_filename)
         [[ -n "$iso_file" ]] && [[ -f "$iso_file" ]] && rm -f "$iso_file"
     fi
     
-    # 3. Variablen zurücksetzen (immer)
+    # 3. Kopier-Log katalogisieren, Aufbewahrung im Hintergrund anwenden
+    local log_file disc_identifier
+    discinfo_get_field log_file log_filename
+    if [[ -n "$log_file" ]] && [[ -f "$log_file" ]]; then
+        discinfo_get_field disc_identifier disc_identifier
+        logging_catalog_add "$log_file" "$disc_identifier"
+        logging_apply_retention &
+    fi
+
+    # 4. Variablen zurücksetzen (immer)
     discinfo_init
 }
 
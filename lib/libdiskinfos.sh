@@ -8,6 +8,7 @@
 #   Typ-Erkennung und Label-Extraktion für optische Medien
 #   - Audio-CD, Video-DVD, Blu-ray, Daten-Discs
 #   - UDF, ISO9660, Audio-TOC Erkennung
+#   - discinfo_probe(): Dateisystem-Strukturen einmalig lesen (DISC_PROBE)
 #   - discinfo_analyze(), discinfo_get_type(), discinfo_get_label()
 #   - Unterstützung für verschiedene Dateisysteme
 #
@@ -66,7 +67,7 @@ readonly DISC_TYPE_UNKNOWN="unknown"
 #   - Wichtig für regionale Releases (DE/GB/US) und Label-Zuordnung
 #   - Beispiel: Deutsche DVD eines UK-Films → country="DE", aber production_country="GB"
 #   - Beispiel: Sampler "Bravo Hits 2021" → release_date="2021-03", aber track.1.year="1989"
-declare -A DISC_INFO=(
+declare -gA DISC_INFO=(
     # ========== Technische Basis-Informationen ==========
     ["disc_id"]=""          # Provider-ID: MusicBrainz DiscID (Audio-CD) / UUID (DVD/BD/Data)
     ["disc_identifier"]=""  # Interne ID für Medium-Wechsel-Erkennung (UUID:LABEL:SIZE_MB)
@@ -102,7 +103,7 @@ declare -A DISC_INFO=(
 
 # DISC_DATA: Metadaten des INHALTS
 #   - Informationen über Inhalt (nicht über die physische Disc)
-declare -A DISC_DATA=(
+declare -gA DISC_DATA=(
     # ========== DATA-DISC ==========
     ["description"]=""         # Freitext-Beschreibung des Inhalts
     ["backup_date"]=""         # Backup-Datum (YYYY-MM-DD)
@@ -147,6 +148,9 @@ discinfo_reset() {
     DISC_INFO[log_filename]=""
     DISC_INFO[iso_basename]=""
     DISC_INFO[temp_pathname]=""
+
+    #-- Probe-Cache der vorherigen Disc verwerfen ---------------------------
+    DISC_PROBE=()
     
     #-- Schreiben nach JSON & Loggen der Initialisierung --------------------
     api_set_section_json "discinfos" "disc_info" "$(api_create_json "DISC_INFO")" || return 1
@@ -162,6 +166,7 @@ discinfo_reset() {
 # Rückgabe.: 0 = Erfolg, 1 = Fehler
 # Beschr...: Orchestriert alle Analyse-Schritte in der richtigen Reihenfolge
 #            01. drivestat_get_drive & drivestat_disc_insert     → Disc in LW
+#                discinfo_probe            → Dateisystem einmalig einlesen
 #            02. discinfo_set_type                                → Disc Type
 #            03. discinfo_set_filesystem                   → Disc-Dateisystem
 #            04. discinfo_set_label                              → Disc-Label
@@ -182,7 +187,8 @@ discinfo_reset() {
 #            
 #            Diese Funktion wird in STATE_ANALYZING aufgerufen und stellt
 #            sicher dass ALLE Disc-Informationen verfügbar sind bevor
-#            der Kopiervorgang startet.
+#            der Kopiervorgang startet. Die Dauer wird pro Disc-Typ in
+#            api/analysis.json erfasst.
 # ===========================================================================
 discinfo_analyze() {
     #-- Start der Analyse im LOG vermerken ----------------------------------
@@ -197,7 +203,9 @@ discinfo_analyze() {
     # bereits erfolgt.
     # -----------------------------------------------------------------------
 
+    local start_us="${EPOCHREALTIME/[.,]/}"
     drivestat_get_drive && drivestat_get_inserted || return 1  # Disc erkannt
+    discinfo_probe                   # Dateisystem einmalig lesen (→ Cache)
     discinfo_set_type || return 1                         # Disc-Typ erkennen
     discinfo_set_filesystem || return 1                # Dateisystem erkennen
     discinfo_set_label || return 1                        # Label extrahieren
@@ -215,15 +223,409 @@ discinfo_analyze() {
     #-- Schreiben nach JSON & Loggen der Initialisierung --------------------
     api_set_section_json "discinfos" "disc_info" "$(api_create_json "DISC_INFO")" || return 1
 
+    #-- Analysedauer pro Disc-Typ erfassen ----------------------------------
+    local analysis_ms=$(( (${EPOCHREALTIME/[.,]/} - start_us) / 1000 ))
+    log_info "$(printf "$MSG_INFO_ANALYSIS_TIME" "${DISC_INFO[type]}" "$analysis_ms" "${DISC_PROBE[probe_ms]:-0}")"
+    _discinfo_record_analysis_time "${DISC_INFO[type]}" "$analysis_ms" "${DISC_PROBE[probe_ms]}"
+
     #-- Ende der Analyse im LOG vermerken --------------------------------------    
     log_debug "$MSG_DEBUG_INIT_SUCCESS"
     return 0
 }
 
+# ===========================================================================
+# DISC-PROBE (EINMALIGES LESEN DER DATEISYSTEM-STRUKTUREN)
+# ---------------------------------------------------------------------------
+# Statt dass jeder Detektor eigene Tools (isoinfo -l/-d, blkid) gegen das
+# Laufwerk startet, liest discinfo_probe() die relevanten Sektoren genau
+# einmal und legt die ausgewerteten Felder in DISC_PROBE ab:
+#   - ISO9660 Volume Descriptors ab Sektor 16 (Label, Größe, Blockgröße,
+#     Erstellungsdatum, UUID wie blkid) und das Root-Verzeichnis
+#   - UDF Volume Recognition Sequence, Anchor (Sektor 256) und Volume
+#     Descriptor Sequence (Label, Revision, Partitionsgröße)
+# Die Detektoren werten nur noch DISC_PROBE aus. discinfo_analyze() ruft
+# den Probe in der Haupt-Shell auf, damit der Cache für alle Setter gilt.
+# ===========================================================================
+readonly DISC_PROBE_HEAD_SECTORS=32         # Sektor 16..47 (VDs, UDF VRS/VDS)
+readonly DISC_PROBE_UDF_ANCHOR=256          # UDF Anchor Volume Descriptor
+readonly DISC_PROBE_MAX_DIR_SECTORS=8       # Obergrenze Root-Verzeichnis
+
+declare -gA DISC_PROBE=()
+
+# ===========================================================================
+# _discinfo_probe_read
+# ---------------------------------------------------------------------------
+# Funktion.: Liest Sektoren (2048 Bytes) vom Laufwerk als Hex-Strings in
+# .........  das Array 'sectors' des Aufrufers (Index = LBA)
+# Parameter: $1 = Device oder Image
+# .........  $2 = Start-LBA
+# .........  $3 = Anzahl Sektoren
+# Rückgabe.: 0 = mindestens ein Sektor gelesen, 1 = nicht lesbar
+# ===========================================================================
+_discinfo_probe_read() {
+    local device="$1"
+    local lba="$2"
+    local count="$3"
+
+    mapfile -t -O "$lba" sectors < <(dd if="$device" bs=2048 skip="$lba" count="$count" \
+        status=none 2>/dev/null | od -An -v -tx1 -w2048 | tr -d ' ')
+
+    [[ -n "${sectors[lba]}" ]]
+}
+
+# ===========================================================================
+# _discinfo_hex_to_text
+# ---------------------------------------------------------------------------
+# Funktion.: Wandelt Hex-Bytes in Text (bis NUL, ohne Füllzeichen am Ende)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = Hex-String
+# Rückgabe.: 0
+# ===========================================================================
+_discinfo_hex_to_text() {
+    local hex="$2"
+    local escaped="" text index
+
+    for (( index = 0; index < ${#hex}; index += 2 )); do
+        [[ "${hex:index:2}" == "00" ]] && break
+        escaped+="\\x${hex:index:2}"
+    done
+    printf -v text '%b' "$escaped"
+    printf -v "$1" '%s' "${text%"${text##*[! ]}"}"
+}
+
+# ===========================================================================
+# _discinfo_hex_to_uint_le
+# ---------------------------------------------------------------------------
+# Funktion.: Wandelt Hex-Bytes in Little-Endian Reihenfolge in eine Zahl
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = Hex-String
+# Rückgabe.: 0
+# ===========================================================================
+_discinfo_hex_to_uint_le() {
+    local hex="$2"
+    local reversed="" index
+
+    for (( index = ${#hex} - 2; index >= 0; index -= 2 )); do
+        reversed+="${hex:index:2}"
+    done
+    printf -v "$1" '%d' "$(( 16#${reversed:-0} ))"
+}
+
+# ===========================================================================
+# _discinfo_udf_dstring
+# ---------------------------------------------------------------------------
+# Funktion.: Dekodiert einen UDF dstring (OSTA CS0, 8 oder 16 Bit)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = Hex-String des kompletten Feldes (letztes Byte = Länge)
+# Rückgabe.: 0
+# ===========================================================================
+_discinfo_udf_dstring() {
+    local hex="$2"
+    local used=$(( 16#${hex: -2} ))
+    local content="" index
+
+    [[ $used -gt 1 ]] || { printf -v "$1" '%s' ""; return 0; }
+    content="${hex:2:(used - 1) * 2}"
+
+    #-- 16 Bit (UCS-2 Big-Endian) → nur das niederwertige Byte verwenden ----
+    if [[ "${hex:0:2}" == "10" ]]; then
+        local narrow=""
+        for (( index = 2; index < ${#content}; index += 4 )); do
+            narrow+="${content:index:2}"
+        done
+        content="$narrow"
+    fi
+    _discinfo_hex_to_text "$1" "$content"
+}
+
+# ===========================================================================
+# _discinfo_iso_date
+# ---------------------------------------------------------------------------
+# Funktion.: Wandelt ein ISO9660 Datum (17 Bytes dec-datetime) um
+# Parameter: $1 = Name der Zielvariable (ISO 8601, leer falls ungesetzt)
+# .........  $2 = Name der Zielvariable (UUID-Format wie blkid)
+# .........  $3 = Hex-String des Feldes
+# Rückgabe.: 0 = Datum gesetzt, 1 = Feld leer
+# ===========================================================================
+_discinfo_iso_date() {
+    local digits offset sign="+"
+    _discinfo_hex_to_text digits "${3:0:32}"
+
+    if [[ ! "$digits" =~ ^[0-9]{16}$ ]] || [[ "$digits" == 0000* ]]; then
+        printf -v "$1" '%s' ""
+        printf -v "$2" '%s' ""
+        return 1
+    fi
+
+    #-- Zeitzone: int8 in 15-Minuten-Schritten ------------------------------
+    offset=$(( 16#${3:32:2} ))
+    (( offset > 127 )) && offset=$(( offset - 256 ))
+    (( offset < 0 )) && { sign="-"; offset=$(( -offset )); }
+
+    printf -v "$1" '%s-%s-%sT%s:%s:%s%s%02d:%02d' "${digits:0:4}" "${digits:4:2}" \
+        "${digits:6:2}" "${digits:8:2}" "${digits:10:2}" "${digits:12:2}" \
+        "$sign" $(( offset * 15 / 60 )) $(( offset * 15 % 60 ))
+    printf -v "$2" '%s-%s-%s-%s-%s-%s-%s' "${digits:0:4}" "${digits:4:2}" \
+        "${digits:6:2}" "${digits:8:2}" "${digits:10:2}" "${digits:12:2}" "${digits:14:2}"
+}
+
+# ===========================================================================
+# _discinfo_probe_iso9660
+# ---------------------------------------------------------------------------
+# Funktion.: Wertet die ISO9660 Volume Descriptors und das Root-Verzeichnis
+# .........  aus 'sectors' aus und befüllt DISC_PROBE
+# Parameter: $1 = Device oder Image (für Nachlesen des Root-Verzeichnisses)
+# Rückgabe.: 0 = Primary Volume Descriptor gefunden, 1 = kein ISO9660
+# ===========================================================================
+_discinfo_probe_iso9660() {
+    local device="$1"
+    local lba sector pvd=""
+
+    #-- Volume Descriptor Set ab Sektor 16 bis zum Terminator (Typ 255) -----
+    for (( lba = 16; lba < 32; lba++ )); do
+        sector="${sectors[lba]}"
+        [[ "${sector:2:10}" == "4344303031" ]] || continue          # "CD001"
+        case "${sector:0:2}" in
+            01) [[ -z "$pvd" ]] && pvd="$sector" ;;
+            ff) break ;;
+        esac
+    done
+    [[ -n "$pvd" ]] || return 1
+
+    local value uuid
+    DISC_PROBE[iso9660]=1
+    _discinfo_hex_to_text value "${pvd:80:64}"                 # Volume ID
+    DISC_PROBE[label]="$value"
+    DISC_PROBE[volume_sectors]=$(( 16#${pvd:168:8} ))         # Big-Endian
+    DISC_PROBE[block_size]=$(( 16#${pvd:260:4} ))
+
+    #-- Datum: Erstellung, UUID wie blkid (Änderung, sonst Erstellung) ------
+    _discinfo_iso_date value uuid "${pvd:1626:34}" && DISC_PROBE[created_at]="$value"
+    DISC_PROBE[uuid]="$uuid"
+    _discinfo_iso_date value uuid "${pvd:1660:34}" && DISC_PROBE[uuid]="$uuid"
+
+    #-- Root-Verzeichnis (Directory Record ab Offset 156) -------------------
+    local root_lba=$(( 16#${pvd:324:8} ))
+    local root_sectors=$(( (16#${pvd:340:8} + 2047) / 2048 ))
+    (( root_sectors > DISC_PROBE_MAX_DIR_SECTORS )) && root_sectors=$DISC_PROBE_MAX_DIR_SECTORS
+    [[ $root_lba -gt 0 ]] || return 0
+
+    if [[ -z "${sectors[root_lba]}" ]]; then
+        _discinfo_probe_read "$device" "$root_lba" "$root_sectors" || return 0
+    fi
+
+    local entries="" pos record_length name_length name
+    for (( lba = root_lba; lba < root_lba + root_sectors; lba++ )); do
+        sector="${sectors[lba]}"
+        pos=0
+        while (( pos < 2048 )) && [[ -n "${sector:pos * 2:2}" ]]; do
+            record_length=$(( 16#${sector:pos * 2:2} ))
+            (( record_length == 0 )) && break
+            name_length=$(( 16#${sector:(pos + 32) * 2:2} ))
+
+            #-- "." und ".." (0x00/0x01) überspringen ----------------------
+            if (( name_length > 1 )); then
+                _discinfo_hex_to_text name "${sector:(pos + 33) * 2:name_length * 2}"
+                entries+=" ${name%%;*}"
+            fi
+            pos=$(( pos + record_length ))
+        done
+    done
+    DISC_PROBE[root_entries]="${entries# }"
+    return 0
+}
+
+# ===========================================================================
+# _discinfo_probe_udf
+# ---------------------------------------------------------------------------
+# Funktion.: Wertet UDF Recognition Sequence, Anchor (Sektor 256) und
+# .........  Volume Descriptor Sequence aus 'sectors' aus
+# Parameter: $1 = Device oder Image (für Nachlesen der VDS)
+# Rückgabe.: 0 = UDF gefunden, 1 = kein UDF
+# Hinweis..: Das UDF Root-Verzeichnis wird nicht traversiert - Video-DVDs
+# .........  haben immer eine ISO9660-Bridge, Blu-rays (UDF 2.50, Meta-
+# .........  daten-Partition) werden über Revision und Größe erkannt
+# ===========================================================================
+_discinfo_probe_udf() {
+    local device="$1"
+    local lba sector nsr=0
+
+    #-- Volume Recognition Sequence: NSR02/NSR03 ----------------------------
+    for (( lba = 16; lba < 32; lba++ )); do
+        case "${sectors[lba]:2:10}" in
+            4e53523032|4e53523033) nsr=1; break ;;
+        esac
+    done
+
+    [[ $nsr -eq 1 ]] && DISC_PROBE[udf]=1
+
+    #-- Anchor Volume Descriptor Pointer (Tag 2) ----------------------------
+    local anchor="${sectors[DISC_PROBE_UDF_ANCHOR]}"
+    [[ "${anchor:0:4}" == "0200" ]] || return $(( nsr == 0 ))
+    DISC_PROBE[udf]=1
+
+    local vds_length vds_lba
+    _discinfo_hex_to_uint_le vds_length "${anchor:32:8}"
+    _discinfo_hex_to_uint_le vds_lba "${anchor:40:8}"
+    local vds_sectors=$(( vds_length / 2048 ))
+    (( vds_sectors > 16 )) && vds_sectors=16
+    [[ $vds_lba -gt 0 ]] && [[ $vds_sectors -gt 0 ]] || return 0
+
+    if [[ -z "${sectors[vds_lba]}" ]]; then
+        _discinfo_probe_read "$device" "$vds_lba" "$vds_sectors" || return 0
+    fi
+
+    local value partition_start=0 partition_length=0 revision
+    for (( lba = vds_lba; lba < vds_lba + vds_sectors; lba++ )); do
+        sector="${sectors[lba]}"
+        case "${sector:0:4}" in
+            0100)   #-- Primary Volume Descriptor: Volume Identifier -----
+                    _discinfo_udf_dstring value "${sector:48:64}"
+                    [[ -z "${DISC_PROBE[udf_label]}" ]] && DISC_PROBE[udf_label]="$value"
+                    ;;
+            0500)   #-- Partition Descriptor: Start und Länge ------------
+                    _discinfo_hex_to_uint_le partition_start "${sector:376:8}"
+                    _discinfo_hex_to_uint_le partition_length "${sector:384:8}"
+                    ;;
+            0600)   #-- Logical Volume Descriptor: Label, UDF-Revision ---
+                    _discinfo_udf_dstring value "${sector:168:256}"
+                    [[ -n "$value" ]] && DISC_PROBE[udf_label]="$value"
+                    _discinfo_hex_to_uint_le revision "${sector:480:4}"
+                    printf -v 'DISC_PROBE[udf_revision]' '%x.%02x' $(( revision >> 8 )) $(( revision & 255 ))
+                    ;;
+            0800)   break ;;                                  # Terminator
+        esac
+    done
+    (( partition_length > 0 )) && DISC_PROBE[udf_sectors]=$(( partition_start + partition_length ))
+    return 0
+}
+
+# ===========================================================================
+# discinfo_probe
+# ---------------------------------------------------------------------------
+# Funktion.: Liest die Dateisystem-Strukturen der eingelegten Disc einmalig
+# .........  und füllt den Cache DISC_PROBE für alle Detektoren
+# Parameter: keine
+# Rückgabe.: 0 = Dateisystem gefunden, 1 = nicht lesbar (z.B. Audio-CD)
+# Extras...: DISC_PROBE[status]: ok | unreadable
+# .........  DISC_PROBE[vd_hash]: MD5 über Volume Descriptors und Anchor
+# .........  DISC_PROBE[probe_ms]: Dauer des Lesens und Auswertens
+# ===========================================================================
+discinfo_probe() {
+    local device
+    device=$(drivestat_get_drive) || return 1
+    local start_us="${EPOCHREALTIME/[.,]/}"
+    local -a sectors=()
+
+    DISC_PROBE=([status]="unreadable" [iso9660]=0 [udf]=0)
+
+    #-- Volume Descriptors + UDF Anchor (weitere Sektoren nur bei Bedarf) ---
+    if _discinfo_probe_read "$device" 16 "$DISC_PROBE_HEAD_SECTORS"; then
+        _discinfo_probe_read "$device" "$DISC_PROBE_UDF_ANCHOR" 1
+        _discinfo_probe_iso9660 "$device"
+        _discinfo_probe_udf "$device"
+
+        #-- Fingerabdruck der Volume Descriptors (Archiv-Register) ----------
+        DISC_PROBE[vd_hash]=$(printf '%s' "${sectors[@]:16:16}" "${sectors[DISC_PROBE_UDF_ANCHOR]}" | md5sum)
+        DISC_PROBE[vd_hash]="${DISC_PROBE[vd_hash]%% *}"
+        [[ ${DISC_PROBE[iso9660]} -eq 1 ]] || [[ ${DISC_PROBE[udf]} -eq 1 ]] && DISC_PROBE[status]="ok"
+    fi
+
+    DISC_PROBE[probe_ms]=$(( (${EPOCHREALTIME/[.,]/} - start_us) / 1000 ))
+    log_debug "$(printf "$MSG_DEBUG_PROBE_RESULT" "${DISC_PROBE[status]}" "${DISC_PROBE[iso9660]}" "${DISC_PROBE[udf]}" "${DISC_PROBE[probe_ms]}")"
+    [[ "${DISC_PROBE[status]}" == "ok" ]]
+}
+
+# ===========================================================================
+# discinfo_get_vd_hash
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert den Fingerabdruck der Volume Descriptors (MD5)
+# Parameter: keine
+# Ausgabe..: Hash (stdout), leer bei Discs ohne Dateisystem
+# Rückgabe.: 0 = Wert vorhanden, 1 = Leer
+# ===========================================================================
+discinfo_get_vd_hash() {
+    echo "${DISC_PROBE[vd_hash]}"
+    [[ -n "${DISC_PROBE[vd_hash]}" ]]
+}
+
+# ===========================================================================
+# _discinfo_probe_get
+# ---------------------------------------------------------------------------
+# Funktion.: Liest ein Feld aus dem Probe-Cache (führt den Probe aus, falls
+# .........  ein Detektor außerhalb von discinfo_analyze aufgerufen wird)
+# Parameter: $1 = Feldname (z.B. label, volume_sectors, root_entries)
+# Ausgabe..: Wert (stdout)
+# Rückgabe.: 0 = Wert vorhanden, 1 = leer
+# ===========================================================================
+_discinfo_probe_get() {
+    [[ -n "${DISC_PROBE[status]}" ]] || discinfo_probe >/dev/null
+    echo "${DISC_PROBE[$1]}"
+    [[ -n "${DISC_PROBE[$1]}" ]]
+}
+
+# ===========================================================================
+# _discinfo_record_analysis_time
+# ---------------------------------------------------------------------------
+# Funktion.: Summiert die Analysedauer pro Disc-Typ in api/analysis.json
+# .........  (.by_type.<typ>)
+# Parameter: $1 = Disc-Typ
+# .........  $2 = Dauer der Analyse in Millisekunden
+# .........  $3 = davon Probe in Millisekunden
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# ===========================================================================
+_discinfo_record_analysis_time() {
+    local disc_type="${1:-unknown}"
+    local analysis_ms="$2"
+    local probe_ms="${3:-0}"
+
+    [[ "$analysis_ms" =~ ^[0-9]+$ ]] || return 1
+    [[ "$probe_ms" =~ ^[0-9]+$ ]] || probe_ms=0
+
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        local stats
+        stats=$(api_get_section_json "analysis" ".by_type" "{}")
+        stats=$(jq --arg type "$disc_type" --argjson ms "$analysis_ms" --argjson probe "$probe_ms" '
+            .[$type] = ((.[$type] // {discs: 0, total_ms: 0})
+                | .discs += 1 | .total_ms += $ms
+                | .avg_ms = (.total_ms / .discs | floor)
+                | .last_ms = $ms | .last_probe_ms = $probe)' \
+            <<< "$stats") || exit 1
+        api_set_section_json "analysis" ".by_type" "$stats"
+    ) 9>"$(folders_get_temp_dir)/.analysis.lock"
+}
+
 # ============================================================================
 # GETTER/SETTER FUNKTIONEN FÜR DISC_INFO
 # ============================================================================
 
+# ===========================================================================
+# discinfo_get_field
+# ---------------------------------------------------------------------------
+# Funktion.: Liest ein DISC_INFO Feld direkt in eine Variable des Aufrufers
+# .........  (ohne Subshell und ohne Debug-Log, für Hot-Paths)
+# Parameter: $1 = Name der Zielvariable (z.B. iso_filename)
+# .........  $2 = DISC_INFO Schlüssel (z.B. iso_filename, disc_identifier),
+# .........       zusätzlich vd_hash aus dem Probe-Cache
+# .........  $3 = Default, falls das Feld leer ist (optional)
+# Rückgabe.: 0 = Wert vorhanden, 1 = Leer (Zielvariable = Default)
+# Beispiel.: local iso_filename
+# .........  discinfo_get_field iso_filename iso_filename
+# Hinweis..: Ersetzt 'var=$(discinfo_get_...)' in häufig durchlaufenen
+# .........  Pfaden, die discinfo_get_* Funktionen bleiben für Aufrufe mit
+# .........  Logging/Fehlerbehandlung bestehen
+# ===========================================================================
+discinfo_get_field() {
+    local _discinfo_value
+    case "$2" in
+        vd_hash) _discinfo_value="${DISC_PROBE[vd_hash]}" ;;
+        *)       _discinfo_value="${DISC_INFO[$2]}" ;;
+    esac
+    printf -v "$1" '%s' "${_discinfo_value:-$3}"
+    [[ -n "$_discinfo_value" ]]
+}
+
 # ===========================================================================
 # discinfo_get_id
 # ---------------------------------------------------------------------------
@@ -302,12 +704,12 @@ discinfo_detect_id() {
         return 0
     fi
     
-    #-- DVD/BD/Data: Ermittle UUID mit blkid --------------------------------
-    local uuid=""
+    #-- DVD/BD/Data: UUID aus dem Probe-Cache (ISO9660-Datum wie blkid) ----
+    local uuid=$(_discinfo_probe_get "uuid")
     
-    #-- blkid Pfad ermitteln und wenn vorhanden verwenden -------------------
-    local blkid_cmd=$(systeminfo_get_tool_path "blkid") || return 1
-    if [[ -n "$blkid_cmd" ]]; then
+    #-- Fallback (nur UDF ohne ISO9660-Bridge): blkid -----------------------
+    local blkid_cmd=$(command -v blkid)
+    if [[ -z "$uuid" ]] && [[ -n "$blkid_cmd" ]]; then
         local blkid_output
         blkid_output=$($blkid_cmd -p "$(drivestat_get_drive)" 2>/dev/null)
         
@@ -469,26 +871,14 @@ discinfo_set_label() {
 # ===========================================================================
 # discinfo_detect_label
 # ---------------------------------------------------------------------------
-# Funktion.: Ermittle Volume-Label von Disc
+# Funktion.: Ermittle Volume-Label von Disc (aus DISC_PROBE)
 # Parameter: keine
 # Ausgabe..: Label (stdout)
 # Rückgabe.: 0 = Erfolg
 # ===========================================================================
 discinfo_detect_label() {
-    #-- Ermittle Label mit blkid oder isoinfo -------------------------------
-    local label=""
-    
-    #-- blkid Pfad ermitteln und wenn vorhanden verwenden -------------------
-    local blkid_cmd=$(systeminfo_get_tool_path "blkid") || return 1
-    if [[ -n "$blkid_cmd" ]]; then
-        label=$($blkid_cmd "$(drivestat_get_drive)" 2>/dev/null | grep -o 'LABEL="[^"]*"' | cut -d'"' -f2)
-    fi
-    
-    #-- Fallback: Versuche Volume ID mit isoinfo zu lesen -------------------
-    local isoinfo_cmd=$(systeminfo_get_tool_path "isoinfo") || return 1
-    if [[ -n "$isoinfo_cmd" ]]; then
-        label=$($isoinfo_cmd -d -i "$(drivestat_get_drive)" 2>/dev/null | grep "Volume id:" | sed 's/Volume id: //' | xargs)
-    fi
+    #-- Volume ID (ISO9660) aus dem Probe-Cache, sonst UDF-Label ------------
+    local label=$(_discinfo_probe_get "label") || label=$(_discinfo_probe_get "udf_label")
 
     #-- Fallback: Datum verwenden, wenn kein Label gefunden -----------------
     if [[ -z "$label" ]] || [[ "$label" =~ ^[[:space:]]*$ ]]; then
@@ -586,34 +976,27 @@ discinfo_set_type() {
 # ===========================================================================
 discinfo_detect_type() {
     local detected_type="$DISC_TYPE_UNKNOWN"
-    local isoinfo_cmd=$(systeminfo_get_tool_path "isoinfo") || return 1
 
-    #-- 1. SPEZIFISCHSTE Prüfung: Video-DVD (VIDEO_TS) ----------------------
-    if [[ -n "$isoinfo_cmd" ]]; then
-        local iso_listing
-        iso_listing=$($isoinfo_cmd -l -i "$(drivestat_get_drive)" 2>/dev/null)
-        
-        if echo "$iso_listing" | grep -q "Directory listing of /VIDEO_TS"; then
-            echo "$DISC_TYPE_DVD_VIDEO"
-            return 0
-        fi
-        
-        if echo "$iso_listing" | grep -q "Directory listing of /BDMV"; then
-            echo "$DISC_TYPE_BD_VIDEO"
-            return 0
-        fi
+    #-- 1. Kein lesbares Dateisystem → Audio-CD -----------------------------
+    if [[ "$(_discinfo_probe_get "status")" != "ok" ]]; then
+        echo "$DISC_TYPE_AUDIO_CD"
+        return 0
     fi
 
-    #-- 2. Fallback: Audio-CD (kein Dateisystem) ----------------------------
-    local iso_info=$($isoinfo_cmd -d -i "$(drivestat_get_drive)" 2>/dev/null)
-    if [[ -z "$iso_info" ]]; then
-        echo "$DISC_TYPE_AUDIO_CD"
+    #-- 2. SPEZIFISCHSTE Prüfung: Root-Verzeichnis (VIDEO_TS / BDMV) --------
+    local root_entries=" $(_discinfo_probe_get "root_entries") "
+    if [[ "$root_entries" == *" VIDEO_TS "* ]]; then
+        echo "$DISC_TYPE_DVD_VIDEO"
         return 0
     fi
-    
+    if [[ "$root_entries" == *" BDMV "* ]]; then
+        echo "$DISC_TYPE_BD_VIDEO"
+        return 0
+    fi
+
     #-- 3. Fallback: Größenbasierte Erkennung -------------------------------
-    local volume_size="${DISC_INFO[size_sectors]}"
-    if [[ -n "$volume_size" ]] && [[ "$volume_size" =~ ^[0-9]+$ ]]; then
+    local volume_size=$(discinfo_detect_size_sectors 2>/dev/null)
+    if [[ "$volume_size" =~ ^[0-9]+$ ]] && [[ $volume_size -gt 0 ]]; then
         local size_mb=$((volume_size * 2048 / 1024 / 1024))
         
         if [[ $size_mb -lt 900 ]]; then
@@ -621,9 +1004,9 @@ discinfo_detect_type() {
         elif [[ $size_mb -lt 9000 ]]; then
             detected_type="$DISC_TYPE_DVD_ROM"
         else
-            #-- Für bd-video/bd-rom Unterscheidung: Filesystem separat prüfen
-            local fs_type=$(discinfo_detect_filesystem)  
-            if [[ "$fs_type" == "udf" ]]; then
+            #-- Für bd-video/bd-rom Unterscheidung: UDF 2.50+ (BD-Video) ---
+            local udf_revision=$(_discinfo_probe_get "udf_revision")
+            if [[ -n "$udf_revision" ]] && (( 10#${udf_revision/./} >= 250 )); then
                 detected_type="$DISC_TYPE_BD_VIDEO"
             else
                 detected_type="$DISC_TYPE_BD_ROM"
@@ -799,28 +1182,20 @@ discinfo_set_size_sectors() {
 # ===========================================================================
 # discinfo_detect_size_sectors
 # ---------------------------------------------------------------------------
-# Funktion.: Ermittle Volume-Größe (in Sektoren) mit isoinfo
+# Funktion.: Ermittle Volume-Größe (in Sektoren) aus DISC_PROBE
 # Parameter: keine
 # Ausgabe..: Anzahl Sektoren (stdout)
 # Rückgabe.: 0 = Erfolg, 1 = Nicht ermittelbar
-# Beschr...: Liest "Volume size is: XXXXX" aus isoinfo -d Ausgabe
+# Beschr...: ISO9660 Volume Space Size, bei reinem UDF Partitionsende
 # ===========================================================================
 discinfo_detect_size_sectors() {
-    local volume_size=0
-    
-    #-- isoinfo Pfad ermitteln und wenn vorhanden verwenden -----------------
-    local isoinfo_cmd=$(systeminfo_get_tool_path "isoinfo") || return 1
-    if [[ -n "$isoinfo_cmd" ]]; then
-        local isoinfo_output=$($isoinfo_cmd -d -i "$(drivestat_get_drive)" 2>/dev/null)
-        
-        #-- Lese "Volume size is: XXXXX" ------------------------------------
-        volume_size=$(echo "$isoinfo_output" | grep "Volume size is:" | awk '{print $4}')
-        
-        if [[ -n "$volume_size" ]] && [[ "$volume_size" =~ ^[0-9]+$ ]]; then
-            log_debug "$volume_size sectors"
-            echo "$volume_size"
-            return 0
-        fi
+    #-- ISO9660 Volume Space Size, sonst Ende der UDF-Partition -------------
+    local volume_size=$(_discinfo_probe_get "volume_sectors") || volume_size=$(_discinfo_probe_get "udf_sectors")
+
+    if [[ "$volume_size" =~ ^[0-9]+$ ]] && [[ $volume_size -gt 0 ]]; then
+        log_debug "$volume_size sectors"
+        echo "$volume_size"
+        return 0
     fi
     
     #-- Kein Wert gefunden --------------------------------------------------
@@ -902,32 +1277,21 @@ discinfo_set_block_size() {
 # ===========================================================================
 # discinfo_detect_block_size
 # ---------------------------------------------------------------------------
-# Funktion.: Ermittle Block-Größe mit isoinfo
+# Funktion.: Ermittle Block-Größe aus DISC_PROBE
 # Parameter: keine
 # Ausgabe..: Block-Größe in Bytes (stdout), default: 2048
 # Rückgabe.: 0 = Erfolg
-# Beschr...: Liest "Logical block size is: XXXX" aus isoinfo -d Ausgabe
 # ===========================================================================
 discinfo_detect_block_size() {
     local block_size=2048  # Fallback für optische Medien
-    
-    #-- isoinfo Pfad ermitteln und wenn vorhanden verwenden -----------------
-    local isoinfo_cmd=$(systeminfo_get_tool_path "isoinfo") || return 1
-    if [[ -n "$isoinfo_cmd" ]]; then
-        local isoinfo_output=$($isoinfo_cmd -d -i "$(drivestat_get_drive)" 2>/dev/null)
-        
-        #-- Lese "Logical block size is: XXXX" ------------------------------
-        local detected_block_size
-        detected_block_size=$(echo "$isoinfo_output" | grep -i "Logical block size is:" | awk '{print $5}')
-        
-        if [[ -n "$detected_block_size" ]] && [[ "$detected_block_size" =~ ^[0-9]+$ ]]; then
-            block_size=$detected_block_size
-            log_debug "discinfo_detect_block_size: $block_size bytes (erkannt)"
-        else
-            log_debug "discinfo_detect_block_size: $block_size bytes (Fallback)"
-        fi
+    local detected_block_size=$(_discinfo_probe_get "block_size")
+
+    #-- Logical Block Size aus dem ISO9660 Primary Volume Descriptor --------
+    if [[ "$detected_block_size" =~ ^[0-9]+$ ]] && [[ $detected_block_size -gt 0 ]]; then
+        block_size=$detected_block_size
+        log_debug "discinfo_detect_block_size: $block_size bytes (erkannt)"
     else
-        log_debug "discinfo_detect_block_size: $block_size bytes (Fallback, isoinfo nicht verfügbar)"
+        log_debug "discinfo_detect_block_size: $block_size bytes (Fallback)"
     fi
     
     echo "$block_size"
@@ -1001,11 +1365,21 @@ discinfo_set_estimated_size_mb() {
 # Ausgabe..: Geschätzte Größe in MB (stdout)
 # Rückgabe.: 0 = Erfolg, 1 = Fehler (size_mb nicht verfügbar)
 # Beschr...: Berechnet als size_mb + 10% Overhead für ISO-Struktur
+#            Bei komprimierter Ausgabe (OUTPUT_COMPRESSION=zstd) wird die
+#            bisher gemessene Kompressionsrate des Disc-Typs angewendet
 # ===========================================================================
 discinfo_detect_estimated_size_mb() {
     #-- Lese size_mb mit Getter ---------------------------------------------
     local size_mb=$(discinfo_get_size_mb) || return 1
 
+    #-- Komprimierte Ausgabe: gemessene Rate dieses Disc-Typs ---------------
+    local ratio_permille
+    if declare -f common_compression_enabled >/dev/null 2>&1 && common_compression_enabled && \
+       ratio_permille=$(common_get_compression_ratio "${DISC_INFO[type]}"); then
+        log_debug "size_mb=$size_mb MB → $(( (size_mb * ratio_permille + 999) / 1000 )) MB (zstd, ${ratio_permille}‰)"
+        size_mb=$(( (size_mb * ratio_permille + 999) / 1000 ))
+    fi
+
     #-- Berechnung: size_mb + 10% Overhead ----------------------------------
     local estimated_size_mb=$((size_mb + size_mb / 10))
 
@@ -1086,13 +1460,11 @@ discinfo_detect_filesystem() {
     #-- Standardwert für unbekanntes Dateisystem ----------------------------
     local fs_type="unknown"
     
-    #-- blkid Pfad ermitteln und wenn vorhanden verwenden -------------------
-    local blkid_cmd=$(systeminfo_get_tool_path "blkid") || return 1
-    if [[ -n "$blkid_cmd" ]]; then
-        local blkid_output=$($blkid_cmd "$(drivestat_get_drive)" 2>/dev/null)
-        if [[ -n "$blkid_output" ]]; then
-            fs_type=$(echo "$blkid_output" | grep -o 'TYPE="[^"]*"' | cut -d'"' -f2)
-        fi
+    #-- UDF hat Vorrang (wie blkid bei UDF/ISO9660-Bridge) ------------------
+    if [[ "$(_discinfo_probe_get "udf")" == "1" ]]; then
+        fs_type="udf"
+    elif [[ "$(_discinfo_probe_get "iso9660")" == "1" ]]; then
+        fs_type="iso9660"
     fi
     
     #-- Rückgabe des ermittelten Dateisystem-Typs ---------------------------
@@ -1220,13 +1592,8 @@ discinfo_set_created_at() {
 # Rückgabe.: 0 = Erfolg
 # ===========================================================================
 discinfo_detect_created_at() {
-    local timestamp=""
-    
-    #-- isoinfo Pfad ermitteln und wenn vorhanden verwenden -----------------
-    local isoinfo_cmd=$(systeminfo_get_tool_path "isoinfo") || return 1
-    if [[ -n "$isoinfo_cmd" ]]; then
-        timestamp=$($isoinfo_cmd -d -i "$(drivestat_get_drive)" 2>/dev/null | grep "Creation Date:" | sed 's/Creation Date: //' | xargs)
-    fi
+    #-- Volume Creation Date aus dem Probe-Cache ----------------------------
+    local timestamp=$(_discinfo_probe_get "created_at")
     
     #-- Fallback: Aktuelles Datum -------------------------------------------
     if [[ -z "$timestamp" ]]; then
@@ -1911,6 +2278,7 @@ discinfo_get_iso_filename() {
 # Parameter: $1 = iso_filename (vollständiger Pfad)
 # Rückgabe.: 0 = Erfolg, 1 = Dateiname leer
 # Beschr...: Ergänzt .iso-Endung und Pfad automatisch falls nicht vorhanden
+#            (.iso.zst für komprimierte Ausgabe bleibt erhalten)
 # ===========================================================================
 discinfo_set_iso_filename() {
     #-- Parameter übernehmen ------------------------------------------------
@@ -1923,8 +2291,8 @@ discinfo_set_iso_filename() {
         return 1
     fi
 
-    #-- Dateiendung prüfen (sollte .iso sein) und ggf. ergänzen -------------
-    if [[ "$filename" != *.iso ]]; then
+    #-- Dateiendung prüfen (.iso bzw. komprimiert .iso.zst), ggf. ergänzen --
+    if [[ "$filename" != *.iso ]] && [[ "$filename" != *.iso.zst ]]; then
         filename="${filename}.iso"
         log_debug "$MSG_DEBUG_SET_ISO_FILENAME_EXTENSION_ADDED: '$filename'"
     fi
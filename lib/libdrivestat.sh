@@ -7,9 +7,11 @@
 # Beschreibung:
 #   Überwacht den Status des optischen Laufwerks (Schublade, Medium)
 #   - drivestat_get_drive() - Findet erstes optisches Laufwerk
+#   - drivestat_detect_drives() - Findet alle Laufwerke (Multi-Drive)
+#   - drivestat_attach_image() - Image-Datei/Loop-Device als Quelle (Batch)
 #   - drivestat_get_closed(), drivestat_get_inserted()
 #   - drivestat_start_monitor(), drivestat_stop_monitor()
-#   - Background-Monitoring mit automatischer Status-Erkennung
+#   - drivestat_wait_event() - Ereignisgesteuert (udev), Polling als Fallback
 #
 # -----------------------------------------------------------------------------
 # Dependencies: liblogging (für log_* Funktionen)
@@ -91,7 +93,7 @@ readonly DRIVE_STATUS_ERROR="error"                            # Fehlerstatus
 # Datenstruktur für Laufwerks-Informationen
 # ---------------------------------------------------------------------------
 # DRIVE_INFO: Laufwerksinformationen
-declare -A DRIVE_INFO=(
+declare -gA DRIVE_INFO=(
     #==================== Technische Daten des Laufwerks ====================
     [drive]=""                  # Pfad zum optischen Laufwerk (z.B. /dev/sr0)
     [vendor]="unknown"            # Hersteller (z.B. "ASUS", "LG", "Pioneer")
@@ -105,6 +107,9 @@ declare -A DRIVE_INFO=(
     [status]="$DRIVE_STATUS_EMPTY"  # empty, disc_inserted, disc_ready, error
 )
 
+# Laufwerks-Instanz im Multi-Drive-Betrieb (z.B. "sr0"), leer = 1. Laufwerk
+DRIVESTAT_INSTANCE=""
+
 # ===========================================================================
 # drivestat_reset
 # ---------------------------------------------------------------------------
@@ -178,6 +183,24 @@ drivestat_analyse() {
 # GETTER/SETTER FUNCTIONEN FÜR DRIVE_INFO
 # ===========================================================================
 
+# ===========================================================================
+# drivestat_get_field
+# ---------------------------------------------------------------------------
+# Funktion.: Liest ein DRIVE_INFO Feld direkt in eine Variable des Aufrufers
+# .........  (ohne Subshell und ohne Debug-Log, für Hot-Paths)
+# Parameter: $1 = Name der Zielvariable (z.B. drive)
+# .........  $2 = DRIVE_INFO Schlüssel (z.B. drive, medium_inserted)
+# .........  $3 = Default, falls das Feld leer ist (optional)
+# Rückgabe.: 0 = Wert vorhanden, 1 = Leer (Zielvariable = Default)
+# Beispiel.: local drive
+# .........  drivestat_get_field drive drive || return 1
+# ===========================================================================
+drivestat_get_field() {
+    local _drivestat_value="${DRIVE_INFO[$2]}"
+    printf -v "$1" '%s' "${_drivestat_value:-$3}"
+    [[ -n "$_drivestat_value" ]]
+}
+
 # ===========================================================================
 # drivestat_get_drive
 # ---------------------------------------------------------------------------
@@ -236,7 +259,7 @@ drivestat_set_drive() {
 
         #-- Warte auf Laufwerk (wichtig bei USB-Laufwerken) -----------------
         if [[ ! -b "$drive_path" ]]; then
-            local udevadm_cmd=$(systeminfo_get_tool_path "udevadm") || return 1
+            local udevadm_cmd=$(command -v udevadm)
             if [[ -n "$udevadm_cmd" ]]; then
                 $udevadm_cmd settle --timeout=3 2>/dev/null
                 # Trigger udev für sr* Devices ------------------------------
@@ -294,6 +317,13 @@ drivestat_detect_drive() {
     #-- Drive ---------------------------------------------------------------
     local drive=""
 
+    #-- Multi-Drive-Betrieb: Instanz ist fest an ein Laufwerk gebunden ------
+    if [[ -n "$DRIVESTAT_INSTANCE" ]]; then
+        [[ -b "/dev/${DRIVESTAT_INSTANCE}" ]] && drive="/dev/${DRIVESTAT_INSTANCE}"
+        echo "$drive"
+        return 0
+    fi
+
     #------------------------------------------------------------------------
     # Versuch mit verschiedenen Methoden das optische Laufwerk zu finden
     #------------------------------------------------------------------------
@@ -345,6 +375,41 @@ drivestat_detect_drive() {
     return 0
 }
 
+# ===========================================================================
+# drivestat_detect_drives
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt ALLE optischen Laufwerke des Systems (Multi-Drive)
+# Parameter: Keine
+# Ausgabe..: Ein Device-Pfad pro Zeile (z.B. /dev/sr0), sortiert
+# Rückgabe.: 0 = Mindestens ein Laufwerk gefunden, 1 = Kein Laufwerk
+# Hinweis..: Prüft lsblk (TYPE=rom), Fallback /sys/class/block/sr*
+# ===========================================================================
+drivestat_detect_drives() {
+    local drives=""
+
+    #-- Methode 1: lsblk mit TYPE=rom (alle Treffer) ------------------------
+    if command -v lsblk >/dev/null 2>&1; then
+        drives=$(lsblk -ndo NAME,TYPE 2>/dev/null | awk '$2=="rom" {print "/dev/" $1}')
+    fi
+
+    #-- Methode 2: /sys/class/block Durchsuchen -----------------------------
+    if [[ -z "$drives" ]]; then
+        local dev
+        for dev in /sys/class/block/sr*; do
+            [[ -e "$dev" ]] && drives+="/dev/$(basename "$dev")"$'\n'
+        done
+    fi
+
+    #-- Rückgabe (nur existierende Block-Devices) ---------------------------
+    local found=1 drive
+    while read -r drive; do
+        [[ -b "$drive" ]] || continue
+        echo "$drive"
+        found=0
+    done < <(printf '%s\n' "$drives" | sort -u)
+    return $found
+}
+
 # ===========================================================================
 # drivestat_get_vendor
 # ---------------------------------------------------------------------------
@@ -415,7 +480,7 @@ drivestat_set_vendor() {
 drivestat_detect_vendor() {
     #-- Locale Variablen vorbereiten ----------------------------------------
     local vendor="unknown"
-    local drive_path="$(drivestat_get_drive)" || {echo "$vendor"; return 1;}
+    local drive_path="$(drivestat_get_drive)" || { echo "$vendor"; return 1; }
 
     #-- Prüfe ob Device gültig ist ------------------------------------------
     local device_basename=$(basename "$drive_path")
@@ -499,7 +564,7 @@ drivestat_set_model() {
 drivestat_detect_model() {
     #-- Locale Variablen vorbereiten ----------------------------------------
     local model="unknown"
-    local drive_path="$(drivestat_get_drive)" || {echo "$model"; return 1;}
+    local drive_path="$(drivestat_get_drive)" || { echo "$model"; return 1; }
 
     #-- Prüfe ob Device gültig ist ------------------------------------------
     local device_basename=$(basename "$drive_path")
@@ -583,7 +648,7 @@ drivestat_set_firmware() {
 drivestat_detect_firmware() {
     #-- Locale Variablen vorbereiten ----------------------------------------
     local firmware="unknown"
-    local drive_path="$(drivestat_get_drive)" || {echo "$firmware"; return 1;}
+    local drive_path="$(drivestat_get_drive)" || { echo "$firmware"; return 1; }
 
     #-- Prüfe ob Device gültig ist ------------------------------------------
     local device_basename=$(basename "$drive_path")
@@ -667,7 +732,7 @@ drivestat_set_bus_type() {
 drivestat_detect_bus_type() {
     #-- Locale Variablen vorbereiten ----------------------------------------
     local bus_type="unknown"
-    local drive_path="$(drivestat_get_drive)" || {echo "$bus_type"; return 1;}
+    local drive_path="$(drivestat_get_drive)" || { echo "$bus_type"; return 1; }
 
     #-- Prüfe ob Device gültig ist ------------------------------------------
     local device_basename=$(basename "$drive_path")
@@ -767,7 +832,7 @@ drivestat_set_capabilities() {
 drivestat_detect_capabilities() {
     #-- Locale Variablen vorbereiten ----------------------------------------
     local capabilities="unknown"
-    local drive_path="$(drivestat_get_drive)" || {echo "$capabilities"; return 1;}
+    local drive_path="$(drivestat_get_drive)" || { echo "$capabilities"; return 1; }
 
     #-- Prüfe ob Device gültig ist ------------------------------------------
     local device_basename=$(basename "$drive_path")
@@ -1065,7 +1130,7 @@ drivestat_detect_inserted() {
     # Versuche mit dd ein paar Bytes zu lesen
     # Timeout von 2 Sekunden für langsame USB-Laufwerke
     # Versuche zuerst mit bs=2048 (Daten-CDs/DVDs/Blu-ray)
-    local dd_cmd=$(systeminfo_get_tool_path "dd") || return 1
+    local dd_cmd=$(command -v dd)
     if [[ -n "$dd_cmd" ]]; then
          if timeout 2 "$dd_cmd" if="${DRIVE_INFO[drive]}" of=/dev/null bs=2048 count=1 2>/dev/null; then
             echo "true"
@@ -1075,7 +1140,7 @@ drivestat_detect_inserted() {
 
     # Fallback: Prüfe mit cdparanoia ob Audio-CD vorhanden
     # cdparanoia -Q gibt 0 zurück wenn Audio-CD lesbar ist
-    local cdparanoia_cmd=$(systeminfo_get_tool_path "cdparanoia") || return 1
+    local cdparanoia_cmd=$(command -v cdparanoia)
     if [[ -n "$cdparanoia_cmd" ]]; then
          if timeout 3 "$cdparanoia_cmd" -Q -d "${DRIVE_INFO[drive]}" >/dev/null 2>&1; then
             echo "true"
@@ -1180,6 +1245,430 @@ drivestat_detect_status() {
     return 0
 }
 
+# ===========================================================================
+# IMAGE-DATEIEN ALS QUELLE (BATCH-BETRIEB)
+# ===========================================================================
+
+# Vom Modul selbst angelegtes Loop-Device (wird bei detach wieder gelöst)
+_DRIVESTAT_LOOP_DEVICE=""
+
+# ===========================================================================
+# drivestat_attach_image
+# ---------------------------------------------------------------------------
+# Funktion.: Verwendet eine Image-Datei (.iso/.img/.bin) oder ein Loop-
+# .........  Device anstelle eines optischen Laufwerks als Quelle. Danach
+# .........  arbeiten discinfo_analyze() und die Kopierfunktionen unverändert.
+# Parameter: $1 = Pfad zur Image-Datei oder zum Block-Device (/dev/loopN)
+# Rückgabe.: 0 = Quelle gesetzt, 1 = Fehler (Quelle nicht lesbar)
+# Extras...: Dateien werden read-only an ein Loop-Device gebunden (losetup),
+# .........  ohne losetup/Root-Rechte wird die Datei direkt gelesen
+# ===========================================================================
+drivestat_attach_image() {
+    local source="$1"
+    local device=""
+
+    #-- Quelle prüfen -------------------------------------------------------
+    if [[ -z "$source" ]] || [[ ! -r "$source" ]]; then
+        log_error "$(printf "$MSG_ERROR_IMAGE_NOT_READABLE" "$source")"
+        return 1
+    fi
+
+    #-- Block-Device direkt nutzen, Datei an Loop-Device binden -------------
+    if [[ -b "$source" ]]; then
+        device="$source"
+    elif [[ -f "$source" ]]; then
+        if [[ $EUID -eq 0 ]] && command -v losetup >/dev/null 2>&1; then
+            device=$(losetup --find --show --read-only "$source" 2>/dev/null)
+            [[ -n "$device" ]] && _DRIVESTAT_LOOP_DEVICE="$device"
+        fi
+        [[ -z "$device" ]] && device="$source"
+    else
+        log_error "$(printf "$MSG_ERROR_IMAGE_NOT_READABLE" "$source")"
+        return 1
+    fi
+
+    #-- Quelle als "Laufwerk mit eingelegtem Medium" eintragen --------------
+    #-- (direkt ins Array, drivestat_set_drive() erwartet ein echtes -------
+    #-- optisches Laufwerk und würde auf udev warten) ----------------------
+    DRIVE_INFO[drive]="$device"
+    DRIVE_INFO[medium_inserted]=true
+    DRIVE_INFO[closed]=true
+    log_info "$(printf "$MSG_INFO_IMAGE_ATTACHED" "$source" "$device")"
+    return 0
+}
+
+# ===========================================================================
+# drivestat_detach_image
+# ---------------------------------------------------------------------------
+# Funktion.: Löst die mit drivestat_attach_image() gesetzte Quelle wieder
+# .........  (inkl. Loop-Device, falls dieses vom Modul angelegt wurde)
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg
+# ===========================================================================
+drivestat_detach_image() {
+    if [[ -n "$_DRIVESTAT_LOOP_DEVICE" ]]; then
+        losetup --detach "$_DRIVESTAT_LOOP_DEVICE" 2>/dev/null
+        log_debug "$(printf "$MSG_DEBUG_IMAGE_DETACHED" "$_DRIVESTAT_LOOP_DEVICE")"
+        _DRIVESTAT_LOOP_DEVICE=""
+    fi
+
+    DRIVE_INFO[drive]=""
+    DRIVE_INFO[medium_inserted]=false
+    return 0
+}
+
+# ===========================================================================
+# KALIBRIERUNG DER LESEPARAMETER (PRO LAUFWERKSMODELL)
+# ===========================================================================
+# Kandidaten für die Kalibrierung -------------------------------------------
+readonly DRIVESTAT_CALIB_REQUEST_SIZES="2048 32768 131072 524288 1048576" # B
+readonly DRIVESTAT_CALIB_READAHEAD="0 256 1024 4096"    # 512-Byte-Sektoren
+readonly DRIVESTAT_CALIB_ZONES="inner middle outer"   # Messbereiche (Radius)
+readonly DRIVESTAT_CALIB_SAMPLE_MB=16            # Default MB pro Messbereich
+readonly DRIVESTAT_CALIB_TIMEOUT=60        # Max. Sekunden pro Einzelmessung
+readonly DRIVESTAT_CALIB_RETRY_AFTER=604800  # Sekunden Pause nach Fehlschlag
+
+_DRIVESTAT_ORIGINAL_READAHEAD=""  # Readahead vor drivestat_apply_read_params
+
+# ===========================================================================
+# drivestat_get_calibration_key
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert den Schlüssel, unter dem die Kalibrierung des aktuellen
+# .........  Laufwerks gespeichert wird (Hersteller_Modell_Firmware)
+# Parameter: Keine (nutzt DRIVE_INFO)
+# Ausgabe..: Schlüssel (z.B. "HL-DT-ST_DVDRAM_GH24NSD1_LG00") oder ""
+# Rückgabe.: 0 = Erfolg, 1 = Laufwerksmodell unbekannt
+# Hinweis..: Leer- und Sonderzeichen werden durch '_' ersetzt, damit der
+# .........  Schlüssel als INI-Key verwendet werden kann
+# ===========================================================================
+drivestat_get_calibration_key() {
+    #-- Schlüssel aus Hersteller, Modell und Firmware zusammensetzen --------
+    local key="${DRIVE_INFO[vendor]}_${DRIVE_INFO[model]}_${DRIVE_INFO[firmware]}"
+    key="${key//[^A-Za-z0-9._-]/_}"
+
+    #-- Ohne bekanntes Modell ist keine Zuordnung möglich -------------------
+    if [[ "$key" == "unknown_unknown_unknown" ]]; then
+        echo ""
+        return 1
+    fi
+
+    echo "$key"
+    return 0
+}
+
+# ===========================================================================
+# drivestat_get_calibration
+# ---------------------------------------------------------------------------
+# Funktion.: Liest die gespeicherte Kalibrierung für das aktuelle Laufwerk
+# Parameter: Keine (nutzt drivestat_get_calibration_key)
+# Ausgabe..: request_size|readahead|throughput_kbps|timestamp oder ""
+# Rückgabe.: 0 = Kalibrierung vorhanden, 1 = nicht kalibriert
+# Hinweis..: Gespeichert in conf/libdrivestat.ini, Sektion [calibration]
+# .........  Ein Fehlschlag-Marker (failed|<epoch>) gilt als nicht kalibriert,
+# .........  siehe drivestat_calibration_due
+# ===========================================================================
+drivestat_get_calibration() {
+    #-- Schlüssel des Laufwerks ermitteln -----------------------------------
+    local key
+    key=$(drivestat_get_calibration_key) || {
+        echo ""
+        return 1
+    }
+
+    #-- Wert aus INI lesen (ohne Default → kein Self-Healing-Write) ---------
+    local value
+    value=$(settings_get_value_ini "drivestat" "calibration" "$key" 2>/dev/null)
+    if [[ -n "$value" ]] && [[ "$value" != failed\|* ]]; then
+        log_debug "$(printf "$MSG_DEBUG_CALIBRATION_GET" "$key" "$value")"
+        echo "$value"
+        return 0
+    fi
+
+    echo ""
+    return 1
+}
+
+# ===========================================================================
+# drivestat_calibration_due
+# ---------------------------------------------------------------------------
+# Funktion.: Prüft, ob das aktuelle Laufwerk kalibriert werden soll
+# Parameter: Keine (nutzt drivestat_get_calibration_key)
+# Rückgabe.: 0 = Kalibrierung fällig (keine vorhanden, letzter Fehlschlag
+# .........      älter als DRIVESTAT_CALIB_RETRY_AFTER)
+# .........  1 = Nicht fällig (kalibriert, Modell unbekannt oder Pause nach
+# .........      Fehlschlag)
+# Hinweis..: Verhindert, dass eine fehlschlagende Kalibrierung (~1 GB Lesen)
+# .........  vor jeder Daten-Disc erneut läuft
+# ===========================================================================
+drivestat_calibration_due() {
+    local key value
+    key=$(drivestat_get_calibration_key) || return 1
+    value=$(settings_get_value_ini "drivestat" "calibration" "$key" 2>/dev/null)
+    [[ -z "$value" ]] && return 0
+
+    #-- Fehlschlag-Marker: erst nach Ablauf der Pause erneut versuchen ------
+    if [[ "$value" == failed\|* ]]; then
+        local failed_at="${value#failed|}"
+        failed_at="${failed_at%%|*}"
+        [[ "$failed_at" =~ ^[0-9]+$ ]] || return 0
+        if (( EPOCHSECONDS - failed_at >= DRIVESTAT_CALIB_RETRY_AFTER )); then
+            return 0
+        fi
+        log_debug "$(printf "$MSG_DEBUG_CALIBRATION_BACKOFF" "$key" "$(( (failed_at + DRIVESTAT_CALIB_RETRY_AFTER - EPOCHSECONDS) / 3600 ))")"
+        return 1
+    fi
+
+    return 1
+}
+
+# ===========================================================================
+# _drivestat_mark_calibration_failed
+# ---------------------------------------------------------------------------
+# Funktion.: Speichert einen Fehlschlag-Marker für das Laufwerk, damit die
+# .........  Kalibrierung nicht vor jeder Disc wiederholt wird
+# Parameter: $1 = Kalibrierungs-Schlüssel
+# Rückgabe.: 1 (immer, zur direkten Verwendung als Fehler-Rückgabe)
+# Speichert: conf/libdrivestat.ini [calibration] <key>=failed|<epoch>
+# ===========================================================================
+_drivestat_mark_calibration_failed() {
+    settings_set_value_ini "drivestat" "calibration" "$1" "failed|${EPOCHSECONDS}"
+    return 1
+}
+
+# ===========================================================================
+# drivestat_get_request_size
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert die kalibrierte Request-Größe (Bytes) für das Laufwerk
+# Parameter: $1 = Default (optional, Standard: 2048)
+# Ausgabe..: Request-Größe in Bytes
+# Rückgabe.: 0 = Kalibrierter Wert, 1 = Default (nicht kalibriert)
+# ===========================================================================
+drivestat_get_request_size() {
+    local default="${1:-2048}"
+    local calibration
+
+    calibration=$(drivestat_get_calibration) || {
+        echo "$default"
+        return 1
+    }
+
+    local request_size="${calibration%%|*}"
+    if [[ "$request_size" =~ ^[0-9]+$ ]] && [[ $request_size -gt 0 ]]; then
+        echo "$request_size"
+        return 0
+    fi
+
+    echo "$default"
+    return 1
+}
+
+# ===========================================================================
+# drivestat_apply_read_params
+# ---------------------------------------------------------------------------
+# Funktion.: Setzt den kalibrierten Readahead-Wert des Block-Device vor einem
+# .........  Kopiervorgang, der bisherige Wert wird für die Wiederherstellung
+# .........  gemerkt
+# Parameter: Keine
+# Rückgabe.: 0 = Angewendet, 1 = Nicht kalibriert oder blockdev fehlt
+# Hinweis..: Gegenstück: drivestat_restore_read_params
+# ===========================================================================
+drivestat_apply_read_params() {
+    local drive="${DRIVE_INFO[drive]}"
+    local calibration
+
+    #-- Voraussetzungen prüfen ----------------------------------------------
+    [[ -b "$drive" ]] || return 1
+    command -v blockdev >/dev/null 2>&1 || return 1
+    calibration=$(drivestat_get_calibration) || return 1
+
+    #-- Readahead aus Kalibrierung extrahieren (2. Feld) --------------------
+    local readahead
+    IFS='|' read -r _ readahead _ <<< "$calibration"
+    [[ "$readahead" =~ ^[0-9]+$ ]] || return 1
+
+    #-- Alten Wert merken und neuen Wert setzen -----------------------------
+    _DRIVESTAT_ORIGINAL_READAHEAD=$(blockdev --getra "$drive" 2>/dev/null)
+    if blockdev --setra "$readahead" "$drive" 2>/dev/null; then
+        log_info "$(printf "$MSG_INFO_READ_PARAMS_APPLIED" "$readahead" "${_DRIVESTAT_ORIGINAL_READAHEAD:-?}")"
+        return 0
+    fi
+
+    _DRIVESTAT_ORIGINAL_READAHEAD=""
+    return 1
+}
+
+# ===========================================================================
+# drivestat_restore_read_params
+# ---------------------------------------------------------------------------
+# Funktion.: Stellt den Readahead-Wert vor drivestat_apply_read_params wieder
+# .........  her
+# Parameter: Keine
+# Rückgabe.: 0 = Erfolg (oder nichts zu tun)
+# ===========================================================================
+drivestat_restore_read_params() {
+    local drive="${DRIVE_INFO[drive]}"
+
+    if [[ -n "$_DRIVESTAT_ORIGINAL_READAHEAD" ]] && [[ -b "$drive" ]]; then
+        blockdev --setra "$_DRIVESTAT_ORIGINAL_READAHEAD" "$drive" 2>/dev/null
+        log_debug "$(printf "$MSG_DEBUG_READ_PARAMS_RESTORED" "$_DRIVESTAT_ORIGINAL_READAHEAD")"
+        _DRIVESTAT_ORIGINAL_READAHEAD=""
+    fi
+    return 0
+}
+
+# ===========================================================================
+# _drivestat_measure_zone
+# ---------------------------------------------------------------------------
+# Funktion.: Misst den Lesedurchsatz eines Bereichs des eingelegten Mediums
+# Parameter: $1 = Laufwerk (z.B. /dev/sr0)
+# .........  $2 = Offset in Bytes (Vielfaches von 2048)
+# .........  $3 = Anzahl Bytes
+# .........  $4 = Request-Größe in Bytes (dd bs)
+# Ausgabe..: Durchsatz in KB/s (0 bei Lesefehler)
+# Rückgabe.: 0 = Erfolg, 1 = Lesefehler/Timeout
+# Hinweis..: Leert vorher den Buffer-Cache des Device, damit wiederholte
+# .........  Messungen desselben Bereichs nicht aus dem RAM bedient werden
+# ===========================================================================
+_drivestat_measure_zone() {
+    local drive="$1"
+    local offset="$2"
+    local sample_bytes="$3"
+    local request_size="$4"
+
+    #-- Buffer-Cache leeren -------------------------------------------------
+    blockdev --flushbufs "$drive" 2>/dev/null
+
+    #-- Lesen und Zeit messen -----------------------------------------------
+    local start_ns end_ns
+    start_ns=$(date +%s%N)
+    if ! timeout "$DRIVESTAT_CALIB_TIMEOUT" dd if="$drive" of=/dev/null bs="$request_size" \
+            skip="$offset" count="$sample_bytes" iflag=skip_bytes,count_bytes 2>/dev/null; then
+        echo "0"
+        return 1
+    fi
+    end_ns=$(date +%s%N)
+
+    #-- Durchsatz berechnen (Integer-Arithmetik) ----------------------------
+    local elapsed_ms=$(( (end_ns - start_ns) / 1000000 ))
+    [[ $elapsed_ms -lt 1 ]] && elapsed_ms=1
+    echo $(( sample_bytes / 1024 * 1000 / elapsed_ms ))
+    return 0
+}
+
+# ===========================================================================
+# drivestat_calibrate
+# ---------------------------------------------------------------------------
+# Funktion.: Kalibriert die Leseparameter des aktuellen Laufwerks anhand des
+# .........  eingelegten Mediums. Für jede Kombination aus Readahead und
+# .........  Request-Größe wird der Durchsatz in drei Zonen (innen, Mitte,
+# .........  außen) gemessen, die schnellste Kombination wird pro Hersteller/
+# .........  Modell/Firmware gespeichert.
+# Parameter: $1 = Stichprobengröße pro Zone in MB (optional)
+# Rückgabe.: 0 = Erfolg, 1 = Fehler (kein Medium, Tools fehlen, Lesefehler)
+# Speichert: conf/libdrivestat.ini [calibration] <key>=rs|ra|kbps|timestamp
+# .........  bzw. <key>=failed|<epoch> bei Mediengröße/Messfehlern
+# .........  api/drivestat.json .calibration (inkl. aller Messwerte)
+# Hinweis..: Nur für Daten-Medien sinnvoll (Audio-CDs sind nicht per dd
+# .........  lesbar). Der ursprüngliche Readahead wird wiederhergestellt.
+# ===========================================================================
+drivestat_calibrate() {
+    local sample_mb="${1:-${DRIVE_CALIBRATION_SAMPLE_MB:-$DRIVESTAT_CALIB_SAMPLE_MB}}"
+    local drive="${DRIVE_INFO[drive]}"
+
+    #-- Voraussetzungen prüfen ----------------------------------------------
+    if [[ ! -b "$drive" ]]; then
+        log_error "$MSG_ERROR_CALIBRATION_NO_DRIVE"
+        return 1
+    fi
+    if ! command -v blockdev >/dev/null 2>&1; then
+        log_error "$MSG_ERROR_CALIBRATION_TOOL_MISSING"
+        return 1
+    fi
+    local key
+    key=$(drivestat_get_calibration_key) || {
+        log_error "$MSG_ERROR_CALIBRATION_NO_KEY"
+        return 1
+    }
+
+    #-- Mediengröße ermitteln und Stichprobe begrenzen ----------------------
+    local media_bytes
+    media_bytes=$(blockdev --getsize64 "$drive" 2>/dev/null)
+    if [[ ! "$media_bytes" =~ ^[0-9]+$ ]] || [[ $media_bytes -lt 1048576 ]]; then
+        log_error "$MSG_ERROR_CALIBRATION_SIZE"
+        _drivestat_mark_calibration_failed "$key"
+        return 1
+    fi
+    local sample_bytes=$(( sample_mb * 1024 * 1024 ))
+    [[ $sample_bytes -gt $(( media_bytes / 4 )) ]] && sample_bytes=$(( media_bytes / 4 ))
+    sample_bytes=$(( sample_bytes / 2048 * 2048 ))
+
+    #-- Zonen-Offsets berechnen (äußere Zone mit 1% Abstand zum Lead-Out) ---
+    local -A zone_offset=(
+        [inner]=0
+        [middle]=$(( (media_bytes / 2) / 2048 * 2048 ))
+        [outer]=$(( (media_bytes - media_bytes / 100 - sample_bytes) / 2048 * 2048 ))
+    )
+    [[ ${zone_offset[outer]} -lt 0 ]] && zone_offset[outer]=0
+
+    log_info "$(printf "$MSG_INFO_CALIBRATION_START" "$key" "$(( sample_bytes / 1048576 ))")"
+
+    #-- Laufwerk hochdrehen (erste Messung sonst durch Spin-Up verfälscht) --
+    _drivestat_measure_zone "$drive" 0 1048576 65536 >/dev/null
+
+    #-- Alle Kombinationen messen -------------------------------------------
+    local original_ra=$(blockdev --getra "$drive" 2>/dev/null)
+    local best_rs=0 best_ra=0 best_kbps=0
+    local results_json="["
+    local first=true
+    local ra rs zone
+
+    for ra in $DRIVESTAT_CALIB_READAHEAD; do
+        blockdev --setra "$ra" "$drive" 2>/dev/null || continue
+
+        for rs in $DRIVESTAT_CALIB_REQUEST_SIZES; do
+            local sum_kbps=0 zones=0 kbps
+            for zone in $DRIVESTAT_CALIB_ZONES; do
+                kbps=$(_drivestat_measure_zone "$drive" "${zone_offset[$zone]}" "$sample_bytes" "$rs") || continue
+                sum_kbps=$(( sum_kbps + kbps ))
+                ((zones++))
+            done
+            [[ $zones -eq 0 ]] && continue
+
+            local avg_kbps=$(( sum_kbps / zones ))
+            log_debug "$(printf "$MSG_DEBUG_CALIBRATION_RESULT" "$ra" "$rs" "$avg_kbps")"
+
+            [[ "$first" == false ]] && results_json+="," || first=false
+            results_json+="{\"readahead\":$ra,\"request_size\":$rs,\"throughput_kbps\":$avg_kbps,\"zones\":$zones}"
+
+            if [[ $avg_kbps -gt $best_kbps ]]; then
+                best_kbps=$avg_kbps
+                best_rs=$rs
+                best_ra=$ra
+            fi
+        done
+    done
+    results_json+="]"
+
+    #-- Ursprünglichen Readahead wiederherstellen ---------------------------
+    [[ -n "$original_ra" ]] && blockdev --setra "$original_ra" "$drive" 2>/dev/null
+
+    if [[ $best_kbps -eq 0 ]]; then
+        log_error "$MSG_ERROR_CALIBRATION_FAILED"
+        _drivestat_mark_calibration_failed "$key"
+        return 1
+    fi
+
+    #-- Ergebnis persistent speichern (pro Hersteller/Modell/Firmware) ------
+    local timestamp=$(date '+%Y-%m-%dT%H:%M:%S')
+    settings_set_value_ini "drivestat" "calibration" "$key" "${best_rs}|${best_ra}|${best_kbps}|${timestamp}" || return 1
+
+    #-- Ergebnis in der API bereitstellen -----------------------------------
+    api_set_section_json "drivestat" ".calibration" "{\"key\":\"$key\",\"request_size\":$best_rs,\"readahead\":$best_ra,\"throughput_kbps\":$best_kbps,\"sample_bytes\":$sample_bytes,\"calibrated_at\":\"$timestamp\",\"results\":$results_json}"
+
+    log_info "$(printf "$MSG_INFO_CALIBRATION_COMPLETE" "$best_rs" "$best_ra" "$best_kbps")"
+    return 0
+}
+
 # ===========================================================================
 # GETTER/SETTER FUNCTIONEN FÜR MODULINFORMATIONEN (SOFTWARE)
 # ===========================================================================
@@ -1230,74 +1719,259 @@ drivestat_collect_software_info() {
 }
 
 # ===========================================================================
-# HINTERGRUND ÜBERWACHUNG DES LAUFWERKSTATUS
+# EREIGNISGESTEUERTE ÜBERWACHUNG DES LAUFWERKSTATUS (UDEV)
+# ---------------------------------------------------------------------------
+# Statt den Laufwerkstatus alle 2 Sekunden per lsblk/dd/cdparanoia abzu-
+# fragen, lauscht ein Listener (udevadm monitor, Coprozess) auf Kernel-/udev-
+# Ereignisse der optischen Laufwerke (Medium eingelegt/entfernt, Laufwerk
+# angeschlossen/getrennt). Die State Machine blockiert in
+# drivestat_wait_event() bis ein Ereignis eintrifft. Ein Poll mit niedriger
+# Frequenz (DRIVE_EVENT_FALLBACK_POLL) bleibt als Rückfallebene aktiv, ohne
+# udevadm wird wie bisher im Intervall des Aufrufers gepollt.
+#
+# Messwerte (api/drivestat.json → .detection):
+#   mode, events, fallback_polls, idle_forks_per_sec (systemweit, gemessen
+#   während der Wartezeit), insert_to_analysis_ms (Ereignis → Analyse)
+# ===========================================================================
+_DRIVESTAT_MONITOR_PID=""           # PID des Ereignis-Listeners (Coprozess)
+_DRIVESTAT_EVENT_FD=""              # Lese-Deskriptor des Listeners
+_DRIVESTAT_EVENT_TS=""              # Zeitpunkt des letzten Medium-Ereignisses
+declare -gA _DRIVESTAT_DETECTION=(
+    [events]=0
+    [fallback_polls]=0
+    [idle_forks]=0
+    [idle_usec]=0
+    [insert_to_analysis_ms]=""
+)
+
 # ===========================================================================
-_DRIVESTAT_MONITOR_PID=""           # PID des Hintergrund-Monitoring-Workers
+# _drivestat_event_listener
+# ---------------------------------------------------------------------------
+# Funktion.: Liest udev-Ereignisse des Block-Subsystems und gibt für
+# .........  optische Laufwerke je Ereignis eine Zeile aus
+# Parameter: keine
+# Ausgabe..: "<zeitstempel> <action> <devname> <media>" (stdout)
+# .........  media: 1 = Medium vorhanden, 0 = kein Medium, eject = Auswurf
+# Rückgabe.: läuft bis udevadm beendet wird
+# ===========================================================================
+_drivestat_event_listener() {
+    local line action="" devname="" cdrom="" media="0"
+
+    udevadm monitor --udev --subsystem-match=block --property 2>/dev/null | \
+    while IFS= read -r line; do
+        case "$line" in
+            ACTION=*)               action="${line#ACTION=}" ;;
+            DEVNAME=*)              devname="${line#DEVNAME=}" ;;
+            ID_CDROM=1)             cdrom=1 ;;
+            ID_CDROM_MEDIA=1)       media=1 ;;
+            DISK_EJECT_REQUEST=1)   media="eject" ;;
+            "")
+                #-- Ereignisblock vollständig → nur optische Laufwerke ------
+                if [[ -n "$devname" ]] && { [[ "$cdrom" == "1" ]] || [[ "$devname" == /dev/sr* ]]; }; then
+                    echo "${EPOCHREALTIME/[.,]/} ${action:-change} ${devname} ${media}"
+                fi
+                action="" devname="" cdrom="" media="0"
+                ;;
+        esac
+    done
+}
 
 # ===========================================================================
-# _drivestat_monitor_worker
+# _drivestat_read_fork_counter
 # ---------------------------------------------------------------------------
-# Funktion.: Hintergrund-Worker, der regelmäßig den Laufwerkstatus überprüft
-# .........  und bei Änderungen die entsprechenden Setter-Funktionen aufruft
-# Parameter: Keine
-# Rückgabe.: Läuft endlos im Hintergrund, Rückgabe nur bei Fehler
-# Hinweis..: Vergleicht den aktuellen Status mit dem vorherigen und ruft nur
-# .........  bei Änderungen die Setter-Funktionen auf, um unnötige API-
-# .........  Updates zu vermeiden
-# ===========================================================================
-_drivestat_monitor_worker() {
-    #-- Variablen für vorherigen Status (initial leer) ----------------------
-    local prev_drive
-    local prev_closed
-    local prev_inserted
-
-    #-- Endlosschleife zur regelmäßigen Überprüfung -------------------------
-    while true; do
-        #-- Ermitteln des aktuellen Status ----------------------------------
-        local curr_drive=$(drivestat_detect_drive)
-        local curr_closed=$(drivestat_detect_closed && echo "1" || echo "0")
-        local curr_inserted=$(drivestat_detect_inserted && echo "1" || echo "0")
-
-        #-- Vergleichen und Setter-Funktionen bei Änderungen aufrufen -------
-        [[ "$prev_drive" != "$curr_drive" ]] && {
-            if [[ -z "$curr_drive" ]]; then
-                drivestat_reset                                    # NO_DRIVE
-            else
-                drivestat_analyse                              # DRIVE_DETECT
+# Funktion.: Liest den systemweiten Prozess-Zähler (forks seit Boot) ohne
+# .........  selbst einen Prozess zu starten
+# Parameter: keine
+# Ausgabe..: Zähler (stdout, 0 falls /proc/stat fehlt)
+# ===========================================================================
+_drivestat_read_fork_counter() {
+    local key value
+    if [[ -r /proc/stat ]]; then
+        while read -r key value _; do
+            [[ "$key" == "processes" ]] && { echo "$value"; return 0; }
+        done < /proc/stat
+    fi
+    echo 0
+}
+
+# ===========================================================================
+# _drivestat_probe_media
+# ---------------------------------------------------------------------------
+# Funktion.: Aktualisiert Schubladen- und Medium-Status durch direkte
+# .........  Abfrage des Laufwerks (Rückfallebene ohne Ereignis). Ist noch
+# .........  kein Laufwerk bekannt, wird es zuerst ermittelt.
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg, 1 = kein Laufwerk bekannt
+# ===========================================================================
+_drivestat_probe_media() {
+    #-- Noch kein Laufwerk bekannt → Laufwerk ermitteln ---------------------
+    if [[ -z "${DRIVE_INFO[drive]}" ]]; then
+        drivestat_analyse || return 1
+    fi
+
+    if [[ ! -b "${DRIVE_INFO[drive]}" ]]; then
+        drivestat_reset
+        return 1
+    fi
+    drivestat_detect_closed && drivestat_set_closed "true" || drivestat_set_closed "false"
+    drivestat_set_inserted "$(drivestat_detect_inserted)"
+    drivestat_set_status
+}
+
+# ===========================================================================
+# _drivestat_apply_event
+# ---------------------------------------------------------------------------
+# Funktion.: Überträgt ein Ereignis des Listeners auf DRIVE_INFO
+# Parameter: $1 = Zeitstempel (µs), $2 = Action, $3 = Device, $4 = Media
+# Rückgabe.: 0 = Ereignis betrifft dieses Laufwerk, 1 = fremdes Laufwerk
+# ===========================================================================
+_drivestat_apply_event() {
+    local timestamp="$1" action="$2" devname="$3" media="$4"
+
+    #-- Im Multi-Drive-Betrieb nur Ereignisse des eigenen Laufwerks ---------
+    if [[ -n "${DRIVE_INFO[drive]}" ]] && [[ "$devname" != "${DRIVE_INFO[drive]}" ]]; then
+        return 1
+    fi
+
+    (( _DRIVESTAT_DETECTION[events]++ ))
+    log_debug "$(printf "$MSG_DEBUG_DRIVE_EVENT" "$action" "$devname" "$media")"
+
+    #-- Laufwerk entfernt → Status zurücksetzen ----------------------------
+    if [[ "$action" == "remove" ]]; then
+        [[ -n "${DRIVE_INFO[drive]}" ]] && drivestat_reset
+        return 0
+    fi
+
+    #-- Laufwerk ohne bekannten Pfad → Aufrufer übernimmt die Analyse ------
+    [[ -n "${DRIVE_INFO[drive]}" ]] || return 0
+
+    case "$media" in
+        1)
+            #-- udev hat das Medium bereits geprüft → kein dd-Test nötig ----
+            drivestat_set_closed "true"
+            drivestat_set_inserted "true"
+            _DRIVESTAT_EVENT_TS="$timestamp"
+            ;;
+        eject)
+            drivestat_set_inserted "false"
+            ;;
+        *)
+            drivestat_set_inserted "false"
+            drivestat_detect_closed && drivestat_set_closed "true" || drivestat_set_closed "false"
+            ;;
+    esac
+    drivestat_set_status
+    return 0
+}
+
+# ===========================================================================
+# _drivestat_update_detection_stats
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt die Messwerte der Erkennung in die API
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg
+# ===========================================================================
+_drivestat_update_detection_stats() {
+    local mode="poll"
+    [[ -n "$_DRIVESTAT_EVENT_FD" ]] && mode="udev"
+
+    local forks_per_sec="0"
+    if [[ ${_DRIVESTAT_DETECTION[idle_usec]} -gt 0 ]]; then
+        local rate=$(( _DRIVESTAT_DETECTION[idle_forks] * 100000000 / _DRIVESTAT_DETECTION[idle_usec] ))
+        forks_per_sec="$(( rate / 100 )).$(printf '%02d' $(( rate % 100 )))"
+    fi
+
+    api_set_section_json "drivestat" ".detection" "{\"mode\":\"${mode}\",\"events\":${_DRIVESTAT_DETECTION[events]},\"fallback_polls\":${_DRIVESTAT_DETECTION[fallback_polls]},\"idle_forks_per_sec\":${forks_per_sec},\"insert_to_analysis_ms\":${_DRIVESTAT_DETECTION[insert_to_analysis_ms]:-null}}"
+}
+
+# ===========================================================================
+# drivestat_wait_event
+# ---------------------------------------------------------------------------
+# Funktion.: Blockiert bis ein Laufwerks-Ereignis eintrifft oder das
+# .........  Intervall abläuft und aktualisiert danach DRIVE_INFO
+# Parameter: $1 = Poll-Intervall in Sekunden ohne udev (z.B. 2)
+# Rückgabe.: 0 = Ereignis empfangen, 1 = Timeout (Status per Poll geprüft)
+# Hinweis..: Mit udev wird statt $1 DRIVE_EVENT_FALLBACK_POLL verwendet
+# ===========================================================================
+drivestat_wait_event() {
+    local timeout="${1:-2}"
+    [[ -n "$_DRIVESTAT_EVENT_FD" ]] && timeout="${DRIVE_EVENT_FALLBACK_POLL:-60}"
+
+    local start_usec="${EPOCHREALTIME/[.,]/}"
+    local forks_before=$(_drivestat_read_fork_counter)
+    local deadline=$(( SECONDS + timeout ))
+    local got_event=1 read_result timestamp action devname media
+
+    if [[ -n "$_DRIVESTAT_EVENT_FD" ]]; then
+        while [[ $SECONDS -lt $deadline ]]; do
+            read -r -t "$(( deadline - SECONDS ))" -u "$_DRIVESTAT_EVENT_FD" timestamp action devname media
+            read_result=$?
+            if [[ $read_result -gt 128 ]]; then
+                break                                              # Timeout
+            elif [[ $read_result -ne 0 ]]; then
+                #-- Listener beendet → dauerhaft auf Polling umstellen ------
+                log_warning "$MSG_WARNING_DRIVE_EVENTS_LOST"
+                drivestat_stop_monitor
+                break
             fi
-        }
+            _drivestat_apply_event "$timestamp" "$action" "$devname" "$media" && { got_event=0; break; }
+        done
+    else
+        sleep "$timeout"
+    fi
 
-        [[ "$prev_closed" != "$curr_closed" ]] && {
-            drivestat_set_closed                 # LAUFWERK OFFEN/GESCHLOSSEN
-        }
+    #-- Wartezeit als Leerlauf verbuchen (vor eigenen Abfragen) -------------
+    (( _DRIVESTAT_DETECTION[idle_forks] += $(_drivestat_read_fork_counter) - forks_before ))
+    (( _DRIVESTAT_DETECTION[idle_usec] += ${EPOCHREALTIME/[.,]/} - start_usec ))
 
-        [[ "$prev_inserted" != "$curr_inserted" ]] && {
-            drivestat_set_inserted                # MEDIUM EINGELEGT/ENTFERNT
-        }
+    #-- Kein Ereignis → Status direkt abfragen (Rückfallebene) --------------
+    [[ $got_event -ne 0 ]] && (( _DRIVESTAT_DETECTION[fallback_polls]++ ))
+    if [[ $got_event -ne 0 ]] || [[ -z "${DRIVE_INFO[drive]}" ]]; then
+        _drivestat_probe_media
+    fi
 
+    _drivestat_update_detection_stats
+    return $got_event
+}
 
-        [[ ("$prev_closed" != "$curr_closed") || ("$prev_inserted" != "$curr_inserted") ]] && {
-            drivestat_set_status # Gesamtstatus basierend auf CLOSED/INSERTED
-        }
+# ===========================================================================
+# drivestat_media_event_pending
+# ---------------------------------------------------------------------------
+# Funktion.: Prüft ob das aktuelle Medium per udev-Ereignis gemeldet wurde
+# .........  (udev hat es bereits geprüft → keine Spin-Up-Pause nötig)
+# Parameter: keine
+# Rückgabe.: 0 = ja, 1 = nein (Poll-Erkennung)
+# ===========================================================================
+drivestat_media_event_pending() {
+    [[ -n "$_DRIVESTAT_EVENT_TS" ]]
+}
 
-        #-- Aktualisieren des vorherigen Status für die nächste Iteration ---
-        prev_drive="$curr_drive"
-        prev_closed="$curr_closed"
-        prev_inserted="$curr_inserted"
+# ===========================================================================
+# drivestat_record_analysis_start
+# ---------------------------------------------------------------------------
+# Funktion.: Erfasst die Latenz zwischen Medium-Ereignis und Start der
+# .........  Analyse (insert_to_analysis_ms) und setzt das Ereignis zurück
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg
+# ===========================================================================
+drivestat_record_analysis_start() {
+    [[ -n "$_DRIVESTAT_EVENT_TS" ]] || return 0
 
-        #-- Wartezeit von 2 Sekunden vor der nächsten Überprüfung -----------
-        sleep 2
-    done
+    _DRIVESTAT_DETECTION[insert_to_analysis_ms]=$(( (${EPOCHREALTIME/[.,]/} - _DRIVESTAT_EVENT_TS) / 1000 ))
+    _DRIVESTAT_EVENT_TS=""
+    log_debug "$(printf "$MSG_DEBUG_DRIVE_EVENT_LATENCY" "${_DRIVESTAT_DETECTION[insert_to_analysis_ms]}")"
+    _drivestat_update_detection_stats
+    return 0
 }
 
 # ===========================================================================
 # drivestat_start_monitor
 # ---------------------------------------------------------------------------
-# Funktion.: Startet den Hintergrund-Monitoring-Worker für das Laufwerk
+# Funktion.: Startet den udev-Ereignis-Listener für das Laufwerk
 # Parameter: Keine
-# Rückgabe.: 0 = Erfolg, 1 = Fehler
-# Hinweis..: Speichert die PID des Workers in _DRIVESTAT_MONITOR_PID
-# .........  und loggt den Startvorgang
+# Rückgabe.: 0 = Erfolg (auch ohne udev, dann Polling)
+# Hinweis..: DRIVE_EVENTS=off erzwingt Polling. Der Listener läuft als
+# .........  Coprozess, drivestat_wait_event() liest seine Ausgabe.
 # ===========================================================================
 drivestat_start_monitor() {
     #-- Überprüfen ob bereits ein Monitor läuft -----------------------------
@@ -1306,30 +1980,41 @@ drivestat_start_monitor() {
         return 0
     fi
 
-    #-- Starte den Monitor-Worker im Hintergrund ----------------------------
-    _drivestat_monitor_worker &
-    _DRIVESTAT_MONITOR_PID=$!
+    #-- udev verfügbar? Sonst Polling im Intervall der State Machine --------
+    if [[ "${DRIVE_EVENTS:-auto}" == "off" ]] || ! command -v udevadm >/dev/null 2>&1 \
+       || [[ ! -d /run/udev ]]; then
+        log_warning "$MSG_WARNING_DRIVE_EVENTS_UNAVAILABLE"
+        _drivestat_update_detection_stats
+        return 0
+    fi
+
+    #-- Listener als Coprozess starten --------------------------------------
+    coproc _DRIVESTAT_EVENTS { _drivestat_event_listener; }
+    _DRIVESTAT_MONITOR_PID="$_DRIVESTAT_EVENTS_PID"
+    _DRIVESTAT_EVENT_FD="${_DRIVESTAT_EVENTS[0]}"
     log_debug "$(printf "$MSG_DEBUG_MONITOR_STARTED" "$_DRIVESTAT_MONITOR_PID")"
+    _drivestat_update_detection_stats
     return 0
 }
 
 # ===========================================================================
 # drivestat_stop_monitor
 # ---------------------------------------------------------------------------
-# Funktion.: Stoppt den Hintergrund-Monitoring-Worker für das Laufwerk
+# Funktion.: Stoppt den udev-Ereignis-Listener für das Laufwerk
 # Parameter: Keine
-# Rückgabe.: 0 = Erfolg, 1 = Fehler
-# Hinweis..: Beendet den Worker-Prozess basierend auf der gespeicherten PID
-# .........  und loggt den Stoppvorgang
+# Rückgabe.: 0 = Erfolg
+# Hinweis..: Beendet den Coprozess samt udevadm und schließt den Deskriptor
 # ===========================================================================
 drivestat_stop_monitor() {
     #-- Überprüfen ob ein Monitor läuft --------------------------------------
-    if [[ -n "$_DRIVESTAT_MONITOR_PID" ]] && kill -0 "$_DRIVESTAT_MONITOR_PID" 2>/dev/null; then
+    if [[ -n "$_DRIVESTAT_MONITOR_PID" ]]; then
         log_debug "$(printf "$MSG_DEBUG_MONITOR_STOPPED" "$_DRIVESTAT_MONITOR_PID")"
-        kill "$_DRIVESTAT_MONITOR_PID" 2>/dev/null;
+        pkill -P "$_DRIVESTAT_MONITOR_PID" 2>/dev/null
+        kill "$_DRIVESTAT_MONITOR_PID" 2>/dev/null
+        wait "$_DRIVESTAT_MONITOR_PID" 2>/dev/null
+        [[ -n "$_DRIVESTAT_EVENT_FD" ]] && exec {_DRIVESTAT_EVENT_FD}<&- 2>/dev/null
         _DRIVESTAT_MONITOR_PID=""
-    else
-        log_warning "$MSG_WARNING_NO_MONITOR_TO_STOP"
+        _DRIVESTAT_EVENT_FD=""
     fi
     return 0
 }
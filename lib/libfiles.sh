@@ -50,66 +50,92 @@ files_check_dependencies() {
 # ============================================================================
 # FAILED DISC TRACKING PATH
 # ============================================================================
-readonly FAILED_DISCS_FILE=".failed_discs"    # Zentrale Fehler-Tracking Datei
+readonly FAILED_DISCS_DIR=".failed_discs.d"   # Fehler-Tracking, 1 Datei pro Disc
 
 # ===========================================================================
 # get_failed_disc_path
 # ---------------------------------------------------------------------------
-# Funktion.: Liefert Pfad zur Failed-Disc-Tracking-Datei (INI-Format)
+# Funktion.: Liefert Pfad zum Failed-Disc-Verzeichnis (eine Datei pro Disc,
+# .........  Dateiname = Schlüssel aus Disc-Typ und Identifier)
 # Parameter: keine
-# Rückgabe.: 0 = Datei existiert/wurde erstellt (Pfad in stdout)
+# Rückgabe.: 0 = Verzeichnis existiert/wurde erstellt (Pfad in stdout)
 #            1 = Fehler beim Erstellen/Zugriff
-# Beispiel.: local failed_file
-#            failed_file=$(get_failed_disc_path) || return 1
-#            → "/media/iso/.failed_discs"
-# Extras...: Erstellt Datei automatisch falls nicht vorhanden
+# Beispiel.: local failed_dir
+#            failed_dir=$(get_failed_disc_path) || return 1
+#            → "/media/iso/.failed_discs.d"
+# Extras...: Erstellt Verzeichnis automatisch falls nicht vorhanden
 #            Nutzt folders_get_output_dir() aus libfolders.sh
 #            Pattern für alle Dateipfad-Funktionen in libfiles.sh
 # ===========================================================================
 get_failed_disc_path() {
-    #-- Eröffne Debug-Log ---------------------------------------------------
-    log_debug "get_failed_disc_path: Start"
-
-    #-- Ermittle Ausgabe-Ordner ---------------------------------------------    
+    #-- Ermittle Ausgabe-Ordner ---------------------------------------------
     local out_dir
     out_dir=$(folders_get_output_dir) || {
         log_error "get_failed_disc_path: folders_get_output_dir fehlgeschlagen"
         return 1
     }
-    
-    #-- Vollständigen Pfad zur Failed-Disc-Datei erstellen ------------------
-    local failed_file="${out_dir}/${FAILED_DISCS_FILE}"
-    
-    #-- Prüfe ob Datei bereits existiert ------------------------------------
-    if [[ -f "$failed_file" ]]; then
-        log_debug "get_failed_disc_path: Datei existiert bereits: $failed_file"
-        echo "$failed_file"
+
+    #-- Vollständigen Pfad zum Failed-Disc-Verzeichnis erstellen ------------
+    local failed_dir="${out_dir}/${FAILED_DISCS_DIR}"
+    if [[ -d "$failed_dir" ]]; then
+        echo "$failed_dir"
         return 0
     fi
-    
-    #-- Erstelle Datei mit INI-Header ---------------------------------------
-    log_debug "get_failed_disc_path: Erstelle neue Datei: $failed_file"
-    {
-        echo "# Failed Disc Tracking (INI Format)"
-        echo "# Format: UUID:LABEL:SIZE_MB=timestamp|method|retry_count"
-        echo "# Sections: [data], [audio], [dvd], [bluray]"
-        echo ""
-    } > "$failed_file"
-    
-    if [[ $? -eq 0 ]]; then
-        #-- Prüfe ob Erstellung erfolgreich war -----------------------------
-        if [[ -f "$failed_file" ]]; then
-            log_debug "get_failed_disc_path: Datei erfolgreich erstellt: $failed_file"
-            echo "$failed_file"
-            return 0
-        else
-            log_error "get_failed_disc_path: Datei-Erstellung fehlgeschlagen (Datei nicht vorhanden): $failed_file"
-            return 1
-        fi
-    else
-        log_error "get_failed_disc_path: Datei-Erstellung fehlgeschlagen (cat-Fehler): $failed_file"
+
+    #-- Erstelle Verzeichnis ------------------------------------------------
+    mkdir -p "$failed_dir" 2>/dev/null || {
+        log_error "get_failed_disc_path: Verzeichnis-Erstellung fehlgeschlagen: $failed_dir"
         return 1
+    }
+
+    echo "$failed_dir"
+    return 0
+}
+
+# ============================================================================
+# ARCHIVE REGISTRY PATH
+# ============================================================================
+readonly ARCHIVE_REGISTRY_FILE=".archive_registry"  # Bereits archivierte Discs
+
+# ===========================================================================
+# get_archive_registry_path
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert Pfad zum Archiv-Register (bereits archivierte Discs)
+# Parameter: keine
+# Rückgabe.: 0 = Datei existiert/wurde erstellt (Pfad in stdout)
+#            1 = Fehler beim Erstellen/Zugriff
+# Beispiel.: local registry_file
+#            registry_file=$(get_archive_registry_path) || return 1
+#            → "/media/iso/.archive_registry"
+# Extras...: Erstellt Datei automatisch falls nicht vorhanden
+#            Eine Zeile pro Disc, Felder durch TAB getrennt
+# ===========================================================================
+get_archive_registry_path() {
+    #-- Ermittle Ausgabe-Ordner ---------------------------------------------
+    local out_dir
+    out_dir=$(folders_get_output_dir) || {
+        log_error "get_archive_registry_path: folders_get_output_dir fehlgeschlagen"
+        return 1
+    }
+
+    #-- Vollständigen Pfad zum Register erstellen ---------------------------
+    local registry_file="${out_dir}/${ARCHIVE_REGISTRY_FILE}"
+    if [[ -f "$registry_file" ]]; then
+        echo "$registry_file"
+        return 0
     fi
+
+    #-- Erstelle Datei mit Header -------------------------------------------
+    {
+        echo "# Archive Registry (TAB-separiert)"
+        echo "# Format: identifier  vd_hash  size_sectors  type  method  md5  archived_at  iso_path"
+    } > "$registry_file" 2>/dev/null || {
+        log_error "get_archive_registry_path: Datei-Erstellung fehlgeschlagen: $registry_file"
+        return 1
+    }
+
+    echo "$registry_file"
+    return 0
 }
 
 # ============================================================================
@@ -124,6 +150,67 @@ sanitize_filename() {
     echo "$filename" | sed 's/[<>:"/\\|?*]/_/g' | sed 's/[[:space:]]/_/g' | sed 's/__*/_/g'
 }
 
+# ============================================================================
+# STAGING (LOKALES ZWISCHENLAGER)
+# ============================================================================
+
+# ===========================================================================
+# get_staging_path
+# ---------------------------------------------------------------------------
+# Funktion.: Bildet einen Archiv-Pfad (unterhalb des Ausgabe-Verzeichnis)
+# .........  auf den entsprechenden Pfad im Staging-Verzeichnis ab
+# Parameter: $1 = Pfad im Ausgabe-Verzeichnis
+# Rückgabe.: Staging-Pfad (stdout), Return 1 = Staging deaktiviert
+# ===========================================================================
+get_staging_path() {
+    local archive_path="$1"
+    local staging_dir output_dir
+
+    staging_dir=$(folders_get_staging_dir) || return 1
+    output_dir=$(folders_get_output_dir) || return 1
+
+    echo "${staging_dir}/${archive_path#${output_dir}/}"
+    return 0
+}
+
+# ===========================================================================
+# get_archive_path
+# ---------------------------------------------------------------------------
+# Funktion.: Gegenstück zu get_staging_path() - liefert den endgültigen
+# .........  Pfad im Ausgabe-Verzeichnis für eine Datei im Staging
+# Parameter: $1 = Pfad im Staging-Verzeichnis
+# Rückgabe.: Archiv-Pfad (stdout)
+# .........  Return 1 = Datei liegt nicht im Staging (bereits im Archiv)
+# ===========================================================================
+get_archive_path() {
+    local staged_path="$1"
+    local staging_dir output_dir
+
+    staging_dir=$(folders_get_staging_dir) || return 1
+    [[ "$staged_path" == "${staging_dir}/"* ]] || return 1
+    output_dir=$(folders_get_output_dir) || return 1
+
+    echo "${output_dir}/${staged_path#${staging_dir}/}"
+    return 0
+}
+
+# ============================================================================
+# KOMPRIMIERTE IMAGES (.iso.zst)
+# ============================================================================
+
+# ===========================================================================
+# get_image_stem
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert den Pfad eines Images ohne Endung (.iso bzw. .iso.zst),
+# .........  Basis für die Begleitdateien (.md5, .nfo, .idx)
+# Parameter: $1 = Pfad zum Image
+# Rückgabe.: Pfad ohne Endung (stdout)
+# ===========================================================================
+get_image_stem() {
+    local image_path="${1%.zst}"
+    echo "${image_path%.iso}"
+}
+
 # ============================================================================
 # FILENAME GENERATION
 # ============================================================================
@@ -136,6 +223,8 @@ sanitize_filename() {
 #            $2 = base_name (Basis-Name ohne .iso)
 #            $3 = existing_file (optional, existierende Datei die umbenannt wird)
 # Rückgabe.: Eindeutiger Pfad (mit _1, _2 etc. falls nötig)
+# Hinweis..: Bei aktivem Staging zählen auch noch nicht migrierte Images,
+# .........  komprimierte Images (.iso.zst) belegen den Namen ebenfalls
 # ===========================================================================
 get_unique_iso_path() {
     local target_dir="$1"
@@ -146,8 +235,25 @@ get_unique_iso_path() {
     local full_path="${target_dir}/${base_filename}"
     
     # Prüfe ob Datei bereits existiert und füge Nummer hinzu
+    # Im Multi-Drive-Betrieb wird der Name atomar reserviert (noclobber),
+    # damit zwei Laufwerke mit gleichem Disc-Label nicht dieselbe Datei wählen
     local counter=1
-    while [[ -f "$full_path" ]] && [[ "$full_path" != "$existing_file" ]]; do
+    while true; do
+        if [[ "$full_path" == "$existing_file" ]]; then
+            break
+        fi
+        local staged_path
+        staged_path=$(get_staging_path "$full_path") || staged_path=""
+        if [[ ! -f "$full_path" ]] && [[ ! -f "${full_path}.zst" ]] && \
+           [[ -z "$staged_path" || ( ! -f "$staged_path" && ! -f "${staged_path}.zst" ) ]]; then
+            [[ -z "${DRIVESTAT_INSTANCE:-}" ]] && break
+            if [[ -n "$staged_path" ]]; then
+                mkdir -p "$(dirname "$staged_path")" 2>/dev/null
+                ( set -C; : > "$staged_path" ) 2>/dev/null && break
+            else
+                ( set -C; : > "$full_path" ) 2>/dev/null && break
+            fi
+        fi
         base_filename="${base_name}_${counter}.iso"
         full_path="${target_dir}/${base_filename}"
         ((counter++))
@@ -177,12 +283,12 @@ init_filenames() {
     local disc_type
     
     if ! disc_label=$(discinfo_get_label); then
-        log_error \"init_filenames: disc_label nicht gesetzt!\"
+        log_error "init_filenames: disc_label nicht gesetzt!"
         return 1
     fi
     
     if ! disc_type=$(discinfo_get_type); then
-        log_error \"init_filenames: disc_type nicht gesetzt!\"
+        log_error "init_filenames: disc_type nicht gesetzt!"
         return 1
     fi
     
@@ -205,43 +311,57 @@ init_filenames() {
             target_dir=$(folders_get_modul_output_dir)
             ;;
     esac
-    local iso_path=$(get_unique_iso_path \"$target_dir\" \"$disc_label\")
-    discinfo_set_iso_filename \"$iso_path\"
+    local iso_path=$(get_unique_iso_path "$target_dir" "$disc_label")
+
+    # 1a. Staging aktiv: zuerst lokal schreiben, Migration per Nachbearbeitung
+    local staged_path
+    if staged_path=$(get_staging_path "$iso_path"); then
+        mkdir -p "$(dirname "$staged_path")" 2>/dev/null
+        iso_path="$staged_path"
+    fi
+    discinfo_set_iso_filename "$iso_path"
     
     # 2. MD5-Dateinamen ableiten
-    local md5_path=\"${iso_path%.iso}.md5\"
-    discinfo_set_md5_filename \"$md5_path\"
+    local md5_path="${iso_path%.iso}.md5"
+    discinfo_set_md5_filename "$md5_path"
     
     # 3. Log-Dateinamen ableiten (im separaten log/ Verzeichnis)
-    local base_name=$(basename \"${iso_path%.iso}\")
+    local base_name=$(basename "${iso_path%.iso}")
     local log_path="$(folders_get_log_dir)/${base_name}.log"
-    discinfo_set_log_filename \"$log_path\"
+    discinfo_set_log_filename "$log_path"
     
     # 4. ISO-Basisname extrahieren
-    local iso_base=$(basename \"$iso_path\")
-    discinfo_set_iso_basename \"$iso_base\"
+    local iso_base=$(basename "$iso_path")
+    discinfo_set_iso_basename "$iso_base"
     
     # 5. Temp-Pathname erstellen (falls nicht bereits vorhanden)
+    #    Multi-Drive: eigenes Arbeitsverzeichnis pro Laufwerks-Instanz
+    #    (<temp>/<instanz>.tmp - die .tmp-Endung ergänzt der Setter)
     local temp_path
     if ! temp_path=$(discinfo_get_temp_pathname); then
         temp_path=$(folders_get_temp_dir)
-        discinfo_set_temp_pathname \"$temp_path\"
+        [[ -n "${DRIVESTAT_INSTANCE:-}" ]] && temp_path="${temp_path}/${DRIVESTAT_INSTANCE}"
+        discinfo_set_temp_pathname "$temp_path"
+        discinfo_get_field temp_path temp_pathname
     fi
     
     # Setze alte globale Variablen für Rückwärtskompatibilität (DEPRECATED)
-    iso_filename=\"$iso_path\"
-    md5_filename=\"$md5_path\"
-    log_filename=\"$log_path\"
-    iso_basename=\"$iso_base\"
-    temp_pathname=\"$temp_path\"
+    iso_filename="$iso_path"
+    md5_filename="$md5_path"
+    log_filename="$log_path"
+    iso_basename="$iso_base"
+    temp_pathname="$temp_path"
     
-    log_debug \"init_filenames: ISO='$iso_path', MD5='$md5_path', LOG='$log_path', TEMP='$temp_path'\"
+    log_debug "init_filenames: ISO='$iso_path', MD5='$md5_path', LOG='$log_path', TEMP='$temp_path'"
     return 0
 }
 
 # ============================================================================
 # MODULE INI PATH HELPER
 # ============================================================================
+# API-Dateien mit Laufwerks-Bezug, im Multi-Drive-Betrieb pro Instanz unter
+# api/drives/<instanz>/ abgelegt (alle anderen API-Dateien bleiben global)
+readonly API_DRIVE_SCOPED_FILES="live discinfos drivestat"
 
 # ===========================================================================
 # get_module_ini_path
@@ -360,10 +480,13 @@ get_module_conf_path() {
 #            api_file=$(get_module_api_path "tmdb") || return 1
 #            → "/opt/disk2iso/api/tmdb.json"
 # Extras...: Erstellt Datei automatisch falls nicht vorhanden (Heile dich selbst)
+# .........  Akzeptiert auch Dateinamen mit Endung ("status.json")
+# .........  Multi-Drive: Dateien aus API_DRIVE_SCOPED_FILES liegen unter
+# .........  api/drives/<DRIVESTAT_INSTANCE>/
 # Nutzt....: folders_get_api_dir() aus libfolders.sh
 # ===========================================================================
 get_module_api_path() {
-    local module_name="$1"
+    local module_name="${1%.json}"
     
     if [[ -z "$module_name" ]]; then
         log_error "Module name missing" 2>/dev/null || echo "ERROR: Module name missing" >&2
@@ -376,6 +499,12 @@ get_module_api_path() {
         return 1
     }
     
+    # Multi-Drive: Laufwerks-bezogene Dateien pro Instanz isolieren
+    if [[ -n "${DRIVESTAT_INSTANCE:-}" ]] && [[ " $API_DRIVE_SCOPED_FILES " == *" $module_name "* ]]; then
+        api_dir="${api_dir}/drives/${DRIVESTAT_INSTANCE}"
+        mkdir -p "$api_dir" 2>/dev/null || return 1
+    fi
+    
     local api_file="${api_dir}/${module_name}.json"
     
     # Prüfe ob Datei bereits existiert
@@ -141,18 +141,22 @@ _MOUNT_DIR_CREATED=false                     # Mount-Verzeichnis erstellt
 # .........  Return-Code: 0 = Erfolg, 1 = Fehler (nicht erstellbar)
 # Hinweis..: Nutzt Lazy Initialization - wird nur einmal pro Session geprüft
 # .........  Erstellt Ordner automatisch wenn Parent-Dir existiert
-# .........  Verwendet settings_get_output_dir() aus libsettings.sh für Pfad
+# .........  Liest den Pfad aus dem Settings-Snapshot (libsettings.sh)
 # ===========================================================================
 folders_get_output_dir() {
+    #-- Lese Ausgabe-Verzeichnis aus Konfiguration (Settings-Snapshot) -----
+    #-- wie settings_get_output_dir(), aber ohne Subshell ------------------
+    local output_dir
+    if ! settings_get_conf_field output_dir "disk2iso" "DEFAULT_OUTPUT_DIR" \
+       && ! settings_get_conf_field output_dir "disk2iso" "OUTPUT_DIR"; then
+        log_error "$MSG_ERROR_OUTPUT_DIR_READ_FAILED" >&2
+        echo ""
+        return 1
+    fi
+    output_dir="${output_dir%/}"
+
     #-- Lazy Initialization: Ausgabe-Verzeichnis nur einmal prüfen ----------
     if [[ "$_OUTPUT_DIR_CREATED" == false ]]; then
-        #-- Lese Ausgabe-Verzeichnis aus Konfiguration ----------------------
-        local output_dir=$(settings_get_output_dir) || {
-            log_error "$MSG_ERROR_OUTPUT_DIR_READ_FAILED" >&2
-            echo ""
-            return 1
-        }
-        
         #-- Kontrolle ob das Ausgabe-Verzeichnis bereits existiert ----------
         if [[ ! -d "$output_dir" ]]; then
             log_warning "$MSG_WARNING_OUTPUT_DIR_MISSING $output_dir$MSG_SUFFIX_TRY_CREATE" >&2
@@ -178,18 +182,12 @@ folders_get_output_dir() {
         fi
         
         #-- Flag setzen (unabhängig ob erstellt oder bereits vorhanden) ----
+        #-- Pfad nur bei der ersten Prüfung loggen -------------------------
+        log_info "$MSG_OUTPUT_DIRECTORY $output_dir" >&2
         _OUTPUT_DIR_CREATED=true
-    else
-        #-- Ausgabe-Verzeichnis wurde bereits geprüft ----------------------
-        output_dir=$(settings_get_output_dir) || {
-            log_error "$MSG_ERROR_OUTPUT_DIR_READ_FAILED" >&2
-            echo ""
-            return 1
-        }
     fi
 
     #-- Gebe Ausgabe-Verzeichnis zurück -------------------------------------
-    log_info "$MSG_OUTPUT_DIRECTORY $output_dir"
     echo "${output_dir%/}"
     return 0
 }
@@ -239,6 +237,33 @@ folders_get_temp_dir() {
     return 0
 }
 
+# ===========================================================================
+# folders_get_staging_dir
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert das lokale Staging-Verzeichnis (z.B. SSD), in das
+# .........  Images mit voller Laufwerksgeschwindigkeit geschrieben werden,
+# .........  bevor sie ins Ausgabe-Verzeichnis migriert werden
+# Parameter: keine
+# Rückgabe.: Pfad zum Staging-Verzeichnis (ohne trailing slash)
+# .........  Return-Code: 0 = Staging aktiv, 1 = deaktiviert/nicht erstellbar
+# ===========================================================================
+folders_get_staging_dir() {
+    local staging_dir
+    staging_dir=$(settings_get_staging_dir) || return 1
+
+    if [[ ! -d "$staging_dir" ]]; then
+        if ! mkdir -p "$staging_dir" 2>/dev/null; then
+            log_error "$MSG_ERROR_STAGING_DIR_CREATE_FAILED $staging_dir$MSG_SUFFIX_MISSING_PERMISSIONS" >&2
+            return 1
+        fi
+        chmod $DIR_PERMISSIONS_PUBLIC "$staging_dir" 2>/dev/null
+        log_info "$MSG_INFO_STAGING_DIR_CREATED $staging_dir" >&2
+    fi
+
+    echo "$staging_dir"
+    return 0
+}
+
 # ===========================================================================
 # folders_get_log_dir
 # ---------------------------------------------------------------------------
@@ -418,6 +443,7 @@ readonly MODULE_LANG_DIR="lang"                  # Sprachdateien
 readonly MODULE_CONF_DIR="conf"                  # Konfiguration
 readonly MODULE_DOC_DIR="doc"                    # Dokumentation
 readonly MODULE_API_DIR="api"                    # API JSON-Dateien
+readonly MODULE_API_RAM_LINK=".ram_dir"          # Verweis auf API_RAM_DIR
 
 # ===========================================================================
 # folders_get_lib_dir
@@ -522,14 +548,46 @@ folders_get_doc_dir() {
 # ===========================================================================
 # folders_get_api_dir
 # ---------------------------------------------------------------------------
-# Funktion.: Liefert den Pfad zum API-Verzeichnis für JSON-Dateien
+# Funktion.: Liefert den Pfad zum AKTIVEN API-Verzeichnis für JSON-Dateien
 # Parameter: keine
 # Rückgabe.: 0 = Ordner existiert (Pfad in stdout)
 # .........  1 = Ordner fehlt (leerer String in stdout)
 # Beispiel.: folders_get_api_dir → "/opt/disk2iso/api"
-# Hinweis..: Erstellt KEINEN Ordner - nur von install.sh erstellt
+# .........  RAM-Betrieb → "/run/disk2iso/api"
+# Hinweis..: Mit API_RAM_DIR (disk2iso.conf) legt api_init() den Verweis
+# .........  api/.ram_dir an. Existiert der Ordner aus dem Verweis (nach
+# .........  Reboot erst wieder ab Service-Start), gilt er für ALLE Leser
+# .........  (Updater, Web-UI) - ohne dass diese disk2iso.conf laden müssen.
+# .........  Erstellt KEINEN Ordner - nur von install.sh/api_init erstellt
 # ===========================================================================
 folders_get_api_dir() {
+    #-- RAM-Verzeichnis aktiv? (Verweis lesen, ohne Subshell) ---------------
+    local ram_dir=""
+    local ram_link="${INSTALL_DIR}/${MODULE_API_DIR}/${MODULE_API_RAM_LINK}"
+    if [[ -f "$ram_link" ]]; then
+        IFS= read -r ram_dir < "$ram_link"
+        if [[ -n "$ram_dir" ]] && [[ -d "$ram_dir" ]]; then
+            echo "$ram_dir"
+            return 0
+        fi
+    fi
+
+    #-- Sonst dauerhaftes Verzeichnis ---------------------------------------
+    folders_get_api_store_dir
+}
+
+# ===========================================================================
+# folders_get_api_store_dir
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert den Pfad zum dauerhaften API-Verzeichnis (Datenträger)
+# Parameter: keine
+# Rückgabe.: 0 = Ordner existiert (Pfad in stdout)
+# .........  1 = Ordner fehlt (leerer String in stdout)
+# Beispiel.: folders_get_api_store_dir → "/opt/disk2iso/api"
+# Hinweis..: Ziel für api_persist() (History) im RAM-Betrieb
+# .........  Erstellt KEINEN Ordner - nur von install.sh erstellt
+# ===========================================================================
+folders_get_api_store_dir() {
     #-- Ermitteln des kompletten Verzeichnis-Pfad ---------------------------
     local api_dir="${INSTALL_DIR}/${MODULE_API_DIR}"
     
@@ -8,6 +8,8 @@
 #   Zentrale Verwaltung von Modul-Abhängigkeiten und System-Integrität
 #   - integrity_check_module_dependencies() - Manifest-basierte Dependency-Prüfung
 #   - Validierung von Modul-Dateien, Ordnern und externen Tools
+#   - integrity_load_modules() - Laden der Module in topologischer Reihenfolge
+#     (Abhängigkeitsgraph aus allen Manifesten, Ladeplan-Cache, Ladezeiten)
 #   - Basis für zukünftige Features (Auto-Update, Repair, Diagnostics)
 #   - Verwendet INI-Manifeste (conf/lib<module>.ini)
 #
@@ -43,13 +45,13 @@ integrity_check_dependencies() {
     logging_load_language_file "integrity"
     
     # Integrity-Modul benötigt:
-    # - libsettings.sh (settings_get_value_ini, settings_get_array_ini)
+    # - libsettings.sh (settings_get_ini_field, INI-Cache der Manifeste)
     # - liblogging.sh (log_*, logging_load_language_file)
     # - libfolders.sh (folders_ensure_subfolder)
     # - libfiles.sh (files_get_*_path)
     
     # Prüfe ob benötigte Funktionen verfügbar sind
-    if ! declare -f settings_get_value_ini >/dev/null 2>&1; then
+    if ! declare -f settings_get_ini_field >/dev/null 2>&1; then
         echo "$MSG_ERROR_GET_INI_VALUE_MISSING" >&2
         return 1
     fi
@@ -73,12 +75,13 @@ integrity_check_dependencies() {
 # Parameter: $1 = module_name (z.B. "audio", "dvd", "metadata")
 # Rückgabe.: 0 = Alle kritischen Abhängigkeiten erfüllt
 #            1 = Kritische Abhängigkeiten fehlen (Modul nicht nutzbar)
-# Nutzt....: INI-Format: conf/lib<module>.ini
+# Nutzt....: INI-Format: conf/lib<module>.ini (via INI-Cache aus libsettings,
+#            ein awk-Lauf für alle Manifeste statt einem pro Key)
 # Prüft....: - Modul-Dateien (lib, lang, conf, www)
 #            - Modul-Ordner (output, cache, logs, etc.)
 #            - Externe Tools (critical + optional)
-# TODO.....: Interne Modul-Abhängigkeiten prüfen (z.B. [moduledependencies] required=liblogging,libconfig)
-#            Implementierung: declare -f Prüfung für benötigte Funktionen aus anderen lib*.sh Modulen
+# Hinweis..: Interne Modul-Abhängigkeiten ([dependencies] internal) werden
+#            bereits beim Laden durch integrity_load_modules() aufgelöst
 # ===========================================================================
 integrity_check_module_dependencies() {
     local module_name="$1"
@@ -103,7 +106,7 @@ integrity_check_module_dependencies() {
     # Lade DB-Datei falls definiert 
     # ------------------------------------------------------------------------
     local db_file
-    db_file=$(settings_get_value_ini "${module_name}" "modulefiles" "db")
+    settings_get_ini_field db_file "${module_name}" "modulefiles" "db"
 
     if [[ -n "$db_file" ]]; then
         local db_path="${INSTALL_DIR}/${db_file}"
@@ -131,7 +134,7 @@ integrity_check_module_dependencies() {
     for file_type in "${file_types[@]}"; do
         # Lese Dateiname aus Manifest
         local filename
-        filename=$(settings_get_value_ini "${module_name}" "modulefiles" "$file_type")
+        settings_get_ini_field filename "${module_name}" "modulefiles" "$file_type"
         
         # Nur prüfen wenn Eintrag existiert
         if [[ -n "$filename" ]]; then
@@ -210,7 +213,7 @@ integrity_check_module_dependencies() {
         for folder_type in "${folder_types[@]}"; do
             # Lese Ordner-Namen aus Manifest
             local folder_name
-            folder_name=$(settings_get_value_ini "${module_name}" "folders" "$folder_type")
+            settings_get_ini_field folder_name "${module_name}" "folders" "$folder_type"
             
             # Nur prüfen wenn Eintrag existiert
             if [[ -n "$folder_name" ]]; then
@@ -246,21 +249,24 @@ integrity_check_module_dependencies() {
     # ------------------------------------------------------------------------
     local missing=()                      # Array der fehlende kritische Tools
     local external_deps                 # Kritische externe Tools aus Manifest
+    local -a tools
     
-    # Lese externe Tools aus Manifest (via settings_get_array_ini)
-    external_deps=$(settings_get_array_ini "${module_name}" "dependencies" "external")
+    # Lese externe Tools aus Manifest (kommagetrennt, via Manifest-Index)
+    settings_get_ini_field external_deps "${module_name}" "dependencies" "external"
 
     # Prüfung der kritischen Tools, falls definiert
     if [[ -n "$external_deps" ]]; then
 
         # Elementweise prüfen
-        while IFS= read -r tool; do
-            [[ -z "$tool" ]] && continue  # Überspringe leere Zeilen
+        IFS=',' read -ra tools <<< "$external_deps"
+        for tool in "${tools[@]}"; do
+            tool="${tool//[[:space:]]/}"
+            [[ -z "$tool" ]] && continue  # Überspringe leere Einträge
 
             if ! command -v "$tool" >/dev/null 2>&1; then
                 missing+=("$tool") # Sammle fehlende Tools
             fi
-        done <<< "$external_deps"
+        done
     fi
     
     # Auswertung der Kritische Tools 
@@ -277,20 +283,22 @@ integrity_check_module_dependencies() {
     local optional_missing=()             # Array der fehlende optionale Tools
     local optional_deps                         # Optionale Tools aus Manifest
 
-    # Lese optionale Tools aus Manifest (via settings_get_array_ini)
-    optional_deps=$(settings_get_array_ini "${module_name}" "dependencies" "optional")
+    # Lese optionale Tools aus Manifest (kommagetrennt, via Manifest-Index)
+    settings_get_ini_field optional_deps "${module_name}" "dependencies" "optional"
     
     # Prüfung der optionalen Tools, falls definiert
     if [[ -n "$optional_deps" ]]; then
 
         # Elementweise prüfen
-        while IFS= read -r tool; do
-            [[ -z "$tool" ]] && continue           # Überspringe leere Zeilen
+        IFS=',' read -ra tools <<< "$optional_deps"
+        for tool in "${tools[@]}"; do
+            tool="${tool//[[:space:]]/}"
+            [[ -z "$tool" ]] && continue           # Überspringe leere Einträge
             
             if ! command -v "$tool" >/dev/null 2>&1; then
                 optional_missing+=("$tool") # Sammle fehlende optionale Tools
             fi
-        done <<< "$optional_deps"
+        done
     fi
     
     # Auswertung der optionale Tools 
@@ -316,63 +324,194 @@ integrity_check_module_dependencies() {
 }
 
 # ===========================================================================
-# _integrity_collect_modules
+# MODUL-LADEPLAN (ABHÄNGIGKEITSGRAPH AUS DEN INI-MANIFESTEN)
+# ===========================================================================
+# Die Manifeste (conf/lib*.ini) liefert der INI-Cache aus libsettings.sh
+# (ein awk-Lauf für alle Dateien). Aus [dependencies] internal entsteht der
+# Abhängigkeitsgraph, die Lade-Reihenfolge ist seine topologische Sortierung
+# (Kahn, bei Gleichstand alphabetisch). Zirkuläre Abhängigkeiten sind kein
+# Fehler: erst werden alle Libraries gesourct, danach der Reihe nach
+# <modul>_check_dependencies aufgerufen.
+# Der Plan wird in conf/.modules.plan zwischengespeichert und nur neu
+# berechnet, wenn sich Name, Änderungszeit oder Größe eines Manifests ändert.
+
+readonly INTEGRITY_PLAN_CACHE=".modules.plan"
+readonly INTEGRITY_CORE_MODULES=" logging settings folders files integrity "
+
+declare -gA INTEGRITY_MODULE_DEPS=()     # modul → interne Abhängigkeiten
+declare -gA INTEGRITY_MODULE_MISSING=()  # modul → unbekannte Abhängigkeiten
+declare -ga INTEGRITY_LOAD_ORDER=()      # Module in Lade-Reihenfolge
+declare -ga INTEGRITY_PLAN_CYCLE=()      # Module mit zirkulären Abhängigkeiten
+declare -gA INTEGRITY_LOAD_TIMES=()      # modul → Ladezeit in ms
+INTEGRITY_PLAN_SOURCE=""                 # cache | parsed (leer = kein Plan)
+
+# ===========================================================================
+# _integrity_sort_modules
 # ---------------------------------------------------------------------------
-# Funktion.: Sammelt alle ladbaren Module aus den INI-Manifesten
-# Parameter: $1 = result_array (Referenz auf das Ergebnis-Array)
-# Rückgabe.: 0 = Module gefunden (Array wurde befüllt)
-# .........  1 = Keine Module gefunden (Array bleibt leer)
-# Extras...: Hilfsfunktion für integrity_load_modules()
-# .........  Überspringt Core-Module und Module ohne .sh-Datei
+# Funktion.: Sortiert die Module topologisch nach ihren internen
+# .........  Abhängigkeiten (INTEGRITY_MODULE_DEPS → INTEGRITY_LOAD_ORDER)
+# Parameter: $@ = alle Modulnamen
+# Rückgabe.: 0 = Erfolg (vorgezogene Module eines Zyklus landen in
+# .........  INTEGRITY_PLAN_CYCLE)
 # ===========================================================================
-_integrity_collect_modules() {
-    local -n result_array=$1  # Array per Reference 
-    local conf_dir=$(folders_get_conf_dir)
-    
-    #-- Log: Start der Modulsammlung ----------------------------------------
-    log_info "$MSG_SCANNING_MODULES: ${conf_dir}"
+_integrity_sort_modules() {
+    local -A indegree=() dependents=() used_by=()
+    local module dep next
 
-    #-- Alle gefundenen *.ini Dateien durchgehen (lib*.ini) -----------------
-    for ini_file in "${conf_dir}"/lib*.ini; do
-        [[ -f "$ini_file" ]] || continue
-        
-        #-- Extrahiere Modul-Name (lib<modulname>.ini → modulname) ----------
-        local module_name=$(basename "$ini_file" .ini | sed 's/^lib//')
-
-        # -------------------------------------------------------------------
-        # Überspringe Core-Module (werden im Deamon explizit geladen) 
-        # Sicherheitsfunktion, eigentlich haben diese Core-Module keine ini
-        # Dateien, aber falls doch, sollen sie nicht als optionale Module 
-        # erkannt werden. 
-        # -------------------------------------------------------------------
-        case "$module_name" in
-            logging|settings|folders|files|integrity)
-                log_debug "$MSG_SKIP_CORE_MODULE: ${module_name}"
-                continue
-                ;;
-        esac
-        
-        #-- Lese notwendige Info's aus INI ----------------------------------
-        local module_lib=$(settings_get_value_ini "${module_name}" "modulefiles" "lib")
-        local requires=$(settings_get_value_ini "${module_name}" "dependencies" "internal")
+    INTEGRITY_LOAD_ORDER=()
+    INTEGRITY_PLAN_CYCLE=()
 
-        #-- Prüfe ob zur *.ini eine *.sh existiert --------------------------
-        if [[ ! -f "$module_lib" ]]; then
-            log_warning "$MSG_MODULE_LIB_MISSING: ${module_name} (${module_lib})"
-            continue
+    #-- Eingangsgrad = Anzahl bekannter Abhängigkeiten ----------------------
+    for module in "$@"; do
+        indegree[$module]=0
+        used_by[$module]=0
+    done
+    for module in "$@"; do
+        for dep in ${INTEGRITY_MODULE_DEPS[$module]}; do
+            [[ -n "${indegree[$dep]+x}" ]] || continue
+            (( indegree[$module]++ ))
+            (( used_by[$dep]++ ))
+            dependents[$dep]+="${module} "
+        done
+    done
+
+    #-- Kahn: Module ohne offene Abhängigkeiten laden (alphabetisch) --------
+    #-- Stockt die Sortierung (Zyklus), wird das Modul mit den wenigsten -----
+    #-- offenen Abhängigkeiten vorgezogen (bei Gleichstand das meistgenutzte)
+    #-- und in INTEGRITY_PLAN_CYCLE vermerkt --------------------------------
+    local -a sorted=()
+    mapfile -t sorted < <(printf '%s\n' "$@" | sort)
+    local count=${#sorted[@]} pick min
+    while [[ ${#INTEGRITY_LOAD_ORDER[@]} -lt $count ]]; do
+        pick=""
+        min=""
+        for module in "${sorted[@]}"; do
+            [[ "${indegree[$module]}" -lt 0 ]] && continue
+            if [[ "${indegree[$module]}" -eq 0 ]]; then
+                pick="$module"
+                break
+            fi
+            if [[ -z "$min" ]] || (( indegree[$module] < indegree[$min] )) \
+               || (( indegree[$module] == indegree[$min] && used_by[$module] > used_by[$min] )); then
+                min="$module"
+            fi
+        done
+        if [[ -z "$pick" ]]; then
+            pick="$min"
+            INTEGRITY_PLAN_CYCLE+=("$pick")
         fi
-                
-        #-- Füge zu Ergebnis-Array hinzu (Format: module_name|requires) -----
-        result_array[$module_name]="${internal_deps:-}"
-        log_debug "$MSG_MODULE_FOUND: ${module_name} (deps: ${internal_deps:-KEINE})"
+
+        INTEGRITY_LOAD_ORDER+=("$pick")
+        indegree[$pick]=-1
+        for next in ${dependents[$pick]}; do
+            [[ "${indegree[$next]}" -gt 0 ]] && (( indegree[$next]-- ))
+        done
     done
-    
-    #-- Rückgabe: Erfolg wenn Module gefunden, sonst Fehler -----------------
-    if [[ ${#result_array[@]} -gt 0 ]]; then
-        return 0
-    else
-        return 1
+    return 0
+}
+
+# ===========================================================================
+# integrity_build_plan
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt Abhängigkeiten und Lade-Reihenfolge aller Module,
+# .........  aus dem Cache (conf/.modules.plan) oder durch Neuberechnung
+# Parameter: keine
+# Rückgabe.: 0 = Plan vorhanden, 1 = keine Manifeste gefunden
+# Extras...: Setzt INTEGRITY_MODULE_DEPS,
+# .........  INTEGRITY_MODULE_MISSING, INTEGRITY_LOAD_ORDER,
+# .........  INTEGRITY_PLAN_CYCLE und INTEGRITY_PLAN_SOURCE (cache|parsed)
+# ===========================================================================
+integrity_build_plan() {
+    local conf_dir="${INSTALL_DIR}/${MODULE_CONF_DIR:-conf}"
+    local cache_file="${conf_dir}/${INTEGRITY_PLAN_CACHE}"
+    local -a manifests=("${conf_dir}"/lib*.ini)
+
+    INTEGRITY_PLAN_SOURCE="parsed"
+    [[ -f "${manifests[0]}" ]] || return 1
+
+    #-- Cache-Schlüssel: Name, Änderungszeit und Größe aller Manifeste ------
+    local -a stat_lines
+    mapfile -t stat_lines < <(stat -c '%n:%Y:%s' "${manifests[@]}" 2>/dev/null)
+    local plan_key="${stat_lines[*]}"
+
+    #-- Cache gültig? (2. Zeile = Schlüssel) → Plan direkt sourcen ----------
+    if [[ -f "$cache_file" ]]; then
+        local cached_key=""
+        { read -r; read -r cached_key; } < "$cache_file"
+        if [[ "$cached_key" == "# key: ${plan_key}" ]] && source "$cache_file" 2>/dev/null; then
+            INTEGRITY_PLAN_SOURCE="cache"
+            log_debug "$MSG_DEBUG_PLAN_FROM_CACHE ${cache_file}"
+            return 0
+        fi
     fi
+
+    #-- Module und interne Abhängigkeiten (lib-Präfix/Core-Module entfernen) 
+    local -a modules=()
+    local ini_file module_name dep_list dep
+    local -a deps
+    INTEGRITY_MODULE_DEPS=()
+    INTEGRITY_MODULE_MISSING=()
+    for ini_file in "${manifests[@]}"; do
+        module_name="${ini_file##*/lib}"
+        module_name="${module_name%.ini}"
+        [[ "$INTEGRITY_CORE_MODULES" == *" ${module_name} "* ]] && continue
+        modules+=("$module_name")
+    done
+    for module_name in "${modules[@]}"; do
+        settings_get_ini_field dep_list "${module_name}" "dependencies" "internal"
+        IFS=',' read -ra deps <<< "$dep_list"
+        for dep in "${deps[@]}"; do
+            dep="${dep//[[:space:]]/}"
+            dep="${dep#lib}"
+            [[ -z "$dep" ]] || [[ "$dep" == "$module_name" ]] && continue
+            [[ "$INTEGRITY_CORE_MODULES" == *" ${dep} "* ]] && continue
+            if [[ " ${modules[*]} " == *" ${dep} "* ]]; then
+                INTEGRITY_MODULE_DEPS[$module_name]+="${dep} "
+            else
+                INTEGRITY_MODULE_MISSING[$module_name]+="${dep} "
+            fi
+        done
+    done
+
+    #-- Topologisch sortieren -----------------------------------------------
+    _integrity_sort_modules "${modules[@]}"
+    if [[ ${#INTEGRITY_PLAN_CYCLE[@]} -gt 0 ]]; then
+        log_warning "$MSG_WARNING_DEPENDENCY_CYCLE ${INTEGRITY_PLAN_CYCLE[*]}"
+    fi
+
+    #-- Plan zwischenspeichern (atomar, Fehler sind nicht kritisch) ---------
+    local plan
+    plan=$(declare -p INTEGRITY_MODULE_DEPS INTEGRITY_MODULE_MISSING INTEGRITY_LOAD_ORDER INTEGRITY_PLAN_CYCLE 2>/dev/null)
+    {
+        echo "# disk2iso Modul-Ladeplan (automatisch erzeugt, nicht bearbeiten)"
+        echo "# key: ${plan_key}"
+        echo "${plan//declare -/declare -g}"
+    } > "${cache_file}.tmp" 2>/dev/null && mv -f "${cache_file}.tmp" "$cache_file" 2>/dev/null \
+        || rm -f "${cache_file}.tmp" 2>/dev/null
+
+    log_debug "$MSG_DEBUG_PLAN_PARSED ${#modules[@]}: ${INTEGRITY_LOAD_ORDER[*]}"
+    return 0
+}
+
+# ===========================================================================
+# _integrity_report_load_times
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt Ladeplan und Ladezeiten nach api/modules.json
+# Parameter: $1 = Gesamtdauer in ms
+# Rückgabe.: 0 = Erfolg, 1 = libapi nicht geladen/API-Ordner fehlt
+# ===========================================================================
+_integrity_report_load_times() {
+    local total_ms="$1"
+    declare -f api_set_file_json >/dev/null 2>&1 || return 1
+    [[ -d "${INSTALL_DIR}/${MODULE_API_DIR:-api}" ]] || return 1
+
+    local module times="" order=""
+    for module in "${INTEGRITY_LOAD_ORDER[@]}"; do
+        order+="${order:+, }\"${module}\""
+        [[ -n "${INTEGRITY_LOAD_TIMES[$module]}" ]] && times+="${times:+, }\"${module}\": ${INTEGRITY_LOAD_TIMES[$module]}"
+    done
+
+    api_set_file_json "modules" "{\"plan\": \"${INTEGRITY_PLAN_SOURCE}\", \"order\": [${order}], \"load_ms\": {${times}}, \"total_ms\": ${total_ms}}"
 }
 
 # ===========================================================================
@@ -380,190 +519,138 @@ _integrity_collect_modules() {
 # ---------------------------------------------------------------------------
 # Funktion.: Auto-Discovery und Laden aller optionalen Module aus INI-Manifesten
 # Parameter: keine
-# Rückgabe.: 0 = Mindestens ein Modul geladen
-#            1 = Keine Module gefunden oder Fehler
-# Ablauf...: 1. Scanne conf/ nach lib*.ini Dateien
-#            2. Parse [module] Sektion (priority, requires_modules)
-#            3. Sortiere nach Priority (niedrig = zuerst)
-#            4. Lade Module in korrekter Reihenfolge
-#            5. Rufe {module}_check_dependencies() auf
+# Rückgabe.: 0 = Module geladen (einzelne Module dürfen fehlschlagen)
+#            1 = Unauflösbare Abhängigkeiten (Service nicht startbar)
+# Ablauf...: 1. Ladeplan ermitteln (integrity_build_plan, Cache oder Parse)
+#            2. Libraries in Plan-Reihenfolge sourcen
+#            3. {module}_check_dependencies() in Plan-Reihenfolge aufrufen
+#            4. Ladezeit pro Modul loggen und nach api/modules.json schreiben
 # Extras...: Überspringt Module deren .sh fehlt (z.B. nur Config vorhanden)
-#            Loggt fehlende Dependencies als Warnung (nicht kritisch)
+#            Abhängigkeiten auf unbekannte oder nicht ladbare Module sind
+#            kritisch, zirkuläre Abhängigkeiten nur eine Warnung
 # ===========================================================================
 integrity_load_modules() {
-    #-- Config-Verzeichnis ermitteln (via libfolders.sh) --------------------
-    local conf_dir=$(folders_get_conf_dir) 
-    
-    #-- Erfasse alle Module durch die zugehörige INI-Datei ------------------
-    declare -a modules_to_load=() # Assoziatives Array -> einfaches Entfernen
-    if ! _integrity_collect_modules modules_to_load; then
-        # Keine Module gefunden → Kein Laden nötig, aber auch kein Fehler ---
+    local start_us="${EPOCHREALTIME/[.,]/}"
+
+    #-- Ladeplan ermitteln --------------------------------------------------
+    log_info "$MSG_SCANNING_MODULES: ${INSTALL_DIR}/${MODULE_CONF_DIR:-conf}"
+    if ! integrity_build_plan || [[ ${#INTEGRITY_LOAD_ORDER[@]} -eq 0 ]]; then
         log_info "$MSG_NO_OPTIONAL_MODULES"
         return 0
     fi
-    # Module gefunden → Laden kann beginnen ---------------------------------
-    log_info "Gefundene Module: ${!modules_pending[*]}"
-   
-    # Initialisiere Tracking-Variablen für den Ladeprozess ------------------
-    local iteration=0                                   # aktueller Durchlauf
-    local max_iterations=15      # Sicherheitslimit, Endlosschleife vermeiden
-    local loaded_count=0                # Anzahl erfolgreich geladener Module
-    local failed_count=0                      # Anzahl nicht geladener Module
-    declare -A failed_modules=()
-    
-    #-- Phase 3: Iteratives Laden --------------------------------------------
-    while [[ ${#modules_to_load[@]} -gt 0 ]] && [[ $iteration -lt $max_iterations ]]; do
-        ((iteration++))
-        log_debug "Iteration ${iteration}: ${#modules_to_load[@]} Module ausstehend (${!modules_to_load[*]})"
-        
-        #-- Array für erfolgreich verarbeitete Module in dieser Iteration ---
-        declare -a processed_in_iteration=()
-        
-        #-- Durchlaufe alle ausstehenden Module -----------------------------
-        for module_name in "${!modules_to_load[@]}"; do
-            
-            #-- Prüfe ob bereits geladen ------------------------------------
-            if declare -f "${module_name}_check_dependencies" >/dev/null 2>&1; then
-                log_debug "${module_name}: Bereits geladen (überspringe)"
-                processed_in_iteration+=("$module_name")
-                ((loaded_count++))
-                continue
-            fi
-            
-            #-- Lese interne Dependencies aus Array (modules_to_load) -------
-            local internal_deps="${modules_to_load[$module_name]}"
-            
-            #-- Prüfe Dependencies DIREKT via declare -f --------------------
-            local dependencies_met=true
-            if [[ -n "$internal_deps" ]]; then
-                IFS=',' read -ra DEPS <<< "$internal_deps"
-                local missing_deps=()
-                
-                for dep in "${DEPS[@]}"; do
-                    dep=$(echo "$dep" | xargs)  # Trim whitespace
-                    
-                    #-- Ist die check_dependencies Funktion verfügbar -------
-                    if ! declare -f "${dep}_check_dependencies" >/dev/null 2>&1; then
-                        dependencies_met=false
-                        missing_deps+=("$dep")
-                    fi
-                done
-                
-                #-- Logge fehlende Dependencies ------------------------------
-                if [[ ${#missing_deps[@]} -gt 0 ]]; then
-                    log_debug "${module_name}: Warte auf: ${missing_deps[*]}"
-                fi
-            fi
-            
-            #-- Dependencies nicht erfüllt → nächste Iteration --------------
-            if ! $dependencies_met; then
-                continue
-            fi
-            
-            #-- Dependencies erfüllt → Versuche Modul zu laden --------------
-            log_info "$MSG_LOADING_MODULE: ${module_name}"
-            local module_lib="${INSTALL_DIR}/lib/lib${module_name}.sh"
-            
-            #-- Schritt 1: source Modul-Library -----------------------------
-            if ! source "$module_lib" 2>/dev/null; then
-                log_error "${module_name}: $MSG_MODULE_LOAD_FAILED"
-                failed_modules[$module_name]="source_failed"
-                processed_in_iteration+=("$module_name")
-                ((failed_count++))
-                continue
-            fi
-            
-            #-- Schritt 2: Prüfe ob check_dependencies Funktion existiert ---
-            if ! declare -f "${module_name}_check_dependencies" >/dev/null 2>&1; then
-                log_warning "${module_name}: $MSG_MODULE_CHECK_FUNC_MISSING"
-                failed_modules[$module_name]="no_check_func"
-                processed_in_iteration+=("$module_name")
-                ((failed_count++))
-                continue
-            fi
-            
-            #-- Schritt 3: Rufe check_dependencies auf ----------------------
-            if "${module_name}_check_dependencies"; then
-                log_info "${module_name}: $MSG_MODULE_LOADED"
-                processed_in_iteration+=("$module_name")
-                ((loaded_count++))
-            else
-                log_warning "${module_name}: $MSG_MODULE_DEPS_NOT_MET"
-                failed_modules[$module_name]="deps_not_met"
-                processed_in_iteration+=("$module_name")
-                ((failed_count++))
-            fi
-        done
-        
-        #-- Entferne verarbeitete Module aus modules_to_load ----------------
-        for module_name in "${processed_in_iteration[@]}"; do
-            unset modules_to_load[$module_name]
+    log_info "$MSG_MODULE_PLAN (${INTEGRITY_PLAN_SOURCE}): ${INTEGRITY_LOAD_ORDER[*]}"
+
+    local module_name module_lib dep dep_list t0
+    local loaded_count=0 failed_count=0
+    local -A failed_modules=() sourced=()
+    local -a unresolved=()
+
+    #-- Phase 1: Libraries in Plan-Reihenfolge sourcen ----------------------
+    for module_name in "${INTEGRITY_LOAD_ORDER[@]}"; do
+        #-- Bereits geladen (z.B. erneuter Aufruf) --------------------------
+        if declare -f "${module_name}_check_dependencies" >/dev/null 2>&1; then
+            sourced[$module_name]=true
+            continue
+        fi
+
+        settings_get_ini_field module_lib "${module_name}" "modulefiles" "lib" "lib${module_name}.sh"
+        module_lib="${INSTALL_DIR}/${MODULE_LIB_DIR:-lib}/${module_lib##*/}"
+        if [[ ! -f "$module_lib" ]]; then
+            log_warning "$MSG_MODULE_LIB_MISSING: ${module_name} (${module_lib})"
+            failed_modules[$module_name]="lib_missing"
+            continue
+        fi
+
+        log_info "$MSG_LOADING_MODULE: ${module_name}"
+        t0="${EPOCHREALTIME/[.,]/}"
+        # shellcheck source=/dev/null
+        if ! source "$module_lib" 2>/dev/null; then
+            log_error "${module_name}: $MSG_MODULE_LOAD_FAILED"
+            failed_modules[$module_name]="source_failed"
+            continue
+        fi
+        INTEGRITY_LOAD_TIMES[$module_name]=$(( (${EPOCHREALTIME/[.,]/} - t0) / 1000 ))
+        sourced[$module_name]=true
+    done
+
+    #-- Phase 2: Abhängigkeiten prüfen (check_dependencies) -----------------
+    for module_name in "${INTEGRITY_LOAD_ORDER[@]}"; do
+        [[ -n "${sourced[$module_name]}" ]] || continue
+
+        #-- Interne Abhängigkeiten müssen geladen sein ----------------------
+        if [[ -n "${INTEGRITY_MODULE_MISSING[$module_name]}" ]]; then
+            unresolved+=("$module_name")
+            continue
+        fi
+        for dep in ${INTEGRITY_MODULE_DEPS[$module_name]}; do
+            [[ -n "${sourced[$dep]}" ]] || { unresolved+=("$module_name"); continue 2; }
         done
-        
-        #-- Stagnations-Check: Wurden Fortschritte gemacht ------------------
-        if [[ ${#processed_in_iteration[@]} -eq 0 ]]; then
-            #-- Keine Fortschritte → Zirkuläre Dependencies/fehlende Module 
-            log_error "Stagnation erkannt: Keine Module in Iteration ${iteration} verarbeitet"
-            break
+
+        if ! declare -f "${module_name}_check_dependencies" >/dev/null 2>&1; then
+            log_warning "${module_name}: $MSG_MODULE_CHECK_FUNC_MISSING"
+            failed_modules[$module_name]="no_check_func"
+            continue
+        fi
+
+        t0="${EPOCHREALTIME/[.,]/}"
+        if "${module_name}_check_dependencies"; then
+            (( INTEGRITY_LOAD_TIMES[$module_name] += (${EPOCHREALTIME/[.,]/} - t0) / 1000 ))
+            log_info "${module_name}: $MSG_MODULE_LOADED (${INTEGRITY_LOAD_TIMES[$module_name]} ms)"
+            ((loaded_count++))
+        else
+            (( INTEGRITY_LOAD_TIMES[$module_name] += (${EPOCHREALTIME/[.,]/} - t0) / 1000 ))
+            log_warning "${module_name}: $MSG_MODULE_DEPS_NOT_MET"
+            failed_modules[$module_name]="deps_not_met"
         fi
-        
-        log_debug "Iteration ${iteration}: ${#processed_in_iteration[@]} Module verarbeitet"
     done
-    
-    #-- Phase 4: Fehleranalyse & Diagnose ------------------------------------
-    if [[ ${#modules_to_load[@]} -gt 0 ]]; then
+    failed_count=${#failed_modules[@]}
+
+    #-- Phase 3: Fehleranalyse & Diagnose -----------------------------------
+    if [[ ${#unresolved[@]} -gt 0 ]]; then
         log_error "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
         log_error "KRITISCHER FEHLER: Unauflösbare Modul-Abhängigkeiten!"
         log_error "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-        log_error "Betroffene Module: ${!modules_to_load[*]}"
+        log_error "Betroffene Module: ${unresolved[*]}"
         log_error ""
-        
-        # Detaillierte Diagnose für jedes ungeladene Modul
-        for module_name in "${!modules_to_load[@]}"; do
-            local internal_deps="${modules_to_load[$module_name]}"  # ← Aus Array!
-            
+
+        for module_name in "${unresolved[@]}"; do
             log_error "┌─ Modul: ${module_name}"
-            
-            if [[ -n "$internal_deps" ]]; then
-                log_error "│  Benötigt: ${internal_deps}"
-                log_error "│  Dependency-Status:"
-                
-                IFS=',' read -ra DEPS <<< "$internal_deps"
-                for dep in "${DEPS[@]}"; do
-                    dep=$(echo "$dep" | xargs)
-                    
-                    if ! declare -f "${dep}_check_dependencies" >/dev/null 2>&1; then
-                        log_error "│    ✗ ${dep} (nicht verfügbar)"
-                    else
-                        log_error "│    ✓ ${dep} (verfügbar - sollte nicht passieren!)"
-                    fi
-                done
-            else
-                log_error "│  Keine Dependencies definiert, aber trotzdem nicht ladbar"
-                log_error "│  Mögliche Ursache: Syntaxfehler in lib${module_name}.sh"
-            fi
-            
+            settings_get_ini_field dep_list "${module_name}" "dependencies" "internal"
+            log_error "│  Benötigt: ${dep_list}"
+            log_error "│  Dependency-Status:"
+            for dep in ${INTEGRITY_MODULE_MISSING[$module_name]}; do
+                log_error "│    ✗ ${dep} (kein Manifest vorhanden)"
+            done
+            for dep in ${INTEGRITY_MODULE_DEPS[$module_name]}; do
+                if [[ -n "${sourced[$dep]}" ]]; then
+                    log_error "│    ✓ ${dep}"
+                else
+                    log_error "│    ✗ ${dep} (nicht ladbar: ${failed_modules[$dep]:-unbekannt})"
+                fi
+            done
             log_error "└─────────────────────────────────────────────────────────────"
         done
-        
+
         log_error ""
         log_error "SERVICE NICHT STARTBAR - Bitte Dependencies auflösen!"
         log_error "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-        
         return 1
     fi
-    
-    #-- Phase 5: Zusammenfassung ---------------------------------------------
+
+    #-- Phase 4: Zusammenfassung --------------------------------------------
+    local total_ms=$(( (${EPOCHREALTIME/[.,]/} - start_us) / 1000 ))
     log_info "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-    log_info "$MSG_MODULE_SUMMARY: ${loaded_count} $MSG_LOADED, ${failed_count} $MSG_FAILED"
-    log_info "Iterationen benötigt: ${iteration}/${max_iterations}"
-    
+    log_info "$MSG_MODULE_SUMMARY: ${loaded_count} $MSG_LOADED, ${failed_count} $MSG_FAILED (${total_ms} ms)"
+
     if [[ $failed_count -gt 0 ]]; then
         log_warning ""
         log_warning "Fehlgeschlagene Module (Service läuft trotzdem):"
         for module_name in "${!failed_modules[@]}"; do
             local reason="${failed_modules[$module_name]}"
             case "$reason" in
+                lib_missing)
+                    log_warning "  ✗ ${module_name}: Modul-Library fehlt (nur Manifest vorhanden)"
+                    ;;
                 source_failed)
                     log_warning "  ✗ ${module_name}: Modul konnte nicht geladen werden (Syntaxfehler?)"
                     ;;
@@ -579,8 +666,9 @@ integrity_load_modules() {
             esac
         done
     fi
-    
+
     log_info "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-    
+
+    _integrity_report_load_times "$total_ms"
     return 0
-}
\ No newline at end of file
+}
@@ -6,7 +6,11 @@
 #
 # Beschreibung:
 #   Zentrale Logging-Funktionen für alle Module
-#   - Timestamped Logging mit optionaler Datei-Ausgabe
+#   - Timestamped Logging ohne Fork (printf %(...)T statt date)
+#   - Level-Filter vor der Formatierung (LOG_LEVEL), optional JSON-Zeilen
+#     (LOG_FORMAT=json) und Zeilen-Puffer (LOG_BUFFER_LINES, log_flush())
+#   - Kopier-Logs: Katalog (catalog.tsv) und Aufbewahrung mit gzip
+#     (logging_catalog_add(), logging_apply_retention())
 #   - Modulares Sprachsystem (logging_load_language_file)
 #   - log_error(), log_info(), log_warning(), log_debug()
 #   - Wird von allen anderen Modulen verwendet
@@ -43,7 +47,7 @@ logging_check_dependencies() {
     logging_load_language_file "logging"; [[ $? -eq 1 ]] && return 1
 
     # Logging-Modul benötigt keine externen Tools
-    # Verwendet nur Bash-Funktionen (echo, printf, date)
+    # Verwendet nur Bash-Builtins (printf %(...)T statt date)
     # Log-Verzeichnisse werden von anderen Modulen erstellt (libfiles, etc.)
     
     # Logging: Caller-Info (Datei:Funktion:Zeile) in Log-Meldungen
@@ -51,6 +55,9 @@ logging_check_dependencies() {
     # Debug:    1 (Zeigt [datei.sh:funktion:zeile] für Fehlersuche)
     LOG_CALLER_INFO="${LOG_CALLER_INFO:-0}"
 
+    # Level, Format und Puffer aus disk2iso.conf (vorher per source geladen)
+    logging_configure
+
     return 0
 }
 
@@ -127,6 +134,156 @@ logging_load_language_file() {
     fi
 }
 
+# ============================================================================
+# LOG-BACKEND (LEVEL, FORMAT, PUFFER)
+# ============================================================================
+# Jede Log-Zeile entsteht ohne Fork: Zeitstempel via printf %(...)T statt
+# $(date ...). Der Level wird als Zahl geprüft BEVOR die Meldung formatiert
+# wird - ein gefiltertes log_debug kostet nur einen Vergleich.
+# Optional JSON-Zeilen (LOG_FORMAT=json) mit Modul, Funktion, Laufwerk und
+# Disc-Kennung sowie ein Zeilen-Puffer (LOG_BUFFER_LINES) für den Service.
+
+readonly LOG_LEVEL_DEBUG=0
+readonly LOG_LEVEL_INFO=1
+readonly LOG_LEVEL_WARNING=2
+readonly LOG_LEVEL_ERROR=3
+readonly LOG_LEVEL_OFF=4
+
+_LOG_LEVEL_NUM=$LOG_LEVEL_INFO          # Aktiver Level (Zahl)
+[[ "${DEBUG:-0}" == "1" ]] && _LOG_LEVEL_NUM=$LOG_LEVEL_DEBUG
+_LOG_JSON=0                             # 1 = JSON-Zeilen
+_LOG_BUFFER_LINES=0                     # 0 = ungepuffert
+_LOG_BUFFER_PID=""                      # Nur dieser Prozess puffert
+_LOG_BUFFER_OUT=""                      # Gepufferte stdout-Zeilen
+_LOG_BUFFER_ERR=""                      # Gepufferte stderr-Zeilen
+_LOG_BUFFER_COUNT=0
+_LOG_BUFFER_SINCE=0                     # EPOCHSECONDS der ältesten Zeile
+LOG_EMITTED=0                           # Ausgegebene Zeilen (Benchmark)
+
+# ===========================================================================
+# logging_configure
+# ---------------------------------------------------------------------------
+# Funktion.: Setzt Level, Format und Puffer des Log-Backends
+# Parameter: $1 = Level: debug|info|warning|error|off (Standard: LOG_LEVEL)
+# .........  $2 = Format: text|json (Standard: LOG_FORMAT)
+# .........  $3 = Puffer in Zeilen, 0 = aus (Standard: LOG_BUFFER_LINES)
+# Rückgabe.: 0
+# Hinweis..: DEBUG=1 erzwingt Level debug. Gepuffert wird nur im
+# .........  aufrufenden Prozess - Subshells ($(...), Worker) schreiben
+# .........  direkt, sonst gingen Zeilen beim Ende der Subshell verloren.
+# .........  log_flush wird an einen vorhandenen EXIT-Trap angehängt (nicht
+# .........  ersetzt); wer später selbst "trap ... EXIT" setzt, ruft
+# .........  log_flush in seinem Exit-Pfad auf.
+# ===========================================================================
+logging_configure() {
+    local level="${1:-${LOG_LEVEL:-info}}"
+    local format="${2:-${LOG_FORMAT:-text}}"
+    local buffer="${3:-${LOG_BUFFER_LINES:-0}}"
+
+    [[ "${DEBUG:-0}" == "1" ]] && level="debug"
+    case "${level,,}" in
+        debug)        _LOG_LEVEL_NUM=$LOG_LEVEL_DEBUG ;;
+        warning|warn) _LOG_LEVEL_NUM=$LOG_LEVEL_WARNING ;;
+        error)        _LOG_LEVEL_NUM=$LOG_LEVEL_ERROR ;;
+        off|none)     _LOG_LEVEL_NUM=$LOG_LEVEL_OFF ;;
+        *)            _LOG_LEVEL_NUM=$LOG_LEVEL_INFO ;;
+    esac
+
+    [[ "${format,,}" == "json" ]] && _LOG_JSON=1 || _LOG_JSON=0
+
+    log_flush
+    [[ "$buffer" =~ ^[0-9]+$ ]] || buffer=0
+    _LOG_BUFFER_LINES=$buffer
+    _LOG_BUFFER_PID=$BASHPID
+    if (( buffer > 0 )); then
+        #-- Vorhandenen EXIT-Trap erhalten: "trap -- '<cmd>' EXIT" ---------
+        local -a exit_trap=()
+        eval "exit_trap=($(trap -p EXIT))"
+        local exit_cmd="${exit_trap[2]:-}"
+        [[ "$exit_cmd" == *log_flush* ]] || trap "log_flush${exit_cmd:+; ${exit_cmd}; log_flush}" EXIT
+    fi
+    return 0
+}
+
+# ===========================================================================
+# log_flush
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt gepufferte Log-Zeilen aus
+# Parameter: keine
+# Rückgabe.: 0
+# Hinweis..: Aufruf in der Hauptschleife und beim Beenden, Warnungen und
+# .........  Fehler lösen den Flush sofort aus
+# ===========================================================================
+log_flush() {
+    (( _LOG_BUFFER_COUNT > 0 )) || return 0
+    [[ -n "$_LOG_BUFFER_OUT" ]] && printf '%s' "$_LOG_BUFFER_OUT"
+    [[ -n "$_LOG_BUFFER_ERR" ]] && printf '%s' "$_LOG_BUFFER_ERR" >&2
+    _LOG_BUFFER_OUT=""
+    _LOG_BUFFER_ERR=""
+    _LOG_BUFFER_COUNT=0
+    return 0
+}
+
+# ===========================================================================
+# _log_emit
+# ---------------------------------------------------------------------------
+# Funktion.: Formatiert und schreibt eine Log-Zeile (Level bereits geprüft)
+# Parameter: $1 = Level-Name (info, warning, ...)
+# .........  $2 = Präfix im Text-Format (z.B. "- INFO: ", "- ")
+# .........  $3 = 1 = stdout, 2 = stderr
+# .........  $4 = Nachricht
+# .........  $5 = 1 = Caller-Info immer anzeigen (Debug)
+# Rückgabe.: 0
+# Hinweis..: Caller = Funktion, die log_* aufgerufen hat (Index 2)
+# ===========================================================================
+_log_emit() {
+    local line ts
+
+    if (( _LOG_JSON )); then
+        local msg="$4" module="${BASH_SOURCE[2]##*/}"
+        local disc="${DISC_INFO[disc_identifier]:-}"
+        module="${module%.sh}"; module="${module#lib}"
+        msg="${msg//\\/\\\\}"; msg="${msg//\"/\\\"}"
+        msg="${msg//$'\n'/\\n}"; msg="${msg//$'\t'/\\t}"; msg="${msg//$'\r'/}"
+        disc="${disc//\\/\\\\}"; disc="${disc//\"/\\\"}"
+        printf -v ts '%(%Y-%m-%dT%H:%M:%S)T' -1
+        ts+=".${EPOCHREALTIME:${#EPOCHREALTIME}-6:3}"
+        printf -v line '{"ts":"%s","level":"%s","module":"%s","func":"%s","line":%d,"drive":"%s","disc":"%s","msg":"%s"}\n' \
+            "$ts" "$1" "$module" "${FUNCNAME[2]:-main}" "${BASH_LINENO[1]:-0}" \
+            "${DRIVESTAT_INSTANCE:-}" "$disc" "$msg"
+    else
+        printf -v ts '%(%Y-%m-%d %H:%M:%S)T' -1
+        if [[ "$5" == "1" ]] || [[ "${LOG_CALLER_INFO:-0}" == "1" ]]; then
+            line="$ts [${BASH_SOURCE[2]##*/}:${FUNCNAME[2]:-main}:${BASH_LINENO[1]}] $2$4"$'\n'
+        else
+            line="$ts $2$4"$'\n'
+        fi
+    fi
+    (( LOG_EMITTED++ ))
+
+    #-- Ungepuffert (Standard) oder Subshell → direkt schreiben -------------
+    if (( _LOG_BUFFER_LINES == 0 )) || [[ "$BASHPID" != "$_LOG_BUFFER_PID" ]]; then
+        printf '%s' "$line" >&"$3"
+        return 0
+    fi
+
+    (( _LOG_BUFFER_COUNT == 0 )) && _LOG_BUFFER_SINCE=$EPOCHSECONDS
+    if [[ "$3" == "1" ]]; then
+        _LOG_BUFFER_OUT+="$line"
+    else
+        _LOG_BUFFER_ERR+="$line"
+    fi
+    (( _LOG_BUFFER_COUNT++ ))
+
+    #-- Warnung/Fehler, voller Puffer oder älter als 1s → ausschreiben ------
+    if [[ "$1" == "warning" ]] || [[ "$1" == "error" ]] \
+       || (( _LOG_BUFFER_COUNT >= _LOG_BUFFER_LINES )) \
+       || (( EPOCHSECONDS - _LOG_BUFFER_SINCE >= 1 )); then
+        log_flush
+    fi
+    return 0
+}
+
 # ============================================================================
 # LOGGING FUNCTIONS
 # ============================================================================
@@ -135,87 +292,153 @@ logging_load_language_file() {
 # Parameter: $1 = Nachricht zum Loggen
 # Ausgabe: Konsole (kein File-Logging für Service-Messages)
 log_message() {
-    local message="$1"
-    local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
-    
-    # Optional: Caller-Info (Datei:Funktion:Zeile)
-    if [[ "${LOG_CALLER_INFO:-0}" == "1" ]]; then
-        local caller_file="${BASH_SOURCE[2]##*/}"
-        local caller_func="${FUNCNAME[2]}"
-        local caller_line="${BASH_LINENO[1]}"
-        echo "$timestamp [$caller_file:$caller_func:$caller_line] - $message"
-    else
-        echo "$timestamp - $message"
-    fi
+    (( _LOG_LEVEL_NUM <= LOG_LEVEL_INFO )) || return 0
+    _log_emit "info" "- " 1 "$1"
 }
 
 # Funktion für Info-Logging (alias für log_message)
 # Parameter: $1 = Info-Nachricht
 log_info() {
-    local message="- INFO: $1"
-    local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
-    
-    # Optional: Caller-Info
-    if [[ "${LOG_CALLER_INFO:-0}" == "1" ]]; then
-        local caller_file="${BASH_SOURCE[2]##*/}"
-        local caller_func="${FUNCNAME[2]}"
-        local caller_line="${BASH_LINENO[1]}"
-        echo "$timestamp [$caller_file:$caller_func:$caller_line] $message"
-    else
-        echo "$timestamp $message"
-    fi
+    (( _LOG_LEVEL_NUM <= LOG_LEVEL_INFO )) || return 0
+    _log_emit "info" "- INFO: " 1 "$1"
 }
 
 # Funktion für Warning-Logging
 # Parameter: $1 = Warning-Nachricht
 # Ausgabe: Konsole + stderr
 log_warning() {
-    local message="- WARNING: $1"
-    local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
-    
-    # Optional: Caller-Info
-    if [[ "${LOG_CALLER_INFO:-0}" == "1" ]]; then
-        local caller_file="${BASH_SOURCE[2]##*/}"
-        local caller_func="${FUNCNAME[2]}"
-        local caller_line="${BASH_LINENO[1]}"
-        echo "$timestamp [$caller_file:$caller_func:$caller_line] $message" >&2
-    else
-        echo "$timestamp $message" >&2
-    fi
+    (( _LOG_LEVEL_NUM <= LOG_LEVEL_WARNING )) || return 0
+    _log_emit "warning" "- WARNING: " 2 "$1"
 }
 
 # Funktion für Error-Logging
 # Parameter: $1 = Error-Nachricht
 # Ausgabe: Konsole + stderr
 log_error() {
-    local message="- ERROR: $1"
-    local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
-    
-    # Optional: Caller-Info
-    if [[ "${LOG_CALLER_INFO:-0}" == "1" ]]; then
-        local caller_file="${BASH_SOURCE[2]##*/}"
-        local caller_func="${FUNCNAME[2]}"
-        local caller_line="${BASH_LINENO[1]}"
-        echo "$timestamp [$caller_file:$caller_func:$caller_line] $message" >&2
-    else
-        echo "$timestamp $message" >&2
-    fi
+    (( _LOG_LEVEL_NUM <= LOG_LEVEL_ERROR )) || return 0
+    _log_emit "error" "- ERROR: " 2 "$1"
 }
 
 # Funktion für Debug-Logging
 # Parameter: $1 = Debug-Nachricht
-# Ausgabe: Nur wenn DEBUG=1 gesetzt ist
+# Ausgabe: Nur bei Level debug (LOG_LEVEL=debug oder DEBUG=1), stderr
+# Debug-Modus zeigt IMMER Caller-Info (überschreibt LOG_CALLER_INFO)
 log_debug() {
-    if [[ "${DEBUG:-0}" == "1" ]]; then
-        local message="- DEBUG: $1"
-        local timestamp="$(date '+%Y-%m-%d %H:%M:%S')"
-        
-        # Debug-Modus zeigt IMMER Caller-Info (überschreibt LOG_CALLER_INFO)
-        local caller_file="${BASH_SOURCE[2]##*/}"
-        local caller_func="${FUNCNAME[2]}"
-        local caller_line="${BASH_LINENO[1]}"
-        echo "$timestamp [$caller_file:$caller_func:$caller_line] $message" >&2
-    fi
+    (( _LOG_LEVEL_NUM <= LOG_LEVEL_DEBUG )) || return 0
+    _log_emit "debug" "- DEBUG: " 2 "$1" 1
+}
+
+# ============================================================================
+# KOPIER-LOGS: KATALOG UND AUFBEWAHRUNG
+# ============================================================================
+# Kopier-Logs liegen in <output_dir>/.log. Der Katalog (catalog.tsv, eine
+# Zeile "name<TAB>bytes<TAB>mtime<TAB>disc_identifier" je Log) erlaubt der
+# Web-UI die Auflistung ohne stat() pro Datei. Aufbewahrung nach Alter,
+# Anzahl und Gesamtgröße (LOG_RETENTION_*), ältere Logs werden mit gzip
+# gepackt (LOG_COMPRESS_DAYS) und bleiben lesbar (Web-UI entpackt beim Lesen).
+
+readonly LOG_CATALOG_FILE="catalog.tsv"
+readonly LOG_ACTIVE_MINUTES=60          # Jüngere Logs nie packen/löschen
+
+# ===========================================================================
+# logging_catalog_add
+# ---------------------------------------------------------------------------
+# Funktion.: Trägt ein abgeschlossenes Kopier-Log in den Katalog ein
+# Parameter: $1 = Log-Datei (vollständiger Pfad)
+# .........  $2 = Disc-Kennung (DISC_INFO[disc_identifier], optional)
+# Rückgabe.: 0 = Erfolg, 1 = Datei fehlt
+# Hinweis..: Hängt nur eine Zeile an (letzter Eintrag je Name gilt),
+# .........  logging_apply_retention() schreibt den Katalog kompakt neu
+# ===========================================================================
+logging_catalog_add() {
+    local log_file="$1"
+    local disc="${2//$'\t'/ }"
+    local stat_line
+
+    [[ -f "$log_file" ]] || return 1
+    stat_line=$(stat -c '%s	%Y' "$log_file" 2>/dev/null) || return 1
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 10 9
+        printf '%s\t%s\t%s\n' "${log_file##*/}" "$stat_line" "$disc" \
+            >> "${log_file%/*}/${LOG_CATALOG_FILE}"
+    ) 9>"${log_file%/*}/.${LOG_CATALOG_FILE}.lock"
+}
+
+# ===========================================================================
+# logging_apply_retention
+# ---------------------------------------------------------------------------
+# Funktion.: Packt ältere Kopier-Logs, löscht Logs außerhalb der
+# .........  Aufbewahrung und schreibt den Katalog neu
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg/bereits laufend, 1 = Log-Verzeichnis fehlt
+# Hinweis..: Läuft an einem Log-Verzeichnis nur einmal gleichzeitig
+# .........  (flock -n, weitere Aufrufe kehren sofort zurück). Logs der
+# .........  letzten LOG_ACTIVE_MINUTES werden nie angefasst.
+# Extras...: Einstellungen (0 = keine Grenze): LOG_RETENTION_DAYS,
+# .........  LOG_RETENTION_COUNT, LOG_RETENTION_MAX_MB, LOG_COMPRESS_DAYS
+# ===========================================================================
+logging_apply_retention() {
+    local log_dir days count max_mb compress_days
+    log_dir=$(folders_get_log_dir 2>/dev/null) || return 1
+    [[ -d "$log_dir" ]] || return 1
+
+    settings_get_conf_field days "disk2iso" "LOG_RETENTION_DAYS" "365"
+    settings_get_conf_field count "disk2iso" "LOG_RETENTION_COUNT" "0"
+    settings_get_conf_field max_mb "disk2iso" "LOG_RETENTION_MAX_MB" "500"
+    settings_get_conf_field compress_days "disk2iso" "LOG_COMPRESS_DAYS" "7"
+
+    (
+        if command -v flock >/dev/null 2>&1; then
+            flock -n 9 || exit 0
+        fi
+
+        #-- 1. Ältere Logs packen (gzip übernimmt Name und mtime) -----------
+        if [[ "$compress_days" =~ ^[1-9][0-9]*$ ]] && command -v gzip >/dev/null 2>&1; then
+            find "$log_dir" -maxdepth 1 -type f -name '*.log' \
+                -mmin "+$(( compress_days * 1440 > LOG_ACTIVE_MINUTES ? compress_days * 1440 : LOG_ACTIVE_MINUTES ))" \
+                -print0 | xargs -0 -r gzip -f -q
+        fi
+
+        #-- 2. Aufbewahrung prüfen und Katalog neu schreiben (ein awk) ------
+        local catalog="${log_dir}/${LOG_CATALOG_FILE}"
+        local -a expired=()
+        (
+            command -v flock >/dev/null 2>&1 && flock -w 10 8
+            touch "$catalog"
+            mapfile -t expired < <(
+                find "$log_dir" -maxdepth 1 -type f \( -name '*.log' -o -name '*.log.gz' \) \
+                    -printf '%f\t%s\t%T@\n' | sort -t $'\t' -k3,3nr | \
+                LC_ALL=C awk -F'\t' -v OFS='\t' -v catalog="$catalog" \
+                    -v now="$EPOCHSECONDS" -v active=$(( LOG_ACTIVE_MINUTES * 60 )) \
+                    -v max_age=$(( ${days:-0} * 86400 )) -v max_count="${count:-0}" \
+                    -v max_bytes=$(( ${max_mb:-0} * 1048576 )) -v out="${catalog}.tmp" '
+                    FILENAME == catalog { disc[$1] = $4; next }     # alter Katalog
+                    {
+                        name = $1; bytes = $2; mtime = int($3)
+                        base = name; sub(/\.gz$/, "", base)
+                        keep = (now - mtime < active)
+                        if (!keep) {
+                            keep = !(max_age > 0 && now - mtime > max_age) \
+                                && !(max_count > 0 && kept >= max_count) \
+                                && !(max_bytes > 0 && total + bytes > max_bytes)
+                        }
+                        if (!keep) { print name; next }             # → löschen
+                        kept++; total += bytes
+                        d = (name in disc) ? disc[name] : disc[base]
+                        print name, bytes, mtime, d > out
+                    }
+                    END { if (!kept) printf "" > out }
+                ' "$catalog" -)
+
+            #-- 3. Abgelaufene Logs löschen, neuen Katalog aktivieren -------
+            if [[ ${#expired[@]} -gt 0 ]]; then
+                rm -f -- "${expired[@]/#/${log_dir}/}"
+                log_info "$MSG_LOG_RETENTION_DELETED ${#expired[@]}"
+            fi
+            mv -f "${catalog}.tmp" "$catalog"
+        ) 8>"${log_dir}/.${LOG_CATALOG_FILE}.lock"
+    ) 9>"${log_dir}/.${LOG_CATALOG_FILE}.retention.lock"
+    return 0
 }
 
 # ============================================================================
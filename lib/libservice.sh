@@ -38,54 +38,70 @@ service_check_dependencies() {
     return 0
 }
 
+# ===========================================================================
+# _service_status_json
+# ---------------------------------------------------------------------------
+# Funktion.: Bilde Unit-Zustand auf das JSON von service_get_status ab
+# Parameter: $1 = LoadState, $2 = ActiveState, $3 = UnitFileState
+#            $4 = Timestamp (ISO 8601)
+# Ausgabe..: JSON-Objekt (stdout, einzeilig)
+# Hinweis..: Gleiche Abbildung wie service_state.py (Web-Interface)
+# ===========================================================================
+_service_status_json() {
+    local status="inactive" running=false enabled=false
+    
+    if [[ -z "$1" || "$1" == "not-found" ]]; then
+        status="not_installed"
+    else
+        case "$2" in
+            active) status="active"; running=true ;;
+            failed) status="error" ;;
+        esac
+    fi
+    [[ "$3" == "enabled" ]] && enabled=true
+    
+    printf '{"status":"%s","running":%s,"enabled":%s,"timestamp":"%s"}' \
+        "$status" "$running" "$enabled" "$4"
+}
+
+# ===========================================================================
+# _service_timestamp
+# ---------------------------------------------------------------------------
+# Funktion.: Aktuelle Zeit im Format von date -Iseconds (ohne Fork)
+# Parameter: $1 = Name der Zielvariable
+# ===========================================================================
+_service_timestamp() {
+    local -n _ts_ref="$1"
+    printf -v _ts_ref '%(%Y-%m-%dT%H:%M:%S%z)T' -1
+    _ts_ref="${_ts_ref:0:-2}:${_ts_ref: -2}"
+}
+
 # ===========================================================================
 # service_get_status
 # ---------------------------------------------------------------------------
 # Funktion.: Ermittle Status eines systemd Service
 # Parameter: $1 = Service-Name (ohne .service)
 # Rückgabe.: 0 = Erfolg, 1 = Fehler
-# Ausgabe..: JSON mit status (active/inactive/error/not_installed) und running (true/false)
+# Ausgabe..: JSON mit status (active/inactive/error/not_installed), running
+# .........  und enabled (true/false)
+# Hinweis..: Ein systemctl show statt list-unit-files + is-active
 # ===========================================================================
 service_get_status() {
     local service_name="$1"
+    local key value load_state="" active_state="" file_state="" timestamp
     
-    # Timestamp der Prüfung
-    local timestamp=$(date -Iseconds)
-    
-    # Prüfe ob Service existiert
-    if ! systemctl list-unit-files "${service_name}.service" 2>/dev/null | grep -q "${service_name}.service"; then
-        echo "{\"status\":\"not_installed\",\"running\":false,\"timestamp\":\"${timestamp}\"}"
-        return 0
-    fi
+    while IFS='=' read -r key value; do
+        case "$key" in
+            LoadState)     load_state="$value" ;;
+            ActiveState)   active_state="$value" ;;
+            UnitFileState) file_state="$value" ;;
+        esac
+    done < <(systemctl show -p LoadState -p ActiveState -p UnitFileState \
+                 "${service_name}.service" 2>/dev/null)
     
-    # Prüfe Service-Status
-    local status_text=$(systemctl is-active "${service_name}" 2>/dev/null)
-    local status="inactive"
-    local running=false
-    
-    case "$status_text" in
-        active)
-            status="active"
-            running=true
-            ;;
-        inactive)
-            status="inactive"
-            running=false
-            ;;
-        failed)
-            status="error"
-            running=false
-            ;;
-        *)
-            status="inactive"
-            running=false
-            ;;
-    esac
-    
-    # Timestamp der Prüfung hinzufügen
-    local timestamp=$(date -Iseconds)
-    
-    echo "{\"status\":\"${status}\",\"running\":${running},\"timestamp\":\"${timestamp}\"}"
+    _service_timestamp timestamp
+    _service_status_json "$load_state" "$active_state" "$file_state" "$timestamp"
+    echo
 }
 
 # ===========================================================================
@@ -95,26 +111,56 @@ service_get_status() {
 # Parameter: keine
 # Rückgabe.: 0 = Erfolg, 1 = Fehler
 # Hinweis..: FLÜCHTIG - zyklisch ausführen (z.B. alle 10s)
+# .........  Läuft das Web-Interface, pflegt dessen service_state die Datei
+# .........  ereignisgesteuert (systemd-Bus) - dann hier nichts zu tun.
+# .........  Die watcher_pid zählt nur, wenn der Prozess app.py ausführt
+# .........  (/proc/<pid>/cmdline) - eine wiederverwendete PID zählt nicht.
+# .........  Sonst EIN systemctl show für alle Services.
 # Schreibt.: api/service_status.json
 # ===========================================================================
 service_collect_status_info() {
     local api_dir=$(folders_get_api_dir) || return 1
     local json_file="${api_dir}/service_status.json"
+    local services=("disk2iso" "disk2iso-web" "disk2iso-volatile-updater")
+    local line watcher_pid="" arg
+    local -a watcher_cmd=()
+    
+    #-- Web-Interface hält den Stand aktuell? (ohne Fork prüfen) -----------
+    if [[ -f "$json_file" ]]; then
+        while IFS= read -r line; do
+            [[ "$line" =~ \"watcher_pid\":\ *([0-9]+) ]] && watcher_pid="${BASH_REMATCH[1]}"
+        done < "$json_file"
+        #-- PID gehört noch dem Web-Interface? (nach PID-Wiederverwendung --
+        #-- sonst nie wieder aktualisiert) ----------------------------------
+        if [[ -n "$watcher_pid" ]] \
+           && mapfile -d '' watcher_cmd < "/proc/${watcher_pid}/cmdline" 2>/dev/null; then
+            for arg in "${watcher_cmd[@]}"; do
+                [[ "$arg" == */disk2iso-web/app.py ]] && return 0
+            done
+        fi
+    fi
     
-    # Sammle Status aller Services
-    local disk2iso_status=$(service_get_status "disk2iso")
-    local webui_status=$(service_get_status "disk2iso-web")
-    local updater_status=$(service_get_status "disk2iso-volatile-updater")
+    #-- Alle Units mit einem Aufruf abfragen (Blöcke durch Leerzeilen) -----
+    local -A load=() active=() file=()
+    local key value id=""
+    while IFS='=' read -r key value; do
+        case "$key" in
+            Id)            id="${value%.service}" ;;
+            LoadState)     load[$id]="$value" ;;
+            ActiveState)   active[$id]="$value" ;;
+            UnitFileState) file[$id]="$value" ;;
+        esac
+    done < <(systemctl show -p Id -p LoadState -p ActiveState -p UnitFileState \
+                 "${services[@]/%/.service}" 2>/dev/null)
     
-    # Erstelle JSON
-    local json="{
-  \"disk2iso\": ${disk2iso_status},
-  \"disk2iso-web\": ${webui_status},
-  \"disk2iso-volatile-updater\": ${updater_status},
-  \"timestamp\": \"$(date -Iseconds)\"
-}"
+    local timestamp name json="{"
+    _service_timestamp timestamp
+    for name in "${services[@]}"; do
+        json+=$'\n'"  \"${name}\": $(_service_status_json "${load[$name]:-}" "${active[$name]:-}" "${file[$name]:-}" "$timestamp"),"
+    done
+    json+=$'\n'"  \"source\": \"poll\","$'\n'"  \"timestamp\": \"${timestamp}\""$'\n'"}"
     
-    echo "$json" > "$json_file"
+    echo "$json" > "${json_file}.tmp.$$" && mv -f "${json_file}.tmp.$$" "$json_file"
 }
 
 # ===========================================================================
@@ -12,7 +12,7 @@
 #
 #
 # -----------------------------------------------------------------------------
-# Dependencies: Keine (nutzt nur awk, sed, grep - POSIX-Standard)
+# Dependencies: Keine (nutzt nur awk, sed, grep, stat - POSIX-Standard)
 # -----------------------------------------------------------------------------
 # Author: D.Götze
 # Version: 1.3.0
@@ -45,6 +45,10 @@ settings_check_dependencies() {
     # Prüfe kritische Abhängigkeit: Existenz der Settings-Datei
     settings_validate_file || return 1
     
+    # Snapshot und INI-Cache im Hauptprozess anlegen (Subshells erben sie)
+    _settings_snapshot_ensure "disk2iso"
+    _settings_ini_ensure
+    
     # Settings-Modul nutzt POSIX-Standard-Tools (awk, sed, grep)
     # Diese sind auf jedem Linux-System verfügbar
     return 0
@@ -59,12 +63,299 @@ settings_check_dependencies() {
 # Globale Flags für Lazy Initialization -------------------------------------
 _SETTINGS_FILE_VALIDATED=false                 # Settings-Datei wurde geprüft
 _SETTINGS_DEPENDENCIES_VALIDATED=false         # Dependencies geprüft (get_module_ini_path verfügbar)
-_SETTINGS_SAVE_DEFAULT_CONF=false              # Flag für rekursiven Default-Write (verhindert Endlosschleife)
-_SETTINGS_SAVE_DEFAULT_INI=false               # Flag für rekursiven Default-Write (verhindert Endlosschleife)
 
 # Globaler Pfad zur Konfigurations-Datei
 CONFIG_FILE="${SCRIPT_DIR}/conf/disk2iso.conf"
 
+# ===========================================================================
+# SETTINGS-SNAPSHOT (.conf EINMAL EINLESEN, AUS DEM SPEICHER BEDIENEN)
+# ===========================================================================
+# Jede .conf wird beim ersten Zugriff in einem Durchlauf (nur Bash-Builtins)
+# in _SETTINGS_SNAPSHOT gelesen ("modul|KEY" → Wert ohne Quotes/Kommentar).
+# Alle Getter bedienen sich daraus. Ob die Datei extern geändert wurde (z.B.
+# über das Web-Interface), wird höchstens alle SETTINGS_SNAPSHOT_CHECK_SECONDS
+# per stat (Änderungszeit + Größe) geprüft, nur dann wird neu eingelesen.
+# Self-Healing-Defaults landen sofort im Snapshot und werden gesammelt per
+# settings_flush_defaults() in einem Schreibvorgang pro Datei gespeichert.
+# ---------------------------------------------------------------------------
+readonly SETTINGS_SNAPSHOT_CHECK_SECONDS=2
+
+declare -gA _SETTINGS_SNAPSHOT=()            # "modul|KEY" → Wert
+declare -gA _SETTINGS_SNAPSHOT_PATH=()       # modul → Pfad der .conf
+declare -gA _SETTINGS_SNAPSHOT_STAMP=()      # modul → "mtime:size" beim Einlesen
+declare -gA _SETTINGS_SNAPSHOT_CHECKED=()    # modul → letzte Prüfung (Epoch)
+declare -gA _SETTINGS_PENDING_DEFAULTS=()    # "modul|KEY" → noch zu schreibender Default
+
+# ===========================================================================
+# _settings_snapshot_load
+# ---------------------------------------------------------------------------
+# Funktion.: Liest eine .conf Datei komplett in _SETTINGS_SNAPSHOT ein
+# Parameter: $1 = module (z.B. "disk2iso")
+# .........  $2 = Pfad zur .conf
+# .........  $3 = Stempel "mtime:size" der eingelesenen Datei
+# Rückgabe.: 0 = Erfolg, 1 = Datei nicht lesbar
+# Hinweis..: Nur Zeilen der Form KEY=Wert (wie bisher, "readonly KEY=" wird
+# .........  ignoriert), bei doppelten Keys gilt die erste Zeile. Ohne Fork.
+# ===========================================================================
+_settings_snapshot_load() {
+    local module="$1"
+    local filepath="$2"
+    local line key value entry
+
+    [[ -r "$filepath" ]] || return 1
+
+    #-- Alte Werte des Moduls verwerfen -------------------------------------
+    for entry in "${!_SETTINGS_SNAPSHOT[@]}"; do
+        [[ "$entry" == "${module}|"* ]] && unset '_SETTINGS_SNAPSHOT[$entry]'
+    done
+
+    #-- Datei zeilenweise einlesen ------------------------------------------
+    while IFS= read -r line || [[ -n "$line" ]]; do
+        [[ "$line" =~ ^([A-Za-z_][A-Za-z0-9_]*)=(.*)$ ]] || continue
+        key="${BASH_REMATCH[1]}"
+        value="${BASH_REMATCH[2]}"
+        [[ -n "${_SETTINGS_SNAPSHOT["${module}|${key}"]+x}" ]] && continue
+
+        if [[ "$value" =~ ^\"(([^\"\\]|\\.)*)\" ]]; then
+            value="${BASH_REMATCH[1]//\\\"/\"}"
+        else
+            value="${value%%[[:space:]]#*}"
+            value="${value%"${value##*[![:space:]]}"}"
+        fi
+        _SETTINGS_SNAPSHOT["${module}|${key}"]="$value"
+    done < "$filepath"
+
+    #-- Noch nicht geschriebene Defaults wieder einblenden ------------------
+    for entry in "${!_SETTINGS_PENDING_DEFAULTS[@]}"; do
+        [[ "$entry" == "${module}|"* ]] || continue
+        [[ -n "${_SETTINGS_SNAPSHOT[$entry]}" ]] || _SETTINGS_SNAPSHOT[$entry]="${_SETTINGS_PENDING_DEFAULTS[$entry]}"
+    done
+
+    _SETTINGS_SNAPSHOT_STAMP[$module]="$3"
+    return 0
+}
+
+# ===========================================================================
+# _settings_snapshot_ensure
+# ---------------------------------------------------------------------------
+# Funktion.: Stellt sicher, dass der Snapshot eines Moduls aktuell ist
+# Parameter: $1 = module (z.B. "disk2iso")
+# Rückgabe.: 0 = Snapshot verfügbar, 1 = .conf nicht ermittelbar/lesbar
+# Hinweis..: Innerhalb von SETTINGS_SNAPSHOT_CHECK_SECONDS nach der letzten
+# .........  Prüfung ohne jeden Fork, danach ein stat-Aufruf
+# ===========================================================================
+_settings_snapshot_ensure() {
+    local module="$1"
+
+    #-- Kürzlich geprüft → Snapshot verwenden -------------------------------
+    if [[ -n "${_SETTINGS_SNAPSHOT_STAMP[$module]}" ]] \
+       && (( EPOCHSECONDS - ${_SETTINGS_SNAPSHOT_CHECKED[$module]:-0} < SETTINGS_SNAPSHOT_CHECK_SECONDS )); then
+        return 0
+    fi
+
+    #-- Pfad einmalig auflösen ----------------------------------------------
+    local filepath="${_SETTINGS_SNAPSHOT_PATH[$module]}"
+    if [[ -z "$filepath" ]]; then
+        if [[ "$module" == "disk2iso" ]] && [[ -f "$CONFIG_FILE" ]]; then
+            filepath="$CONFIG_FILE"
+        else
+            filepath=$(get_module_conf_path "$module") || return 1
+        fi
+        _SETTINGS_SNAPSHOT_PATH[$module]="$filepath"
+    fi
+
+    #-- Änderungszeit + Größe vergleichen, nur bei Abweichung neu einlesen --
+    local stamp
+    stamp=$(/usr/bin/stat -c '%Y:%s' "$filepath" 2>/dev/null) || return 1
+    _SETTINGS_SNAPSHOT_CHECKED[$module]=$EPOCHSECONDS
+    [[ "$stamp" == "${_SETTINGS_SNAPSHOT_STAMP[$module]}" ]] && return 0
+
+    _settings_snapshot_load "$module" "$filepath" "$stamp"
+}
+
+# ===========================================================================
+# _settings_snapshot_invalidate
+# ---------------------------------------------------------------------------
+# Funktion.: Erzwingt beim nächsten Zugriff ein erneutes Einlesen
+# Parameter: $1 = module (z.B. "disk2iso")
+# Rückgabe.: 0
+# Hinweis..: Nach jedem Schreibzugriff aufrufen (Änderungen innerhalb
+# .........  derselben Sekunde mit gleicher Größe erkennt stat nicht)
+# ===========================================================================
+_settings_snapshot_invalidate() {
+    unset '_SETTINGS_SNAPSHOT_STAMP[$1]' '_SETTINGS_SNAPSHOT_CHECKED[$1]'
+    return 0
+}
+
+# ===========================================================================
+# settings_get_conf_field
+# ---------------------------------------------------------------------------
+# Funktion.: Liest einen Wert aus dem Settings-Snapshot direkt in eine
+# .........  Variable des Aufrufers (ohne Subshell)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = module (Modulname ohne Suffix, z.B. "disk2iso")
+# .........  $3 = key (z.B. "DDRESCUE_RETRIES")
+# .........  $4 = default (optional, Fallback wenn Key fehlt oder leer ist)
+# Rückgabe.: 0 = Wert (oder Default) gesetzt, 1 = Leer/nicht vorhanden
+# Extras...: Ein verwendeter Default wird vorgemerkt und mit
+# .........  settings_flush_defaults() gesammelt in die Datei geschrieben
+# Beispiel.: settings_get_conf_field retries "disk2iso" "DDRESCUE_RETRIES" "1"
+# ===========================================================================
+settings_get_conf_field() {
+    local _settings_value=""
+
+    if _settings_snapshot_ensure "$2"; then
+        _settings_value="${_SETTINGS_SNAPSHOT["${2}|${3}"]}"
+        if [[ -z "$_settings_value" ]] && [[ -n "$4" ]]; then
+            _settings_value="$4"
+            _SETTINGS_SNAPSHOT["${2}|${3}"]="$4"
+            _SETTINGS_PENDING_DEFAULTS["${2}|${3}"]="$4"
+        fi
+    fi
+
+    printf -v "$1" '%s' "${_settings_value:-$4}"
+    [[ -n "${_settings_value:-$4}" ]]
+}
+
+# ===========================================================================
+# settings_flush_defaults
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt alle vorgemerkten Self-Healing-Defaults, ein
+# .........  Schreibvorgang pro .conf Datei
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg (oder nichts zu tun), 1 = mind. eine Datei fehlgeschlagen
+# Hinweis..: Aufruf z.B. nach dem Laden der Module und im Leerlauf des
+# .........  Daemons; nicht schreibbare Defaults bleiben vorgemerkt
+# ===========================================================================
+settings_flush_defaults() {
+    [[ ${#_SETTINGS_PENDING_DEFAULTS[@]} -eq 0 ]] && return 0
+
+    local -A modules=()
+    local entry module rc=0
+    local -a pairs
+
+    for entry in "${!_SETTINGS_PENDING_DEFAULTS[@]}"; do
+        modules[${entry%%|*}]=1
+    done
+
+    for module in "${!modules[@]}"; do
+        pairs=()
+        for entry in "${!_SETTINGS_PENDING_DEFAULTS[@]}"; do
+            [[ "$entry" == "${module}|"* ]] && pairs+=("${entry#*|}" "${_SETTINGS_PENDING_DEFAULTS[$entry]}")
+        done
+
+        if _settings_write_conf "$module" "${pairs[@]}"; then
+            for entry in "${!_SETTINGS_PENDING_DEFAULTS[@]}"; do
+                [[ "$entry" == "${module}|"* ]] && unset '_SETTINGS_PENDING_DEFAULTS[$entry]'
+            done
+        else
+            log_warning "$MSG_SETTINGS_DEFAULT_SAVE_FAILED: ${module} (${#pairs[@]} / 2)" 2>/dev/null
+            rc=1
+        fi
+    done
+    return $rc
+}
+
+# ===========================================================================
+# _settings_format_conf_value
+# ---------------------------------------------------------------------------
+# Funktion.: Formatiert einen Wert für eine .conf Datei (Smart Quoting)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = value
+# Rückgabe.: 0
+# Type-Detection:
+#   - Pure Integer (^-?[0-9]+$) → Ohne Quotes
+#   - Boolean (true|false|0|1|yes|no) → Normalisiert zu true/false, ohne Quotes
+#   - String → Mit Quotes, escaped
+# ===========================================================================
+_settings_format_conf_value() {
+    local value="$2"
+
+    if [[ "$value" =~ ^-?[0-9]+$ ]]; then
+        # Pure Integer - keine Quotes
+        printf -v "$1" '%s' "$value"
+
+    elif [[ "$value" =~ ^(true|false|0|1|yes|no|on|off)$ ]]; then
+        # Boolean - normalisieren zu true/false, keine Quotes
+        case "$value" in
+            true|1|yes|on)   printf -v "$1" '%s' "true" ;;
+            false|0|no|off)  printf -v "$1" '%s' "false" ;;
+        esac
+
+    else
+        # String - mit Quotes + Escaping
+        printf -v "$1" '"%s"' "${value//\"/\\\"}"
+    fi
+    return 0
+}
+
+# ===========================================================================
+# _settings_write_conf
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt ein oder mehrere Key=Wert Paare in eine .conf Datei
+# .........  (ein Lese- und ein atomarer Schreibvorgang)
+# Parameter: $1 = module (Modulname ohne Suffix, z.B. "disk2iso")
+# .........  $2.. = key value [key value ...]
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Hinweis..: Vorhandene Keys werden ersetzt (erste Zeile "KEY="), fehlende
+# .........  am Dateiende angehängt. Invalidiert den Snapshot des Moduls.
+# ===========================================================================
+_settings_write_conf() {
+    local module="$1"
+    shift
+
+    local filepath="${_SETTINGS_SNAPSHOT_PATH[$module]}"
+    if [[ -z "$filepath" ]]; then
+        filepath=$(get_module_conf_path "$module") || {
+            log_error "$MSG_SETTINGS_PATH_RESOLUTION_FAILED: $module" 2>/dev/null || echo "ERROR: $MSG_SETTINGS_PATH_RESOLUTION_FAILED" >&2
+            return 1
+        }
+    fi
+
+    #-- Neue Zeilen vorbereiten ---------------------------------------------
+    local -A new_lines=()
+    local -a keys=()
+    local formatted
+    while [[ $# -ge 2 ]]; do
+        _settings_format_conf_value formatted "$2"
+        [[ -n "${new_lines[$1]+x}" ]] || keys+=("$1")
+        new_lines[$1]="${1}=${formatted}"
+        shift 2
+    done
+
+    #-- Datei einlesen und ersetzen (erste Fundstelle je Key) ---------------
+    local -a lines=()
+    local i key
+    mapfile -t lines < "$filepath" 2>/dev/null || return 1
+    for i in "${!lines[@]}"; do
+        [[ "${lines[$i]}" =~ ^([A-Za-z_][A-Za-z0-9_]*)= ]] || continue
+        key="${BASH_REMATCH[1]}"
+        [[ -n "${new_lines[$key]+x}" ]] || continue
+        lines[$i]="${new_lines[$key]}"
+        unset 'new_lines[$key]'
+    done
+
+    #-- Fehlende Keys anhängen ----------------------------------------------
+    for key in "${keys[@]}"; do
+        [[ -n "${new_lines[$key]+x}" ]] && lines+=("${new_lines[$key]}")
+    done
+
+    #-- Atomar schreiben (Rechte der Originaldatei übernehmen) --------------
+    local temp_file="${filepath}.tmp.$$"
+    if ! printf '%s\n' "${lines[@]}" > "$temp_file" 2>/dev/null; then
+        rm -f "$temp_file" 2>/dev/null
+        return 1
+    fi
+    /usr/bin/chmod --reference="$filepath" "$temp_file" 2>/dev/null
+    if ! /usr/bin/mv -f "$temp_file" "$filepath" 2>/dev/null; then
+        rm -f "$temp_file" 2>/dev/null
+        return 1
+    fi
+
+    _settings_snapshot_invalidate "$module"
+    return 0
+}
+
 # ===========================================================================
 # settings_validate_file
 # ---------------------------------------------------------------------------
@@ -131,7 +422,7 @@ settings_validate_dependencies() {
 # Hinweis..: - Besondere Bedeutung dieser Funktion, da OUTPUT_DIR essentiell
 # .........  - für die Funktionsweise von disk2iso ist. Daher hier separat
 # .........  - implementiert, um Abhängigkeiten zu minimieren.
-# .........  - Liest DEFAULT_OUTPUT_DIR oder OUTPUT_DIR aus Konfiguration
+# .........  - Liest DEFAULT_OUTPUT_DIR oder OUTPUT_DIR aus dem Snapshot
 # .........  - Entfernt trailing slash für konsistente Rückgabe
 # ===========================================================================
 settings_get_output_dir() {
@@ -140,14 +431,10 @@ settings_get_output_dir() {
     #-- Stelle sicher dass Settings-Datei validiert wurde --------------------
     settings_validate_file || return 1
     
-    #-- Lese OUTPUT_DIR aus Settings -----------------------------------------
-    # Lese DEFAULT_OUTPUT_DIR falls vorhanden
-    output_dir=$(/usr/bin/grep -E '^DEFAULT_OUTPUT_DIR=' "$CONFIG_FILE" 2>/dev/null | /usr/bin/sed 's/^DEFAULT_OUTPUT_DIR=//;s/^"\(.*\)"$/\1/')
-    
-    # Fallback: Lese OUTPUT_DIR falls DEFAULT_OUTPUT_DIR nicht gesetzt
-    if [[ -z "$output_dir" ]]; then
-        output_dir=$(/usr/bin/grep -E '^OUTPUT_DIR=' "$CONFIG_FILE" 2>/dev/null | /usr/bin/sed 's/^OUTPUT_DIR=//;s/^"\(.*\)"$/\1/')
-    fi
+    #-- Lese OUTPUT_DIR aus Settings-Snapshot --------------------------------
+    # Lese DEFAULT_OUTPUT_DIR falls vorhanden, sonst Fallback auf OUTPUT_DIR
+    settings_get_conf_field output_dir "disk2iso" "DEFAULT_OUTPUT_DIR" \
+        || settings_get_conf_field output_dir "disk2iso" "OUTPUT_DIR"
     
     #-- Fehlerfall: Kein OUTPUT_DIR gefunden -------------------------------
     if [[ -z "$output_dir" ]]; then
@@ -160,6 +447,27 @@ settings_get_output_dir() {
     return 0
 }
 
+# ===========================================================================
+# settings_get_staging_dir
+# ---------------------------------------------------------------------------
+# Funktion.: Lese STAGING_DIR aus disk2iso.conf (lokales Zwischenlager)
+# Parameter: keine
+# Rückgabe.: STAGING_DIR Pfad (stdout, ohne trailing slash)
+# .........  Return-Code: 0 = Staging aktiv, 1 = nicht konfiguriert
+# Hinweis..: Wie settings_get_output_dir() aus dem Settings-Snapshot
+# .........  gelesen, damit auch Web-Interface und Updater den Wert kennen
+# ===========================================================================
+settings_get_staging_dir() {
+    local staging_dir=""
+
+    settings_validate_file || return 1
+    settings_get_conf_field staging_dir "disk2iso" "STAGING_DIR"
+
+    [[ -z "$staging_dir" ]] && return 1
+    echo "${staging_dir%/}"
+    return 0
+}
+
 # ===========================================================================
 # settings_get_language
 # ---------------------------------------------------------------------------
@@ -177,7 +485,7 @@ settings_get_language() {
     settings_validate_file || return 1
     
     #-- Lese WEB_LANGUAGE aus Settings ---------------------------------------
-    language=$(/usr/bin/grep -E '^WEB_LANGUAGE=' "$CONFIG_FILE" 2>/dev/null | /usr/bin/sed 's/^WEB_LANGUAGE=//;s/^"\(.*\)"$/\1/')
+    settings_get_conf_field language "disk2iso" "WEB_LANGUAGE"
     
     #-- Fallback auf "de" wenn nicht gesetzt ---------------------------------
     if [[ -z "$language" ]]; then
@@ -235,8 +543,10 @@ settings_set_language() {
         # Add new value nach LANGUAGE Zeile
         /usr/bin/sed -i "/^readonly LANGUAGE=/a WEB_LANGUAGE=\"${language}\"" "$CONFIG_FILE"
     fi
-    
-    return $?
+    local rc=$?
+
+    _settings_snapshot_invalidate "disk2iso"
+    return $rc
 }
 
 # ============================================================================
@@ -251,12 +561,13 @@ settings_set_language() {
 # ===========================================================================
 # settings_get_value_conf
 # ---------------------------------------------------------------------------
-# Funktion.: Lese einzelnen Wert aus .conf Datei
+# Funktion.: Lese einzelnen Wert aus .conf Datei (via Settings-Snapshot)
 # Parameter: $1 = module (Modulname ohne Suffix, z.B. "disk2iso")
 #            $2 = key (z.B. "OUTPUT_DIR")
 #            $3 = default (optional, Fallback wenn Key nicht gefunden)
 # Rückgabe.: 0 = Erfolg (Wert oder Default), 1 = Fehler (Key fehlt, kein Default)
-# Ausgabe..: Value (stdout), Quotes werden automatisch entfernt
+# Ausgabe..: Value (stdout), Quotes und Zeilen-Kommentare werden entfernt
+# Hinweis..: Im selben Prozess besser settings_get_conf_field (ohne Subshell)
 # Beispiel.: output_dir=$(settings_get_value_conf "disk2iso" "OUTPUT_DIR" "/opt/disk2iso/output")
 # ===========================================================================
 settings_get_value_conf() {
@@ -276,50 +587,18 @@ settings_get_value_conf() {
         return 1
     fi
     
-    #-- Pfad-Resolution über zentrale Funktion ------------------------------
-    local filepath
-    filepath=$(get_module_conf_path "$module") || {
-        log_error "$MSG_SETTINGS_PATH_RESOLUTION_FAILED: $module" 2>/dev/null || echo "ERROR: $MSG_SETTINGS_PATH_RESOLUTION_FAILED" >&2
-        return 1
-    }
-    
-    #-- Lese Wert (nutze erste Zeile die passt) -----------------------------
+    #-- Wert aus Snapshot (Default wird vorgemerkt) -------------------------
     local value
-    value=$(/usr/bin/sed -n "s/^${key}=\(.*\)/\1/p" "$filepath" | /usr/bin/head -1)
-    
-    #-- Entferne umschließende Quotes falls vorhanden -----------------------
-    value=$(echo "$value" | /usr/bin/sed 's/^"\(.*\)"$/\1/')
-    
-    #-- Wert gefunden oder Default nutzen (Self-Healing) -------------------
-    if [[ -n "$value" ]]; then
-        echo "$value"
-        return 0
-    elif [[ -n "$default" ]]; then
-        # Self-Healing: Default-Wert in Settings schreiben (falls nicht in Schleife)
-        if [[ "$_SETTINGS_SAVE_DEFAULT_CONF" == false ]]; then
-            _SETTINGS_SAVE_DEFAULT_CONF=true
-            
-            # Schreibe Default in Settings-Datei
-            if settings_set_value_conf "$module" "$key" "$default" 2>/dev/null; then
-                # Lese Wert erneut zur Bestätigung (rekursiver Aufruf)
-                _SETTINGS_SAVE_DEFAULT_CONF=false
-                settings_get_value_conf "$module" "$key" "$default"
-                return $?
-            else
-                # Schreibfehler - gebe Default trotzdem zurück
-                _SETTINGS_SAVE_DEFAULT_CONF=false
-                log_warning "$MSG_SETTINGS_DEFAULT_SAVE_FAILED: ${module}.${key}=${default}" 2>/dev/null
-                echo "$default"
-                return 0
-            fi
-        else
-            # In rekursivem Aufruf - verhindere Endlosschleife
-            echo "$default"
-            return 0
-        fi
-    else
+    if ! settings_get_conf_field value "$module" "$key" "$default"; then
         return 1
     fi
+
+    #-- Self-Healing: vorgemerkten Default sofort schreiben -----------------
+    # (Aufruf meist in Subshell/Einzelprozess, Vormerkung ginge sonst verloren)
+    [[ ${#_SETTINGS_PENDING_DEFAULTS[@]} -gt 0 ]] && settings_flush_defaults
+
+    echo "$value"
+    return 0
 }
 
 # ===========================================================================
@@ -355,37 +634,8 @@ settings_set_value_conf() {
         return 1
     fi
     
-    # Pfad-Resolution über zentrale Funktion
-    local filepath
-    filepath=$(get_module_conf_path "$module") || {
-        log_error "$MSG_SETTINGS_PATH_RESOLUTION_FAILED: $module" 2>/dev/null || echo "ERROR: $MSG_SETTINGS_PATH_RESOLUTION_FAILED" >&2
-        return 1
-    }
-    
-    # Type Detection (Smart Quoting)
-    local formatted_value
-    
-    if [[ "$value" =~ ^-?[0-9]+$ ]]; then
-        # Pure Integer - keine Quotes
-        formatted_value="${value}"
-        
-    elif [[ "$value" =~ ^(true|false|0|1|yes|no|on|off)$ ]]; then
-        # Boolean - normalisieren zu true/false, keine Quotes
-        case "$value" in
-            true|1|yes|on)   formatted_value="true" ;;
-            false|0|no|off)  formatted_value="false" ;;
-        esac
-        
-    else
-        # String - mit Quotes + Escaping
-        # Escape existing quotes
-        local escaped_value="${value//\"/\\\"}"
-        formatted_value="\"${escaped_value}\""
-    fi
-    
-    # Atomic write mit sed
-    /usr/bin/sed -i "s|^${key}=.*|${key}=${formatted_value}|" "$filepath" 2>/dev/null
-    return $?
+    # Schreiben (Smart Quoting, fehlender Key wird angehängt)
+    _settings_write_conf "$module" "$key" "$value"
 }
 
 # ===========================================================================
@@ -421,7 +671,220 @@ settings_del_value_conf() {
     
     # Lösche Zeile mit sed (in-place)
     /usr/bin/sed -i "/^${key}=/d" "$filepath" 2>/dev/null
-    return $?
+    local rc=$?
+
+    _settings_snapshot_invalidate "$module"
+    return $rc
+}
+
+# ===========================================================================
+# INI-CACHE (ALLE MODUL-MANIFESTE EINMAL EINLESEN)
+# ===========================================================================
+# Alle conf/lib*.ini werden in EINEM awk-Lauf in _SETTINGS_INI gelesen
+# ("modul|sektion|key" → Wert). Wie beim Settings-Snapshot wird höchstens
+# alle SETTINGS_SNAPSHOT_CHECK_SECONDS per stat geprüft, ob sich Dateien
+# geändert haben; neu eingelesen werden nur die geänderten Dateien.
+# Schreibzugriffe über settings_set_*_ini aktualisieren den Cache direkt.
+# ---------------------------------------------------------------------------
+declare -gA _SETTINGS_INI=()                 # "modul|sektion|key" → Wert
+declare -gA _SETTINGS_INI_STAMP=()           # modul → "mtime:size" beim Einlesen
+_SETTINGS_INI_CHECKED=0                      # letzte Prüfung (Epoch)
+_SETTINGS_INI_DIR=""                         # Verzeichnis der Manifeste
+
+# ===========================================================================
+# _settings_ini_drop
+# ---------------------------------------------------------------------------
+# Funktion.: Entfernt alle Cache-Einträge eines Moduls (oder einer Sektion)
+# Parameter: $1 = module
+# .........  $2 = section (optional, sonst alle Sektionen)
+# Rückgabe.: 0
+# ===========================================================================
+_settings_ini_drop() {
+    local prefix="${1}|${2:+${2}|}"
+    local entry
+    for entry in "${!_SETTINGS_INI[@]}"; do
+        [[ "$entry" == "$prefix"* ]] && unset '_SETTINGS_INI[$entry]'
+    done
+    return 0
+}
+
+# ===========================================================================
+# _settings_ini_parse
+# ---------------------------------------------------------------------------
+# Funktion.: Liest eine oder mehrere INI-Dateien in einem awk-Lauf in den
+# .........  Cache (vorhandene Einträge dieser Module werden ersetzt)
+# Parameter: $@ = Pfade der INI-Dateien (conf/lib<modul>.ini)
+# Rückgabe.: 0
+# Hinweis..: Gleiche Regeln wie bisher pro Aufruf: Kommentare (#, ;) und
+# .........  Zeilen vor der ersten Sektion werden ignoriert, bei doppelten
+# .........  Keys gilt die erste Zeile, Whitespace um Key/Wert entfällt
+# ===========================================================================
+_settings_ini_parse() {
+    local file module section key value
+
+    for file in "$@"; do
+        module="${file##*/lib}"
+        _settings_ini_drop "${module%.ini}"
+    done
+
+    while IFS=$'\t' read -r module section key value; do
+        _SETTINGS_INI["${module}|${section}|${key}"]="$value"
+    done < <(/usr/bin/awk '
+        FNR == 1 { module = FILENAME; sub(/.*\/lib/, "", module); sub(/\.ini$/, "", module); section = "" }
+        /^[[:space:]]*[#;]/ { next }
+        /^[[:space:]]*\[.*\][[:space:]]*$/ { section = $0; gsub(/^[[:space:]]*\[|\][[:space:]]*$/, "", section); next }
+        section != "" && index($0, "=") > 0 {
+            key = substr($0, 1, index($0, "=") - 1)
+            value = substr($0, index($0, "=") + 1)
+            gsub(/^[[:space:]]+|[[:space:]]+$/, "", key)
+            gsub(/^[[:space:]]+|[[:space:]]+$/, "", value)
+            id = module "|" section "|" key
+            if (key != "" && !(id in seen)) { seen[id] = 1; printf "%s\t%s\t%s\t%s\n", module, section, key, value }
+        }' "$@" 2>/dev/null)
+
+    return 0
+}
+
+# ===========================================================================
+# _settings_ini_ensure
+# ---------------------------------------------------------------------------
+# Funktion.: Stellt sicher, dass der INI-Cache aktuell ist
+# Parameter: keine
+# Rückgabe.: 0
+# Hinweis..: Innerhalb von SETTINGS_SNAPSHOT_CHECK_SECONDS nach der letzten
+# .........  Prüfung ohne Fork, sonst ein stat über alle Manifeste
+# ===========================================================================
+_settings_ini_ensure() {
+    #-- Kürzlich geprüft → Cache verwenden ----------------------------------
+    if (( _SETTINGS_INI_CHECKED > 0 && EPOCHSECONDS - _SETTINGS_INI_CHECKED < SETTINGS_SNAPSHOT_CHECK_SECONDS )); then
+        return 0
+    fi
+
+    #-- Verzeichnis einmalig ermitteln (auch ohne libfolders nutzbar) -------
+    if [[ -z "$_SETTINGS_INI_DIR" ]]; then
+        if type -t folders_get_conf_dir &>/dev/null; then
+            _SETTINGS_INI_DIR=$(folders_get_conf_dir 2>/dev/null)
+        fi
+        [[ -n "$_SETTINGS_INI_DIR" ]] || _SETTINGS_INI_DIR="${CONFIG_FILE%/*}"
+    fi
+
+    #-- Stempel aller Manifeste vergleichen ---------------------------------
+    local -a files=("${_SETTINGS_INI_DIR}"/lib*.ini)
+    local -a stamps=() changed=()
+    local -A present=()
+    local line module
+    [[ -f "${files[0]}" ]] && mapfile -t stamps < <(/usr/bin/stat -c '%n|%Y:%s' "${files[@]}" 2>/dev/null)
+
+    for line in "${stamps[@]}"; do
+        module="${line%|*}"
+        module="${module##*/lib}"
+        module="${module%.ini}"
+        present[$module]=1
+        [[ "${line##*|}" == "${_SETTINGS_INI_STAMP[$module]}" ]] && continue
+        _SETTINGS_INI_STAMP[$module]="${line##*|}"
+        changed+=("${line%|*}")
+    done
+
+    #-- Gelöschte Manifeste aus dem Cache entfernen -------------------------
+    for module in "${!_SETTINGS_INI_STAMP[@]}"; do
+        [[ -n "${present[$module]}" ]] && continue
+        _settings_ini_drop "$module"
+        unset '_SETTINGS_INI_STAMP[$module]'
+    done
+
+    _SETTINGS_INI_CHECKED=$EPOCHSECONDS
+    [[ ${#changed[@]} -gt 0 ]] && _settings_ini_parse "${changed[@]}"
+    return 0
+}
+
+# ===========================================================================
+# _settings_ini_restamp
+# ---------------------------------------------------------------------------
+# Funktion.: Übernimmt nach einem eigenen Schreibzugriff den neuen Stempel
+# .........  der Datei, damit der (bereits aktualisierte) Cache gültig bleibt
+# Parameter: $1 = module
+# .........  $2 = Pfad der INI-Datei
+# Rückgabe.: 0
+# ===========================================================================
+_settings_ini_restamp() {
+    #-- Cache noch nie geladen → jetzt komplett einlesen --------------------
+    if (( _SETTINGS_INI_CHECKED == 0 )); then
+        _settings_ini_ensure
+        return 0
+    fi
+    _SETTINGS_INI_STAMP[$1]=$(/usr/bin/stat -c '%Y:%s' "$2" 2>/dev/null)
+    return 0
+}
+
+# ===========================================================================
+# settings_get_ini_field
+# ---------------------------------------------------------------------------
+# Funktion.: Liest einen INI-Wert aus dem Cache direkt in eine Variable des
+# .........  Aufrufers (ohne Subshell, ohne awk)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = module (z.B. "audio")
+# .........  $3 = section (z.B. "dependencies")
+# .........  $4 = key (z.B. "optional")
+# .........  $5 = default (optional, wird NICHT in die Datei geschrieben)
+# Rückgabe.: 0 = Wert vorhanden, 1 = Leer/nicht vorhanden (Default gesetzt)
+# Beispiel.: settings_get_ini_field tools "audio" "dependencies" "optional"
+# ===========================================================================
+settings_get_ini_field() {
+    _settings_ini_ensure
+    local _settings_value="${_SETTINGS_INI["${2}|${3}|${4}"]}"
+    printf -v "$1" '%s' "${_settings_value:-$5}"
+    [[ -n "$_settings_value" ]]
+}
+
+# ===========================================================================
+# settings_export_json
+# ---------------------------------------------------------------------------
+# Funktion.: Gibt Settings-Snapshot (disk2iso.conf) und INI-Cache als JSON aus
+# Parameter: keine
+# Rückgabe.: 0
+# Ausgabe..: {"conf": {"modul|KEY": "Wert"}, "ini": {"modul|sektion|key": "Wert"}}
+# Hinweis..: Für das Web-Interface: ein Bash-Aufruf liefert alle Werte, Python
+# .........  hält sie bis zur nächsten Dateiänderung im Speicher
+# ===========================================================================
+settings_export_json() {
+    local entry value sep=""
+
+    _settings_snapshot_ensure "disk2iso"
+    _settings_ini_ensure
+
+    printf '{"conf": {'
+    for entry in "${!_SETTINGS_SNAPSHOT[@]}"; do
+        _settings_json_escape value "${_SETTINGS_SNAPSHOT[$entry]}"
+        printf '%s"%s": "%s"' "$sep" "$entry" "$value"
+        sep=", "
+    done
+    printf '}, "ini": {'
+    sep=""
+    for entry in "${!_SETTINGS_INI[@]}"; do
+        _settings_json_escape value "${_SETTINGS_INI[$entry]}"
+        printf '%s"%s": "%s"' "$sep" "$entry" "$value"
+        sep=", "
+    done
+    printf '}}\n'
+    return 0
+}
+
+# ===========================================================================
+# _settings_json_escape
+# ---------------------------------------------------------------------------
+# Funktion.: Maskiert einen Wert für einen JSON-String (ohne Fork)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = Wert
+# Rückgabe.: 0
+# ===========================================================================
+_settings_json_escape() {
+    local _settings_json="${2//\\/\\\\}"
+    _settings_json="${_settings_json//\"/\\\"}"
+    _settings_json="${_settings_json//$'\t'/\\t}"
+    _settings_json="${_settings_json//$'\r'/\\r}"
+    _settings_json="${_settings_json//$'\n'/\\n}"
+    printf -v "$1" '%s' "$_settings_json"
+    return 0
 }
 
 # ============================================================================
@@ -437,13 +900,14 @@ settings_del_value_conf() {
 # ===========================================================================
 # settings_get_value_ini
 # ---------------------------------------------------------------------------
-# Funktion.: Lese einzelnen Wert aus .ini Datei (KERN-IMPLEMENTIERUNG)
+# Funktion.: Lese einzelnen Wert aus .ini Datei (via INI-Cache)
 # Parameter: $1 = module (Modulname ohne Suffix, z.B. "audio")
 # .........  $2 = section (z.B. "dependencies")
 # .........  $3 = key (z.B. "optional")
 # .........  $4 = default (optional, Fallback wenn Key nicht gefunden)
 # Rückgabe.: 0 = Erfolg (Wert oder Default), 1 = Fehler (Key fehlt, kein Default)
 # Ausgabe..: Value (stdout)
+# Hinweis..: Im selben Prozess besser settings_get_ini_field (ohne Subshell)
 # Beispiel.: tools=$(settings_get_value_ini "audio" "dependencies" "optional" "")
 # ===========================================================================
 settings_get_value_ini() {
@@ -453,23 +917,7 @@ settings_get_value_ini() {
     local key="$3"
     local default="${4:-}"
     
-    #-- Validiere Dependencies ----------------------------------------------
-    if ! type -t get_module_ini_path &>/dev/null; then
-        log_error "$MSG_SETTINGS_GET_MODULE_INI_PATH_UNAVAILABLE" 2>/dev/null || echo "ERROR: $MSG_SETTINGS_GET_MODULE_INI_PATH_UNAVAILABLE" >&2
-        return 1
-    fi
-    
-    #-- Hole Pfad zur INI-Datei via get_module_ini_path() -------------------
-    local filepath=$(get_module_ini_path "$module") || {
-        if [[ -n "$default" ]]; then
-            echo "$default"
-            return 0
-        fi
-        log_error "$MSG_SETTINGS_MODULE_INI_NOT_FOUND: $module" 2>/dev/null || echo "ERROR: $MSG_SETTINGS_MODULE_INI_NOT_FOUND: $module" >&2
-        return 1
-    }
-    
-    #-- Validierung der Parameter -------------------------------------------
+    #-- Parameter-Validierung -----------------------------------------------
     if [[ -z "$module" ]]; then
         log_error "$MSG_SETTINGS_MODULE_MISSING" 2>/dev/null || echo "ERROR: $MSG_SETTINGS_MODULE_MISSING" >&2
         return 1
@@ -485,54 +933,22 @@ settings_get_value_ini() {
         return 1
     fi
     
-    #-- awk-Logik für INI-Parsing -------------------------------------------
+    #-- Wert aus INI-Cache --------------------------------------------------
     local value
-    value=$(awk -F'=' -v section="[${section}]" -v key="$key" '
-        # Wenn Zeile = Section-Header → Sektion gefunden
-        $0 == section { in_section=1; next }
-        
-        # Wenn neue Section beginnt → Sektion verlassen
-        /^\[.*\]/ { in_section=0 }
-        
-        # Wenn in Sektion UND Key matcht → Wert extrahieren
-        in_section && $1 ~ "^[[:space:]]*" key "[[:space:]]*$" {
-            # Entferne Whitespace vor/nach Wert
-            gsub(/^[[:space:]]+|[[:space:]]+$/, "", $2)
-            print $2
-            exit
-        }
-    ' "$filepath")
-    
-    #-- Wert gefunden oder Default nutzen (Self-Healing) -------------------
-    if [[ -n "$value" ]]; then
+    if settings_get_ini_field value "$module" "$section" "$key"; then
         echo "$value"
         return 0
-    elif [[ -n "$default" ]]; then
-        # Self-Healing: Default-Wert in INI-Datei schreiben (falls nicht in Schleife)
-        if [[ "$_SETTINGS_SAVE_DEFAULT_INI" == false ]]; then
-            _SETTINGS_SAVE_DEFAULT_INI=true
-            
-            # Schreibe Default in INI-Datei
-            if settings_set_value_ini "$module" "$section" "$key" "$default" 2>/dev/null; then
-                # Lese Wert erneut zur Bestätigung (rekursiver Aufruf)
-                _SETTINGS_SAVE_DEFAULT_INI=false
-                settings_get_value_ini "$module" "$section" "$key" "$default"
-                return $?
-            else
-                # Schreibfehler - gebe Default trotzdem zurück
-                _SETTINGS_SAVE_DEFAULT_INI=false
-                log_warning "$MSG_SETTINGS_DEFAULT_SAVE_FAILED: ${module}.[${section}].${key}=${default}" 2>/dev/null
-                echo "$default"
-                return 0
-            fi
-        else
-            # In rekursivem Aufruf - verhindere Endlosschleife
-            echo "$default"
-            return 0
-        fi
-    else
-        return 1
     fi
+    
+    #-- Kein Wert und kein Default ------------------------------------------
+    [[ -z "$default" ]] && return 1
+    
+    #-- Self-Healing: Default in INI-Datei schreiben (aktualisiert Cache) ---
+    if ! settings_set_value_ini "$module" "$section" "$key" "$default" 2>/dev/null; then
+        log_warning "$MSG_SETTINGS_DEFAULT_SAVE_FAILED: ${module}.[${section}].${key}=${default}" 2>/dev/null
+    fi
+    echo "$default"
+    return 0
 }
 
 # ===========================================================================
@@ -584,45 +1000,47 @@ settings_set_value_ini() {
     
     # KERN-IMPLEMENTIERUNG: Atomic write mit awk
     # Hinweis: Datei-Existenz ist garantiert durch get_module_ini_path() (Self-Healing)
-    # Escape Sonderzeichen für sed
-    local escaped_key=$(echo "$key" | sed 's/[\/&]/\\&/g')
-    local escaped_value=$(echo "$value" | sed 's/[\/&]/\\&/g')
+    # Existenz von Section/Key aus dem INI-Cache (statt grep + awk)
+    _settings_ini_ensure
+    local entry section_found=false
+    for entry in "${!_SETTINGS_INI[@]}"; do
+        [[ "$entry" == "${module}|${section}|"* ]] && { section_found=true; break; }
+    done
     
     # Prüfe ob Section existiert
-    if ! grep -q "^\[${section}\]" "$filepath" 2>/dev/null; then
+    if [[ "$section_found" == false ]] && ! grep -q "^\[${section}\]" "$filepath" 2>/dev/null; then
         # Section fehlt - erstelle sie
-        echo "" >> "$filepath"
-        echo "[${section}]" >> "$filepath"
-        echo "${key}=${value}" >> "$filepath"
-        return 0
-    fi
+        {
+            echo ""
+            echo "[${section}]"
+            echo "${key}=${value}"
+        } >> "$filepath" || return 1
     
     # Prüfe ob Key in Section existiert
-    if awk -v section="[${section}]" -v key="$key" '
-        $0 == section { in_section=1; next }
-        /^\[.*\]/ { in_section=0 }
-        in_section && $1 ~ "^[[:space:]]*" key "[[:space:]]*$" { found=1; exit }
-        END { exit !found }
-    ' "$filepath"; then
+    elif [[ -n "${_SETTINGS_INI["${module}|${section}|${key}"]+x}" ]]; then
         # Key existiert - aktualisiere Wert
-        awk -v section="[${section}]" -v key="$key" -v value="$value" '
+        awk -F'=' -v section="[${section}]" -v key="$key" -v value="$value" '
             $0 == section { in_section=1; print; next }
             /^\[.*\]/ { in_section=0 }
-            in_section && $1 ~ "^[[:space:]]*" key "[[:space:]]*$" {
+            in_section && !done && $1 ~ "^[[:space:]]*" key "[[:space:]]*$" {
                 print key "=" value
+                done=1
                 next
             }
             { print }
-        ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath"
+        ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath" || return 1
     else
         # Key fehlt - füge in Section ein
         awk -v section="[${section}]" -v key="$key" -v value="$value" '
             $0 == section { in_section=1; print; print key "=" value; next }
             /^\[.*\]/ { in_section=0 }
             { print }
-        ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath"
+        ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath" || return 1
     fi
     
+    # Cache aktualisieren statt Datei neu einzulesen
+    _SETTINGS_INI["${module}|${section}|${key}"]="$value"
+    _settings_ini_restamp "$module" "$filepath"
     return 0
 }
 
@@ -672,13 +1090,16 @@ settings_del_value_ini() {
     
     # Hinweis: Datei-Existenz ist garantiert durch get_module_ini_path() (Self-Healing)
     # KERN-IMPLEMENTIERUNG: awk löscht Key=Value Zeile in angegebener Sektion
-    awk -v section="[${section}]" -v key="$key" '
+    awk -F'=' -v section="[${section}]" -v key="$key" '
         $0 == section { in_section=1; print; next }
         /^\[.*\]/ { in_section=0 }
         in_section && $1 ~ "^[[:space:]]*" key "[[:space:]]*$" { next }
         { print }
-    ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath"
+    ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath" || return 1
     
+    # Cache aktualisieren
+    unset '_SETTINGS_INI["${module}|${section}|${key}"]'
+    _settings_ini_restamp "$module" "$filepath"
     return 0
 }
 
@@ -897,15 +1318,21 @@ settings_set_section_ini() {
     echo "[${section}]" >> "$filepath"
     
     # Füge alle Key=Value Paare hinzu
+    local pair_key
     for pair in "$@"; do
         # Validiere Format key=value
         if [[ "$pair" =~ ^[^=]+=.* ]]; then
             echo "$pair" >> "$filepath"
+            # Cache aktualisieren (erste Zeile je Key gilt)
+            pair_key="${pair%%=*}"
+            [[ -n "${_SETTINGS_INI["${module}|${section}|${pair_key}"]+x}" ]] \
+                || _SETTINGS_INI["${module}|${section}|${pair_key}"]="${pair#*=}"
         else
             log_warning "$MSG_SETTINGS_INVALID_KEYVALUE_PAIR: $pair" 2>/dev/null
         fi
     done
     
+    _settings_ini_restamp "$module" "$filepath"
     return 0
 }
 
@@ -960,8 +1387,11 @@ settings_del_section_ini() {
         
         # Alle anderen Zeilen ausgeben
         { print }
-    ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath"
+    ' "$filepath" > "${filepath}.tmp" && mv "${filepath}.tmp" "$filepath" || return 1
     
+    # Cache aktualisieren
+    _settings_ini_drop "$module" "$section"
+    _settings_ini_restamp "$module" "$filepath"
     return 0
 }
 
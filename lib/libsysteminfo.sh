@@ -57,7 +57,7 @@ systeminfo_check_dependencies() {
 # Datenstruktur für System-Informationen
 # ---------------------------------------------------------------------------
 # SYSTEM_INFO: Systeminformationen
-declare -A SYSTEM_INFO=(
+declare -gA SYSTEM_INFO=(
     # ========== Betriebssystem ==========
     [os_distribution]=""        # z.B. "Debian", "Ubuntu"
     [os_version]=""             # z.B. "12.5", "22.04 LTS"
@@ -1230,64 +1230,411 @@ systeminfo_detect_storage_used() {
 }
 
 # ===========================================================================
-# HINTERGRUND ÜBERWACHUNG DES SPEICHERPLATZES
+# RESIDENTER COLLECTOR (FLÜCHTIGE SYSTEMDATEN)
 # ===========================================================================
-_SYSTEMINFO_MONITOR_PID=""   # PID des Hintergrund-Monitors für Speicherplatz
+# Ein residenter Prozess (disk2iso-updater.service) sammelt Uptime,
+# Speicherplatz und Service-Status mit eigenem Intervall je Messwert.
+# Solange Bedarf besteht, gelten die kurzen Intervalle, sonst die langen:
+#   - Web-UI: schreibt Epoch-Sekunden nach <demand_dir>/web (max. alle 5s)
+#   - Daemon: systeminfo_start_monitor legt <demand_dir>/copy-<pid> an
+# Ersetzt den 30s-Timer (Neustart + fünf Libraries je Lauf) und den
+# df-Worker des Daemons. Eigene CPU-Kosten stehen in api/collector.json.
+# ---------------------------------------------------------------------------
+SYSTEMINFO_DEMAND_DIR="/run/disk2iso/collector"
+SYSTEMINFO_VIEWER_TIMEOUT=60         # Sekunden ohne Web-Anfrage bis Leerlauf
+SYSTEMINFO_IDLE_TICK=5               # Prüfintervall auf neuen Bedarf
+
+#-- Intervalle je Messwert: "<bei Bedarf>:<im Leerlauf>" in Sekunden -------
+declare -gA SYSTEMINFO_COLLECT_INTERVALS=(
+    [os]="3600:3600"
+    [uptime]="30:300"
+    [storage]="15:120"
+    [services]="10:60"
+)
+
+#-- Messwert -> Collector-Funktion -----------------------------------------
+declare -gA SYSTEMINFO_COLLECT_FUNCS=(
+    [os]="systeminfo_collect_os_info"
+    [uptime]="systeminfo_collect_uptime_info"
+    [storage]="systeminfo_collect_storage_info"
+    [services]="service_collect_status_info"
+)
+
+_SYSTEMINFO_MONITOR_FILE=""          # Bedarfs-Marker dieses Kopiervorgangs
+_SYSTEMINFO_DEMAND_PATH=""           # Bedarfs-Verzeichnis des Collectors
+_SYSTEMINFO_DEMAND_REASON=""         # web | copy | leer (Leerlauf)
+_SYSTEMINFO_API_DIR=""               # API-Verzeichnis des laufenden Ticks
+declare -gA _SYSTEMINFO_OS_INFO=()   # statische OS-Werte für os_info.json
+declare -gA _SYSTEMINFO_LAST_JSON=() # zuletzt geschriebener Inhalt je Datei
+declare -gA _SYSTEMINFO_NEXT_RUN=() _SYSTEMINFO_LAST_RUN=()
+declare -gA _SYSTEMINFO_RUNS=() _SYSTEMINFO_CPU_TICKS=()
 
 # ===========================================================================
-# systeminfo_monitor_worker
+# _systeminfo_json_escape
 # ---------------------------------------------------------------------------
-# Funktion.: Endlosschleife, die alle 60 Sekunden Speicherplatz aktualisiert
-# Parameter: Keine
-# Rückgabe.: Läuft endlos, bis Prozess beendet wird
+# Funktion.: Maskiert einen String für JSON (ohne Subshell)
+# Parameter: $1 = Name der Zielvariable
+# .........  $2 = Wert
+# Rückgabe.: 0
+# ===========================================================================
+_systeminfo_json_escape() {
+    local _si_json="${2//\\/\\\\}"
+    _si_json="${_si_json//\"/\\\"}"
+    _si_json="${_si_json//$'\t'/\\t}"
+    _si_json="${_si_json//$'\n'/\\n}"
+    printf -v "$1" '%s' "$_si_json"
+    return 0
+}
+
+# ===========================================================================
+# _systeminfo_write_json
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt eine API-Datei atomar, aber nur bei geändertem Inhalt
+# Parameter: $1 = Dateiname (relativ zum API-Verzeichnis)
+# .........  $2 = JSON-Inhalt
+# Rückgabe.: 0 = Erfolg (oder unverändert), 1 = Fehler
+# ===========================================================================
+_systeminfo_write_json() {
+    local api_dir="$_SYSTEMINFO_API_DIR"
+    if [[ -z "$api_dir" ]]; then
+        api_dir=$(folders_get_api_dir) || return 1
+    fi
+    local file="${api_dir}/$1"
+
+    #-- Unverändert? Dann kein Schreiben (und kein mv-Prozess) --------------
+    [[ "${_SYSTEMINFO_LAST_JSON[$file]-}" == "$2" ]] && [[ -f "$file" ]] && return 0
+
+    printf '%s\n' "$2" > "${file}.tmp.$$" && mv -f "${file}.tmp.$$" "$file" || return 1
+    _SYSTEMINFO_LAST_JSON[$file]="$2"
+    return 0
+}
+
+# ===========================================================================
+# systeminfo_collect_os_info
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt die statischen OS-Werte und schreibt os_info.json
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Schreibt.: api/os_info.json (über systeminfo_collect_uptime_info)
+# Hinweis..: Ändert sich praktisch nie - im Collector stündlich
+# ===========================================================================
+systeminfo_collect_os_info() {
+    _SYSTEMINFO_OS_INFO=(
+        [distribution]="$(systeminfo_detect_distribution)"
+        [version]="$(systeminfo_detect_version)"
+        [kernel]="$(systeminfo_detect_kernel)"
+        [architecture]="$(systeminfo_detect_architecture)"
+        [hostname]="$(systeminfo_detect_hostname)"
+    )
+    systeminfo_collect_uptime_info
+}
+
+# ===========================================================================
+# systeminfo_collect_uptime_info
+# ---------------------------------------------------------------------------
+# Funktion.: Aktualisiert die Uptime in os_info.json
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Schreibt.: api/os_info.json
+# Hinweis..: Ohne Fork: /proc/uptime statt "uptime -p", gleiches Format
+# ===========================================================================
+systeminfo_collect_uptime_info() {
+    #-- Statische Werte noch nicht ermittelt? -------------------------------
+    if [[ ${#_SYSTEMINFO_OS_INFO[@]} -eq 0 ]]; then
+        systeminfo_collect_os_info
+        return
+    fi
+
+    #-- Uptime wie "uptime -p" formatieren ----------------------------------
+    local seconds rest
+    read -r seconds rest < /proc/uptime || return 1
+    seconds="${seconds%%.*}"
+    local -a values=( $(( seconds / 86400 )) $(( seconds % 86400 / 3600 )) $(( seconds % 3600 / 60 )) )
+    local -a units=( day hour minute )
+    local uptime="" i
+    for i in 0 1 2; do
+        (( values[i] > 0 )) || { (( i == 2 )) && [[ -z "$uptime" ]]; } || continue
+        uptime+="${uptime:+, }${values[i]} ${units[i]}"
+        (( values[i] == 1 )) || uptime+="s"
+    done
+    uptime="up ${uptime}"
+
+    #-- JSON zusammensetzen -------------------------------------------------
+    local key value json="{"
+    for key in distribution version kernel architecture hostname; do
+        _systeminfo_json_escape value "${_SYSTEMINFO_OS_INFO[$key]:-Unknown}"
+        json+="\"${key}\":\"${value}\","
+    done
+    json+="\"uptime\":\"${uptime}\"}"
+
+    _systeminfo_write_json "os_info.json" "$json"
+}
+
+# ===========================================================================
+# systeminfo_collect_storage_info
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt Speicherplatz am Ausgabe-Verzeichnis (ein df-Aufruf)
+# Parameter: keine
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# Schreibt.: api/storage_info.json
+# Hinweis..: Felder wie get_disk_space() im Web-Interface (GB mit zwei,
+# .........  Prozent mit einer Nachkommastelle)
+# ===========================================================================
+systeminfo_collect_storage_info() {
+    #-- Ausgabe-Verzeichnis aus dem Settings-Snapshot (ohne Subshell) -------
+    local output_dir=""
+    settings_get_conf_field output_dir "disk2iso" "DEFAULT_OUTPUT_DIR" \
+        || settings_get_conf_field output_dir "disk2iso" "OUTPUT_DIR"
+    output_dir="${output_dir%/}"
+
+    #-- Ein df für alle Werte (Bytes, POSIX-Format) -------------------------
+    local fs total=0 used=0 free=0 rest
+    if [[ -d "$output_dir" ]]; then
+        { read -r rest; read -r fs total used free rest; } \
+            < <(df -P -B1 -- "$output_dir" 2>/dev/null)
+        [[ "$total" =~ ^[0-9]+$ ]] || total=0
+        [[ "$free" =~ ^[0-9]+$ ]] || free=0
+    fi
+
+    #-- Umrechnen (Ganzzahl-Arithmetik, GB = 1024^3) ------------------------
+    local total_c=$(( total * 100 / 1073741824 )) free_c=$(( free * 100 / 1073741824 ))
+    local used_p=0 free_p=0
+    if (( total > 0 )); then
+        used_p=$(( (total - free) * 1000 / total ))
+        free_p=$(( free * 1000 / total ))
+    fi
+    local disk_space
+    printf -v disk_space '{"free_gb":%d.%02d,"total_gb":%d.%02d,"used_percent":%d.%d,"free_percent":%d.%d}' \
+        $(( free_c / 100 )) $(( free_c % 100 )) $(( total_c / 100 )) $(( total_c % 100 )) \
+        $(( used_p / 10 )) $(( used_p % 10 )) $(( free_p / 10 )) $(( free_p % 10 ))
+
+    #-- JSON zusammensetzen (flach für Widgets, disk_space für /api/archive) -
+    local dir_json
+    _systeminfo_json_escape dir_json "$output_dir"
+    _systeminfo_write_json "storage_info.json" \
+        "{\"output_dir\":\"${dir_json}\",\"path\":\"${dir_json}\",${disk_space:1:-1},\"disk_space\":${disk_space}}"
+}
+
+# ===========================================================================
+# _systeminfo_cpu_ticks
+# ---------------------------------------------------------------------------
+# Funktion.: Liest die verbrauchte CPU-Zeit dieses Prozesses inkl. beendeter
+# .........  Kindprozesse (utime+stime+cutime+cstime) ohne Fork
+# Parameter: $1 = Name der Zielvariable (Clock-Ticks)
+# Rückgabe.: 0 = Erfolg, 1 = /proc nicht lesbar
+# ===========================================================================
+_systeminfo_cpu_ticks() {
+    local _si_stat
+    local -a _si_fields
+    if ! read -r _si_stat < "/proc/${BASHPID}/stat"; then
+        printf -v "$1" '%d' 0
+        return 1
+    fi
+    #-- Felder nach dem Kommando-Namen: state=0 ... utime=11 .. cstime=14 --
+    read -r -a _si_fields <<< "${_si_stat##*) }"
+    printf -v "$1" '%d' $(( _si_fields[11] + _si_fields[12] + _si_fields[13] + _si_fields[14] ))
+}
+
 # ===========================================================================
-systeminfo_monitor_worker() {
-    #-- Endlosschleife, die alle 60 Sekunden Speicherplatz aktualisiert -----
+# _systeminfo_demand_active
+# ---------------------------------------------------------------------------
+# Funktion.: Prüft, ob Bedarf an kurzen Intervallen besteht
+# Parameter: keine
+# Rückgabe.: 0 = Bedarf (Grund in _SYSTEMINFO_DEMAND_REASON), 1 = Leerlauf
+# Hinweis..: Ohne Fork; verwaiste Kopier-Marker werden entfernt
+# ===========================================================================
+_systeminfo_demand_active() {
+    local dir="$_SYSTEMINFO_DEMAND_PATH" beat="" marker
+    _SYSTEMINFO_DEMAND_REASON=""
+
+    #-- Web-UI: letzte Anfrage jünger als SYSTEMINFO_VIEWER_TIMEOUT? --------
+    if [[ -f "${dir}/web" ]]; then
+        IFS= read -r beat < "${dir}/web"
+    fi
+    if [[ "$beat" =~ ^[0-9]+$ ]] && (( EPOCHSECONDS - beat < SYSTEMINFO_VIEWER_TIMEOUT )); then
+        _SYSTEMINFO_DEMAND_REASON="web"
+        return 0
+    fi
+
+    #-- Daemon: laufender Kopiervorgang? ------------------------------------
+    for marker in "${dir}"/copy-*; do
+        [[ -e "$marker" ]] || continue
+        if kill -0 "${marker##*-}" 2>/dev/null; then
+            _SYSTEMINFO_DEMAND_REASON="copy"
+            return 0
+        fi
+        rm -f "$marker"
+    done
+    return 1
+}
+
+# ===========================================================================
+# _systeminfo_write_collector_stats
+# ---------------------------------------------------------------------------
+# Funktion.: Schreibt Intervalle, Läufe und CPU-Kosten nach collector.json
+# Parameter: $1 = CPU-Ticks beim Start, $2 = Startzeit (Epoch)
+# .........  $3 = Clock-Ticks pro Sekunde
+# Rückgabe.: 0 = Erfolg, 1 = Fehler
+# ===========================================================================
+_systeminfo_write_collector_stats() {
+    local start_ticks="$1" started="$2" clk_tck="$3"
+    local ticks metric interval last started_iso last_iso
+    _systeminfo_cpu_ticks ticks
+
+    #-- CPU-Anteil seit Start in Hundertstel Prozent ------------------------
+    local elapsed=$(( EPOCHSECONDS - started ))
+    (( elapsed > 0 )) || elapsed=1
+    local used=$(( ticks - start_ticks ))
+    local cpu_pct=$(( used * 10000 / (clk_tck * elapsed) ))
+
+    local demand=false
+    [[ -n "$_SYSTEMINFO_DEMAND_REASON" ]] && demand=true
+    printf -v started_iso '%(%Y-%m-%dT%H:%M:%S%z)T' "$started"
+
+    local metrics="" entry
+    for metric in "${!SYSTEMINFO_COLLECT_FUNCS[@]}"; do
+        last="${_SYSTEMINFO_LAST_RUN[$metric]:-0}"
+        printf -v last_iso '%(%Y-%m-%dT%H:%M:%S%z)T' "$last"
+        if [[ "$demand" == true ]]; then
+            interval="${SYSTEMINFO_COLLECT_INTERVALS[$metric]%%:*}"
+        else
+            interval="${SYSTEMINFO_COLLECT_INTERVALS[$metric]##*:}"
+        fi
+        printf -v entry '"%s":{"interval_s":%d,"runs":%d,"cpu_ms":%d,"last_run":"%s","next_in_s":%d}' \
+            "$metric" "$interval" "${_SYSTEMINFO_RUNS[$metric]:-0}" \
+            $(( ${_SYSTEMINFO_CPU_TICKS[$metric]:-0} * 1000 / clk_tck )) "$last_iso" \
+            $(( ${_SYSTEMINFO_NEXT_RUN[$metric]:-0} - EPOCHSECONDS ))
+        metrics+="${metrics:+,}${entry}"
+    done
+
+    local json
+    printf -v json '{"pid":%d,"started":"%s","demand":%s,"demand_reason":"%s","cpu_ms":%d,"cpu_percent":%d.%02d,"metrics":{%s}}' \
+        "$BASHPID" "$started_iso" "$demand" "$_SYSTEMINFO_DEMAND_REASON" \
+        $(( used * 1000 / clk_tck )) $(( cpu_pct / 100 )) $(( cpu_pct % 100 )) "$metrics"
+    _systeminfo_write_json "collector.json" "$json"
+}
+
+# ===========================================================================
+# systeminfo_collector_run
+# ---------------------------------------------------------------------------
+# Funktion.: Hauptschleife des residenten Collectors (disk2iso-updater)
+# Parameter: keine
+# Rückgabe.: Läuft endlos, 1 = Start fehlgeschlagen
+# Hinweis..: Wartet fork-frei (read -t auf eigener Pipe) bis zum nächsten
+# .........  fälligen Messwert, höchstens SYSTEMINFO_IDLE_TICK Sekunden.
+# .........  Beginnt Bedarf, werden Messwerte auf das kurze Intervall
+# .........  vorgezogen (ggf. sofort).
+# ===========================================================================
+systeminfo_collector_run() {
+    #-- Bedarfs-Verzeichnis anlegen (RAM bevorzugt, sonst API-Verzeichnis) --
+    _SYSTEMINFO_DEMAND_PATH="$SYSTEMINFO_DEMAND_DIR"
+    if ! mkdir -p "$_SYSTEMINFO_DEMAND_PATH" 2>/dev/null; then
+        local api_dir
+        api_dir=$(folders_get_api_dir) || return 1
+        _SYSTEMINFO_DEMAND_PATH="${api_dir}/.collector"
+        mkdir -p "$_SYSTEMINFO_DEMAND_PATH" || return 1
+    fi
+
+    #-- Pipe zum fork-freien Warten, Clock-Ticks einmalig ermitteln ---------
+    local sleep_fd clk_tck
+    exec {sleep_fd}<> <(:)
+    clk_tck=$(getconf CLK_TCK 2>/dev/null)
+    [[ "$clk_tck" =~ ^[1-9][0-9]*$ ]] || clk_tck=100
+
+    local started=$EPOCHSECONDS start_ticks
+    _systeminfo_cpu_ticks start_ticks
+    log_info "$MSG_SYSTEMINFO_COLLECTOR_STARTED ${_SYSTEMINFO_DEMAND_PATH}"
+
+    local metric interval next wait ran had_demand=false
     while true; do
-        systeminfo_set_output_dir          # Aktualisiere Ausgabe-Verzeichnis
-        systeminfo_set_storage_total       # Aktualisiere Gesamtspeicherplatz
-        systeminfo_set_storage_free       # Aktualisiere freien Speicherplatz
-        systeminfo_set_storage_used    # Aktualisiere genutzten Speicherplatz
-        sleep 60                             # Alle 60 Sekunden aktualisieren
+        #-- Bedarf prüfen; bei Beginn auf kurze Intervalle vorziehen --------
+        if _systeminfo_demand_active; then
+            if [[ "$had_demand" == false ]]; then
+                for metric in "${!SYSTEMINFO_COLLECT_FUNCS[@]}"; do
+                    next=$(( ${_SYSTEMINFO_LAST_RUN[$metric]:-0} + ${SYSTEMINFO_COLLECT_INTERVALS[$metric]%%:*} ))
+                    (( next < ${_SYSTEMINFO_NEXT_RUN[$metric]:-0} )) && _SYSTEMINFO_NEXT_RUN[$metric]=$next
+                done
+                log_debug "$MSG_DEBUG_SYSTEMINFO_COLLECTOR_DEMAND ${_SYSTEMINFO_DEMAND_REASON}"
+            fi
+            had_demand=true
+        else
+            had_demand=false
+        fi
+
+        #-- Fällige Messwerte sammeln, CPU-Kosten je Messwert zählen --------
+        ran=false
+        _SYSTEMINFO_API_DIR=""
+        for metric in "${!SYSTEMINFO_COLLECT_FUNCS[@]}"; do
+            (( EPOCHSECONDS >= ${_SYSTEMINFO_NEXT_RUN[$metric]:-0} )) || continue
+            if [[ -z "$_SYSTEMINFO_API_DIR" ]]; then
+                _SYSTEMINFO_API_DIR=$(folders_get_api_dir) || break
+            fi
+
+            local before after
+            _systeminfo_cpu_ticks before
+            "${SYSTEMINFO_COLLECT_FUNCS[$metric]}" \
+                || log_warning "$MSG_WARNING_SYSTEMINFO_COLLECT_FAILED ${metric}"
+            _systeminfo_cpu_ticks after
+
+            _SYSTEMINFO_CPU_TICKS[$metric]=$(( ${_SYSTEMINFO_CPU_TICKS[$metric]:-0} + after - before ))
+            _SYSTEMINFO_RUNS[$metric]=$(( ${_SYSTEMINFO_RUNS[$metric]:-0} + 1 ))
+            _SYSTEMINFO_LAST_RUN[$metric]=$EPOCHSECONDS
+            if [[ "$had_demand" == true ]]; then
+                interval="${SYSTEMINFO_COLLECT_INTERVALS[$metric]%%:*}"
+            else
+                interval="${SYSTEMINFO_COLLECT_INTERVALS[$metric]##*:}"
+            fi
+            _SYSTEMINFO_NEXT_RUN[$metric]=$(( EPOCHSECONDS + interval ))
+            ran=true
+        done
+        [[ "$ran" == true ]] && _systeminfo_write_collector_stats "$start_ticks" "$started" "$clk_tck"
+
+        #-- Bis zum nächsten fälligen Messwert warten ------------------------
+        wait=$SYSTEMINFO_IDLE_TICK
+        for metric in "${!_SYSTEMINFO_NEXT_RUN[@]}"; do
+            next=$(( _SYSTEMINFO_NEXT_RUN[$metric] - EPOCHSECONDS ))
+            (( next < wait )) && wait=$next
+        done
+        (( wait < 1 )) && wait=1
+        read -r -t "$wait" -u "$sleep_fd" _ || true
     done
 }
 
 # ===========================================================================
 # systeminfo_start_monitor
 # ---------------------------------------------------------------------------
-# Funktion.: Startet den Hintergrund-Monitor für Speicherplatz
+# Funktion.: Meldet dem Collector Bedarf für die Dauer eines Kopiervorgangs
 # Parameter: Keine
-# Rückgabe.: 0 = Monitor gestartet oder läuft bereits, 1 = Fehler
+# Rückgabe.: 0 = Bedarf gemeldet oder kein Collector aktiv
+# Hinweis..: Startet keinen eigenen Prozess mehr - der Collector verkürzt
+# .........  seine Intervalle, solange der Marker (mit unserer PID) besteht
 # ===========================================================================
 systeminfo_start_monitor() {
-    #-- Überprüfe, ob bereits ein Monitor läuft --------------------------------
-    if [[ -n "$_SYSTEMINFO_MONITOR_PID" ]] && kill -0 "$_SYSTEMINFO_MONITOR_PID" 2>/dev/null; then
-        log_debug "Systeminfo Monitor läuft bereits mit PID $_SYSTEMINFO_MONITOR_PID"
-        return 0
+    local dir="$SYSTEMINFO_DEMAND_DIR"
+    if [[ ! -d "$dir" ]]; then
+        dir="$(folders_get_api_dir)/.collector"
+        if [[ ! -d "$dir" ]]; then
+            log_debug "$MSG_DEBUG_SYSTEMINFO_COLLECTOR_MISSING"
+            return 0
+        fi
     fi
-    
-    #-- Starte den Monitor-Worker im Hintergrund ----------------------------
-    systeminfo_disk_space_monitor &
-    _SYSTEMINFO_MONITOR_PID=$!
-    log_debug "Systeminfo Monitor gestartet mit PID $_SYSTEMINFO_MONITOR_PID"
+
+    _SYSTEMINFO_MONITOR_FILE="${dir}/copy-${BASHPID}"
+    : > "$_SYSTEMINFO_MONITOR_FILE" 2>/dev/null || _SYSTEMINFO_MONITOR_FILE=""
     return 0
 }
 
 # ===========================================================================
-#  systeminfo_stop_monitor
+# systeminfo_stop_monitor
 # ---------------------------------------------------------------------------
-# Funktion.: Stoppt den Hintergrund-Monitor für Speicherplatz
+# Funktion.: Nimmt den Bedarf des Kopiervorgangs zurück
 # Parameter: Keine
-# Rückgabe.: 0 = Monitor gestoppt oder lief nicht, 1 = Fehler
+# Rückgabe.: 0
 # ===========================================================================
 systeminfo_stop_monitor() {
-    #-- Überprüfe, ob Monitor läuft und beende ihn --------------------------------
-    if [[ -n "$_SYSTEMINFO_MONITOR_PID" ]] && kill -0 "$_SYSTEMINFO_MONITOR_PID" 2>/dev/null; then
-        log_info "Beende Hintergrund-Überwachung des Speicherplatzes (PID $_SYSTEMINFO_MONITOR_PID)"
-        kill "$_SYSTEMINFO_MONITOR_PID" 2>/dev/null
-        _SYSTEMINFO_MONITOR_PID=""
-    else
-        log_debug "Kein aktiver Disk Space Monitor zum Beenden gefunden"
+    if [[ -n "$_SYSTEMINFO_MONITOR_FILE" ]]; then
+        rm -f "$_SYSTEMINFO_MONITOR_FILE"
+        _SYSTEMINFO_MONITOR_FILE=""
     fi
     return 0
 }
@@ -1299,7 +1646,7 @@ systeminfo_stop_monitor() {
 # ---------------------------------------------------------------------------
 # Datenstruktur für Tool Path und Versionen (für Auto-Detection)
 # ---------------------------------------------------------------------------
-declare -A TOOL_PATHS=(
+declare -gA TOOL_PATHS=(
     #-- Drivestat-Tools -----------------------------------------------------
     [lsblk]=""
     [dmesg]=""
@@ -1314,6 +1661,120 @@ declare -A TOOL_PATHS=(
     [jq]=""
 )
 
+# ---------------------------------------------------------------------------
+# Software-Inventar: Versionen ändern sich nur mit der Paket-Datenbank.
+# Ergebnisse gelten, solange ihre Datei neuer ist als alle Stempel-Pfade
+# (dieselben Pfade wie software_inventory.py der Web-Oberfläche). Eine
+# Neuermittlung fragt apt-cache EINMAL für alle Tools ab und startet die
+# --version Aufrufe parallel (höchstens SYSTEMINFO_PROBE_JOBS gleichzeitig).
+# ---------------------------------------------------------------------------
+SYSTEMINFO_PROBE_JOBS=6
+SYSTEMINFO_INVENTORY_STAMPS=(
+    "/var/lib/dpkg/status"
+    "/var/lib/apt/lists"
+    "/usr/bin"
+    "/usr/sbin"
+    "/usr/local/bin"
+)
+declare -gA _SYSTEMINFO_APT_CANDIDATES=()   # tool -> Candidate (apt-cache)
+
+# ===========================================================================
+# _systeminfo_inventory_fresh
+# ---------------------------------------------------------------------------
+# Funktion.: Prüft ob ein gespeichertes Inventar-Ergebnis noch gültig ist
+# Parameter: $1 = Ergebnis-/Stempel-Datei
+# .........  $2.. = weitere Dateien, deren Änderung das Ergebnis verwirft
+# .........        (z.B. conf/lib<modul>.ini)
+# Rückgabe.: 0 = gültig, 1 = fehlt oder Paket-Datenbank ist neuer
+# Hinweis..: Nur Dateitests, kein Prozess
+# ===========================================================================
+_systeminfo_inventory_fresh() {
+    local stamp_file="$1"
+    shift
+    local path
+
+    [[ -f "$stamp_file" ]] || return 1
+    for path in "${SYSTEMINFO_INVENTORY_STAMPS[@]}" "$@"; do
+        [[ -e "$path" && "$path" -nt "$stamp_file" ]] && return 1
+    done
+    return 0
+}
+
+# ===========================================================================
+# _systeminfo_load_candidates
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt die verfügbaren Versionen aller Tools mit EINEM
+# .........  apt-cache policy Aufruf (statt eines Aufrufs je Tool)
+# Parameter: $@ = Software-Namen
+# Rückgabe.: 0
+# Hinweis..: Füllt _SYSTEMINFO_APT_CANDIDATES, das von
+# .........  _systeminfo_get_available_version bevorzugt wird
+# ===========================================================================
+_systeminfo_load_candidates() {
+    local name line package=""
+
+    command -v apt-cache >/dev/null 2>&1 || return 0
+    (( $# > 0 )) || return 0
+
+    #-- Unbekannte Pakete liefern keinen Block -> Vorbelegung ---------------
+    for name in "$@"; do
+        _SYSTEMINFO_APT_CANDIDATES[$name]="Unknown"
+    done
+
+    #-- Blöcke "paket:" / "paket:arch:" mit Zeile "  Candidate: x" ---------
+    while IFS= read -r line; do
+        if [[ "$line" =~ ^([^[:space:]:]+)(:[^[:space:]:]+)?:$ ]]; then
+            package="${BASH_REMATCH[1]}"
+        elif [[ -n "$package" && "$line" =~ Candidate:[[:space:]]*([^[:space:]]+) ]]; then
+            if [[ "${BASH_REMATCH[1]}" != "(none)" ]]; then
+                _SYSTEMINFO_APT_CANDIDATES[$package]="${BASH_REMATCH[1]}"
+            fi
+            package=""
+        fi
+    done < <(apt-cache policy "$@" 2>/dev/null)
+    return 0
+}
+
+# ===========================================================================
+# _systeminfo_parallel_probe
+# ---------------------------------------------------------------------------
+# Funktion.: Ruft eine Prüf-Funktion für mehrere Einträge parallel auf
+# Parameter: $1 = Funktionsname
+# .........  $2 = Verzeichnis für die Ausgaben (Datei <index> je Eintrag)
+# .........  $3.. = Einträge, Argumente durch "|" getrennt
+# .........        (z.B. "blkid|true" -> func "blkid" "true")
+# Rückgabe.: 0
+# Hinweis..: Höchstens SYSTEMINFO_PROBE_JOBS Jobs gleichzeitig. Gewartet
+# .........  wird nur auf die eigenen Jobs (PID-Liste) - nicht auf andere
+# .........  Kinder des Aufrufers (Observer-Bus, Laufwerks-Worker, ...)
+# ===========================================================================
+_systeminfo_parallel_probe() {
+    local func="$1"
+    local out_dir="$2"
+    shift 2
+    local -i index=0
+    local item pid
+    local -a args pids=() running=()
+
+    for item in "$@"; do
+        #-- Pool voll: auf den nächsten fertigen eigenen Job warten ---------
+        while (( ${#pids[@]} >= SYSTEMINFO_PROBE_JOBS )); do
+            wait -n "${pids[@]}" 2>/dev/null
+            running=()
+            for pid in "${pids[@]}"; do
+                kill -0 "$pid" 2>/dev/null && running+=("$pid")
+            done
+            pids=("${running[@]}")
+        done
+        IFS='|' read -ra args <<< "$item"
+        "$func" "${args[@]}" > "${out_dir}/${index}" 2>/dev/null &
+        pids+=("$!")
+        index=index+1
+    done
+    (( ${#pids[@]} > 0 )) && wait "${pids[@]}" 2>/dev/null
+    return 0
+}
+
 # ===========================================================================
 # systeminfo_reset_tool_cache
 # ---------------------------------------------------------------------------
@@ -1416,6 +1877,12 @@ _systeminfo_get_available_version() {
     local software_name="$1"
     local available_version="Unknown"
     
+    #-- Bereits per _systeminfo_load_candidates ermittelt? ------------------
+    if [[ -v _SYSTEMINFO_APT_CANDIDATES[$software_name] ]]; then
+        echo "${_SYSTEMINFO_APT_CANDIDATES[$software_name]}"
+        return 0
+    fi
+    
     # Prüfe ob apt-cache verfügbar ist
     if command -v apt-cache >/dev/null 2>&1; then
         # Hole Candidate-Version (nächste installierbare Version)
@@ -1493,6 +1960,7 @@ _systeminfo_collect_tool_info() {
     #-- 1. Installierte Version ermitteln -----------------------------------
     local installed_version
     installed_version=$(_systeminfo_get_software_version "$software_name")
+    installed_version="${installed_version%%$'\n'*}"   # nur erster Treffer
     
     #-- 2. Verfügbare Version ermitteln -------------------------------------
     local available_version="Unknown"
@@ -1547,6 +2015,8 @@ _systeminfo_collect_tool_info() {
 # .........   "executable_path":"/usr/bin/cdparanoia",
 # .........   "caller_module":"libdrivestat.sh"}]
 # Nutzung..: Wird von Modulen aufgerufen für ihre Dependencies
+# Hinweis..: Ergebnis gilt, bis sich Paket-Datenbank oder Modul-INI ändern
+# .........  (_systeminfo_inventory_fresh); Neuermittlung parallel
 # ===========================================================================
 systeminfo_check_software_list() {
     #-- Auto-Detect Caller-Modul --------------------------------------------
@@ -1587,43 +2057,50 @@ systeminfo_check_software_list() {
         return 0
     fi
     
-    #-- JSON-Array aufbauen -------------------------------------------------
-    local json_array="{"
-    local first=true
+    #-- Gespeichertes Ergebnis gültig? (Paket-Datenbank unverändert) -------
+    local api_dir conf_dir stamp_file=""
+    if api_dir=$(folders_get_api_dir 2>/dev/null) && [[ -n "$api_dir" ]]; then
+        conf_dir=$(folders_get_conf_dir 2>/dev/null)
+        stamp_file="${api_dir}/.software_${caller_module}.stamp"
+        if _systeminfo_inventory_fresh "$stamp_file" "${conf_dir}/${caller_module}.ini"; then
+            log_debug "Software-Infos für $caller_module unverändert (Paket-Datenbank)"
+            return 0
+        fi
+    fi
 
-    #-- 1. Verarbeite REQUIRED Dependencies (external) ---------------------
-    for software_name in "${external_array[@]}"; do
-        # Trim Whitespace
-        software_name=$(echo "$software_name" | xargs)
+    #-- Einträge "name|required" (Whitespace ohne xargs entfernen) ----------
+    local -a items=() names=()
+    local entry software_name
+    for entry in "${external_array[@]/%/|true}" "${optional_array[@]/%/|false}"; do
+        software_name="${entry%|*}"
+        software_name="${software_name#"${software_name%%[![:space:]]*}"}"
+        software_name="${software_name%"${software_name##*[![:space:]]}"}"
         [[ -z "$software_name" ]] && continue
-        
-        #-- Komma zwischen Einträgen ----------------------------------------
-        [[ "$first" == "false" ]] && json_array+=","
-        first=false
-        
-        #-- Sammle Tool-Informationen ---------------------------------------
-        local tool_json
-        tool_json=$(_systeminfo_collect_tool_info "$software_name" "true")  
-        json_array+="$tool_json"
+        items+=("${software_name}|${entry##*|}")
+        names+=("$software_name")
     done
-    
-    #-- 2. Verarbeite OPTIONAL Dependencies ---------------------------------
-    for software_name in "${optional_array[@]}"; do
-        # Trim Whitespace
-        software_name=$(echo "$software_name" | xargs)
-        [[ -z "$software_name" ]] && continue
-        
-        #-- Komma zwischen Einträgen ----------------------------------------
-        [[ "$first" == "false" ]] && json_array+=","
-        first=false
-        
-        #-- Sammle Tool-Informationen ---------------------------------------
-        local tool_json
-        tool_json=$(_systeminfo_collect_tool_info "$software_name" "false") 
+
+    #-- Verfügbare Versionen: EIN apt-cache Aufruf für alle Tools ----------
+    _systeminfo_load_candidates "${names[@]}"
+
+    #-- Tools parallel prüfen (Reihenfolge bleibt über den Index erhalten) -
+    local tmp_dir
+    tmp_dir=$(mktemp -d) || return 1
+    _systeminfo_parallel_probe _systeminfo_collect_tool_info "$tmp_dir" "${items[@]}"
+
+    #-- JSON-Array aufbauen -------------------------------------------------
+    local json_array="{"
+    local tool_json
+    local -i index
+    for (( index = 0; index < ${#items[@]}; index++ )); do
+        tool_json=""
+        read -r tool_json < "${tmp_dir}/${index}"
+        [[ -z "$tool_json" ]] && continue
+        [[ "$json_array" != "{" ]] && json_array+=","
         json_array+="$tool_json"
     done
-    
     json_array+="}"
+    rm -rf "${tmp_dir:?}"
 
     #-- Speicher in systeminfo.json unter software.{modul}_dependencies -----
     api_set_value_json "systeminfo" ".software.${caller_module}_dependencies" "$json_array" || {
@@ -1631,6 +2108,7 @@ systeminfo_check_software_list() {
         return 1
     }
 
+    [[ -n "$stamp_file" ]] && : > "$stamp_file"
     log_debug "Software-Infos für $caller_module erfolgreich geschrieben"
     return 0
 }
@@ -1647,19 +2125,85 @@ systeminfo_check_software_list() {
 # ===========================================================================
 
 
+# ===========================================================================
+# SPEICHERPLATZ-RESERVIERUNGEN
+# ---------------------------------------------------------------------------
+# Laufende Kopien (alle Laufwerke, Batch-Jobs, Migrationen) tragen ihren
+# erwarteten Platzbedarf in ein gemeinsames Ledger ein (.temp/
+# .space_reservations, eine Zeile pro Zieldatei):
+#
+#   <zieldatei>|<device-id>|<reservierte bytes>|<pid>
+#
+# Angerechnet wird nur der noch nicht belegte Teil (Reservierung minus
+# bereits allokierte Blöcke der Zieldatei) - vorab allokierte Dateien
+# (fallocate) zählen damit nicht doppelt, df sieht sie bereits.
+# Einträge beendeter Prozesse werden beim nächsten Zugriff verworfen.
+# ===========================================================================
+
+# ===========================================================================
+# _systeminfo_space_ledger
+# ---------------------------------------------------------------------------
+# Funktion.: Liefert den Pfad des Reservierungs-Ledgers
+# Parameter: keine
+# Ausgabe..: Pfad (stdout)
+# Rückgabe.: 0 = Erfolg, 1 = Temp-Verzeichnis nicht verfügbar
+# ===========================================================================
+_systeminfo_space_ledger() {
+    local temp_dir
+    temp_dir=$(folders_get_temp_dir 2>/dev/null) || return 1
+    echo "${temp_dir}/.space_reservations"
+}
+
+# ===========================================================================
+# _systeminfo_get_reserved_bytes
+# ---------------------------------------------------------------------------
+# Funktion.: Summiert die offenen Reservierungen auf einem Dateisystem und
+# .........  entfernt Einträge beendeter Prozesse
+# Parameter: $1 = Device-ID des Dateisystems (stat -c %d)
+# .........  $2 = Zieldatei, die nicht mitgezählt wird (optional)
+# Ausgabe..: Offene Reservierungen in Bytes (stdout)
+# Hinweis..: Nur unter dem Ledger-Lock aufrufen
+# ===========================================================================
+_systeminfo_get_reserved_bytes() {
+    local device="$1"
+    local exclude="${2:-}"
+    local ledger
+    ledger=$(_systeminfo_space_ledger) || { echo 0; return 0; }
+
+    local total=0 path dev bytes pid allocated
+    local -a keep=()
+    if [[ -f "$ledger" ]]; then
+        while IFS='|' read -r path dev bytes pid; do
+            [[ -n "$path" ]] || continue
+            kill -0 "$pid" 2>/dev/null || continue
+            keep+=("${path}|${dev}|${bytes}|${pid}")
+            [[ "$dev" == "$device" ]] && [[ "$path" != "$exclude" ]] || continue
+            allocated=$(( $(stat -c '%b * %B' "$path" 2>/dev/null || echo 0) ))
+            (( bytes > allocated )) && total=$(( total + bytes - allocated ))
+        done < "$ledger"
+        printf '%s\n' "${keep[@]}" | grep -v '^$' > "${ledger}.tmp" && mv -f "${ledger}.tmp" "$ledger"
+    fi
+
+    echo "$total"
+}
+
 # ===========================================================================
 # systeminfo_check_disk_space
 # ---------------------------------------------------------------------------
-# Funktion.: Prüfung des verfügbaren Speicherplatzes
+# Funktion.: Prüfung des verfügbaren Speicherplatzes abzüglich der offenen
+# .........  Reservierungen anderer Kopien, optional mit eigener Reservierung
 # Parameter: $1 = required_mb (benötigte MB - INKL. Overhead!)
+# .........  $2 = Zieldatei (optional) - wird reserviert und (falls
+# .........       möglich) per fallocate vorab allokiert
 # Hinweis..: init_disc_info() berechnet bereits estimated_size_mb
-# .........  mit 10% Overhead. Diese Funktion prüft nur noch ob
-# .........  genug Platz vorhanden ist.
+# .........  mit 10% Overhead. Prüfung und Reservierung erfolgen atomar
+# .........  (flock), Freigabe mit systeminfo_release_disk_space()
 # Rückgabe.: 0 = Ausreichend Platz, 1 = Nicht genug Platz
 # ===========================================================================
 systeminfo_check_disk_space() {
     #-- Parameter einlesen --------------------------------------------------
     local required_mb=$1
+    local target_file="${2:-}"
     
     #-- Validierung der Parameter -------------------------------------------
     if [[ -z "$required_mb" ]] || [[ ! "$required_mb" =~ ^[0-9]+$ ]]; then
@@ -1667,40 +2211,104 @@ systeminfo_check_disk_space() {
         return 0
     fi
     
-    #-- Ermittle Ausgabe-Verzeichnis ----------------------------------------
-    local output_dir=$(folders_get_output_dir) || {
-        log_error "Ausgabe-Verzeichnis nicht verfügbar"
-        return 0  # Fahre fort, wenn Prüfung fehlschlägt
-    }
-    
-    #-- Ermittle verfügbaren Speicherplatz am Ausgabepfad -------------------
-    local available_mb=$(df -BM "$output_dir" 2>/dev/null | tail -1 | awk '{print $4}' | sed 's/M//')
-    
-    #-- Validierung der Ermittlung ------------------------------------------
-    if [[ -z "$available_mb" ]] || [[ ! "$available_mb" =~ ^[0-9]+$ ]]; then
-        log_error "$MSG_WARNING_DISK_SPACE_CHECK_FAILED"
-        return 0  # Fahre fort, wenn Prüfung fehlschlägt
+    #-- Ermittle Ziel-Verzeichnis (Zieldatei, Staging oder Ausgabe) ---------
+    local output_dir
+    if [[ -n "$target_file" ]]; then
+        output_dir=$(dirname "$target_file")
+    else
+        output_dir=$(folders_get_staging_dir 2>/dev/null) || output_dir=$(folders_get_output_dir) || {
+            log_error "Ausgabe-Verzeichnis nicht verfügbar"
+            return 0  # Fahre fort, wenn Prüfung fehlschlägt
+        }
     fi
     
-    #-- Detailliertes Logging -----------------------------------------------
-    log_info "Speicherplatz: ${available_mb} MB verfügbar, ${required_mb} MB benötigt"
+    local ledger lock_file="/dev/null"
+    ledger=$(_systeminfo_space_ledger) && lock_file="${ledger}.lock" || ledger="/dev/null"
+    local owner_pid="$BASHPID"
     
-    if [[ $available_mb -lt $required_mb ]]; then
-        log_error "$MSG_ERROR_INSUFFICIENT_DISK_SPACE ${required_mb} MB benötigt, nur ${available_mb} MB verfügbar"
+    #-- Prüfung und Reservierung unter Lock (mehrere Laufwerke/Jobs) -------
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 30 9
         
-        #-- API: Fehler melden ----------------------------------------------
-        if declare -f api_update_status >/dev/null 2>&1; then
-            api_update_status "error" "" "" "Nicht genug Speicherplatz: ${available_mb}/${required_mb} MB"
+        #-- Ermittle verfügbaren Speicherplatz am Ausgabepfad ---------------
+        local available_mb=$(df -BM "$output_dir" 2>/dev/null | tail -1 | awk '{print $4}' | sed 's/M//')
+        
+        #-- Validierung der Ermittlung --------------------------------------
+        if [[ -z "$available_mb" ]] || [[ ! "$available_mb" =~ ^[0-9]+$ ]]; then
+            log_error "$MSG_WARNING_DISK_SPACE_CHECK_FAILED"
+            exit 0  # Fahre fort, wenn Prüfung fehlschlägt
         fi
         
-        return 1
-    fi
+        #-- Offene Reservierungen anderer Kopien abziehen -------------------
+        local device=$(stat -c %d "$output_dir" 2>/dev/null)
+        local reserved_mb=$(( $(_systeminfo_get_reserved_bytes "$device" "$target_file") / 1048576 ))
+        available_mb=$(( available_mb - reserved_mb ))
+        
+        #-- Detailliertes Logging -------------------------------------------
+        log_info "Speicherplatz: ${available_mb} MB verfügbar, ${required_mb} MB benötigt (${reserved_mb} $MSG_DISK_SPACE_MB_RESERVED)"
+        
+        if [[ $available_mb -lt $required_mb ]]; then
+            log_error "$MSG_ERROR_INSUFFICIENT_DISK_SPACE ${required_mb} MB benötigt, nur ${available_mb} MB verfügbar"
+            
+            #-- API: Fehler melden ------------------------------------------
+            if declare -f api_update_status >/dev/null 2>&1; then
+                api_update_status "error" "" "" "Nicht genug Speicherplatz: ${available_mb}/${required_mb} MB"
+            fi
+            
+            exit 1
+        fi
+        
+        #-- Reservieren und vorab allokieren (weniger Fragmentierung) -------
+        if [[ -n "$target_file" ]] && [[ "$ledger" != "/dev/null" ]]; then
+            local required_bytes=$(( required_mb * 1048576 ))
+            echo "${target_file}|${device}|${required_bytes}|${owner_pid}" >> "$ledger"
+            [[ -e "$target_file" ]] || : > "$target_file"
+            if command -v fallocate >/dev/null 2>&1; then
+                fallocate --keep-size -l "$required_bytes" "$target_file" 2>/dev/null
+            fi
+            log_debug "$MSG_DEBUG_SPACE_RESERVED ${required_mb} MB → $target_file"
+        fi
+        exit 0
+    ) 9>"$lock_file"
+    local check_result=$?
+    [[ $check_result -ne 0 ]] && return 1
     
     #-- Genug Speicherplatz vorhanden ---------------------------------------
     log_info "$MSG_DISK_SPACE_SUFFICIENT"
     return 0
 }
 
+# ===========================================================================
+# systeminfo_release_disk_space
+# ---------------------------------------------------------------------------
+# Funktion.: Gibt die Reservierung einer Zieldatei frei und kürzt nicht
+# .........  benötigten, vorab allokierten Platz hinter dem Dateiende
+# Parameter: $1 = Zieldatei (wie bei systeminfo_check_disk_space)
+# Rückgabe.: 0 = Erfolg (auch wenn keine Reservierung bestand)
+# ===========================================================================
+systeminfo_release_disk_space() {
+    local target_file="$1"
+    [[ -n "$target_file" ]] || return 0
+
+    local ledger
+    ledger=$(_systeminfo_space_ledger) || return 0
+    [[ -f "$ledger" ]] || return 0
+    (
+        command -v flock >/dev/null 2>&1 && flock -w 30 9
+        awk -F'|' -v target="$target_file" '$1 != target' "$ledger" > "${ledger}.tmp"
+        mv -f "${ledger}.tmp" "$ledger"
+    ) 9>"${ledger}.lock"
+
+    #-- Vorab allokierte Blöcke hinter dem Dateiende freigeben --------------
+    #-- (truncate auf die aktuelle Größe verwirft die --keep-size Reserve) -
+    if [[ -f "$target_file" ]]; then
+        truncate -s "$(stat -c %s "$target_file")" "$target_file" 2>/dev/null
+    fi
+
+    log_debug "$MSG_DEBUG_SPACE_RELEASED $target_file"
+    return 0
+}
+
 # ============================================================================
 # SYSTEM INFORMATION COLLECTION (JSON-BASED)
 # ============================================================================
@@ -1718,65 +2326,32 @@ systeminfo_check_disk_space() {
 # Funktion.: Sammle Software-Versionen und schreibe in software_info.json
 # Parameter: keine
 # Rückgabe.: 0 = Erfolg, 1 = Fehler
-# Hinweis..: STATISCH - einmal beim Start ausführen
+# Hinweis..: Aufruf über systeminfo_get_software_info, sobald sich die
+# .........  Paket-Datenbank geändert hat; Prüfungen laufen parallel
 # Schreibt.: api/software_info.json
 # ===========================================================================
 systeminfo_collect_software_info() {
-    local cdparanoia_version="Not installed"
-    local lame_version="Not installed"
-    local dvdbackup_version="Not installed"
-    local ddrescue_version="Not installed"
-    local genisoimage_version="Not installed"
-    local python_version="Not installed"
-    local flask_version="Not installed"
-    local mosquitto_version="Not installed"
-    
-    # Erkenne Versionen
-    if command -v cdparanoia >/dev/null 2>&1; then
-        cdparanoia_version=$(cdparanoia --version 2>&1 | head -1 | grep -oP '\d+\.\d+(\.\d+)?' || echo "installed")
-    fi
-    
-    if command -v lame >/dev/null 2>&1; then
-        lame_version=$(lame --version 2>&1 | head -1 | grep -oP '\d+\.\d+(\.\d+)?' || echo "installed")
-    fi
-    
-    if command -v dvdbackup >/dev/null 2>&1; then
-        dvdbackup_version=$(dvdbackup --version 2>&1 | grep -oP '\d+\.\d+(\.\d+)?' || echo "installed")
-    fi
-    
-    if command -v ddrescue >/dev/null 2>&1; then
-        ddrescue_version=$(ddrescue --version 2>&1 | head -1 | grep -oP '\d+\.\d+(\.\d+)?' || echo "installed")
-    fi
-    
-    if command -v genisoimage >/dev/null 2>&1; then
-        genisoimage_version=$(genisoimage --version 2>&1 | head -1 | grep -oP '\d+\.\d+(\.\d+)?' || echo "installed")
-    fi
-    
-    if command -v python3 >/dev/null 2>&1; then
-        python_version=$(python3 --version 2>&1 | grep -oP '\d+\.\d+(\.\d+)?' || echo "installed")
-    fi
-
-    if python3 -c "import flask" 2>/dev/null; then
-        flask_version=$(python3 -c "import importlib.metadata; print(importlib.metadata.version('flask'))" 2>/dev/null || echo "installed")
-    elif [[ -f "/opt/disk2iso/venv/bin/python3" ]]; then
-        if /opt/disk2iso/venv/bin/python3 -c "import flask" 2>/dev/null; then
-            flask_version=$(/opt/disk2iso/venv/bin/python3 -c "import importlib.metadata; print(importlib.metadata.version('flask'))" 2>/dev/null || echo "installed")
-        fi
-    fi
-
-    if command -v mosquitto >/dev/null 2>&1; then
-        mosquitto_version=$(mosquitto -h 2>&1 | grep -oP 'version \K\d+\.\d+(\.\d+)?' || echo "installed")
-    fi
-    
-    # Schreibe in JSON
-    api_set_value_json "software_info" ".cdparanoia" "$cdparanoia_version" || return 1
-    api_set_value_json "software_info" ".lame" "$lame_version" || return 1
-    api_set_value_json "software_info" ".dvdbackup" "$dvdbackup_version" || return 1
-    api_set_value_json "software_info" ".ddrescue" "$ddrescue_version" || return 1
-    api_set_value_json "software_info" ".genisoimage" "$genisoimage_version" || return 1
-    api_set_value_json "software_info" ".python" "$python_version" || return 1
-    api_set_value_json "software_info" ".flask" "$flask_version" || return 1
-    api_set_value_json "software_info" ".mosquitto" "$mosquitto_version" || return 1
+    #-- Schlüssel in software_info.json -> geprüfte Software ----------------
+    local -a keys=(cdparanoia lame dvdbackup ddrescue genisoimage python flask mosquitto)
+    local -a tools=(cdparanoia lame dvdbackup ddrescue genisoimage python3 flask mosquitto)
+    
+    #-- Versionen parallel ermitteln (statt acht Aufrufe nacheinander) -----
+    local tmp_dir
+    tmp_dir=$(mktemp -d) || return 1
+    _systeminfo_parallel_probe _systeminfo_get_software_version "$tmp_dir" "${tools[@]}"
+    
+    #-- Schreibe in JSON ----------------------------------------------------
+    local -i index
+    local version
+    for (( index = 0; index < ${#keys[@]}; index++ )); do
+        version=""
+        read -r version < "${tmp_dir}/${index}"
+        api_set_value_json "software_info" ".${keys[$index]}" "${version:-Not installed}" || {
+            rm -rf "${tmp_dir:?}"
+            return 1
+        }
+    done
+    rm -rf "${tmp_dir:?}"
     
     return 0
 }
@@ -1925,8 +2500,8 @@ systeminfo_get_software_info() {
     local api_dir=$(folders_get_api_dir) || return 1
     local json_file="${api_dir}/software_info.json"
     
-    if [[ ! -f "$json_file" ]]; then
-        # Fallback: Sammle Daten wenn JSON nicht existiert
+    if ! _systeminfo_inventory_fresh "$json_file"; then
+        # Fehlt oder älter als die Paket-Datenbank: neu sammeln
         systeminfo_collect_software_info || return 1
     fi
     
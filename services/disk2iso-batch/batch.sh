@@ -0,0 +1,378 @@
+#!/bin/bash
+# ===========================================================================
+# Batch Image Ingest
+# ===========================================================================
+# Filepath: services/disk2iso-batch/batch.sh
+#
+# Beschreibung:
+#   Archiviert vorhandene Disc-Images (.iso/.img/.bin) oder Loop-Devices
+#   mit derselben Pipeline wie der Service (Analyse, Benennung, Kopie,
+#   Archiv-Struktur) - ohne optisches Laufwerk
+#   - Begrenzter Worker-Pool (-j N, Standard: BATCH_WORKERS)
+#   - Status pro Worker unter api/drives/batch<N>/ (Live-Status im Web-UI)
+#   - Zusammenfassung mit Durchsatz in api/batch.json
+#   - Bereits archivierte Images werden erkannt (ARCHIVED_DISC_ACTION)
+#   - Eignet sich auch als Benchmark der Pipeline ohne Hardware
+#   - --log-bench: Logging-Aufwand pro analysierter Disc je Log-Level
+#
+# Verwendung:
+#   sudo batch.sh [-j N] [--log-bench [N]] <image|verzeichnis|/dev/loopN> ...
+#
+# ---------------------------------------------------------------------------
+# Dependencies: services/disk2iso/daemon.sh (Module, Kopier-Pipeline)
+# ---------------------------------------------------------------------------
+# Author: D.Götze
+# Version: 1.3.0
+# Last Change: 2026-03-02
+# ===========================================================================
+
+# Ermittle Installationsverzeichnis
+BATCH_SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# Hauptverzeichnis ist zwei Ebenen höher (von services/disk2iso-batch/ nach root)
+INSTALL_DIR="$(dirname "$(dirname "$BATCH_SCRIPT_DIR")")"
+
+# Daemon-Funktionen laden (State-Konstanten, Modul-Loader, copy_disc_to_iso)
+source "${INSTALL_DIR}/services/disk2iso/daemon.sh" || exit 1
+
+# Dateiendungen die bei Verzeichnissen als Image erkannt werden
+readonly BATCH_IMAGE_PATTERNS=("*.iso" "*.img" "*.bin")
+
+# ===========================================================================
+# batch_collect_sources
+# ---------------------------------------------------------------------------
+# Funktion.: Ermittelt die Liste der Quellen aus den Kommandozeilen-
+# .........  Argumenten (Verzeichnisse werden nach Images durchsucht)
+# Parameter: $@ = Dateien, Verzeichnisse oder Block-Devices
+# Ausgabe..: Eine Quelle pro Zeile (stdout)
+# Rückgabe.: 0 = mindestens eine Quelle, 1 = keine Quelle gefunden
+# ===========================================================================
+batch_collect_sources() {
+    local arg pattern found=1
+
+    for arg in "$@"; do
+        if [[ -d "$arg" ]]; then
+            for pattern in "${BATCH_IMAGE_PATTERNS[@]}"; do
+                find "$arg" -maxdepth 1 -type f -iname "$pattern" 2>/dev/null
+            done | sort
+            found=0
+        elif [[ -f "$arg" ]] || [[ -b "$arg" ]]; then
+            echo "$arg"
+            found=0
+        else
+            log_warning "$MSG_BATCH_SOURCE_SKIPPED $arg"
+        fi
+    done
+
+    return $found
+}
+
+# ===========================================================================
+# batch_run_job
+# ---------------------------------------------------------------------------
+# Funktion.: Archiviert eine einzelne Quelle (läuft als Hintergrund-Prozess)
+# Parameter: $1 = Worker-Slot (1..N, bestimmt die API-Instanz batch<N>)
+# .........  $2 = Quelle (Image-Datei oder Block-Device)
+# .........  $3 = Ergebnisdatei (eine Zeile pro Job wird angehängt)
+# Rückgabe.: 0 = Erfolg oder bereits archiviert, 1 = Fehler
+# Extras...: Ergebniszeile: status<TAB>sekunden<TAB>bytes<TAB>quelle<TAB>iso
+# .........  status: success, skipped (bereits archiviert), failure
+# ===========================================================================
+batch_run_job() {
+    local slot="$1"
+    local source="$2"
+    local results_file="$3"
+    local start_time=$(date +%s)
+    local status="failure"
+    local iso_file=""
+    local size_bytes=0
+
+    #-- Eigene Instanz → eigene API-Dateien und eigenes Temp-Verzeichnis ----
+    DRIVESTAT_INSTANCE="batch${slot}"
+    discinfo_reset
+
+    if drivestat_attach_image "$source"; then
+        transition_to_state "$STATE_ANALYZING" "$MSG_BATCH_JOB_STARTED $source"
+
+        if ! discinfo_analyze; then
+            transition_to_state "$STATE_ERROR" "$MSG_BATCH_JOB_FAILED $source"
+            #-- Analyse-Fehler zählt in der History als fehlgeschlagen ------
+            local label disc_type
+            discinfo_get_field label label
+            discinfo_get_field disc_type type
+            api_add_history "error" "${label:-${source##*/}}" "${disc_type:-unknown}" "error" "$MSG_BATCH_JOB_FAILED $source"
+            common_cleanup_disc_operation "failure"
+        elif common_check_archived_disc; then
+            #-- Bereits archiviert (ARCHIVED_DISC_ACTION) → nicht kopieren --
+            status="skipped"
+            transition_to_state "$STATE_COMPLETED" "$MSG_ARCHIVED_DISC_NOT_COPIED $source"
+            common_cleanup_disc_operation "success"
+        else
+            #-- Dateiname vor der Kopie merken (Cleanup setzt DISC_INFO zurück)
+            iso_file=$(discinfo_get_iso_filename)
+            transition_to_state "$STATE_COPYING"
+
+            if copy_disc_to_iso; then
+                status="success"
+                #-- Komprimierte Ausgabe: .iso.zst, Größe unkomprimiert ------
+                [[ ! -f "$iso_file" ]] && [[ -f "${iso_file}.zst" ]] && iso_file="${iso_file}.zst"
+                size_bytes=$(common_get_image_size "$iso_file" || echo 0)
+                transition_to_state "$STATE_COMPLETED" "$MSG_BATCH_JOB_COMPLETED $source"
+            else
+                transition_to_state "$STATE_ERROR" "$MSG_BATCH_JOB_FAILED $source"
+            fi
+        fi
+    fi
+
+    drivestat_detach_image
+
+    #-- Ergebnis anhängen (kurze Zeilen, O_APPEND → keine Vermischung) -----
+    printf '%s\t%s\t%s\t%s\t%s\n' "$status" "$(( $(date +%s) - start_time ))" \
+        "$size_bytes" "$source" "$iso_file" >> "$results_file"
+
+    [[ "$status" != "failure" ]]
+}
+
+# ===========================================================================
+# batch_write_summary
+# ---------------------------------------------------------------------------
+# Funktion.: Wertet die Ergebnisdatei aus, schreibt api/batch.json und gibt
+# .........  eine Zusammenfassung mit Durchsatz aus
+# Parameter: $1 = Ergebnisdatei
+# .........  $2 = Startzeit (Unix-Timestamp)
+# .........  $3 = Anzahl Worker
+# Rückgabe.: 0 = alle Jobs erfolgreich, 1 = mindestens ein Fehler
+# ===========================================================================
+batch_write_summary() {
+    local results_file="$1"
+    local start_time="$2"
+    local workers="$3"
+    local elapsed=$(( $(date +%s) - start_time ))
+    [[ $elapsed -lt 1 ]] && elapsed=1
+
+    local summary
+    summary=$(jq -R -s \
+        --argjson elapsed "$elapsed" \
+        --argjson workers "$workers" \
+        --arg started "$(date -d "@$start_time" '+%Y-%m-%dT%H:%M:%S')" \
+        --arg finished "$(date '+%Y-%m-%dT%H:%M:%S')" '
+        [split("\n")[] | select(length > 0) | split("\t")
+         | {status: .[0], seconds: (.[1] | tonumber), size_mb: ((.[2] | tonumber) / 1048576 | floor),
+            source: .[3], iso: .[4]}] as $jobs
+        | ($jobs | map(select(.status == "success")) | map(.size_mb) | add // 0) as $total_mb
+        | {
+            started: $started,
+            finished: $finished,
+            workers: $workers,
+            jobs_total: ($jobs | length),
+            jobs_ok: ($jobs | map(select(.status == "success")) | length),
+            jobs_skipped: ($jobs | map(select(.status == "skipped")) | length),
+            jobs_failed: ($jobs | map(select(.status == "failure")) | length),
+            total_mb: $total_mb,
+            elapsed_seconds: $elapsed,
+            throughput_mb_s: (($total_mb / $elapsed * 10 | floor) / 10),
+            images_per_hour: ((($jobs | length) * 3600 / $elapsed * 10 | floor) / 10),
+            jobs: $jobs
+          }' "$results_file") || return 1
+
+    api_set_file_json "batch" "$summary"
+
+    #-- Zusammenfassung ausgeben --------------------------------------------
+    log_info "$MSG_BATCH_SUMMARY $(jq -r '"\(.jobs_ok)/\(.jobs_total) OK, \(.jobs_skipped) skip, \(.total_mb) MB in \(.elapsed_seconds)s, \(.throughput_mb_s) MB/s, \(.images_per_hour) Images/h"' <<< "$summary")"
+
+    [[ $(jq -r '.jobs_failed' <<< "$summary") -eq 0 ]]
+}
+
+# ===========================================================================
+# batch_log_benchmark
+# ---------------------------------------------------------------------------
+# Funktion.: Misst den Logging-Aufwand pro analysierter Disc je Log-Level
+# Parameter: $1 = Durchläufe pro Level und Quelle
+# .........  $2... = Quellen (Image-Dateien oder Block-Devices)
+# Rückgabe.: 0 = Erfolg, 1 = keine Quelle analysierbar
+# Extras...: discinfo_analyze() läuft je Level (off, error, warning, info,
+# .........  debug) und Quelle; die Log-Ausgabe geht in eine Temp-Datei.
+# .........  Aufwand = Laufzeit gegenüber Level "off". Ergebnis zusätzlich
+# .........  in api/logbench.json. Format: LOG_FORMAT aus disk2iso.conf.
+# ===========================================================================
+batch_log_benchmark() {
+    local runs="$1"
+    shift
+    local -a sources=("$@")
+    local out_file="$(folders_get_temp_dir)/logbench.$$.out"
+    local level source run t0 discs base_us=0 json="" analyzed=0
+    local -A total_us=() lines=() bytes=()
+
+    log_info "$MSG_BATCH_LOGBENCH_STARTED ${#sources[@]} Images, ${runs}x, ${LOG_FORMAT:-text}"
+    DRIVESTAT_INSTANCE="logbench"
+
+    #-- Aufwärmen (Page-Cache, Probe-Cache), nicht gemessen -----------------
+    logging_configure "off" "" 0
+    for source in "${sources[@]}"; do
+        discinfo_reset
+        drivestat_attach_image "$source" && discinfo_analyze >/dev/null 2>&1 && (( analyzed++ ))
+        drivestat_detach_image
+    done
+
+    for level in off error warning info debug; do
+        logging_configure "$level" "" 0
+        total_us[$level]=0; lines[$level]=0
+        : > "$out_file"
+        for (( run = 0; run < runs; run++ )); do
+            for source in "${sources[@]}"; do
+                discinfo_reset
+                drivestat_attach_image "$source" >>"$out_file" 2>&1 || continue
+                LOG_EMITTED=0
+                t0="${EPOCHREALTIME/[.,]/}"
+                discinfo_analyze >>"$out_file" 2>&1
+                total_us[$level]=$(( ${total_us[$level]} + ${EPOCHREALTIME/[.,]/} - t0 ))
+                lines[$level]=$(( ${lines[$level]} + LOG_EMITTED ))
+                drivestat_detach_image >>"$out_file" 2>&1
+            done
+        done
+        bytes[$level]=$(stat -c %s "$out_file" 2>/dev/null || echo 0)
+    done
+    rm -f "$out_file"
+
+    #-- Ergebnis (Level-Einstellung aus disk2iso.conf wiederherstellen) -----
+    logging_configure
+    if (( analyzed == 0 )); then
+        log_error "$MSG_BATCH_NO_SOURCES"
+        return 1
+    fi
+    discs=$(( runs * ${#sources[@]} ))
+    base_us=$(( ${total_us[off]} / discs ))
+    for level in off error warning info debug; do
+        log_info "$(printf "$MSG_BATCH_LOGBENCH_RESULT" "$level" \
+            "$(( ${total_us[$level]} / discs / 1000 ))" \
+            "$(( (${total_us[$level]} / discs - base_us) / 1000 ))" \
+            "$(( ${lines[$level]} / discs ))")"
+        json+="${json:+, }\"${level}\": {\"us_per_disc\": $(( ${total_us[$level]} / discs )), \"overhead_us_per_disc\": $(( ${total_us[$level]} / discs - base_us )), \"lines_per_disc\": $(( ${lines[$level]} / discs )), \"bytes_per_disc\": $(( ${bytes[$level]} / discs ))}"
+    done
+    api_set_file_json "logbench" "{\"format\": \"${LOG_FORMAT:-text}\", \"discs\": ${discs}, \"levels\": {${json}}}"
+    return 0
+}
+
+# ===========================================================================
+# batch_main
+# ---------------------------------------------------------------------------
+# Funktion.: Einstiegspunkt - verteilt die Quellen auf einen Worker-Pool
+# .........  mit fester Größe und wartet auf alle Jobs
+# Parameter: [-j N] Quellen...
+# Rückgabe.: 0 = alle Jobs erfolgreich, 1 = Fehler
+# ===========================================================================
+batch_main() {
+    local workers=""
+    local log_bench=""
+
+    #-- Parameter auswerten -------------------------------------------------
+    while [[ $# -gt 0 ]]; do
+        case "$1" in
+            -j|--jobs)
+                workers="$2"
+                shift 2
+                ;;
+            --log-bench)
+                #-- Optional Anzahl Durchläufe (Standard: 3) ----------------
+                if [[ "${2:-}" =~ ^[1-9][0-9]*$ ]]; then
+                    log_bench="$2"
+                    shift 2
+                else
+                    log_bench=3
+                    shift
+                fi
+                ;;
+            -h|--help)
+                echo "Verwendung: $0 [-j N] [--log-bench [N]] <image|verzeichnis|/dev/loopN> ..."
+                echo ""
+                echo "  -j N             Anzahl paralleler Jobs (Standard: BATCH_WORKERS aus disk2iso.conf)"
+                echo "  --log-bench [N]  Nur analysieren: Logging-Aufwand pro Disc je Log-Level (N Durchläufe)"
+                exit 0
+                ;;
+            *)
+                break
+                ;;
+        esac
+    done
+
+    if [[ $# -eq 0 ]]; then
+        echo "Verwendung: $0 [-j N] [--log-bench [N]] <image|verzeichnis|/dev/loopN> ..." >&2
+        exit 1
+    fi
+
+    #-- Module laden (Einstellungen, Sprachdateien, Kopier-Pipeline) --------
+    daemon_load_modules
+    [[ -n "$workers" ]] || workers="${BATCH_WORKERS:-2}"
+    [[ "$workers" =~ ^[1-9][0-9]*$ ]] || workers=2
+
+    local -a sources
+    mapfile -t sources < <(batch_collect_sources "$@")
+    if [[ ${#sources[@]} -eq 0 ]]; then
+        log_error "$MSG_BATCH_NO_SOURCES"
+        exit 1
+    fi
+
+    #-- Logging-Benchmark: nur Analyse, keine Kopie -------------------------
+    if [[ -n "$log_bench" ]]; then
+        batch_log_benchmark "$log_bench" "${sources[@]}"
+        return $?
+    fi
+
+    local results_file
+    results_file="$(folders_get_temp_dir)/batch.$$.results"
+    : > "$results_file" || exit 1
+
+    log_info "$MSG_BATCH_STARTED ${#sources[@]} Images, ${workers} Worker"
+
+    #-- Observer-Bus (MQTT-Fortschritt) - die Jobs erben ihn ---------------
+    common_register_observers
+    api_bus_start
+
+    #-- Nachbearbeitung (MD5, Metadaten) parallel zu den Kopien -------------
+    common_start_postprocess_workers
+
+    #-- Bei Abbruch laufende Jobs beenden -----------------------------------
+    trap 'common_stop_postprocess_workers; api_bus_stop; pkill -P $$ 2>/dev/null; wait; rm -f "$results_file"; log_flush; exit 1' SIGTERM SIGINT
+
+    #-- Worker-Pool: jede Quelle im nächsten freien Slot starten ------------
+    local -a slot_pids=()
+    local start_time=$(date +%s)
+    local source slot free_slot
+    for source in "${sources[@]}"; do
+        free_slot=""
+        while [[ -z "$free_slot" ]]; do
+            for ((slot = 1; slot <= workers; slot++)); do
+                if [[ -z "${slot_pids[$slot]:-}" ]] || ! kill -0 "${slot_pids[$slot]}" 2>/dev/null; then
+                    [[ -n "${slot_pids[$slot]:-}" ]] && wait "${slot_pids[$slot]}" 2>/dev/null
+                    free_slot="$slot"
+                    break
+                fi
+            done
+            [[ -z "$free_slot" ]] && wait -n "${slot_pids[@]}" 2>/dev/null
+        done
+
+        batch_run_job "$free_slot" "$source" "$results_file" &
+        slot_pids[$free_slot]=$!
+    done
+    wait "${slot_pids[@]}" 2>/dev/null
+
+    #-- Offene Nachbearbeitung abwarten, dann Worker beenden ----------------
+    common_wait_postprocess_idle
+    common_stop_postprocess_workers
+    api_bus_stop
+
+    #-- Auswertung, Worker-Status aus der API entfernen ---------------------
+    local exit_code=0
+    batch_write_summary "$results_file" "$start_time" "$workers" || exit_code=1
+    rm -f "$results_file"
+    rm -rf "$(folders_get_api_dir)"/drives/batch[0-9]* 2>/dev/null
+
+    log_flush
+    return $exit_code
+}
+
+# Skript starten falls direkt aufgerufen
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    trap - SIGTERM SIGINT
+    batch_main "$@"
+    exit $?
+fi
@@ -1,28 +1,34 @@
 #!/bin/bash
 # ===========================================================================
-# Volatile Data Updater
+# Volatile Data Collector
 # ===========================================================================
 # Filepath: services/disk2iso-updater/updater.sh
 #
 # Beschreibung:
-#   Aktualisiert flüchtige System-Daten (Uptime, Speicherplatz)
-#   Wird von systemd Timer zyklisch (alle 30s) ausgeführt
+#   Residenter Collector für flüchtige System-Daten (Uptime, Speicherplatz,
+#   Service-Status). Läuft dauerhaft als disk2iso-updater.service und
+#   sammelt jeden Messwert in eigenem Intervall - kurz, solange die Web-UI
+#   Besucher hat oder kopiert wird, sonst lang (systeminfo_collector_run).
+#   Ersetzt den früheren 30s-Timer.
 #
 # ---------------------------------------------------------------------------
-# Dependencies: libsysteminfo.sh, libfolders.sh, libsettings.sh
+# Dependencies: liblogging.sh, libfolders.sh, libsettings.sh,
+#               libsysteminfo.sh, libservice.sh
 # ---------------------------------------------------------------------------
 # Author: D.Götze
 # Version: 1.3.0
-# Last Change: 2026-02-07
-# Last Change: 2026-02-05
+# Last Change: 2026-10-18
 # ===========================================================================
 
 # Ermittle Installationsverzeichnis
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+UPDATER_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 # Hauptverzeichnis ist zwei Ebenen höher (von services/disk2iso-updater/ nach root)
-INSTALL_DIR="$(dirname "$(dirname "$SCRIPT_DIR")")"
+INSTALL_DIR="$(dirname "$(dirname "$UPDATER_DIR")")"
+# Libraries und Sprachdateien erwarten das Hauptverzeichnis in SCRIPT_DIR
+SCRIPT_DIR="$INSTALL_DIR"
 
-# Lade erforderliche Libraries
+# Lade Einstellungen und erforderliche Libraries
+source "${INSTALL_DIR}/conf/disk2iso.conf" || exit 1
 source "${INSTALL_DIR}/lib/liblogging.sh" || exit 1
 source "${INSTALL_DIR}/lib/libfolders.sh" || exit 1
 source "${INSTALL_DIR}/lib/libsettings.sh" || exit 1
@@ -32,28 +38,9 @@ source "${INSTALL_DIR}/lib/libservice.sh" || exit 1
 # ===========================================================================
 # Main
 # ===========================================================================
+logging_configure
+logging_load_language_file "systeminfo" >/dev/null 2>&1
 
-# Sammle flüchtige Daten (mit logger für systemd)
-{
-    # Uptime-Information aktualisieren
-    systeminfo_collect_uptime_info || echo "Fehler beim Sammeln von Uptime-Daten" >&2
-    
-    # Speicherplatz-Information aktualisieren
-    systeminfo_collect_storage_info || echo "Fehler beim Sammeln von Storage-Daten" >&2
-    
-    # Service-Status aktualisieren
-    service_collect_status_info || echo "Fehler beim Sammeln von Service-Status" >&2
-    
-} 2>&1 | logger -t "disk2iso-volatile-updater" -p user.info
-
-exit 0
-
-# TODO...: ggf in Zukunft weitere flüchtige Daten hier sammeln (z.B. laufende 
-# .......  Prozesse, Netzwerkstatus)
-# Wichtig: Nur Daten, die schnell und ohne großen Overhead gesammelt werden 
-# ........ können, sollten hier hinzugefügt werden, da der Updater alle 30s 
-# ........ läuft.
-# ........ Daten, die aufwendig zu sammeln sind, sollten besser in den 
-# ........ jeweiligen Service-Status-Infos gesammelt und aktualisiert werden, 
-# ........ um Performance-Probleme zu vermeiden.
-# TODO...: Eventuell in Zukunft in libservice.sh hinzufügen
\ No newline at end of file
+# Läuft bis systemd den Dienst beendet
+systeminfo_collector_run
+exit $?
@@ -10,10 +10,15 @@ import os
 import sys
 import time
 import json
+import re
 import subprocess
 from datetime import datetime
 from pathlib import Path
 from i18n import get_translations
+from settings_cache import get_conf_value, get_ini_bool
+import log_index
+import service_state
+import software_inventory
 
 app = Flask(__name__)
 
@@ -164,6 +169,24 @@ SETTINGS_FILE = INSTALL_DIR / "conf" / "disk2iso.conf"
 VERSION_FILE = INSTALL_DIR / "VERSION"
 API_DIR = INSTALL_DIR / "api"
 
+API_RAM_LINK = API_DIR / ".ram_dir"
+
+def get_api_dir():
+    """Liefert das aktive API-Verzeichnis (wie folders_get_api_dir)
+
+    Mit API_RAM_DIR (disk2iso.conf) verweist api/.ram_dir auf das RAM-
+    Verzeichnis, sobald der Service es angelegt hat - sonst gilt API_DIR.
+    """
+    try:
+        ram_dir = API_RAM_LINK.read_text().strip()
+    except OSError:
+        return API_DIR
+    if ram_dir and os.path.isdir(ram_dir):
+        return Path(ram_dir)
+    return API_DIR
+
+service_state.configure(lambda: get_api_dir() / 'service_status.json')
+
 def get_version():
     """Liest Version aus VERSION-Datei"""
     try:
@@ -177,24 +200,9 @@ def get_setting_value(key, default=""):
     """
     Liest EINZELNEN Wert aus disk2iso.conf via libsettings.sh
     Architektur-Prinzip: Python = Middleware, BASH = Settings-Logic
+    Werte kommen aus settings_cache (ein Bash-Export pro Dateiaenderung)
     """
-    try:
-        script = f"""
-        source {INSTALL_DIR}/lib/libsettings.sh
-        settings_get_value_conf "disk2iso" "{key}" "{default}"
-        """
-        result = subprocess.run(
-            ['/bin/bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return default
-    except Exception as e:
-        print(f"Fehler beim Lesen von {key}: {e}", file=sys.stderr)
-        return default
+    return get_conf_value(key, default)
 
 def get_settings():
     """
@@ -203,6 +211,7 @@ def get_settings():
     """
     settings = {
         "output_dir": get_setting_value("DEFAULT_OUTPUT_DIR", "/media/iso"),
+        "staging_dir": get_setting_value("STAGING_DIR", ""),
         "mp3_quality": int(get_setting_value("MP3_QUALITY", "2")),
         "ddrescue_retries": int(get_setting_value("DDRESCUE_RETRIES", "1")),
         "usb_detection_attempts": int(get_setting_value("USB_DRIVE_DETECTION_ATTEMPTS", "5")),
@@ -243,9 +252,38 @@ def get_language_from_bash():
     
     return 'de'  # Fallback
 
+COLLECTOR_DEMAND_DIR = Path("/run/disk2iso/collector")
+COLLECTOR_BEAT_SECONDS = 5
+# Kuerzestes Leerlauf-Intervall des Collectors (services, 60s) plus Prueftakt -
+# spaetestens dann schreibt ein laufender Collector collector.json neu
+COLLECTOR_STALE_SECONDS = 60 + COLLECTOR_BEAT_SECONDS
+_collector_last_beat = 0.0
+
+def signal_collector_demand():
+    """Meldet dem residenten Collector (disk2iso-updater) aktive Besucher
+
+    Schreibt hoechstens alle COLLECTOR_BEAT_SECONDS die aktuelle Zeit nach
+    <demand_dir>/web - der Collector verkuerzt dann seine Intervalle und
+    kehrt 60s nach der letzten Anfrage in den Leerlauf zurueck.
+    """
+    global _collector_last_beat
+    now = time.time()
+    if now - _collector_last_beat < COLLECTOR_BEAT_SECONDS:
+        return
+    _collector_last_beat = now
+    demand_dir = COLLECTOR_DEMAND_DIR
+    if not demand_dir.is_dir():
+        demand_dir = get_api_dir() / '.collector'
+    try:
+        (demand_dir / 'web').write_text(str(int(now)))
+    except OSError:
+        pass  # Collector laeuft nicht - nichts zu melden
+
 @app.before_request
 def before_request():
     """LÃ¤dt Ãœbersetzungen vor jedem Request"""
+    if not request.path.startswith('/static/'):
+        signal_collector_demand()
     lang = get_language_from_bash()
     g.language = lang
     g.t = get_translations(lang)
@@ -259,47 +297,19 @@ def inject_translations():
     }
 
 def get_service_status_detailed(service_name):
-    """PrÃ¼ft detaillierten Status eines systemd Service
-    
+    """Liefert detaillierten Status eines systemd Service
+
+    Der Stand kommt aus service_state (systemd-Bus-Abonnement bzw.
+    Polling-Fallback) - kein systemctl-Aufruf pro Anfrage.
+
     Args:
         service_name: Name des Service ohne .service Endung
         
     Returns:
         dict mit 'status' (not_installed|inactive|active|error) und 'running' (bool)
     """
-    try:
-        # PrÃ¼fe ob Service existiert
-        result_exists = subprocess.run(
-            ['/usr/bin/systemctl', 'list-unit-files', f'{service_name}.service'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        if service_name not in result_exists.stdout:
-            return {'status': 'not_installed', 'running': False}
-        
-        # PrÃ¼fe Service-Status
-        result = subprocess.run(
-            ['/usr/bin/systemctl', 'is-active', service_name],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        status_text = result.stdout.strip()
-        
-        if status_text == 'active':
-            return {'status': 'active', 'running': True}
-        elif status_text == 'inactive':
-            return {'status': 'inactive', 'running': False}
-        elif status_text == 'failed':
-            return {'status': 'error', 'running': False}
-        else:
-            return {'status': 'inactive', 'running': False}
-            
-    except:
-        return {'status': 'error', 'running': False}
+    state = service_state.get_unit_status(service_name)
+    return {'status': state['status'], 'running': state['running']}
 
 def get_service_status():
     """PrÃ¼ft Status des disk2iso Service (Legacy-KompatibilitÃ¤t)"""
@@ -335,8 +345,73 @@ def count_iso_files(path):
     except:
         return 0
 
-def get_iso_files_by_type(path):
-    """Holt alle ISO-Dateien gruppiert nach Typ"""
+def image_stem(path):
+    """Pfad eines Images ohne Endung (.iso bzw. .iso.zst) - Basis der Begleitdateien"""
+    if path.lower().endswith('.zst'):
+        path = path[:-4]
+    if path.lower().endswith('.iso'):
+        path = path[:-4]
+    return path
+
+class SeekableImage:
+    """Wahlfreier Lesezugriff auf komprimierte Images (<name>.iso.zst)
+
+    Das Image besteht aus unabhängigen zstd-Frames fester Größe, der
+    Frame-Index <name>.idx (siehe libcommon.sh) liefert deren Offsets.
+    Beim Lesen werden nur die betroffenen Frames dekomprimiert.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.frame_bytes = 0
+        self.size = 0
+        self.offsets = []
+        with open(image_stem(path) + '.idx', 'r') as idx:
+            for line in idx:
+                line = line.strip()
+                if line.startswith('# frame_bytes='):
+                    self.frame_bytes = int(line.split('=', 1)[1])
+                elif line.startswith('# total_bytes='):
+                    self.size = int(line.split('=', 1)[1])
+                elif line and not line.startswith('#'):
+                    self.offsets.append(int(line.split()[1]))
+        if not self.frame_bytes or not self.size:
+            raise ValueError(f"Frame-Index unvollständig: {path}")
+        self.compressed_size = os.path.getsize(path)
+        self._cache = (None, b'')
+
+    def _frame(self, number):
+        """Dekomprimiert einen Frame (der zuletzt gelesene wird gecacht)"""
+        if self._cache[0] == number:
+            return self._cache[1]
+        start = self.offsets[number]
+        end = self.offsets[number + 1] if number + 1 < len(self.offsets) else self.compressed_size
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            compressed = f.read(end - start)
+        result = subprocess.run(['zstd', '-dcq'], input=compressed, capture_output=True, check=True)
+        self._cache = (number, result.stdout)
+        return result.stdout
+
+    def iter_range(self, offset, length):
+        """Liefert den Bereich [offset, offset + length) in Frame-Stücken"""
+        end = min(offset + length, self.size)
+        while offset < end:
+            number = offset // self.frame_bytes
+            data = self._frame(number)
+            start = offset - number * self.frame_bytes
+            chunk = data[start:start + (end - offset)]
+            if not chunk:
+                break
+            yield chunk
+            offset += len(chunk)
+
+def get_iso_files_by_type(path, staging_path=None):
+    """Holt alle ISO-Dateien gruppiert nach Typ
+
+    Ist ein Staging-Verzeichnis gesetzt, werden auch dort liegende (noch nicht
+    migrierte) Images gelistet - state = 'staged' bzw. 'migrated'
+    """
     result = {
         'audio': [],
         'dvd': [],
@@ -345,69 +420,85 @@ def get_iso_files_by_type(path):
     }
     
     try:
-        if not os.path.exists(path):
-            return result
+        sources = [(path, 'migrated')]
+        if staging_path and os.path.abspath(staging_path) != os.path.abspath(path):
+            sources.append((staging_path, 'staged'))
         
-        for root, dirs, files in os.walk(path):
-            for filename in files:
-                if not filename.lower().endswith('.iso'):
-                    continue
+        for base_path, state in sources:
+            if not os.path.exists(base_path):
+                continue
+            
+            for root, dirs, files in os.walk(base_path):
+                for filename in files:
+                    if not filename.lower().endswith(('.iso', '.iso.zst')):
+                        continue
                 
-                filepath = os.path.join(root, filename)
-                try:
-                    stat = os.stat(filepath)
-                    file_info = {
-                        'name': filename,
-                        'path': filepath,
-                        'size': stat.st_size,
-                        'created': datetime.fromtimestamp(stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                        'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                    }
+                    filepath = os.path.join(root, filename)
+                    stem = image_stem(filepath)
+                    try:
+                        stat = os.stat(filepath)
+                        file_info = {
+                            'name': filename,
+                            'path': filepath,
+                            'size': stat.st_size,
+                            'created': datetime.fromtimestamp(stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
+                            'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                            'state': state,
+                            'compressed': filename.lower().endswith('.zst')
+                        }
+                        
+                        # Komprimiert: unkomprimierte Größe aus dem Frame-Index
+                        if file_info['compressed']:
+                            file_info['compressed_size'] = stat.st_size
+                            try:
+                                file_info['size'] = SeekableImage(filepath).size
+                            except Exception:
+                                pass
                     
-                    # PrÃ¼fe ob .nfo Metadaten existieren
-                    nfo_path = filepath.replace('.iso', '.nfo')
-                    if os.path.exists(nfo_path):
-                        try:
-                            with open(nfo_path, 'r', encoding='utf-8') as nfo:
-                                nfo_data = {}
-                                for line in nfo:
-                                    if '=' in line:
-                                        key, value = line.strip().split('=', 1)
-                                        nfo_data[key.lower()] = value
-                                file_info['metadata'] = nfo_data
-                        except:
-                            pass
+                        # PrÃ¼fe ob .nfo Metadaten existieren
+                        nfo_path = stem + '.nfo'
+                        if os.path.exists(nfo_path):
+                            try:
+                                with open(nfo_path, 'r', encoding='utf-8') as nfo:
+                                    nfo_data = {}
+                                    for line in nfo:
+                                        if '=' in line:
+                                            key, value = line.strip().split('=', 1)
+                                            nfo_data[key.lower()] = value
+                                    file_info['metadata'] = nfo_data
+                            except:
+                                pass
                     
-                    # PrÃ¼fe ob Thumbnail existiert
-                    thumb_path = filepath.replace('.iso', '-thumb.jpg')
-                    if os.path.exists(thumb_path):
-                        file_info['thumbnail'] = os.path.basename(thumb_path)
+                        # PrÃ¼fe ob Thumbnail existiert
+                        thumb_path = stem + '-thumb.jpg'
+                        if os.path.exists(thumb_path):
+                            file_info['thumbnail'] = os.path.basename(thumb_path)
                     
-                    # Determine type based on directory structure (primary) or filename pattern (fallback)
-                    # Normalisiere Pfad-Komponenten
-                    path_parts = os.path.normpath(root).split(os.sep)
-                    filename_lower = filename.lower()
+                        # Determine type based on directory structure (primary) or filename pattern (fallback)
+                        # Normalisiere Pfad-Komponenten
+                        path_parts = os.path.normpath(root).split(os.sep)
+                        filename_lower = filename.lower()
                     
-                    # PrÃ¼fe zuerst Ordnerstruktur
-                    if 'audio' in path_parts:
-                        result['audio'].append(file_info)
-                    elif 'dvd' in path_parts:
-                        result['dvd'].append(file_info)
-                    elif 'bluray' in path_parts or 'blu-ray' in path_parts or 'bd' in path_parts:
-                        result['bluray'].append(file_info)
-                    elif 'data' in path_parts:
-                        result['data'].append(file_info)
-                    # Fallback: Dateiname-Pattern
-                    elif '_audio-cd_' in filename_lower or '_audiocd_' in filename_lower:
-                        result['audio'].append(file_info)
-                    elif '_bluray_' in filename_lower or '_bd_' in filename_lower or '_blu-ray_' in filename_lower:
-                        result['bluray'].append(file_info)
-                    elif '_dvd_' in filename_lower or '_dvd-video_' in filename_lower:
-                        result['dvd'].append(file_info)
-                    else:
-                        result['data'].append(file_info)
-                except Exception as e:
-                    print(f"Fehler beim Lesen von {filename}: {e}", file=sys.stderr)
+                        # PrÃ¼fe zuerst Ordnerstruktur
+                        if 'audio' in path_parts:
+                            result['audio'].append(file_info)
+                        elif 'dvd' in path_parts:
+                            result['dvd'].append(file_info)
+                        elif 'bluray' in path_parts or 'blu-ray' in path_parts or 'bd' in path_parts:
+                            result['bluray'].append(file_info)
+                        elif 'data' in path_parts:
+                            result['data'].append(file_info)
+                        # Fallback: Dateiname-Pattern
+                        elif '_audio-cd_' in filename_lower or '_audiocd_' in filename_lower:
+                            result['audio'].append(file_info)
+                        elif '_bluray_' in filename_lower or '_bd_' in filename_lower or '_blu-ray_' in filename_lower:
+                            result['bluray'].append(file_info)
+                        elif '_dvd_' in filename_lower or '_dvd-video_' in filename_lower:
+                            result['dvd'].append(file_info)
+                        else:
+                            result['data'].append(file_info)
+                    except Exception as e:
+                        print(f"Fehler beim Lesen von {filename}: {e}", file=sys.stderr)
         
         # Sort each list by modified date (newest first)
         for type_key in result:
@@ -421,7 +512,7 @@ def get_iso_files_by_type(path):
 def read_api_json(filename):
     """Liest JSON-Datei aus API-Verzeichnis"""
     try:
-        file_path = API_DIR / filename
+        file_path = get_api_dir() / filename
         if file_path.exists():
             with open(file_path, 'r') as f:
                 return json.load(f)
@@ -429,11 +520,51 @@ def read_api_json(filename):
         print(f"Fehler beim Lesen von {filename}: {e}", file=sys.stderr)
     return None
 
+def collector_alive():
+    """Prueft, ob der residente Collector (disk2iso-updater) noch arbeitet
+
+    Returns:
+        True, wenn der Prozess aus collector.json lebt und die Datei juenger
+        als COLLECTOR_STALE_SECONDS ist - sonst sind os_info.json und
+        storage_info.json veraltet und muessen per Bash ermittelt werden
+    """
+    try:
+        file_path = get_api_dir() / 'collector.json'
+        if time.time() - file_path.stat().st_mtime > COLLECTOR_STALE_SECONDS:
+            return False
+        with open(file_path, 'r') as f:
+            pid = int(json.load(f).get('pid', 0))
+        if pid <= 0:
+            return False
+        os.kill(pid, 0)
+        return True
+    except PermissionError:
+        return True  # Prozess existiert, gehoert nur einem anderen Benutzer
+    except (OSError, ValueError, AttributeError):
+        return False
+
+def read_collector_json(filename):
+    """Liest eine Collector-Datei nur, solange der Collector lebt
+
+    Args:
+        filename: Dateiname im API-Verzeichnis (z.B. 'os_info.json')
+
+    Returns:
+        dict oder None (Collector gestoppt/haengt oder Datei fehlt)
+    """
+    if not collector_alive():
+        return None
+    return read_api_json(filename)
+
 def get_os_info():
     """Ruft OS-Informationen via Bash-Funktion ab
     
     Nutzt systeminfo_get_os_info() aus libsysteminfo.sh
     """
+    # Stand des residenten Collectors (disk2iso-updater), sonst Bash
+    data = read_collector_json('os_info.json')
+    if data:
+        return data
     try:
         result = subprocess.run(
             ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_get_os_info'],
@@ -451,6 +582,10 @@ def get_storage_info():
     
     Nutzt systeminfo_get_storage_info() aus libsysteminfo.sh
     """
+    # Stand des residenten Collectors (disk2iso-updater), sonst Bash
+    data = read_collector_json('storage_info.json')
+    if data:
+        return data
     try:
         result = subprocess.run(
             ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && source {INSTALL_DIR}/lib/libfolders.sh && systeminfo_get_storage_info'],
@@ -481,72 +616,339 @@ def get_archiv_info():
         return {}
 
 def get_software_info():
-    """Ruft Software-Informationen via Bash-Funktion ab
+    """Liefert die Software-Uebersicht aus dem Software-Inventar
     
-    Nutzt systeminfo_get_software_info() aus libsysteminfo.sh
+    Cache an dpkg-Status/apt-Listen gebunden (software_inventory.py)
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_get_software_info'],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout.strip())
-        return {}
+        return software_inventory.get_software_info()
     except Exception as e:
         print(f"Fehler beim Abrufen von Software-Informationen: {e}", file=sys.stderr)
         return {}
 
-def get_live_status():
-    """Liest Live-Status aus API JSON-Dateien"""
-    status = read_api_json('status.json') or {'status': 'idle', 'timestamp': ''}
-    attributes = read_api_json('attributes.json') or {
-        'disc_label': '',
-        'disc_type': '',
-        'disc_size_mb': 0,
-        'progress_percent': 0,
-        'progress_mb': 0,
-        'total_mb': 0,
-        'eta': '',
-        'filename': '',
-        'method': 'unknown',
-        'container_type': 'none',
-        'error_message': None
-    }
-    progress = read_api_json('progress.json') or {
-        'percent': 0,
-        'copied_mb': 0,
-        'total_mb': 0,
-        'eta': '',
-        'timestamp': ''
-    }
-    
-    # FÃ¼r Audio-CDs: total_tracks aus attributes verwenden
-    disc_type = attributes.get('disc_type', '')
-    if disc_type == 'audio-cd':
-        total_value = attributes.get('total_tracks', progress.get('total_mb', 0))
+# Priorität der States bei mehreren Laufwerken (aktivstes Laufwerk zuerst)
+DRIVE_STATUS_PRIORITY = [
+    'copying', 'analyzing', 'waiting_for_metadata', 'waiting', 'error',
+    'completed', 'waiting_for_removal', 'idle'
+]
+
+# Live-Dokument (lib/libapi.sh): Status, Attribute und Fortschritt in EINER
+# Datei, jede Aenderung erhoeht 'seq'. Geparst wird nur nach einer Aenderung
+# (atomares mv -> neue Inode/mtime), sonst liefert der Cache den letzten Stand.
+LIVE_STATUS_FILE = 'live.json'
+LIVE_STATUS_DEFAULT = {
+    'seq': 0,
+    'status': 'idle',
+    'timestamp': '',
+    'disc_label': '',
+    'disc_type': '',
+    'disc_size_mb': 0,
+    'filename': '',
+    'method': 'unknown',
+    'container_type': 'none',
+    'error_message': None,
+    'percent': 0,
+    'copied_mb': 0,
+    'total_mb': 0,
+    'total_tracks': 0,
+    'eta': '',
+    'progress_timestamp': ''
+}
+_live_cache = {}
+
+def _read_live_document(prefix=''):
+    """Liest live.json (prefix = Unterordner je Laufwerk), geparst nur bei Aenderung"""
+    file_path = get_api_dir() / f'{prefix}{LIVE_STATUS_FILE}'
+    try:
+        st = file_path.stat()
+    except OSError:
+        _live_cache.pop(prefix, None)
+        return dict(LIVE_STATUS_DEFAULT)
+    
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _live_cache.get(prefix)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    
+    document = dict(LIVE_STATUS_DEFAULT)
+    document.update(read_api_json(f'{prefix}{LIVE_STATUS_FILE}') or {})
+    _live_cache[prefix] = (stamp, document)
+    return document
+
+def _read_live_status(prefix=''):
+    """Liest Live-Status aus dem Live-Dokument (prefix = Unterordner je Laufwerk)"""
+    live = _read_live_document(prefix)
+    
+    # Fuer Audio-CDs: total_tracks statt MB
+    disc_type = live.get('disc_type', '')
+    if disc_type == 'audio-cd' and live.get('total_tracks'):
+        total_value = live.get('total_tracks', 0)
     else:
-        total_value = progress.get('total_mb', 0)
+        total_value = live.get('total_mb', 0)
     
     return {
-        'status': status.get('status', 'idle'),
-        'timestamp': status.get('timestamp', ''),
-        'disc_label': attributes.get('disc_label', ''),
+        'seq': live.get('seq', 0),
+        'status': live.get('status', 'idle'),
+        'timestamp': live.get('timestamp', ''),
+        'disc_label': live.get('disc_label', ''),
         'disc_type': disc_type,
-        'disc_size_mb': attributes.get('disc_size_mb', 0),
-        'progress_percent': progress.get('percent', 0),
-        'progress_mb': progress.get('copied_mb', 0),
+        'disc_size_mb': live.get('disc_size_mb', 0),
+        'progress_percent': live.get('percent', 0),
+        'progress_mb': live.get('copied_mb', 0),
         'total_mb': total_value,
-        'eta': progress.get('eta', ''),
-        'filename': attributes.get('filename', ''),
-        'method': attributes.get('method', 'unknown'),
-        'error_message': attributes.get('error_message')
+        'eta': live.get('eta', ''),
+        'filename': live.get('filename', ''),
+        'method': live.get('method', 'unknown'),
+        'error_message': live.get('error_message')
+    }
+
+def get_drive_statuses():
+    """Liest Live-Status aller Laufwerke im Multi-Drive-Betrieb
+
+    Returns:
+        list: Ein Eintrag pro Laufwerk (api/drives/<instanz>/), Feld 'drive'
+              enthält den Instanz-Namen (z.B. 'sr0'). Leer im Single-Drive-Betrieb.
+    """
+    drives_dir = get_api_dir() / 'drives'
+    drives = []
+    try:
+        if drives_dir.is_dir():
+            for drive_dir in sorted(drives_dir.iterdir()):
+                if drive_dir.is_dir():
+                    entry = _read_live_status(f'drives/{drive_dir.name}/')
+                    entry['drive'] = drive_dir.name
+                    drives.append(entry)
+    except Exception as e:
+        print(f"Fehler beim Lesen der Laufwerks-Status: {e}", file=sys.stderr)
+    return drives
+
+def get_live_status():
+    """Liest Live-Status aus API JSON-Dateien
+
+    Im Multi-Drive-Betrieb wird das aktivste Laufwerk als Hauptstatus geliefert,
+    alle Laufwerke zusätzlich unter 'drives'.
+    """
+    drives = get_drive_statuses()
+    if not drives:
+        return _read_live_status()
+
+    # Gesamt-Sequenz: aendert sich, sobald sich ein Laufwerk aendert
+    total_seq = sum(entry.get('seq', 0) for entry in drives)
+
+    def priority(entry):
+        status = entry.get('status', 'idle')
+        if status in DRIVE_STATUS_PRIORITY:
+            return DRIVE_STATUS_PRIORITY.index(status)
+        return len(DRIVE_STATUS_PRIORITY)
+
+    live_status = dict(min(drives, key=priority))
+    live_status['seq'] = total_seq
+    live_status['drives'] = drives
+    return live_status
+
+# History-Journal (lib/libapi.sh): eine JSON-Zeile pro Eintrag in
+# api/history/journal.NNNNNN.jsonl, Index (index.tsv) und vorberechnete
+# Tagesstatistik (days.tsv). Im RAM-Betrieb liegen noch nicht gesicherte
+# Eintraege in <RAM-Verzeichnis>/history.pending.jsonl.
+HISTORY_DIR = 'history'
+HISTORY_PENDING = 'history.pending.jsonl'
+HISTORY_FAILED_RESULTS = ('error',)
+_history_segment_cache = {}
+
+def _read_history_segment(path):
+    """Liest ein Journal-Segment, geparst nur bei Aenderung (volle Segmente
+    aendern sich nie und bleiben im Cache)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _history_segment_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    
+    entries = []
+    try:
+        with open(path, 'r', errors='replace') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError as e:
+        print(f"Fehler beim Lesen von {path}: {e}", file=sys.stderr)
+    _history_segment_cache[path] = (stamp, entries)
+    return entries
+
+def _read_history_tsv(path, fields):
+    """Liest index.tsv / days.tsv (TAB-separiert) als Liste von Dicts"""
+    rows = []
+    try:
+        with open(path, 'r', errors='replace') as f:
+            for line in f:
+                values = line.rstrip('\n').split('\t')
+                if len(values) >= len(fields):
+                    rows.append(dict(zip(fields, values)))
+    except OSError:
+        pass
+    return rows
+
+def _read_history_pending():
+    """Noch nicht ins Journal uebernommene Eintraege (nur RAM-Betrieb)"""
+    api_dir = get_api_dir()
+    if api_dir == API_DIR:
+        return []
+    return _read_history_segment(str(api_dir / HISTORY_PENDING))
+
+def _history_matches(entry, disc_type=None, result=None, date_from=None, date_to=None):
+    """Prueft einen Eintrag gegen die Filter (Datum als YYYY-MM-DD)"""
+    day = entry.get('timestamp', '')[:10]
+    if disc_type and entry.get('type') != disc_type:
+        return False
+    if result and entry.get('result') != result:
+        return False
+    if date_from and day < date_from:
+        return False
+    if date_to and day > date_to:
+        return False
+    return True
+
+def get_history_aggregates(disc_type=None, date_from=None, date_to=None):
+    """Statistik aus der vorberechneten Tagesstatistik (days.tsv)
+
+    Returns:
+        dict: per_day (Discs/Bytes/Fehler pro Tag), by_type (inkl.
+              failure_rate pro Disc-Typ), total
+    """
+    rows = _read_history_tsv(API_DIR / HISTORY_DIR / 'days.tsv',
+                             ('date', 'type', 'result', 'count', 'bytes'))
+    for entry in _read_history_pending():
+        rows.append({'date': entry.get('timestamp', '')[:10], 'type': entry.get('type', ''),
+                     'result': entry.get('result', ''), 'count': 1, 'bytes': entry.get('bytes', 0)})
+    
+    per_day = {}
+    by_type = {}
+    total = {'discs': 0, 'bytes': 0, 'failed': 0}
+    for row in rows:
+        probe = {'timestamp': row['date'], 'type': row['type']}
+        if not _history_matches(probe, disc_type, None, date_from, date_to):
+            continue
+        try:
+            count, size = int(row['count']), int(row['bytes'])
+        except ValueError:
+            continue
+        failed = count if row['result'] in HISTORY_FAILED_RESULTS else 0
+        
+        for bucket in (per_day.setdefault(row['date'], {'date': row['date'], 'discs': 0, 'bytes': 0, 'failed': 0}),
+                       by_type.setdefault(row['type'], {'discs': 0, 'bytes': 0, 'failed': 0}),
+                       total):
+            bucket['discs'] += count
+            bucket['bytes'] += size
+            bucket['failed'] += failed
+    
+    for bucket in list(by_type.values()) + [total]:
+        bucket['failure_rate'] = round(bucket['failed'] / bucket['discs'], 3) if bucket['discs'] else 0
+    
+    return {
+        'per_day': sorted(per_day.values(), key=lambda d: d['date']),
+        'by_type': by_type,
+        'total': total
+    }
+
+def get_history(page=1, per_page=50, disc_type=None, result=None, date_from=None, date_to=None):
+    """Liest eine Seite der AktivitÃ¤ts-History (neueste zuerst)
+
+    Ohne Filter werden Segmente ausserhalb der Seite nur ueber den Index
+    gezaehlt, mit Datumsfilter nicht ueberlappende Segmente uebersprungen.
+
+    Returns:
+        dict: entries, total (Treffer insgesamt), page, per_page, pages
+    """
+    history_dir = API_DIR / HISTORY_DIR
+    segments = _read_history_tsv(history_dir / 'index.tsv', ('segment', 'count', 'first', 'last'))
+    filtered = any((disc_type, result, date_from, date_to))
+    offset = (page - 1) * per_page
+    entries = []
+    total = 0
+    
+    def take(items):
+        nonlocal total
+        for entry in items:
+            if _history_matches(entry, disc_type, result, date_from, date_to):
+                if offset <= total < offset + per_page:
+                    entries.append(entry)
+                total += 1
+    
+    take(reversed(_read_history_pending()))
+    for segment in reversed(segments):
+        if date_from and segment['last'][:10] < date_from:
+            continue
+        if date_to and segment['first'][:10] > date_to:
+            continue
+        count = int(segment['count']) if segment['count'].isdigit() else 0
+        if not filtered and (total + count <= offset or total >= offset + per_page):
+            total += count
+            continue
+        take(reversed(_read_history_segment(str(history_dir / f"journal.{segment['segment']}.jsonl"))))
+    
+    return {
+        'entries': entries,
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'pages': (total + per_page - 1) // per_page
     }
 
-def get_history():
-    """Liest AktivitÃ¤ts-History"""
-    history = read_api_json('history.json')
-    return history if history else []
+FAILED_DISCS_DIR = '.failed_discs.d'
+FAILED_DISC_FIELDS = ('timestamp', 'type', 'identifier', 'method', 'bytes_recovered', 'duration_s', 'drive')
+
+def get_disc_failures(output_dir, min_attempts=2):
+    """Liest das Fehler-Tracking (lib/libcommon.sh, eine Datei pro Disc,
+    eine TAB-separierte Zeile pro Fehlversuch) und liefert alle Discs mit
+    mindestens min_attempts Fehlversuchen, meiste Versuche zuerst"""
+    discs = {}
+    failed_dir = Path(output_dir) / FAILED_DISCS_DIR
+    if not failed_dir.is_dir():
+        return []
+    
+    for entry in os.scandir(failed_dir):
+        if not entry.is_file():
+            continue
+        try:
+            with open(entry.path, 'r', errors='replace') as f:
+                for line in f:
+                    values = line.rstrip('\n').split('\t')
+                    if len(values) < len(FAILED_DISC_FIELDS):
+                        continue
+                    attempt = dict(zip(FAILED_DISC_FIELDS, values))
+                    for key in ('bytes_recovered', 'duration_s'):
+                        attempt[key] = int(attempt[key]) if attempt[key].isdigit() else 0
+                    disc = discs.setdefault((attempt['type'], attempt['identifier']), {
+                        'type': attempt['type'],
+                        'identifier': attempt['identifier'],
+                        'attempts': []
+                    })
+                    disc['attempts'].append(attempt)
+        except OSError as e:
+            print(f"Fehler beim Lesen von {entry.path}: {e}", file=sys.stderr)
+    
+    result = []
+    for disc in discs.values():
+        if len(disc['attempts']) < min_attempts:
+            continue
+        disc['attempts'].sort(key=lambda a: a['timestamp'])
+        disc['count'] = len(disc['attempts'])
+        disc['last_attempt'] = disc['attempts'][-1]['timestamp']
+        disc['methods'] = sorted({a['method'] for a in disc['attempts']})
+        disc['max_bytes_recovered'] = max(a['bytes_recovered'] for a in disc['attempts'])
+        result.append(disc)
+    
+    result.sort(key=lambda d: (d['count'], d['last_attempt']), reverse=True)
+    return result
 
 def get_status_text(live_status, service_running):
     """Generiert lesbaren Status-Text basierend auf Live-Status und Service-Status"""
@@ -600,7 +1002,7 @@ def index():
     status_text = get_status_text(live_status, service_running)
     
     # Archive nach Typen
-    archives = get_iso_files_by_type(settings['output_dir'])
+    archives = get_iso_files_by_type(settings['output_dir'], settings.get('staging_dir'))
     archive_counts = {
         'data': len(archives['data']),
         'audio': len(archives['audio']),
@@ -760,19 +1162,9 @@ def api_modules():
     """
     enabled_modules = {}
     
-    # Funktion um enabled-Status aus INI zu lesen
+    # Funktion um enabled-Status aus INI zu lesen (settings_cache)
     def get_module_enabled(module_name, default=True):
-        try:
-            result = subprocess.run(
-                ['bash', '-c', f'source {INSTALL_DIR}/lib/libsettings.sh && settings_get_value_ini "{module_name}" "module" "enabled" "{str(default).lower()}"'],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                value = result.stdout.strip().lower()
-                return value in ['true', '1', 'yes', 'on']
-            return default
-        except:
-            return default
+        return get_ini_bool(module_name, 'module', 'enabled', default)
     
     # Lese Status aus INI-Dateien
     enabled_modules['metadata'] = get_module_enabled('metadata', True)
@@ -786,41 +1178,23 @@ def api_modules():
     
     return jsonify({
         'enabled_modules': enabled_modules,
+        'load': read_api_json('modules.json') or {},
         'timestamp': datetime.now().isoformat()
     })
 
 @app.route('/api/service/status/<service_name>')
 def api_service_status(service_name):
-    """API-Endpoint fÃ¼r Service-Status
+    """API-Endpoint fuer Service-Status
     
-    Nutzt libservice.sh fÃ¼r Service-Management
+    Liest den Stand aus service_state (systemd-Bus, Fallback Polling)
     """
-    try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libfolders.sh && source {INSTALL_DIR}/lib/libsettings.sh && source {INSTALL_DIR}/lib/libservice.sh && service_get_status "{service_name}"'],
-            capture_output=True, text=True, timeout=5
-        )
-        
-        if result.returncode == 0:
-            status_data = json.loads(result.stdout.strip())
-            return jsonify({
-                'success': True,
-                **status_data,
-                'service': service_name,
-                'timestamp': datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Service status check failed',
-                'timestamp': datetime.now().isoformat()
-            }), 500
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+    status_data = service_state.get_unit_status(service_name)
+    return jsonify({
+        'success': True,
+        **status_data,
+        'service': service_name,
+        'timestamp': datetime.now().isoformat()
+    })
 
 @app.route('/api/service/restart/<service_name>', methods=['POST'])
 def api_service_restart(service_name):
@@ -834,6 +1208,7 @@ def api_service_restart(service_name):
             capture_output=True, text=True, timeout=10
         )
         
+        service_state.refresh(service_name)
         if result.returncode == 0:
             return jsonify({
                 'success': True,
@@ -881,7 +1256,17 @@ def api_module_software(module_name):
                 'timestamp': datetime.now().isoformat()
             }), 404
         
-        # Rufe Modul-Funktion auf
+        # Abhaengigkeiten aus lib<modul>.ini: aus dem Software-Inventar
+        software = software_inventory.get_module_software(module_name)
+        if software is not None:
+            return jsonify({
+                'success': True,
+                'module': module_name,
+                'software': software,
+                'timestamp': datetime.now().isoformat()
+            })
+        
+        # Sonst Modul-Funktion aufrufen
         result = subprocess.run(
             ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libfolders.sh && source {INSTALL_DIR}/lib/libsettings.sh && source {INSTALL_DIR}/lib/libsysteminfo.sh && source {module_lib} && {module_name}_get_software_info'],
             capture_output=True, text=True, timeout=5
@@ -1013,6 +1398,7 @@ def api_archive():
             'output_dir': storage_info.get('output_dir'),
             'disk_space': storage_info.get('disk_space'),
             'archive_counts': archiv_info.get('archive_counts'),
+            'compression': (read_api_json('compression.json') or {}).get('by_type', {}),
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
@@ -1024,8 +1410,17 @@ def api_archive():
 
 @app.route('/api/live_status')
 def api_live_status():
-    """API-Endpoint fÃ¼r Live-Status (fÃ¼r Service-Restart-Warnung)"""
-    return jsonify(get_live_status())
+    """API-Endpoint fÃ¼r Live-Status (fÃ¼r Service-Restart-Warnung)
+
+    Optional ?since=<seq>: unveraenderter Stand liefert nur
+    {'seq': ..., 'changed': false} statt des kompletten Dokuments.
+    """
+    live_status = get_live_status()
+    since = request.args.get('since')
+    if since is not None and since == str(live_status.get('seq', 0)):
+        return jsonify({'seq': live_status.get('seq', 0), 'changed': False})
+    live_status['changed'] = True
+    return jsonify(live_status)
 
 @app.route('/api/status')
 def api_status():
@@ -1034,7 +1429,7 @@ def api_status():
     live_status = get_live_status()
     
     # Archive-Counts ermitteln
-    all_files = get_iso_files_by_type(settings['output_dir'])
+    all_files = get_iso_files_by_type(settings['output_dir'], settings.get('staging_dir'))
     archive_counts = {
         'data': len(all_files.get('data', [])),
         'audio': len(all_files.get('audio', [])),
@@ -1063,8 +1458,61 @@ def api_status():
 
 @app.route('/api/history')
 def api_history():
-    """API-Endpoint fÃ¼r AktivitÃ¤ts-History"""
-    return jsonify(get_history())
+    """API-Endpoint fÃ¼r AktivitÃ¤ts-History
+    
+    Query-Parameter: page, per_page (Standard: 50, max. 500),
+                     type, result, from/to (YYYY-MM-DD)
+    """
+    page = max(1, request.args.get('page', 1, type=int))
+    per_page = min(500, max(1, request.args.get('per_page', 50, type=int)))
+    disc_type = request.args.get('type') or None
+    result = request.args.get('result') or None
+    date_from = request.args.get('from') or None
+    date_to = request.args.get('to') or None
+    
+    history = get_history(page, per_page, disc_type, result, date_from, date_to)
+    history['aggregates'] = get_history_aggregates(disc_type, date_from, date_to)
+    history['timestamp'] = datetime.now().isoformat()
+    return jsonify(history)
+
+@app.route('/api/failures')
+def api_failures():
+    """API-Endpoint fuer Discs mit wiederholten Fehlversuchen
+    
+    Query-Parameter: min = Mindestanzahl Fehlversuche (Standard: 2)
+    """
+    settings = get_settings()
+    min_attempts = request.args.get('min', 2, type=int)
+    failures = get_disc_failures(settings['output_dir'], max(1, min_attempts))
+    return jsonify({
+        'success': True,
+        'min_attempts': max(1, min_attempts),
+        'count': len(failures),
+        'discs': failures,
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/api/observers')
+def api_observers():
+    """API-Endpoint fuer den Observer-Bus (Senken wie MQTT)
+    
+    Je Senke: zugestellt, Fehler, zusammengefasst, verworfen, Rueckstand
+    und Latenz (Dispatcher schreibt observers.json alle 2 Sekunden)
+    """
+    observers = read_api_json('observers.json') or {'sinks': {}}
+    observers['timestamp'] = datetime.now().isoformat()
+    return jsonify(observers)
+
+@app.route('/api/collector')
+def api_collector():
+    """API-Endpoint fuer den residenten Collector (disk2iso-updater)
+    
+    Je Messwert: aktuelles Intervall, Laeufe, CPU-Zeit und letzter Lauf;
+    dazu Bedarf (web/copy) und CPU-Anteil des Collectors seit Start
+    """
+    collector = read_api_json('collector.json') or {'metrics': {}}
+    collector['timestamp'] = datetime.now().isoformat()
+    return jsonify(collector)
 
 @app.route('/api/musicbrainz/releases')
 def api_musicbrainz_releases():
@@ -1252,6 +1700,52 @@ def api_archive_thumbnail(filename):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/archive/download/<path:filepath>')
+def api_archive_download(filepath):
+    """API-Endpoint zum Herunterladen eines Images (unterstützt HTTP-Range)
+
+    Komprimierte Images (.iso.zst) werden als ISO ausgeliefert, über den
+    Frame-Index wird nur der angeforderte Bereich dekomprimiert.
+    """
+    try:
+        settings = get_settings()
+        filepath = os.path.realpath('/' + filepath)
+        allowed = [os.path.realpath(d) for d in (settings['output_dir'], settings.get('staging_dir')) if d]
+        if not any(filepath.startswith(d + os.sep) for d in allowed) or not os.path.isfile(filepath):
+            return jsonify({'error': g.t.get('API_ERROR_FILE_NOT_FOUND', 'File not found')}), 404
+        
+        download_name = os.path.basename(image_stem(filepath)) + '.iso'
+        if not filepath.lower().endswith('.zst'):
+            return send_file(filepath, as_attachment=True, download_name=download_name, conditional=True)
+        
+        image = SeekableImage(filepath)
+        start, end = 0, image.size - 1
+        status = 200
+        range_header = request.headers.get('Range', '')
+        match = re.match(r'bytes=(\d*)-(\d*)$', range_header)
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                if match.group(2):
+                    end = min(int(match.group(2)), image.size - 1)
+            else:
+                start = max(image.size - int(match.group(2)), 0)
+            if start > end:
+                return Response(status=416, headers={'Content-Range': f'bytes */{image.size}'})
+            status = 206
+        
+        headers = {
+            'Accept-Ranges': 'bytes',
+            'Content-Length': str(end - start + 1),
+            'Content-Disposition': f'attachment; filename="{download_name}"'
+        }
+        if status == 206:
+            headers['Content-Range'] = f'bytes {start}-{end}/{image.size}'
+        return Response(image.iter_range(start, end - start + 1), status=status,
+                        mimetype='application/x-iso9660-image', headers=headers)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/service/restart', methods=['POST'])
 def restart_service():
     """
@@ -1479,15 +1973,14 @@ def api_logs_archived():
                 'files': []
             })
         
-        # Sammle alle Log-Dateien
-        log_files = []
-        for log_file in sorted(log_dir.glob('*.log'), key=lambda p: p.stat().st_mtime, reverse=True):
-            stat = log_file.stat()
-            log_files.append({
-                'name': log_file.name,
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            })
+        # Log-Dateien aus dem Katalog (catalog.tsv, kein stat pro Datei)
+        log_files = [{
+            'name': entry['name'],
+            'size': entry['size'],
+            'modified': datetime.fromtimestamp(entry['mtime']).strftime('%Y-%m-%d %H:%M:%S'),
+            'disc': entry['disc'],
+            'compressed': entry['name'].endswith('.gz')
+        } for entry in log_index.list_catalog(str(log_dir))]
         
         return jsonify({
             'success': True,
@@ -1504,8 +1997,8 @@ def api_logs_archived():
 def api_logs_archived_file(filename):
     """API-Endpoint fÃ¼r eine spezifische archivierte Log-Datei"""
     try:
-        # Sicherheitscheck: Nur .log Dateien erlauben und keine Pfad-Traversierung
-        if not filename.endswith('.log') or '/' in filename or '\\' in filename or '..' in filename:
+        # Sicherheitscheck: Nur .log/.log.gz Dateien erlauben und keine Pfad-Traversierung
+        if not filename.endswith(log_index.LOG_SUFFIXES) or '/' in filename or '\\' in filename or '..' in filename:
             return jsonify({
                 'success': False,
                 'message': 'UngÃ¼ltiger Dateiname',
@@ -1526,12 +2019,9 @@ def api_logs_archived_file(filename):
                 'lines': 0
             }), 404
         
-        # Lese die Log-Datei (letzte 1000 Zeilen)
-        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-            # Zeige die letzten 1000 Zeilen
-            recent_lines = lines[-1000:] if len(lines) > 1000 else lines
-            log_content = ''.join(recent_lines)
+        # Lese die letzten 1000 Zeilen (Stream, gepackte Logs werden entpackt)
+        recent_lines = log_index.tail_lines(str(log_file), 1000)
+        log_content = ''.join(recent_lines)
         
         return jsonify({
             'success': True,
@@ -1547,205 +2037,81 @@ def api_logs_archived_file(filename):
             'lines': 0
         })
 
-def get_command_version(command, args=None):
-    """Holt Version eines Kommandozeilen-Tools"""
-    try:
-        cmd = [command]
-        if args:
-            cmd.extend(args if isinstance(args, list) else [args])
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=3
-        )
-        
-        output = result.stdout + result.stderr
-        # Extrahiere Version aus Ausgabe
-        import re
-        version_match = re.search(r'(\d+\.[\d.]+)', output)
-        if version_match:
-            return version_match.group(1)
-        return 'Installiert'
-    except:
+def _parse_log_search_time(value, end_of_day=False):
+    """Wandelt YYYY-MM-DD[THH:MM:SS] in einen Unix-Timestamp (None = offen)"""
+    if not value:
         return None
-
-def get_package_version(package_name):
-    """Holt installierte Version eines Debian-Pakets"""
-    try:
-        result = subprocess.run(
-            ['dpkg', '-s', package_name],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if line.startswith('Version:'):
-                    version = line.split(':', 1)[1].strip()
-                    # KÃ¼rze Debian-Versionsnummern
-                    if '-' in version:
-                        version = version.split('-')[0]
-                    if '+' in version:
-                        version = version.split('+')[0]
-                    return version
-        return None
-    except:
-        return None
-
-def get_available_package_version(package_name):
-    """Holt verfÃ¼gbare Version eines Pakets aus den Repositories"""
+    parsed = datetime.fromisoformat(value)
+    if end_of_day and len(value) == 10:
+        parsed = parsed.replace(hour=23, minute=59, second=59)
+    return parsed.timestamp()
+
+@app.route('/api/logs/search')
+def api_logs_search():
+    """API-Endpoint fuer die Suche ueber alle archivierten Kopier-Logs
+    
+    Query-Parameter:
+        q        = Regulaerer Ausdruck (optional, Gross/Klein egal ausser case=1)
+        severity = Komma-Liste: error, warning, info, debug (optional)
+        from, to = Zeitraum YYYY-MM-DD oder YYYY-MM-DDTHH:MM:SS (optional)
+        page, per_page = Seite (ab 1) und Treffer pro Seite (max. 500)
+        stream   = 1: Treffer als NDJSON streamen (eine Zeile pro Treffer,
+                   letzte Zeile {"page", "has_more"})
+    """
     try:
-        result = subprocess.run(
-            ['apt-cache', 'policy', package_name],
-            capture_output=True,
-            text=True,
-            timeout=3
-        )
-        
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'Candidate:' in line:
-                    version = line.split(':', 1)[1].strip()
-                    if version and version != '(none)':
-                        # KÃ¼rze Debian-Versionsnummern
-                        if '-' in version:
-                            version = version.split('-')[0]
-                        if '+' in version:
-                            version = version.split('+')[0]
-                        return version
-        return 'Unbekannt'
-    except:
-        return 'Unbekannt'
+        page = max(1, request.args.get('page', 1, type=int))
+        per_page = min(500, max(1, request.args.get('per_page', 100, type=int)))
+        pattern = request.args.get('q', '')
+        regex = log_index.compile_pattern(pattern, request.args.get('case') != '1') if pattern else None
+        severities = {s.strip() for s in request.args.get('severity', '').split(',') if s.strip()}
+        unknown = severities - set(log_index.SEVERITY_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unbekannter Schweregrad: {', '.join(sorted(unknown))}")
+        date_from = _parse_log_search_time(request.args.get('from'))
+        date_to = _parse_log_search_time(request.args.get('to'), end_of_day=True)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e), 'matches': []}), 400
+
+    log_dir = str(Path(get_settings()['output_dir']) / '.log')
+    matches = log_index.search(log_dir, regex, severities or None, date_from, date_to,
+                               offset=(page - 1) * per_page, limit=per_page)
+
+    if request.args.get('stream') == '1':
+        def generate():
+            count = 0
+            for match in matches:
+                if count == per_page:
+                    yield json.dumps({'page': page, 'has_more': True}) + '\n'
+                    return
+                count += 1
+                yield json.dumps(match) + '\n'
+            yield json.dumps({'page': page, 'has_more': False}) + '\n'
+        return Response(generate(), mimetype='application/x-ndjson')
+
+    results = list(matches)
+    return jsonify({
+        'success': True,
+        'page': page,
+        'per_page': per_page,
+        'has_more': len(results) > per_page,
+        'matches': results[:per_page],
+        'timestamp': datetime.now().isoformat()
+    })
 
 def check_software_versions():
-    """Sammelt alle Software-Versionen"""
-    software_list = []
+    """Sammelt alle Software-Versionen
     
-    # Audio-CD Tools
-    software_list.extend([
-        {
-            'name': 'cdparanoia',
-            'display_name': 'cdparanoia',
-            'package': 'cdparanoia',
-            'version_cmd': ['cdparanoia', '--version']
-        },
-        {
-            'name': 'abcde',
-            'display_name': 'abcde',
-            'package': 'abcde',
-            'version_cmd': ['abcde', '-v']
-        },
-        {
-            'name': 'lame',
-            'display_name': 'LAME MP3 Encoder',
-            'package': 'lame',
-            'version_cmd': ['lame', '--version']
-        },
-        {
-            'name': 'flac',
-            'display_name': 'FLAC',
-            'package': 'flac',
-            'version_cmd': ['flac', '--version']
-        },
-        {
-            'name': 'vorbis-tools',
-            'display_name': 'Vorbis Tools',
-            'package': 'vorbis-tools',
-            'version_cmd': None  # Package version only
-        }
-    ])
-    
-    # DVD/Blu-ray Tools
-    software_list.extend([
-        {
-            'name': 'makemkv',
-            'display_name': 'MakeMKV',
-            'package': 'makemkv-bin',
-            'version_cmd': ['makemkvcon', '--version']
-        },
-        {
-            'name': 'dvdbackup',
-            'display_name': 'dvdbackup',
-            'package': 'dvdbackup',
-            'version_cmd': None
-        },
-        {
-            'name': 'libbluray',
-            'display_name': 'libbluray',
-            'package': 'libbluray2',
-            'version_cmd': None
-        }
-    ])
-    
-    # System Tools
-    software_list.extend([
-        {
-            'name': 'ddrescue',
-            'display_name': 'GNU ddrescue',
-            'package': 'gddrescue',
-            'version_cmd': ['ddrescue', '--version']
-        },
-        {
-            'name': 'wodim',
-            'display_name': 'wodim',
-            'package': 'wodim',
-            'version_cmd': ['wodim', '--version']
-        },
-        {
-            'name': 'genisoimage',
-            'display_name': 'genisoimage',
-            'package': 'genisoimage',
-            'version_cmd': ['genisoimage', '--version']
-        },
-        {
-            'name': 'isoinfo',
-            'display_name': 'isoinfo',
-            'package': 'genisoimage',
-            'version_cmd': ['isoinfo', '--version']
-        }
-    ])
-    
-    # Sammle Versionen
-    results = []
-    for soft in software_list:
-        installed_version = None
-        available_version = 'Unbekannt'
-        
-        # Versuche Paket-Version
-        if soft['package']:
-            installed_version = get_package_version(soft['package'])
-            available_version = get_available_package_version(soft['package'])
-        
-        # Falls kein Paket oder Kommando angegeben, versuche Command-Version
-        if not installed_version and soft['version_cmd']:
-            installed_version = get_command_version(soft['version_cmd'][0], 
-                                                    soft['version_cmd'][1:] if len(soft['version_cmd']) > 1 else None)
-        
-        # PrÃ¼fe ob Update verfÃ¼gbar
-        update_available = False
-        if installed_version and available_version and available_version != 'Unbekannt':
-            try:
-                # Einfacher String-Vergleich
-                if installed_version != available_version:
-                    update_available = True
-            except:
-                pass
-        
-        results.append({
-            'name': soft['name'],
-            'display_name': soft['display_name'],
-            'installed_version': installed_version,
-            'available_version': available_version,
-            'update_available': update_available
-        })
-    
-    return results
+    Alle Pakete mit je einem dpkg-query/apt-cache Aufruf, --version Aufrufe
+    parallel; Ergebnis gecacht bis sich die Paket-Datenbank aendert
+    """
+    return software_inventory.get_catalog_versions()
 
 def get_os_info():
     """Liest OS-Informationen aus Bash (systeminfo_get_os_info)"""
+    # Stand des residenten Collectors (disk2iso-updater), sonst Bash
+    data = read_collector_json('os_info.json')
+    if data:
+        return data
     try:
         # Rufe Bash-Funktion systeminfo_get_os_info() auf
         script = f"""
@@ -1781,6 +2147,10 @@ systeminfo_get_os_info
 
 def get_storage_info():
     """Liest Storage-Informationen aus Bash (systeminfo_get_storage_info)"""
+    # Stand des residenten Collectors (disk2iso-updater), sonst Bash
+    data = read_collector_json('storage_info.json')
+    if data:
+        return data
     try:
         script = f"""
 source {INSTALL_DIR}/lib/libfolders.sh 2>/dev/null
@@ -1826,23 +2196,9 @@ systeminfo_get_archiv_info
     return {'hardware': {}, 'storage': {}}
 
 def get_software_info():
-    """Liest Software-Informationen aus Bash (systeminfo_get_software_info)"""
+    """Liest Software-Informationen aus dem Software-Inventar"""
     try:
-        script = f"""
-source {INSTALL_DIR}/lib/libfolders.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsettings.sh 2>/dev/null
-source {INSTALL_DIR}/lib/libsysteminfo.sh 2>/dev/null
-systeminfo_get_software_info
-"""
-        result = subprocess.run(
-            ['bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0 and result.stdout.strip():
-            return json.loads(result.stdout)
+        return software_inventory.get_software_info()
     except Exception as e:
         print(f"Fehler beim Lesen der Software-Infos: {e}", file=sys.stderr)
     
@@ -1859,16 +2215,7 @@ def get_disk2iso_info():
     
     try:
         # Service Status
-        if get_service_status():
-            info['service_status'] = 'active'
-        else:
-            result = subprocess.run(
-                ['systemctl', 'is-active', 'disk2iso'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            info['service_status'] = result.stdout.strip()
+        info['service_status'] = service_state.get_unit_status('disk2iso')['active_state']
         
         # Python Version
         result = subprocess.run(
@@ -2340,6 +2687,10 @@ def internal_error(error):
 
 if __name__ == '__main__':
     # Nur fÃ¼r Entwicklung - In Produktion wird Gunicorn/Flask Server verwendet
+    # Service-Status sofort abonnieren (sonst beim ersten Status-Abruf)
+    service_state.start()
+    # Software-Inventar im Hintergrund fuellen (Widgets ohne Wartezeit)
+    software_inventory.start()
     app.run(host='0.0.0.0', port=8080, debug=False)
 
 
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Log-Index - Suche über alle archivierten Kopier-Logs
+Version 1.3.0 - 18.10.2026
+
+Der Index hält je Log-Datei Größe, Änderungszeit und Zeitraum (erster/letzter
+Zeitstempel) im Speicher. Bei jedem Aufruf wird nur das Verzeichnis gelesen
+(os.scandir); neu gelesen werden nur neue oder geänderte Dateien.
+Die Suche liest die Dateien per mmap (kein Einlesen in Python-Strings) und
+verteilt sie auf einen begrenzten Thread-Pool. Treffer kommen in fester
+Reihenfolge (neueste Datei zuerst, innerhalb der Datei zeilenweise), die
+Suche endet, sobald die angeforderte Seite gefüllt ist.
+
+Ältere Logs packt liblogging.sh (logging_apply_retention) mit gzip; sie
+werden beim Lesen blockweise (GZIP_CHUNK_SIZE) entpackt - auch hier endet
+der Scan, sobald die Seite gefüllt ist. Für die reine Auflistung genügt der Katalog
+catalog.tsv (name, bytes, mtime, disc_identifier), ohne stat() pro Datei.
+
+Suchmuster mit verschachtelten Wiederholungen (z.B. "(a+)+") werden abgelehnt,
+jede Suche endet spätestens nach SEARCH_TIME_BUDGET Sekunden - ein Muster
+kann so den gemeinsamen Thread-Pool nicht blockieren.
+"""
+
+import gzip
+import mmap
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from re import _parser as _sre_parse     # Python >= 3.11
+except ImportError:
+    import sre_parse as _sre_parse
+
+LOG_SUFFIXES = ('.log', '.log.gz')
+CATALOG_FILE = 'catalog.tsv'
+SEARCH_THREADS = min(4, os.cpu_count() or 1)
+MAX_LINE_LENGTH = 2000          # Längere Zeilen werden gekürzt ausgegeben
+MAX_PATTERN_LENGTH = 200
+SEARCH_TIME_BUDGET = 10.0       # Sekunden je Suchanfrage (alle Dateien)
+GZIP_CHUNK_SIZE = 1 << 20       # Entpackte Bytes je Block (.log.gz)
+
+# Zeitstempel am Zeilenanfang (liblogging Text/JSON, ISO-Format)
+_TS_RE = re.compile(rb'^(?:\{"ts":")?(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2})')
+
+# Schweregrad einer Zeile: liblogging-Präfixe (Text/JSON) und eindeutige
+# Fehlermeldungen der Tools. Zähler von ddrescue ("read errors: 0",
+# "error rate: 0 B/s") gelten nur mit einem Wert ungleich 0.
+SEVERITY_PATTERNS = {
+    'error': (rb'- ERROR: |"level":"error"'
+              rb'|Input/output error|I/O error|[Mm]edium [Ee]rror'
+              rb'|read errors: *[1-9]|bad areas: *[1-9]|bad-sector: *[1-9]'
+              rb'|^(?:dd|ddrescue|cdparanoia|dvdbackup|genisoimage|makemkvcon): .*(?:error|failed|[Cc]annot)'),
+    'warning': (rb'- WARNING: |"level":"warning"'
+                rb'|error rate: *[1-9]|non-trimmed: *[1-9]|non-scraped: *[1-9]'
+                rb'|^[\w.-]+: [Ww]arning'),
+    'info': rb'- INFO: |"level":"info"',
+    'debug': rb'- DEBUG: |"level":"debug"',
+}
+_SEVERITY_RE = {name: re.compile(pattern, re.MULTILINE) for name, pattern in SEVERITY_PATTERNS.items()}
+_ALL_LINES_RE = re.compile(rb'^', re.MULTILINE)
+_REPEAT_OPS = tuple(getattr(_sre_parse, name) for name in
+                    ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT') if hasattr(_sre_parse, name))
+
+_lock = threading.Lock()
+_index_lock = threading.Lock()
+_index: Dict[str, Dict] = {}     # Pfad → Eintrag
+_pool: Optional[ThreadPoolExecutor] = None
+_catalog_cache: Dict[str, Tuple] = {}   # Verzeichnis → (Stempel, Einträge)
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Liefert den gemeinsamen Thread-Pool (einmalig angelegt)."""
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=SEARCH_THREADS,
+                                           thread_name_prefix='logsearch')
+    return _pool
+
+
+def _parse_ts(match) -> Optional[float]:
+    """Wandelt einen _TS_RE-Treffer in einen Unix-Timestamp."""
+    try:
+        return datetime.strptime(f"{match.group(1).decode()} {match.group(2).decode()}",
+                                 '%Y-%m-%d %H:%M:%S').timestamp()
+    except ValueError:
+        return None
+
+
+def _read_time_range(path: str, mtime: float) -> Tuple[float, float]:
+    """
+    Ermittelt den Zeitraum einer Log-Datei.
+
+    Returns:
+        (erster Zeitstempel, Änderungszeit) - ohne Zeitstempel in der ersten
+        Zeile beginnt der Zeitraum bei der Änderungszeit
+    """
+    try:
+        with open_log(path) as f:
+            match = _TS_RE.match(f.readline(256))
+        first = _parse_ts(match) if match else None
+    except OSError:
+        first = None
+    return (first if first is not None and first <= mtime else mtime), mtime
+
+
+def open_log(path: str):
+    """Öffnet ein Log binär, gepackte Logs (.gz) werden beim Lesen entpackt."""
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+
+def tail_lines(path: str, count: int) -> List[str]:
+    """
+    Liefert die letzten Zeilen eines Logs (gepackt oder ungepackt).
+
+    Liest als Stream - es liegen nie mehr als count Zeilen im Speicher.
+    """
+    with open_log(path) as f:
+        lines = deque(f, maxlen=count)
+    return [line.decode('utf-8', errors='replace') for line in lines]
+
+
+def list_catalog(log_dir: str) -> List[Dict]:
+    """
+    Liefert die Log-Dateien aus dem Katalog (catalog.tsv), neueste zuerst.
+
+    Der Katalog wird nur neu gelesen, wenn er sich geändert hat. Fehlt er
+    (Logs älter als die Katalog-Pflege), wird das Verzeichnis indiziert.
+    Logs, die (noch) nicht im Katalog stehen - laufende oder abgebrochene
+    Kopiervorgänge -, kommen aus demselben Verzeichnis-Scan hinzu; stat()
+    nur für diese Dateien.
+
+    Returns:
+        Einträge (name, size, mtime, disc)
+    """
+    catalog = os.path.join(log_dir, CATALOG_FILE)
+    try:
+        st = os.stat(catalog)
+    except OSError:
+        return [{'name': e['name'], 'size': e['size'], 'mtime': e['mtime'], 'disc': ''}
+                for e in list_files(log_dir)]
+
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _catalog_cache.get(log_dir)
+    if cached and cached[0] == stamp:
+        result = cached[1]
+    else:
+        entries: Dict[str, Dict] = {}
+        with open(catalog, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                fields = line.rstrip('\n').split('\t')
+                if len(fields) < 3 or not fields[0].endswith(LOG_SUFFIXES):
+                    continue
+                try:
+                    entries[fields[0]] = {
+                        'name': fields[0],
+                        'size': int(fields[1]),
+                        'mtime': float(fields[2]),
+                        'disc': fields[3] if len(fields) > 3 else '',
+                    }
+                except ValueError:
+                    continue
+        result = sorted(entries.values(), key=lambda e: e['mtime'], reverse=True)
+        _catalog_cache[log_dir] = (stamp, result, set(entries))
+
+    #-- Nicht katalogisierte Logs (laufende/abgebrochene Kopien) ergänzen ---
+    known = _catalog_cache[log_dir][2]
+    extra = []
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                if (entry.name in known or not entry.name.endswith(LOG_SUFFIXES)
+                        or not entry.is_file()):
+                    continue
+                est = entry.stat()
+                extra.append({'name': entry.name, 'size': est.st_size,
+                              'mtime': est.st_mtime, 'disc': ''})
+    except OSError:
+        pass
+    if not extra:
+        return result
+    return sorted(result + extra, key=lambda e: e['mtime'], reverse=True)
+
+
+def list_files(log_dir: str) -> List[Dict]:
+    """
+    Aktualisiert den Index für ein Log-Verzeichnis.
+
+    Args:
+        log_dir: Verzeichnis mit den Kopier-Logs (<output_dir>/.log)
+
+    Returns:
+        Einträge (name, path, size, mtime, first, last), neueste zuerst
+    """
+    with _index_lock:
+        return _update_index(log_dir)
+
+
+def _update_index(log_dir: str) -> List[Dict]:
+    """Gleicht den Index mit dem Verzeichnis ab (unter _index_lock)."""
+    seen = set()
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(LOG_SUFFIXES) or not entry.is_file():
+                    continue
+                st = entry.stat()
+                seen.add(entry.path)
+                cached = _index.get(entry.path)
+                if cached and cached['mtime_ns'] == st.st_mtime_ns and cached['size'] == st.st_size:
+                    continue
+                first, last = _read_time_range(entry.path, st.st_mtime)
+                _index[entry.path] = {
+                    'name': entry.name,
+                    'path': entry.path,
+                    'size': st.st_size,
+                    'mtime_ns': st.st_mtime_ns,
+                    'mtime': st.st_mtime,
+                    'first': first,
+                    'last': last,
+                }
+    except OSError:
+        pass
+
+    prefix = os.path.join(log_dir, '')
+    for path in [p for p in _index if p.startswith(prefix) and p not in seen]:
+        del _index[path]
+
+    return sorted((e for e in _index.values() if e['path'] in seen),
+                  key=lambda e: e['mtime_ns'], reverse=True)
+
+
+def _subpatterns(value) -> Iterator:
+    """Liefert die Teilmuster eines geparsten Regex-Knotens (rekursiv)."""
+    if isinstance(value, _sre_parse.SubPattern):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _subpatterns(item)
+
+
+def _has_nested_repeat(items, in_repeat: bool = False) -> bool:
+    """
+    Prüft ein geparstes Muster auf Wiederholungen innerhalb von Wiederholungen.
+
+    Solche Muster (z.B. "(a+)+$") brauchen beim Backtracking exponentielle
+    Zeit; "?" (höchstens einmal) zählt nicht als Wiederholung.
+    """
+    for op, value in items:
+        if op in _REPEAT_OPS:
+            _, max_count, sub = value
+            repeats = max_count > 1
+            if repeats and in_repeat:
+                return True
+            if _has_nested_repeat(sub, in_repeat or repeats):
+                return True
+        else:
+            for sub in _subpatterns(value):
+                if _has_nested_repeat(sub, in_repeat):
+                    return True
+    return False
+
+
+def compile_pattern(pattern: str, ignore_case: bool = True):
+    """
+    Übersetzt das Suchmuster in eine bytes-Regex (für mmap).
+
+    Raises:
+        ValueError: Muster zu lang, ungültig oder mit verschachtelten
+                    Wiederholungen (katastrophales Backtracking)
+    """
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise ValueError(f'Suchmuster länger als {MAX_PATTERN_LENGTH} Zeichen')
+    flags = re.IGNORECASE if ignore_case else 0
+    try:
+        if _has_nested_repeat(_sre_parse.parse(pattern.encode('utf-8'), flags)):
+            raise ValueError('Suchmuster mit verschachtelten Wiederholungen (z.B. "(a+)+") '
+                             'sind nicht erlaubt')
+        return re.compile(pattern.encode('utf-8'), flags)
+    except re.error as e:
+        raise ValueError(f'Ungültiges Suchmuster: {e}')
+
+
+def _line_severity(line: bytes) -> str:
+    """
+    Ordnet einer Zeile den höchsten erkannten Schweregrad zu.
+
+    Zeilen ohne erkanntes Muster (z.B. Ausgaben der Tools) gelten als info -
+    dieselbe Regel gilt für den Schweregrad-Filter der Suche.
+    """
+    for name in ('error', 'warning', 'info', 'debug'):
+        if _SEVERITY_RE[name].search(line):
+            return name
+    return 'info'
+
+
+def _scan_file(entry: Dict, regex, severities: Optional[set],
+               date_from: Optional[float], date_to: Optional[float],
+               max_matches: int, deadline: float) -> List[Dict]:
+    """
+    Durchsucht eine Datei per mmap (gepackte Logs blockweise entpackt).
+
+    Das Muster (bzw. ohne Muster das Schweregrad-Muster) läuft direkt über den
+    gemappten Speicher; nur Trefferzeilen werden dekodiert. Nach max_matches
+    Treffern oder nach Ablauf von deadline (time.monotonic) endet der Scan.
+    """
+    matches = []
+    if entry['size'] == 0 or time.monotonic() > deadline:
+        return matches
+    scan_re = regex
+    if scan_re is None and severities and 'info' not in severities:
+        #-- info umfasst auch Zeilen ohne Muster → dann alle Zeilen prüfen --
+        scan_re = re.compile(b'|'.join(SEVERITY_PATTERNS[s] for s in severities), re.MULTILINE)
+    if scan_re is None:
+        scan_re = _ALL_LINES_RE
+
+    try:
+        if entry['path'].endswith('.gz'):
+            with open_log(entry['path']) as f:
+                return _scan_stream(entry, f, scan_re, severities, date_from, date_to,
+                                    max_matches, deadline)
+        with open(entry['path'], 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _scan_buffer(entry, mm, scan_re, severities, date_from, date_to,
+                                max_matches, deadline)
+    except (OSError, ValueError, EOFError):
+        return matches
+
+
+def _scan_stream(entry: Dict, f, scan_re, severities: Optional[set],
+                 date_from: Optional[float], date_to: Optional[float],
+                 max_matches: int, deadline: float) -> List[Dict]:
+    """
+    Sucht in einem Datenstrom (gzip) blockweise.
+
+    Jeder Block endet an einer Zeilengrenze; nur eine über den Block hinaus
+    reichende Restzeile wird mitgenommen. Zeilen ohne Umbruch werden nach
+    GZIP_CHUNK_SIZE Bytes geteilt - es liegen nie mehr als zwei Blöcke im
+    Speicher.
+    """
+    matches = []
+    rest = b''
+    first_line = 1
+    while len(matches) < max_matches and time.monotonic() <= deadline:
+        chunk = f.read(GZIP_CHUNK_SIZE)
+        data = rest + chunk
+        if chunk:
+            cut = data.rfind(b'\n') + 1
+            if cut == 0:
+                if len(data) < GZIP_CHUNK_SIZE:
+                    rest = data
+                    continue
+                cut = len(data)
+            block, rest = data[:cut], data[cut:]
+        else:
+            block, rest = data, b''
+        if block:
+            matches.extend(_scan_buffer(entry, block, scan_re, severities, date_from, date_to,
+                                        max_matches - len(matches), deadline, first_line))
+            first_line += block.count(b'\n')
+        if not chunk:
+            break
+    return matches
+
+
+def _scan_buffer(entry: Dict, mm, scan_re, severities: Optional[set],
+                 date_from: Optional[float], date_to: Optional[float],
+                 max_matches: int, deadline: float, first_line: int = 1) -> List[Dict]:
+    """Sucht in einem Puffer (mmap oder entpackter Block) zeilenweise."""
+    matches = []
+    last_end = -1
+    line_no = first_line
+    line_pos = 0
+    for count, match in enumerate(scan_re.finditer(mm)):
+        if len(matches) >= max_matches:
+            break
+        if count % 1024 == 0 and time.monotonic() > deadline:
+            break
+        if match.start() >= len(mm):
+            break                       # Leere Zeile nach letztem \n
+        start = mm.rfind(b'\n', 0, match.start()) + 1
+        if start <= last_end:
+            continue                    # Zeile bereits ausgegeben
+        end = mm.find(b'\n', match.start())
+        if end < 0:
+            end = len(mm)
+        last_end = end
+        line_no += mm[line_pos:start].count(b'\n')
+        line_pos = start
+        line = mm[start:end]
+
+        severity = _line_severity(line)
+        if severities and severity not in severities:
+            continue
+        ts_match = _TS_RE.match(line)
+        ts = _parse_ts(ts_match) if ts_match else None
+        if ts is not None:
+            if (date_from and ts < date_from) or (date_to and ts > date_to):
+                continue
+        matches.append({
+            'file': entry['name'],
+            'line': line_no,
+            'severity': severity,
+            'timestamp': datetime.fromtimestamp(ts).isoformat() if ts else None,
+            'text': line[:MAX_LINE_LENGTH].decode('utf-8', errors='replace').rstrip('\r'),
+        })
+    return matches
+
+
+def search(log_dir: str, regex=None, severities: Optional[set] = None,
+           date_from: Optional[float] = None, date_to: Optional[float] = None,
+           offset: int = 0, limit: int = 100) -> Iterator[Dict]:
+    """
+    Liefert Treffer über alle Log-Dateien (Generator, für Streaming).
+
+    Args:
+        log_dir: Log-Verzeichnis
+        regex: Kompiliertes Muster (compile_pattern) oder None
+        severities: Erlaubte Schweregrade (error, warning, info, debug)
+        date_from / date_to: Zeitraum als Unix-Timestamp
+        offset: Anzahl zu überspringender Treffer (Pagination)
+        limit: Max. Anzahl Treffer; ein zusätzlicher Treffer zeigt an,
+               dass es eine weitere Seite gibt
+
+    Nach SEARCH_TIME_BUDGET Sekunden endet die Suche mit den bis dahin
+    gefundenen Treffern.
+
+    Yields:
+        Treffer-Dicts (file, line, severity, timestamp, text)
+    """
+    files = [e for e in list_files(log_dir)
+             if not (date_from and e['last'] < date_from)
+             and not (date_to and e['first'] > date_to)]
+    pool = _get_pool()
+    wanted = offset + limit + 1
+    found = 0
+    deadline = time.monotonic() + SEARCH_TIME_BUDGET
+
+    #-- Dateien blockweise parallel scannen, Ausgabe in fester Reihenfolge --
+    for i in range(0, len(files), SEARCH_THREADS):
+        if time.monotonic() > deadline:
+            return
+        batch = files[i:i + SEARCH_THREADS]
+        futures = [pool.submit(_scan_file, e, regex, severities, date_from, date_to,
+                               wanted - found, deadline)
+                   for e in batch]
+        for future in futures:
+            for match in future.result():
+                if found >= offset:
+                    yield match
+                found += 1
+                if found >= wanted:
+                    for rest in futures:
+                        rest.cancel()
+                    return
@@ -7,6 +7,7 @@ import os
 import sys
 from flask import Blueprint, render_template, jsonify
 from i18n import t
+from settings_cache import get_conf_value
 
 # Blueprint für Common Settings Widget
 common_settings_bp = Blueprint('common_settings', __name__)
@@ -14,39 +15,17 @@ common_settings_bp = Blueprint('common_settings', __name__)
 def get_common_settings():
     """
     Liest Common-Einstellungen via libsettings.sh (BASH)
-    Python = Middleware ONLY - keine direkten File-Zugriffe!
+    Python = Middleware ONLY - Werte kommen aus settings_cache
+    (ein settings_export_json pro Dateiänderung statt bash pro Wert)
     """
     try:
-        import subprocess
-        
-        script = """
-        source /opt/disk2iso/lib/libsettings.sh
-        settings_get_value_conf "disk2iso" "DDRESCUE_RETRIES" "1"
-        """
-        
-        result = subprocess.run(
-            ['/bin/bash', '-c', script],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
+        ddrescue_retries = int(get_conf_value("DDRESCUE_RETRIES", "1"))
+    except ValueError:
         ddrescue_retries = 1
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                ddrescue_retries = int(result.stdout.strip())
-            except ValueError:
-                pass
-        
-        return {
-            "ddrescue_retries": ddrescue_retries,
-        }
-        
-    except Exception as e:
-        print(f"Fehler beim Lesen der Common-Einstellungen: {e}", file=sys.stderr)
-        return {
-            "ddrescue_retries": 1,
-        }
+    
+    return {
+        "ddrescue_retries": ddrescue_retries,
+    }
 
 
 @common_settings_bp.route('/api/widgets/common/settings')
@@ -9,15 +9,14 @@ Filepath: www/routes/widgets/softwarecheck_systeminfo.py
 Beschreibung:
     Flask Blueprint für Software-Check-Widget
     - Kompakte Übersicht: Alle Dependencies aktuell ✅ oder Updates verfügbar ⚠️
-    - Nutzt systeminfo_get_software_info() aus libsysteminfo.sh
+    - Nutzt das Software-Inventar (software_inventory.py, gecacht bis
+      sich dpkg-Status oder apt-Listen ändern)
 ============================================================================
 """
 
 from flask import Blueprint, jsonify
-import subprocess
-import json
-import os
 from datetime import datetime
+import software_inventory
 
 # Blueprint erstellen
 softwarecheck_systeminfo_bp = Blueprint(
@@ -26,23 +25,13 @@ softwarecheck_systeminfo_bp = Blueprint(
     url_prefix='/api/widgets/systeminfo'
 )
 
-# Pfade
-INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
-
 
 def get_software_info():
     """
-    Ruft Software-Informationen via Bash-Funktion ab
-    Nutzt systeminfo_get_software_info() aus libsysteminfo.sh
+    Liefert die Software-Übersicht nach Kategorien aus dem Software-Inventar
     """
     try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/libsysteminfo.sh && systeminfo_get_software_info'],
-            capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout.strip())
-        return {}
+        return software_inventory.get_software_info()
     except Exception as e:
         print(f"Fehler beim Abrufen von Software-Informationen: {e}")
         return {}
@@ -15,9 +15,9 @@ Beschreibung:
 
 from flask import Blueprint, jsonify
 import subprocess
-import json
 import os
 from datetime import datetime
+import service_state
 
 # Blueprint erstellen
 status_disk2iso_bp = Blueprint(
@@ -33,29 +33,9 @@ INSTALL_DIR = os.environ.get('DISK2ISO_INSTALL_DIR', '/opt/disk2iso')
 def get_disk2iso_service_status():
     """
     Ruft Status des disk2iso Service ab
-    Nutzt service_get_status() aus libservice.sh
+    Liest den Stand aus service_state (systemd-Bus, Fallback Polling)
     """
-    try:
-        result = subprocess.run(
-            ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libfolders.sh && source {INSTALL_DIR}/lib/libsettings.sh && source {INSTALL_DIR}/lib/libservice.sh && service_get_status "disk2iso"'],
-            capture_output=True, text=True, timeout=5
-        )
-        
-        if result.returncode == 0:
-            return json.loads(result.stdout.strip())
-        return {
-            'status': 'unknown',
-            'running': False,
-            'enabled': False
-        }
-    except Exception as e:
-        print(f"Fehler beim Abrufen des disk2iso Service-Status: {e}")
-        return {
-            'status': 'error',
-            'running': False,
-            'enabled': False,
-            'error': str(e)
-        }
+    return service_state.get_unit_status("disk2iso")
 
 
 @status_disk2iso_bp.route('/status')
@@ -85,6 +65,7 @@ def api_disk2iso_restart():
             ['bash', '-c', f'source {INSTALL_DIR}/lib/liblogging.sh && source {INSTALL_DIR}/lib/libservice.sh && service_restart "disk2iso"'],
             capture_output=True, text=True, timeout=10
         )
+        service_state.refresh("disk2iso")
         
         if result.returncode == 0:
             return jsonify({
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Service State - Unit-Status aus dem systemd-Bus
+Version 1.3.0 - 18.10.2026
+
+Ein residenter Thread abonniert Zustandsänderungen der disk2iso-Units
+über den System-D-Bus (PropertiesChanged unterhalb von
+/org/freedesktop/systemd1/unit) und hält den aktuellen Stand im Speicher.
+Alle Status-Endpoints lesen nur noch diesen Stand; api/service_status.json
+wird bei jeder Änderung geschrieben.
+
+Vorher: systemctl list-unit-files + is-active pro Seitenaufruf und je
+Unit, zusätzlich alle 30s aus dem Updater-Timer.
+
+Das venv enthält kein dbus-Paket - das benötigte Minimum des D-Bus-
+Protokolls (SASL EXTERNAL, Methodenaufruf, Signal-Unmarshalling) ist hier
+mit der Standardbibliothek umgesetzt. Ist der Bus nicht erreichbar, fragt
+der Thread alle POLL_SECONDS mit EINEM systemctl-Aufruf für alle Units ab
+und versucht den Bus nach BUS_RETRY_SECONDS erneut.
+"""
+
+import binascii
+import json
+import os
+import re
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+SYSTEMCTL = '/usr/bin/systemctl'
+SYSTEM_BUS_SOCKET = '/run/dbus/system_bus_socket'
+
+SYSTEMD_SERVICE = 'org.freedesktop.systemd1'
+SYSTEMD_PATH = '/org/freedesktop/systemd1'
+SYSTEMD_MANAGER = 'org.freedesktop.systemd1.Manager'
+SYSTEMD_UNIT = 'org.freedesktop.systemd1.Unit'
+UNIT_PATH_PREFIX = '/org/freedesktop/systemd1/unit/'
+
+# Units in api/service_status.json (Schlüssel wie service_collect_status_info)
+STATUS_FILE_UNITS = ('disk2iso', 'disk2iso-web', 'disk2iso-volatile-updater')
+
+# Einzige abfragbare Units - feste Liste, der Poll-Aufruf wächst nicht mit
+# beliebigen Namen aus /api/service/status/<name>
+KNOWN_UNITS = STATUS_FILE_UNITS + ('disk2iso-updater',)
+
+POLL_SECONDS = 10
+BUS_RETRY_SECONDS = 60
+
+_lock = threading.Lock()
+_start_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_units: Dict[str, Dict[str, str]] = {}
+_watched = set(KNOWN_UNITS)
+_source = 'poll'
+_status_file_getter: Optional[Callable[[], str]] = None
+_last_written: Optional[Dict] = None
+
+
+# ============================================================================
+# D-BUS MINIMAL-CLIENT
+# ============================================================================
+
+# Typcode -> (struct-Format, Alignment) für Typen fester Größe
+_FIXED = {
+    'y': ('B', 1), 'b': ('I', 4), 'n': ('h', 2), 'q': ('H', 2),
+    'i': ('i', 4), 'u': ('I', 4), 'x': ('q', 8), 't': ('Q', 8),
+    'd': ('d', 8), 'h': ('I', 4),
+}
+_ALIGN = {'s': 4, 'o': 4, 'g': 1, 'v': 1, 'a': 4, '(': 8, '{': 8}
+
+_HEADER_PATH = 1
+_HEADER_INTERFACE = 2
+_HEADER_MEMBER = 3
+_HEADER_DESTINATION = 6
+_HEADER_SIGNATURE = 8
+
+_MSG_METHOD_CALL = 1
+_MSG_ERROR = 3
+_MSG_SIGNAL = 4
+
+
+def _padded(length: int, alignment: int) -> int:
+    return (length + alignment - 1) // alignment * alignment
+
+
+def _type_end(sig: str, i: int) -> int:
+    """Liefert den Index hinter dem vollständigen Typ ab sig[i]."""
+    if sig[i] == 'a':
+        return _type_end(sig, i + 1)
+    if sig[i] in '({':
+        depth = 0
+        for j in range(i, len(sig)):
+            if sig[j] in '({':
+                depth += 1
+            elif sig[j] in ')}':
+                depth -= 1
+                if depth == 0:
+                    return j + 1
+        raise ValueError(f'Ungültige Signatur: {sig}')
+    return i + 1
+
+
+class _Reader:
+    """Liest D-Bus-Werte aus einer Nachricht (Alignment relativ zum Anfang)."""
+
+    def __init__(self, data: bytes, pos: int, endian: str):
+        self.data = data
+        self.pos = pos
+        self.endian = endian
+
+    def _align(self, alignment: int) -> None:
+        self.pos = _padded(self.pos, alignment)
+
+    def _unpack(self, fmt: str, size: int):
+        value = struct.unpack_from(self.endian + fmt, self.data, self.pos)[0]
+        self.pos += size
+        return value
+
+    def read(self, sig: str, i: int = 0) -> Tuple[object, int]:
+        """Liest einen Wert vom Typ sig[i:]; liefert (Wert, Index danach)."""
+        code = sig[i]
+        if code in _FIXED:
+            fmt, size = _FIXED[code]
+            self._align(size)
+            value = self._unpack(fmt, size)
+            return (bool(value) if code == 'b' else value), i + 1
+        if code in 'so':
+            self._align(4)
+            length = self._unpack('I', 4)
+            value = self.data[self.pos:self.pos + length].decode('utf-8', 'replace')
+            self.pos += length + 1
+            return value, i + 1
+        if code == 'g':
+            length = self.data[self.pos]
+            value = self.data[self.pos + 1:self.pos + 1 + length].decode('ascii', 'replace')
+            self.pos += length + 2
+            return value, i + 1
+        if code == 'v':
+            inner, _ = self.read('g')
+            value, _ = self.read(inner)
+            return value, i + 1
+        if code == 'a':
+            self._align(4)
+            length = self._unpack('I', 4)
+            end_index = _type_end(sig, i + 1)
+            element = sig[i + 1:end_index]
+            self._align(_ALIGN.get(element[0], _FIXED.get(element[0], ('', 1))[1]))
+            end = self.pos + length
+            if element[0] == '{':
+                result = {}
+                while self.pos < end:
+                    self._align(8)
+                    key, k = self.read(element, 1)
+                    result[key], _ = self.read(element, k)
+                return result, end_index
+            items = []
+            while self.pos < end:
+                item, _ = self.read(element)
+                items.append(item)
+            return items, end_index
+        if code == '(':
+            self._align(8)
+            items = []
+            k = i + 1
+            while sig[k] != ')':
+                item, k = self.read(sig, k)
+                items.append(item)
+            return tuple(items), k + 1
+        raise ValueError(f'Nicht unterstützter D-Bus-Typ: {code}')
+
+
+class _Writer:
+    """Schreibt D-Bus-Werte (nur was für Methodenaufrufe nötig ist)."""
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def align(self, alignment: int) -> None:
+        self.buf += b'\0' * (_padded(len(self.buf), alignment) - len(self.buf))
+
+    def uint32(self, value: int) -> None:
+        self.align(4)
+        self.buf += struct.pack('<I', value)
+
+    def string(self, value: str) -> None:
+        data = value.encode('utf-8')
+        self.uint32(len(data))
+        self.buf += data + b'\0'
+
+    def signature(self, value: str) -> None:
+        data = value.encode('ascii')
+        self.buf.append(len(data))
+        self.buf += data + b'\0'
+
+
+class _BusMessage:
+    def __init__(self, msg_type: int, headers: Dict[int, object], body: List[object]):
+        self.type = msg_type
+        self.path = headers.get(_HEADER_PATH, '')
+        self.interface = headers.get(_HEADER_INTERFACE, '')
+        self.member = headers.get(_HEADER_MEMBER, '')
+        self.body = body
+
+
+class _BusConnection:
+    """Verbindung zum System-Bus: Anmeldung, Methodenaufrufe, Nachrichten lesen."""
+
+    def __init__(self):
+        address = os.environ.get('DBUS_SYSTEM_BUS_ADDRESS', '')
+        path = SYSTEM_BUS_SOCKET
+        if address.startswith('unix:path='):
+            path = address[len('unix:path='):].split(',', 1)[0]
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(5)
+        self.sock.connect(path)
+        self._buffer = b''
+        self._serial = 0
+        self._authenticate()
+        self.call('/org/freedesktop/DBus', 'org.freedesktop.DBus', 'Hello',
+                  'org.freedesktop.DBus')
+
+    def close(self) -> None:
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def _authenticate(self) -> None:
+        uid = binascii.hexlify(str(os.getuid()).encode('ascii'))
+        self.sock.sendall(b'\0AUTH EXTERNAL ' + uid + b'\r\n')
+        while b'\r\n' not in self._buffer:
+            self._recv_more()
+        line, self._buffer = self._buffer.split(b'\r\n', 1)
+        if not line.startswith(b'OK '):
+            raise ConnectionError(f'D-Bus Anmeldung abgelehnt: {line!r}')
+        self.sock.sendall(b'BEGIN\r\n')
+
+    def _recv_more(self) -> None:
+        chunk = self.sock.recv(65536)
+        if not chunk:
+            raise ConnectionError('D-Bus Verbindung geschlossen')
+        self._buffer += chunk
+
+    def call(self, path: str, interface: str, member: str, destination: str,
+             *args: str) -> None:
+        """Sendet einen Methodenaufruf (nur String-Argumente, Antwort wird nicht abgewartet)."""
+        self._serial += 1
+        body = _Writer()
+        for arg in args:
+            body.string(arg)
+        fields = [(_HEADER_PATH, 'o', path), (_HEADER_INTERFACE, 's', interface),
+                  (_HEADER_MEMBER, 's', member), (_HEADER_DESTINATION, 's', destination)]
+        if args:
+            fields.append((_HEADER_SIGNATURE, 'g', 's' * len(args)))
+
+        msg = _Writer()
+        msg.buf += bytes([ord('l'), _MSG_METHOD_CALL, 0, 1])
+        msg.uint32(len(body.buf))
+        msg.uint32(self._serial)
+        msg.uint32(0)                                # Länge Header-Array (unten)
+        for code, type_code, value in fields:
+            msg.align(8)
+            msg.buf.append(code)
+            msg.signature(type_code)
+            if type_code == 'g':
+                msg.signature(value)
+            else:
+                msg.string(value)
+        struct.pack_into('<I', msg.buf, 12, len(msg.buf) - 16)
+        msg.align(8)
+        self.sock.sendall(bytes(msg.buf + body.buf))
+
+    def read_message(self, timeout: Optional[float] = None) -> _BusMessage:
+        """Liest die nächste Nachricht (blockiert ohne timeout unbegrenzt)."""
+        self.sock.settimeout(timeout)
+        while len(self._buffer) < 16:
+            self._recv_more()
+        endian = '<' if self._buffer[0:1] == b'l' else '>'
+        body_length, _, fields_length = struct.unpack_from(endian + 'III', self._buffer, 4)
+        total = _padded(16 + fields_length, 8) + body_length
+        while len(self._buffer) < total:
+            self._recv_more()
+        data, self._buffer = self._buffer[:total], self._buffer[total:]
+
+        reader = _Reader(data, 12, endian)
+        raw_fields, _ = reader.read('a(yv)')
+        headers = {code: value for code, value in raw_fields}
+        body: List[object] = []
+        signature = headers.get(_HEADER_SIGNATURE, '')
+        reader.pos = _padded(16 + fields_length, 8)
+        index = 0
+        while index < len(signature):
+            value, index = reader.read(signature, index)
+            body.append(value)
+        return _BusMessage(data[1], headers, body)
+
+
+def _unescape_unit_path(label: str) -> str:
+    """Wandelt systemd-Objektpfade zurück (disk2iso_2dweb_2eservice -> disk2iso-web.service)."""
+    return re.sub(r'_([0-9a-fA-F]{2})', lambda m: chr(int(m.group(1), 16)), label)
+
+
+# ============================================================================
+# ZUSTAND
+# ============================================================================
+
+def _poll(names: List[str]) -> None:
+    """
+    Fragt Load-/Active-/UnitFileState der Units mit EINEM systemctl-Aufruf ab.
+
+    Args:
+        names: Service-Namen ohne .service Endung
+    """
+    if not names:
+        return
+    result = subprocess.run(
+        [SYSTEMCTL, 'show', '-p', 'Id', '-p', 'LoadState', '-p', 'ActiveState',
+         '-p', 'UnitFileState'] + [f'{name}.service' for name in names],
+        capture_output=True, text=True, timeout=5
+    )
+    # systemctl show trennt die Units durch Leerzeilen, Zuordnung über Id=
+    now = datetime.now().astimezone().isoformat(timespec='seconds')
+    with _lock:
+        # Ohne Antwort (kein systemd) gilt die Unit als nicht installiert
+        for name in names:
+            _units[name] = {'load_state': '', 'active_state': '',
+                            'unit_file_state': '', 'timestamp': now}
+        for block in result.stdout.strip().split('\n\n'):
+            props = dict(line.split('=', 1) for line in block.splitlines() if '=' in line)
+            name = props.get('Id', '')[:-len('.service')]
+            if name not in names:
+                continue
+            _units[name] = {
+                'load_state': props.get('LoadState', ''),
+                'active_state': props.get('ActiveState', ''),
+                'unit_file_state': props.get('UnitFileState', ''),
+                'timestamp': now,
+            }
+
+
+def _to_status(name: str, state: Optional[Dict[str, str]]) -> Dict:
+    """
+    Bildet den Unit-Zustand auf das Format von service_get_status ab.
+
+    Ohne Zustand (unbekannte Unit) bleibt das Format vollständig, mit
+    active_state 'unknown' und leerem timestamp.
+    """
+    if not state:
+        return {
+            'status': 'error' if name in KNOWN_UNITS else 'not_installed',
+            'running': False,
+            'enabled': False,
+            'active_state': 'unknown',
+            'timestamp': '',
+            'source': _source,
+        }
+    if state['load_state'] in ('', 'not-found'):
+        status = 'not_installed'
+    elif state['active_state'] == 'active':
+        status = 'active'
+    elif state['active_state'] == 'failed':
+        status = 'error'
+    else:
+        status = 'inactive'
+    return {
+        'status': status,
+        'running': status == 'active',
+        'enabled': state['unit_file_state'] == 'enabled',
+        'active_state': state['active_state'] or 'unknown',
+        'timestamp': state['timestamp'],
+        'source': _source,
+    }
+
+
+def _write_status_file() -> None:
+    """Schreibt api/service_status.json atomar, wenn sich etwas geändert hat."""
+    global _last_written
+    if _status_file_getter is None:
+        return
+    with _lock:
+        services = {name: _to_status(name, _units.get(name)) for name in STATUS_FILE_UNITS}
+    snapshot = {name: (s['status'], s.get('enabled')) for name, s in services.items()}
+    snapshot['source'] = _source
+    if snapshot == _last_written:
+        return
+
+    # Layout wie service_collect_status_info: ein Service pro Zeile
+    lines = [f'  "{name}": {json.dumps(status, separators=(",", ":"))},'
+             for name, status in services.items()]
+    lines.append(f'  "source": "{_source}",')
+    lines.append(f'  "watcher_pid": {os.getpid()},')
+    lines.append(f'  "timestamp": "{datetime.now().astimezone().isoformat(timespec="seconds")}"')
+    try:
+        path = str(_status_file_getter())
+        tmp = f'{path}.tmp.{os.getpid()}'
+        with open(tmp, 'w') as f:
+            f.write('{\n' + '\n'.join(lines) + '\n}\n')
+        os.replace(tmp, path)
+        _last_written = snapshot
+    except OSError as e:
+        print(f"Fehler beim Schreiben von service_status.json: {e}", file=sys.stderr)
+
+
+def _handle_signal(msg: _BusMessage) -> None:
+    """Übernimmt Zustandsänderungen aus einem systemd-Signal."""
+    if msg.member == 'PropertiesChanged' and msg.path.startswith(UNIT_PATH_PREFIX):
+        unit = _unescape_unit_path(msg.path[len(UNIT_PATH_PREFIX):])
+        name = unit[:-len('.service')] if unit.endswith('.service') else None
+        if name not in _watched or len(msg.body) < 3 or msg.body[0] != SYSTEMD_UNIT:
+            return
+        changed, invalidated = msg.body[1], msg.body[2]
+        if any(key in invalidated for key in ('LoadState', 'ActiveState')):
+            _poll([name])
+        elif 'LoadState' in changed or 'ActiveState' in changed:
+            now = datetime.now().astimezone().isoformat(timespec='seconds')
+            with _lock:
+                state = _units.setdefault(name, {'load_state': '', 'active_state': '',
+                                                 'unit_file_state': '', 'timestamp': now})
+                state['load_state'] = changed.get('LoadState', state['load_state'])
+                state['active_state'] = changed.get('ActiveState', state['active_state'])
+                state['timestamp'] = now
+        _write_status_file()
+    elif msg.interface == SYSTEMD_MANAGER:
+        if msg.member in ('UnitNew', 'UnitRemoved') and msg.body:
+            unit = str(msg.body[0])
+            name = unit[:-len('.service')] if unit.endswith('.service') else None
+            if name in _watched:
+                _poll([name])
+                _write_status_file()
+        elif msg.member in ('UnitFilesChanged', 'Reloading'):
+            # enable/disable, daemon-reload: UnitFileState kommt nicht per Signal
+            _poll(sorted(_watched))
+            _write_status_file()
+
+
+def _follow_bus() -> None:
+    """Abonniert systemd-Signale und verarbeitet sie, bis die Verbindung abbricht."""
+    global _source
+    conn = _BusConnection()
+    try:
+        conn.call('/org/freedesktop/DBus', 'org.freedesktop.DBus', 'AddMatch',
+                  'org.freedesktop.DBus',
+                  f"type='signal',sender='{SYSTEMD_SERVICE}',"
+                  f"interface='org.freedesktop.DBus.Properties',member='PropertiesChanged',"
+                  f"path_namespace='{UNIT_PATH_PREFIX.rstrip('/')}'")
+        conn.call('/org/freedesktop/DBus', 'org.freedesktop.DBus', 'AddMatch',
+                  'org.freedesktop.DBus',
+                  f"type='signal',sender='{SYSTEMD_SERVICE}',interface='{SYSTEMD_MANAGER}'")
+        # Ohne Subscribe sendet systemd keine Unit-Signale an fremde Clients
+        conn.call(SYSTEMD_PATH, SYSTEMD_MANAGER, 'Subscribe', SYSTEMD_SERVICE)
+
+        # Erste Antworten abwarten: Fehler (z.B. Zugriff verweigert) -> Fallback
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            try:
+                msg = conn.read_message(timeout=max(0.1, deadline - time.monotonic()))
+            except socket.timeout:
+                break
+            if msg.type == _MSG_ERROR:
+                raise ConnectionError(f'D-Bus Fehler: {msg.body[0] if msg.body else "?"}')
+            if msg.type == _MSG_SIGNAL:
+                _handle_signal(msg)
+
+        _source = 'dbus'
+        _poll(sorted(_watched))              # Ausgangsstand nach dem Abonnieren
+        _write_status_file()
+        print("Service-Status: systemd-Bus abonniert", file=sys.stderr)
+
+        while True:
+            msg = conn.read_message()
+            if msg.type == _MSG_SIGNAL:
+                _handle_signal(msg)
+    finally:
+        conn.close()
+
+
+def _run() -> None:
+    """Thread-Hauptschleife: Bus abonnieren, bei Fehlern Polling als Fallback."""
+    global _source
+    while True:
+        try:
+            _follow_bus()
+        except Exception as e:
+            if _source != 'poll' or not _units:
+                print(f"Service-Status: systemd-Bus nicht verfügbar ({e}) - Fallback Polling",
+                      file=sys.stderr)
+            _source = 'poll'
+
+        deadline = time.monotonic() + BUS_RETRY_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                _poll(sorted(_watched))
+                _write_status_file()
+            except Exception as e:
+                print(f"Service-Status: systemctl fehlgeschlagen ({e})", file=sys.stderr)
+            time.sleep(POLL_SECONDS)
+
+
+def configure(status_file_getter: Callable[[], str]) -> None:
+    """
+    Legt fest, wohin service_status.json geschrieben wird.
+
+    Args:
+        status_file_getter: Liefert den Pfad (API-Verzeichnis kann wechseln)
+    """
+    global _status_file_getter
+    _status_file_getter = status_file_getter
+
+
+def start() -> None:
+    """Startet den residenten Thread (idempotent)."""
+    global _thread
+    with _start_lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        try:
+            _poll(sorted(_watched))          # sofort gültiger Stand für erste Anfragen
+        except Exception as e:
+            print(f"Service-Status: systemctl fehlgeschlagen ({e})", file=sys.stderr)
+        _thread = threading.Thread(target=_run, name='service-state', daemon=True)
+        _thread.start()
+
+
+def get_unit_status(name: str) -> Dict:
+    """
+    Liefert den Status eines Service aus dem Speicher.
+
+    Args:
+        name: Service-Name ohne .service Endung (nur KNOWN_UNITS)
+
+    Returns:
+        dict mit 'status' (not_installed|inactive|active|error), 'running',
+        'enabled', 'active_state', 'timestamp' und 'source' (dbus|poll);
+        unbekannte Namen gelten als not_installed
+    """
+    if name not in KNOWN_UNITS:
+        return _to_status(name, None)
+    start()
+    with _lock:
+        state = _units.get(name)
+    return _to_status(name, state)
+
+
+def refresh(name: str) -> None:
+    """Fragt eine Unit sofort neu ab (z.B. nach einem Neustart im Polling-Betrieb)."""
+    if _source == 'poll' and name in KNOWN_UNITS:
+        try:
+            _poll([name])
+            _write_status_file()
+        except Exception as e:
+            print(f"Service-Status: systemctl fehlgeschlagen ({e})", file=sys.stderr)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Settings Cache - Werte aus disk2iso.conf und Modul-INIs
+Version 1.3.0 - 18.10.2026
+
+Architektur-Prinzip bleibt: BASH = Settings-Logic, Python = Middleware.
+Das Parsen übernimmt libsettings.sh (settings_export_json). Python ruft
+diesen Export EINMAL auf und hält das Ergebnis im Speicher, bis sich eine
+Datei in conf/ ändert (Änderungszeit/Größe per os.stat, kein Parsen).
+Vorher: ein bash+awk Prozess pro Wert und Seitenaufruf.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from typing import Dict, Optional, Tuple
+
+# Basis-Pfade relativ zu diesem Modul (wie i18n.py)
+INSTALL_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CONF_DIR = os.path.join(INSTALL_DIR, 'conf')
+LIBSETTINGS = os.path.join(INSTALL_DIR, 'lib', 'libsettings.sh')
+
+_lock = threading.Lock()
+_stamp: Optional[Tuple] = None
+_conf: Dict[str, str] = {}
+_ini: Dict[str, str] = {}
+
+
+def _conf_stamp() -> Tuple:
+    """
+    Ermittelt Name, Änderungszeit und Größe aller .conf/.ini Dateien.
+
+    Returns:
+        Tuple als Cache-Schlüssel (ändert sich bei jeder Dateiänderung)
+    """
+    entries = []
+    try:
+        with os.scandir(CONF_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(('.conf', '.ini')):
+                    st = entry.stat()
+                    entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(sorted(entries))
+
+
+def _export() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Liest alle Settings in einem Bash-Aufruf (settings_export_json).
+
+    Returns:
+        (conf, ini) mit Schlüsseln "modul|KEY" bzw. "modul|sektion|key"
+    """
+    script = f'SCRIPT_DIR="{INSTALL_DIR}"; source "{LIBSETTINGS}" && settings_export_json'
+    result = subprocess.run(['/bin/bash', '-c', script],
+                            capture_output=True, text=True, timeout=5)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or 'settings_export_json fehlgeschlagen')
+    data = json.loads(result.stdout)
+    return data.get('conf', {}), data.get('ini', {})
+
+
+def _ensure() -> None:
+    """Aktualisiert den Cache, wenn sich eine Datei in conf/ geändert hat."""
+    global _stamp, _conf, _ini
+
+    stamp = _conf_stamp()
+    if stamp == _stamp:
+        return
+    with _lock:
+        if stamp == _stamp:
+            return
+        try:
+            _conf, _ini = _export()
+            _stamp = stamp
+        except Exception as e:
+            # Alten Stand behalten, beim nächsten Aufruf erneut versuchen
+            print(f"Fehler beim Lesen der Settings: {e}", file=sys.stderr)
+
+
+def invalidate() -> None:
+    """Verwirft den Cache (z.B. nach einem Schreibzugriff über Bash)."""
+    global _stamp
+    _stamp = None
+
+
+def get_conf_value(key: str, default: str = "", module: str = "disk2iso") -> str:
+    """
+    Liest einen Wert aus einer .conf Datei (Standard: disk2iso.conf).
+
+    Args:
+        key: Name der Einstellung (z.B. DDRESCUE_RETRIES)
+        default: Fallback, wenn der Wert fehlt oder leer ist
+        module: Name der .conf ohne Suffix
+
+    Returns:
+        Wert als String (Quotes/Kommentare bereits durch libsettings entfernt)
+    """
+    _ensure()
+    value = _conf.get(f"{module}|{key}", "")
+    return value if value != "" else default
+
+
+def get_ini_value(module: str, section: str, key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Liest einen Wert aus einem Modul-Manifest (conf/lib<modul>.ini).
+
+    Args:
+        module: Modulname ohne Präfix (z.B. "audio")
+        section: INI-Sektion (z.B. "module")
+        key: Schlüssel (z.B. "enabled")
+        default: Fallback, wenn der Wert fehlt oder leer ist
+
+    Returns:
+        Wert als String oder default
+    """
+    _ensure()
+    value = _ini.get(f"{module}|{section}|{key}", "")
+    return value if value != "" else default
+
+
+def get_ini_bool(module: str, section: str, key: str, default: bool = False) -> bool:
+    """Wie get_ini_value, interpretiert den Wert als Boolean (true/1/yes/on)."""
+    value = get_ini_value(module, section, key)
+    if value is None:
+        return default
+    return value.lower() in ('true', '1', 'yes', 'on')
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk2iso Software Inventory - Versionsstand der benötigten Software
+Version 1.3.0 - 18.10.2026
+
+Installierte und verfügbare Versionen ändern sich nur, wenn Pakete
+installiert/aktualisiert oder die Paketlisten neu geladen werden. Der
+Inventar-Cache ist deshalb an die Änderungszeit der dpkg-Statusdatenbank,
+der apt-Listen, der Programmverzeichnisse und des venv gebunden (os.stat,
+kein Prozess) und wird nur nach einer Änderung neu ermittelt.
+
+Die Neuermittlung läuft nebenläufig in einem begrenzten Thread-Pool:
+EIN dpkg-query und EIN apt-cache policy für alle Pakete, die
+--version-Aufrufe der Programme parallel, Python-Module per
+importlib.metadata im Prozess.
+
+Vorher: pro Tool und Seitenaufruf seriell dpkg -s, apt-cache policy,
+<tool> --version bzw. python3 -c "import ..." (mehrere Sekunden).
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import sysconfig
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from settings_cache import get_ini_value
+
+# Obergrenze gleichzeitiger Prüf-Prozesse
+PROBE_WORKERS = 6
+PROBE_TIMEOUT = 3
+
+# Änderungen an diesen Pfaden verwerfen den Cache
+STAMP_PATHS = (
+    '/var/lib/dpkg/status',
+    '/var/lib/apt/lists',
+    '/usr/bin',
+    '/usr/sbin',
+    '/usr/local/bin',
+    sysconfig.get_paths().get('purelib', ''),
+)
+
+# Tools mit abweichendem Versions-Parameter
+VERSION_ARGS = {
+    'abcde': ['-v'],
+    'mosquitto': ['-h'],
+}
+
+# Abhängigkeiten, die Python-Module sind (kein Programm im PATH)
+PYTHON_MODULES = ('flask', 'musicbrainzngs', 'requests')
+
+_VERSION_RE = re.compile(r'(\d+\.\d+(?:\.\d+)?)')
+
+
+class _Probe(NamedTuple):
+    """Eine zu prüfende Software: Paket, Versions-Kommando, Python-Modul."""
+    package: Optional[str]
+    command: Optional[Tuple[str, ...]]
+    python_module: Optional[str]
+
+
+def _catalog_entry(name: str, display_name: str, package: Optional[str],
+                   command: Optional[List[str]] = None,
+                   python_module: Optional[str] = None) -> Dict:
+    return {
+        'name': name,
+        'display_name': display_name,
+        'probe': _Probe(package, tuple(command) if command else None, python_module),
+    }
+
+
+# Software-Übersicht (Widgets softwarecheck/dependencies, check_software_versions)
+CATALOG = {
+    'audio': [
+        _catalog_entry('cdparanoia', 'cdparanoia', 'cdparanoia', ['cdparanoia', '--version']),
+        _catalog_entry('abcde', 'abcde', 'abcde', ['abcde', '-v']),
+        _catalog_entry('lame', 'LAME MP3 Encoder', 'lame', ['lame', '--version']),
+        _catalog_entry('flac', 'FLAC', 'flac', ['flac', '--version']),
+        _catalog_entry('vorbis-tools', 'Vorbis Tools', 'vorbis-tools'),
+    ],
+    'video': [
+        _catalog_entry('makemkv', 'MakeMKV', 'makemkv-bin', ['makemkvcon', '--version']),
+        _catalog_entry('dvdbackup', 'dvdbackup', 'dvdbackup'),
+        _catalog_entry('libbluray', 'libbluray', 'libbluray2'),
+    ],
+    'system': [
+        _catalog_entry('ddrescue', 'GNU ddrescue', 'gddrescue', ['ddrescue', '--version']),
+        _catalog_entry('wodim', 'wodim', 'wodim', ['wodim', '--version']),
+        _catalog_entry('genisoimage', 'genisoimage', 'genisoimage', ['genisoimage', '--version']),
+        _catalog_entry('isoinfo', 'isoinfo', 'genisoimage', ['isoinfo', '--version']),
+    ],
+    'services': [
+        _catalog_entry('python', 'Python', 'python3', ['python3', '--version']),
+        _catalog_entry('flask', 'Flask', None, python_module='flask'),
+        _catalog_entry('mosquitto', 'Mosquitto', 'mosquitto', ['mosquitto', '-h']),
+    ],
+}
+
+_lock = threading.Lock()
+_stamp: Optional[Tuple] = None
+_results: Dict[_Probe, Dict] = {}
+
+
+def _inventory_stamp() -> Tuple:
+    """
+    Ermittelt Änderungszeit und Größe der Paket-Datenbanken.
+
+    Returns:
+        Tuple als Cache-Schlüssel (ändert sich bei jeder Paketänderung)
+    """
+    entries = []
+    for path in STAMP_PATHS:
+        if not path:
+            continue
+        try:
+            st = os.stat(path)
+            entries.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            entries.append((path, None, None))
+    return tuple(entries)
+
+
+def _short_version(version: Optional[str]) -> Optional[str]:
+    """Kürzt Debian-Versionsnummern (Epoche, Revision, +Suffix)."""
+    if not version:
+        return None
+    version = version.split(':', 1)[-1]
+    return version.split('-')[0].split('+')[0]
+
+
+def _dpkg_versions(packages: List[str]) -> Dict[str, str]:
+    """
+    Installierte Paketversionen mit EINEM dpkg-query.
+
+    Args:
+        packages: Paketnamen
+
+    Returns:
+        {paket: version} nur für installierte Pakete
+    """
+    if not packages or not shutil.which('dpkg-query'):
+        return {}
+    try:
+        result = subprocess.run(
+            ['dpkg-query', '-W', '--showformat=${Package}\t${db:Status-Abbrev}\t${Version}\n', *packages],
+            capture_output=True, text=True, timeout=PROBE_TIMEOUT * 2, stdin=subprocess.DEVNULL
+        )
+    except Exception as e:
+        print(f"Fehler bei dpkg-query: {e}", file=sys.stderr)
+        return {}
+
+    # Returncode 1 = einzelne Pakete unbekannt, Ausgabe der übrigen ist gültig
+    versions = {}
+    for line in result.stdout.splitlines():
+        parts = line.split('\t')
+        if len(parts) == 3 and parts[1].startswith('ii') and parts[2]:
+            versions[parts[0].split(':')[0]] = parts[2]
+    return versions
+
+
+def _apt_candidates(packages: List[str]) -> Dict[str, str]:
+    """
+    Verfügbare Paketversionen mit EINEM apt-cache policy.
+
+    Args:
+        packages: Paketnamen
+
+    Returns:
+        {paket: candidate} nur für Pakete mit installierbarer Version
+    """
+    if not packages or not shutil.which('apt-cache'):
+        return {}
+    try:
+        result = subprocess.run(
+            ['apt-cache', 'policy', *packages],
+            capture_output=True, text=True, timeout=PROBE_TIMEOUT * 5, stdin=subprocess.DEVNULL
+        )
+    except Exception as e:
+        print(f"Fehler bei apt-cache policy: {e}", file=sys.stderr)
+        return {}
+
+    candidates = {}
+    current = None
+    for line in result.stdout.splitlines():
+        if line and not line[0].isspace() and line.endswith(':'):
+            # Kopfzeile "paket:" bzw. "paket:arch:"
+            current = line[:-1].split(':')[0]
+        elif current and line.strip().startswith('Candidate:'):
+            version = line.split(':', 1)[1].strip()
+            if version and version != '(none)':
+                candidates.setdefault(current, version)
+    return candidates
+
+
+def _command_version(command: Tuple[str, ...]) -> str:
+    """
+    Version eines Programms aus seiner --version Ausgabe.
+
+    Args:
+        command: Programm und Parameter
+
+    Returns:
+        Versionsnummer oder "" wenn keine erkennbar ist
+    """
+    try:
+        result = subprocess.run(list(command), capture_output=True, text=True,
+                                timeout=PROBE_TIMEOUT, stdin=subprocess.DEVNULL)
+        output = result.stdout + result.stderr
+    except Exception:
+        return ''
+    match = _VERSION_RE.search(output)
+    return match.group(1) if match else ''
+
+
+def _python_versions(modules: List[str]) -> Dict[str, str]:
+    """
+    Versionen von Python-Modulen: zuerst im eigenen Interpreter (venv),
+    fehlende mit EINEM Aufruf des System-python3.
+
+    Args:
+        modules: Distributionsnamen (z.B. "flask")
+
+    Returns:
+        {modul: version} nur für gefundene Module
+    """
+    versions = {}
+    missing = []
+    for module in modules:
+        try:
+            versions[module] = metadata.version(module)
+        except metadata.PackageNotFoundError:
+            missing.append(module)
+
+    python3 = shutil.which('python3')
+    if missing and python3 and os.path.realpath(python3) != os.path.realpath(sys.executable):
+        script = ('import json, sys\n'
+                  'from importlib import metadata\n'
+                  'found = {}\n'
+                  'for m in sys.argv[1:]:\n'
+                  '    try:\n'
+                  '        found[m] = metadata.version(m)\n'
+                  '    except Exception:\n'
+                  '        pass\n'
+                  'print(json.dumps(found))\n')
+        try:
+            result = subprocess.run([python3, '-c', script, *missing], capture_output=True,
+                                    text=True, timeout=PROBE_TIMEOUT * 2, stdin=subprocess.DEVNULL)
+            if result.returncode == 0:
+                versions.update(json.loads(result.stdout))
+        except Exception as e:
+            print(f"Fehler beim Prüfen der Python-Module: {e}", file=sys.stderr)
+    return versions
+
+
+def _probe(probes: Iterable[_Probe]) -> Dict[_Probe, Dict]:
+    """
+    Ermittelt alle Angaben für die übergebenen Prüfungen nebenläufig.
+
+    Args:
+        probes: Zu prüfende Software
+
+    Returns:
+        {probe: {path, package_version, candidate, command_version, module_version}}
+    """
+    probes = list(probes)
+    packages = sorted({p.package for p in probes if p.package})
+    modules = sorted({p.python_module for p in probes if p.python_module})
+    paths = {p: shutil.which(p.command[0]) if p.command else None for p in probes}
+
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as pool:
+        f_dpkg = pool.submit(_dpkg_versions, packages)
+        f_apt = pool.submit(_apt_candidates, packages)
+        f_python = pool.submit(_python_versions, modules)
+        f_commands = {p: pool.submit(_command_version, p.command) for p in probes if paths[p]}
+        dpkg = f_dpkg.result()
+        apt = f_apt.result()
+        python = f_python.result()
+        commands = {p: f.result() for p, f in f_commands.items()}
+
+    return {
+        p: {
+            'path': paths[p] or '',
+            'package_version': dpkg.get(p.package) if p.package else None,
+            'candidate': apt.get(p.package) if p.package else None,
+            'command_version': commands.get(p),
+            'module_version': python.get(p.python_module) if p.python_module else None,
+        }
+        for p in probes
+    }
+
+
+def _lookup(probes: List[_Probe]) -> Dict[_Probe, Dict]:
+    """
+    Liefert Ergebnisse aus dem Cache, fehlende werden ermittelt.
+
+    Args:
+        probes: Zu prüfende Software
+
+    Returns:
+        {probe: Rohdaten} (siehe _probe)
+    """
+    global _stamp, _results
+
+    with _lock:
+        stamp = _inventory_stamp()
+        if stamp != _stamp:
+            _results = {}
+            _stamp = stamp
+        missing = [p for p in dict.fromkeys(probes) if p not in _results]
+        if missing:
+            _results.update(_probe(missing))
+        return {p: _results[p] for p in probes}
+
+
+def _evaluate(raw: Dict) -> Tuple[Optional[str], Optional[str], str, bool]:
+    """
+    Bewertet Rohdaten einer Prüfung.
+
+    Returns:
+        (installed, available, status, update_available) - installed ist ""
+        wenn installiert ohne erkennbare Version, None wenn nicht vorhanden
+    """
+    installed = (_short_version(raw['package_version'])
+                 or raw['module_version']
+                 or raw['command_version'])
+    available = _short_version(raw['candidate'])
+
+    if installed is None:
+        return None, available, 'missing', False
+    if not installed or not available:
+        return installed, available, 'installed', False
+    if installed == available:
+        return installed, available, 'current', False
+    return installed, available, 'outdated', True
+
+
+def _dependency_probe(tool: str) -> _Probe:
+    """Prüfung für eine Abhängigkeit aus conf/lib<modul>.ini."""
+    if tool in PYTHON_MODULES:
+        return _Probe(None, None, tool)
+    return _Probe(tool, (tool, *VERSION_ARGS.get(tool, ['--version'])), None)
+
+
+def get_software_info() -> Dict[str, List[Dict]]:
+    """
+    Software-Übersicht nach Kategorien (Widgets softwarecheck/dependencies).
+
+    Returns:
+        {kategorie: [{name, display_name, package, path, installed_version,
+        available_version, status, update_available}]}
+    """
+    probes = [entry['probe'] for entries in CATALOG.values() for entry in entries]
+    results = _lookup(probes)
+
+    info = {}
+    for category, entries in CATALOG.items():
+        info[category] = []
+        for entry in entries:
+            raw = results[entry['probe']]
+            installed, available, status, update = _evaluate(raw)
+            info[category].append({
+                'name': entry['name'],
+                'display_name': entry['display_name'],
+                'package': entry['probe'].package,
+                'path': raw['path'],
+                'installed_version': 'Installiert' if installed == '' else installed,
+                'available_version': available or 'Unbekannt',
+                'status': status,
+                'update_available': update,
+            })
+    return info
+
+
+def get_catalog_versions() -> List[Dict]:
+    """
+    Flache Liste aller Einträge der Software-Übersicht.
+
+    Returns:
+        Liste wie get_software_info(), ohne Kategorien
+    """
+    return [item for items in get_software_info().values() for item in items]
+
+
+def get_module_software(module: str) -> Optional[Dict[str, Dict]]:
+    """
+    Abhängigkeiten eines Moduls laut conf/lib<modul>.ini [dependencies]
+    im Format von systeminfo_check_software_list.
+
+    Args:
+        module: Modulname ohne Präfix (z.B. "drivestat")
+
+    Returns:
+        {tool: {path, version, available, status, update_available, required}}
+        oder None, wenn das Modul keine Abhängigkeiten definiert
+    """
+    external = get_ini_value(module, 'dependencies', 'external')
+    optional = get_ini_value(module, 'dependencies', 'optional')
+    if external is None and optional is None:
+        return None
+
+    tools = {}
+    for value, required in ((external, True), (optional, False)):
+        for tool in (value or '').split(','):
+            tool = tool.strip()
+            if tool and tool not in tools:
+                tools[tool] = required
+
+    probes = {tool: _dependency_probe(tool) for tool in tools}
+    results = _lookup(list(probes.values()))
+
+    software = {}
+    for tool, required in tools.items():
+        raw = results[probes[tool]]
+        installed, available, status, update = _evaluate(raw)
+        software[tool] = {
+            'path': raw['path'],
+            'version': 'Not installed' if installed is None else (installed or 'installed'),
+            'available': available or 'Unknown',
+            'status': status,
+            'update_available': update,
+            'required': required,
+        }
+    return software
+
+
+def start() -> None:
+    """Füllt den Cache im Hintergrund (erster Seitenaufruf ohne Wartezeit)."""
+    def _warm():
+        try:
+            get_software_info()
+        except Exception as e:
+            print(f"Fehler beim Ermitteln des Software-Inventars: {e}", file=sys.stderr)
+
+    threading.Thread(target=_warm, name='software-inventory', daemon=True).start()
@@ -66,7 +66,7 @@ function createFileItem(file) {
             duration = meta.duration || '';
         } else if (meta.type === 'dvd-video' || meta.type === 'bd-video') {
             // Extrahiere Season/Disc Info
-            const filename = file.name.toLowerCase().replace('.iso', '');
+            const filename = file.name.toLowerCase().replace(/\.iso(\.zst)?$/, '');
             const seasonMatch = filename.match(/season[_\s]*(\d+)/i);
             const discMatch = filename.match(/dis[ck][_\s]*(\d+)/i);
             
@@ -105,6 +105,8 @@ function createFileItem(file) {
         <div class="archive-card-technical">
             <span>💾 ${formatBytes(file.size)}</span>
             <span>📅 ${formatDate(file.modified)}</span>
+            ${file.compressed ? `<span title="${(window.i18n?.ARCHIVE_COMPRESSED_HINT || 'zstd compressed, {size} on disk').replace('{size}', formatBytes(file.compressed_size))}">🗜️ ${Math.round(file.compressed_size * 100 / file.size)}%</span>` : ''}
+            ${file.state === 'staged' ? `<span title="${window.i18n?.ARCHIVE_STAGING_HINT || 'Still in the staging directory, migration to the archive pending'}">⏳ ${window.i18n?.ARCHIVE_STAGING || 'Staging'}</span>` : ''}
         </div>
         <div class="archive-card-actions">
             <button class="btn-edit" onclick="openMetadataModal('${file.path}', '${mediaType}')">
@@ -705,7 +707,7 @@ function downloadISO(isoPath) {
     // Erstelle einen versteckten Link zum Download
     const link = document.createElement('a');
     link.href = `/api/archive/download${isoPath}`;
-    link.download = isoPath.split('/').pop();
+    link.download = isoPath.split('/').pop().replace(/\.zst$/, '');
     document.body.appendChild(link);
     link.click();
     document.body.removeChild(link);
@@ -1,7 +1,7 @@
 /**
  * Widget: livestatus_6x6_systeminfo - Live Status Dashboard
  * Zeigt Echtzeit-Status des disk2iso Service mit Kopierfortschritt
- * Version: 1.2.0
+ * Version: 1.3.0
  */
 
 (function() {
@@ -128,6 +128,9 @@
                     progressBarContainer.setAttribute('data-label', '0%');
                 }
                 
+                // Multi-Drive: Status aller Laufwerke anzeigen
+                renderDriveList(live.drives || []);
+                
                 // Live Status für globalen Zugriff speichern (für Service Restart Warning)
                 window.liveStatus = live;
             })
@@ -136,6 +139,41 @@
             });
     }
 
+    /**
+     * Zeigt eine Zeile pro Laufwerk (nur im Multi-Drive-Betrieb mit >1 Laufwerk)
+     */
+    function renderDriveList(drives) {
+        const driveList = document.getElementById('drive-list');
+        if (!driveList) return;
+        
+        driveList.replaceChildren();
+        if (drives.length < 2) return;
+        
+        drives.forEach(drive => {
+            const row = document.createElement('div');
+            row.className = 'info-row';
+            
+            const label = document.createElement('span');
+            label.className = 'info-label';
+            label.textContent = drive.drive;
+            
+            const value = document.createElement('span');
+            value.className = 'info-value';
+            let text = drive.status;
+            if (drive.disc_label) {
+                text += ` - ${drive.disc_label}`;
+            }
+            if (drive.status === 'copying' && drive.progress_percent > 0) {
+                text += ` (${drive.progress_percent}%)`;
+            }
+            value.textContent = text;
+            
+            row.appendChild(label);
+            row.appendChild(value);
+            driveList.appendChild(row);
+        });
+    }
+
     // Widget-Initialisierung
     if (document.readyState === 'loading') {
         document.addEventListener('DOMContentLoaded', initWidget);
@@ -82,8 +82,11 @@ fi
 # .........  3. Prüfe Abhängigkeiten jedes Moduls (return 1 → exit 1)
 # .........  4. Lade optionale Module automatisch via integrity_load_modules()
 # .........  5. Logge Erfolg oder Fehler beim Laden der Module
+# .........  Mehrfachaufruf (Multi-Drive-Worker) lädt nicht erneut
 # ===========================================================================
 daemon_load_modules() {
+    #-- Module bereits geladen (readonly-Variablen nicht erneut setzen) -----
+    [[ "${_DAEMON_MODULES_LOADED:-false}" == "true" ]] && return 0
 
     # Ermittle Script-Verzeichnis (funktioniert auch bei Symlinks und Service)
     # Löse Symlinks auf, um den echten Pfad zu bekommen
@@ -172,8 +175,10 @@ daemon_load_modules() {
     # =======================================================================
     # Ab hier übernimmt integrity_load_modules() das automatische Laden aller
     # optionalen Core-Module (api, systeminfo, drivestat, diskinfos, common).
+    # Reihenfolge = topologische Sortierung der [dependencies] internal aus
+    # den Manifesten (Ladeplan-Cache in conf/.modules.plan).
     # Module mit fehlenden Dependencies werden übersprungen (return 0).
-    # Bei kritischen Fehlern (z.B. zirkuläre Dependencies) → return 1 → exit 1
+    # Bei kritischen Fehlern (unbekannte Dependencies) → return 1 → exit 1
 
     if ! integrity_load_modules; then
         log_error "Kritischer Fehler beim Laden der Core-Module"
@@ -181,7 +186,11 @@ daemon_load_modules() {
         exit 1
     fi
 
+    _DAEMON_MODULES_LOADED=true
     log_info "$MSG_CORE_MODULES_LOADED"
+
+    # Beim Laden ergänzte Settings-Defaults gesammelt schreiben
+    settings_flush_defaults
 }
 
 # ===========================================================================
@@ -199,42 +208,63 @@ daemon_load_modules() {
 # Rückgabe.: 0 = Erfolg
 # .........  1 = Fehler (Modul nicht verfügbar oder Kopiervorgang fehlgeschlagen)
 # Extras...: Wählt automatisch beste verfügbare Kopiermethode
-# .........  Nutzt Getter für DISC_INFO-Zugriff (discinfo_get_type)
+# .........  Nutzt Getter für DISC_INFO-Zugriff (discinfo_get_field)
 # .........  Ruft common_cleanup_disc_operation() mit explizitem Status auf
+# .........  Multi-Drive: belegt vorher einen Schreib-Slot (MAX_CONCURRENT_WRITES),
+# .........  ohne Slot bricht der Kopiervorgang mit Fehler ab
+# .........  Bei Erfolg wird die Nachbearbeitung (MD5, .nfo) nur eingereiht,
+# .........  damit das Laufwerk sofort wieder frei ist
+# .........  Fehlschlag → History-Eintrag "error" (Fehlerquote/Trends)
 # ===========================================================================
 copy_disc_to_iso() {
     #-- Ermittle Disc-Typ ---------------------------------------------------
-    local disc_type="$(discinfo_get_type)"
+    local disc_type
+    discinfo_get_field disc_type type
     local exit_code=0
     
-    #-- Solange der Kopiervorgang läuft, Speicherplatz aktualisieren --------
-    systeminfo_start_monitor
-
-    #-- Audio-CD: Delegiere an libaudio.sh ----------------------------------
-    if [[ "$disc_type" == "$DISC_TYPE_AUDIO_CD" ]] && is_audio_ready; then
-        copy_audio_cd
-        exit_code=$?
-    #-- Video-DVD: Delegiere an libdvd.sh -----------------------------------
-    elif [[ "$disc_type" == "$DISC_TYPE_DVD_VIDEO" ]] && is_dvd_ready; then
-        copy_video_dvd
-        exit_code=$?
-    #-- Blu-ray: Delegiere an libbluray.sh ----------------------------------
-    elif [[ "$disc_type" == "$DISC_TYPE_BD_VIDEO" ]] && is_bluray_ready; then
-        copy_bluray_disk
-        exit_code=$?
-    #-- Daten-Disc oder kein passendes Kopiermodul aktiv -------------------
+    #-- Multi-Drive: Anzahl paralleler Kopiervorgänge begrenzen -------------
+    #-- Ohne Slot kein Kopiervorgang (und kein Freigeben eines fremden Slots)
+    if ! common_acquire_write_slot; then
+        log_error "$MSG_ERROR_WRITE_SLOT_FAILED"
+        exit_code=1
     else
-        common_copy_data_disc
-        exit_code=$?
+        #-- Solange der Kopiervorgang läuft, Speicherplatz aktualisieren ----
+        systeminfo_start_monitor
+
+        #-- Audio-CD: Delegiere an libaudio.sh ------------------------------
+        if [[ "$disc_type" == "$DISC_TYPE_AUDIO_CD" ]] && is_audio_ready; then
+            copy_audio_cd
+            exit_code=$?
+        #-- Video-DVD: Delegiere an libdvd.sh -------------------------------
+        elif [[ "$disc_type" == "$DISC_TYPE_DVD_VIDEO" ]] && is_dvd_ready; then
+            copy_video_dvd
+            exit_code=$?
+        #-- Blu-ray: Delegiere an libbluray.sh ------------------------------
+        elif [[ "$disc_type" == "$DISC_TYPE_BD_VIDEO" ]] && is_bluray_ready; then
+            copy_bluray_disk
+            exit_code=$?
+        #-- Daten-Disc oder kein passendes Kopiermodul aktiv ---------------
+        else
+            common_copy_data_disc
+            exit_code=$?
+        fi
+
+        #-- Stoppe Systeminfo-Monitor (falls er noch läuft)
+        systeminfo_stop_monitor
+
+        #-- Schreib-Slot für andere Laufwerke freigeben ---------------------
+        common_release_write_slot
     fi
-    
-    #-- Stoppe Systeminfo-Monitor (falls er noch läuft)
-    systeminfo_stop_monitor
-    
+
     #-- Cleanup mit explizitem Status (Success/Failure basierend auf Return-Code)
     if [[ $exit_code -eq 0 ]]; then
+        common_enqueue_postprocess || log_warning "$MSG_WARNING_POSTPROCESS_NOT_QUEUED"
         common_cleanup_disc_operation "success"
     else
+        #-- Fehlschlag in die History (Fehlerquote je Disc-Typ) -------------
+        local label
+        discinfo_get_field label label
+        api_add_history "error" "$label" "$disc_type" "error" "$MSG_COPY_FAILED_FINAL exit ${exit_code}"
         common_cleanup_disc_operation "failure"
     fi
     
@@ -282,57 +312,73 @@ transition_to_state() {
 # Extras...: 11 States: INITIALIZING, WAITING_FOR_DRIVE, DRIVE_DETECTED,
 # .........  WAITING_FOR_MEDIA, MEDIA_DETECTED, ANALYZING, COPYING,
 # .........  COMPLETED, ERROR, WAITING_FOR_REMOVAL, IDLE
-# .........  Polling-Intervalle: Drive=20s, Media=2s, Removal=5s
+# .........  Laufwerk/Medium per udev-Ereignis (drivestat_wait_event),
+# .........  Polling nur als Fallback: ohne udev Drive=20s, Media=2s,
+# .........  Removal=5s, mit udev alle DRIVE_EVENT_FALLBACK_POLL Sekunden
 # .........  Auto-Recovery bei Fehlern (Device-Loss, Lesefehler)
 # ===========================================================================
 run_state_machine() {
     #-- Start der State Machine im Log vermerken ----------------------------
     log_info "$MSG_STATE_MACHINE_STARTED"
-    
-    #-- Laufwerksmonitor starten --------------------------------------------
-    drivestat_start_monitor
 
+    #-- Laufwerks-/Disc-Werte je Durchlauf (ohne Subshell gelesen) ----------
+    local drive inserted disc_type
+    
     #-- Initalen State setzen (INITIALIZING) --------------------------------
     transition_to_state "$STATE_INITIALIZING" "Initialisiere Service..."
 
     #-- Hauptschleife - läuft endlos ----------------------------------------
     while true; do
+        #-- Zurückgestellte Live-Status Updates schreiben (Ratenlimit) ------
+        api_live_flush
+        #-- RAM-Betrieb: History periodisch sichern (API_PERSIST_INTERVAL) --
+        api_persist
+        #-- Gepufferte Log-Zeilen ausschreiben (LOG_BUFFER_LINES) -----------
+        log_flush
+
         case "$CURRENT_STATE" in
             "$STATE_INITIALIZING")
                 daemon_load_modules
+                # Laufwerks-Ereignisse (udev) abonnieren, sonst Polling
+                drivestat_start_monitor
                 # Initialisierung abgeschlossen, suche nach Laufwerk
                 transition_to_state "$STATE_WAITING_FOR_DRIVE" "Suche nach optischem Laufwerk..."
                 ;;
                 
             "$STATE_WAITING_FOR_DRIVE")
                 # Prüfe ob Laufwerk verfügbar ist
-                if drivestat_get_drive; then
-                    transition_to_state "$STATE_WAITING_FOR_MEDIA" "$MSG_DRIVE_DETECTED $(drivestat_get_drive)"
+                if drivestat_get_field drive drive; then
+                    transition_to_state "$STATE_WAITING_FOR_MEDIA" "$MSG_DRIVE_DETECTED $drive"
                 else
-                    # Kein Laufwerk gefunden - warte und versuche erneut
-                    sleep "$POLL_DRIVE_INTERVAL"
+                    # Kein Laufwerk gefunden - warte auf Ereignis/Fallback-Poll
+                    drivestat_wait_event "$POLL_DRIVE_INTERVAL"
                 fi
                 ;;
                 
             "$STATE_WAITING_FOR_MEDIA")
                 # Prüfe ob Medium eingelegt ist
-                if drivestat_get_inserted; then
+                drivestat_get_field inserted medium_inserted false
+                if [[ "$inserted" == "true" ]]; then
                     transition_to_state "$STATE_MEDIA_DETECTED" "$MSG_MEDIUM_DETECTED"
                 else
                     # Prüfe ob Laufwerk noch da ist
-                    if ! drivestat_get_drive; then
+                    if ! drivestat_get_field drive drive; then
                         transition_to_state "$STATE_WAITING_FOR_DRIVE" "Laufwerk nicht mehr verfügbar"
+                        continue
                     fi
-                    sleep "$POLL_MEDIA_INTERVAL"
+                    drivestat_wait_event "$POLL_MEDIA_INTERVAL"
                 fi
                 ;;
                 
             "$STATE_MEDIA_DETECTED")
-                # Kurze Pause für Spin-Up und Erkennung
-                sleep 2  
+                # Kurze Pause für Spin-Up und Erkennung (entfällt bei udev-
+                # Ereignis, udev hat das Medium bereits gelesen)
+                drivestat_media_event_pending || sleep 2
 
                 # Medium erkannt - warte bis es bereit ist (Spin-Up)
-                if drivestat_get_inserted; then
+                drivestat_get_field inserted medium_inserted false
+                if [[ "$inserted" == "true" ]]; then
+                    drivestat_record_analysis_start
                     transition_to_state "$STATE_ANALYZING" "Analysiere Medium..."
                 else
                     # Medium nicht lesbar - zurück zum Warten
@@ -348,15 +394,34 @@ run_state_machine() {
                     continue
                 fi
                 
-                log_info "$MSG_DISC_TYPE_DETECTED $(discinfo_get_type)"
+                discinfo_get_field disc_type type
+                drivestat_get_field drive drive
+                log_info "$MSG_DISC_TYPE_DETECTED $disc_type"
 
                 # Unmounte Disc falls sie auto-gemountet wurde
-                if mount | grep -q "$(drivestat_get_drive)"; then
+                if mount | grep -q "$drive"; then
                     log_info "$MSG_UNMOUNTING_DISC"
-                    umount "$(drivestat_get_drive)" 2>/dev/null || sudo umount "$(drivestat_get_drive)" 2>/dev/null
+                    umount "$drive" 2>/dev/null || sudo umount "$drive" 2>/dev/null
                     sleep 1
                 fi
                 
+                # Bereits archiviert? → überspringen bzw. nur prüfen
+                # (ARCHIVED_DISC_ACTION), Laufwerk sofort wieder frei
+                if common_check_archived_disc; then
+                    common_cleanup_disc_operation "success"
+                    transition_to_state "$STATE_COMPLETED" "$MSG_ARCHIVED_DISC_NOT_COPIED"
+                    continue
+                fi
+
+                # Kalibriere Leseparameter einmalig pro Laufwerksmodell
+                # (Audio-CDs sind nicht blockweise lesbar, nach Fehlschlag
+                # erst wieder nach DRIVESTAT_CALIB_RETRY_AFTER)
+                if [[ "${DRIVE_CALIBRATION:-false}" == "true" ]] \
+                   && [[ "$disc_type" != "$DISC_TYPE_AUDIO_CD" ]] \
+                   && drivestat_calibration_due; then
+                    drivestat_calibrate || log_warning "$MSG_WARNING_CALIBRATION_SKIPPED"
+                fi
+                
                 # Starte Kopiervorgang
                 transition_to_state "$STATE_COPYING"
                 ;;
@@ -364,8 +429,9 @@ run_state_machine() {
             "$STATE_COPYING")
                 # Kopiere Disc als ISO
                 if copy_disc_to_iso; then
+                    # Kein Warten: Nachbearbeitung läuft im Hintergrund, Disc
+                    # wird im nächsten State sofort ausgeworfen
                     transition_to_state "$STATE_COMPLETED" "Kopiervorgang erfolgreich abgeschlossen"
-                    sleep 3  # Kurze Pause damit Status sichtbar wird
                 else
                     transition_to_state "$STATE_ERROR" "Kopiervorgang fehlgeschlagen"
                     sleep 3
@@ -380,15 +446,18 @@ run_state_machine() {
                 
             "$STATE_WAITING_FOR_REMOVAL")
                 # Warte bis Medium entfernt wurde
-                if ! drivestat_get_inserted; then
+                drivestat_get_field inserted medium_inserted false
+                if [[ "$inserted" != "true" ]]; then
                     # Medium entfernt - zurück zum Warten auf neues Medium
                     transition_to_state "$STATE_IDLE" "Medium entfernt"
                 else
-                    sleep "$POLL_REMOVAL_INTERVAL"
+                    drivestat_wait_event "$POLL_REMOVAL_INTERVAL"
                 fi
                 ;;
                 
             "$STATE_IDLE")
+                # Vorgemerkte Settings-Defaults schreiben (nicht während Kopie)
+                settings_flush_defaults
                 # Kurze Pause, dann zurück zum Warten auf Medium
                 sleep 1
                 transition_to_state "$STATE_WAITING_FOR_MEDIA" "$MSG_WAITING_FOR_MEDIUM"
@@ -407,6 +476,70 @@ run_state_machine() {
 # START & SIGNAL-HANDLING
 # ============================================================================
 
+# ============================================================================
+# MULTI-DRIVE BETRIEB
+# ============================================================================
+
+# ===========================================================================
+# run_drive_worker()
+# ---------------------------------------------------------------------------
+# Funktion.: Führt die State Machine für genau ein Laufwerk aus. Läuft als
+# .........  eigener Hintergrund-Prozess (Subshell) mit eigenen DRIVE_INFO/
+# .........  DISC_INFO Arrays.
+# Parameter: $1 = Device-Pfad (z.B. /dev/sr1)
+# Rückgabe.: läuft endlos (Exit via SIGTERM vom Supervisor)
+# Extras...: Setzt DRIVESTAT_INSTANCE → Laufwerk fest, API-Dateien unter
+# .........  api/drives/<instanz>/, eigenes Temp-Verzeichnis
+# ===========================================================================
+run_drive_worker() {
+    local device="$1"
+
+    DRIVESTAT_INSTANCE="$(basename "$device")"
+    trap 'log_info "$MSG_DRIVE_WORKER_ENDED $DRIVESTAT_INSTANCE"; drivestat_stop_monitor; pkill -P $BASHPID 2>/dev/null; common_release_write_slot; common_cleanup_disc_operation "interrupted"; exit 0' SIGTERM SIGINT
+
+    log_info "$MSG_DRIVE_WORKER_STARTED $DRIVESTAT_INSTANCE"
+    run_state_machine
+}
+
+# ===========================================================================
+# run_drive_supervisor()
+# ---------------------------------------------------------------------------
+# Funktion.: Startet für jedes erkannte optische Laufwerk einen eigenen
+# .........  Worker (run_drive_worker) und überwacht diese. Neu angeschlos-
+# .........  sene Laufwerke erhalten automatisch einen Worker, beendete
+# .........  Worker werden neu gestartet.
+# Parameter: keine
+# Rückgabe.: läuft endlos (Exit via SIGTERM/SIGINT → cleanup_service)
+# Extras...: Aktiv wenn MULTI_DRIVE=true in disk2iso.conf
+# ===========================================================================
+run_drive_supervisor() {
+    local -A workers=()
+    local device pid
+
+    log_info "$MSG_DRIVE_SUPERVISOR_STARTED"
+
+    while true; do
+        #-- Beendete Worker entfernen (werden ggf. neu gestartet) -----------
+        for device in "${!workers[@]}"; do
+            pid="${workers[$device]}"
+            if ! kill -0 "$pid" 2>/dev/null; then
+                wait "$pid" 2>/dev/null
+                unset 'workers[$device]'
+            fi
+        done
+
+        #-- Worker für jedes (neue) Laufwerk starten ------------------------
+        while IFS= read -r device; do
+            [[ -z "$device" ]] && continue
+            [[ -n "${workers[$device]:-}" ]] && continue
+            run_drive_worker "$device" &
+            workers[$device]=$!
+        done < <(drivestat_detect_drives)
+
+        sleep "$POLL_DRIVE_INTERVAL"
+    done
+}
+
 # ===========================================================================
 # main()
 # ---------------------------------------------------------------------------
@@ -491,6 +624,22 @@ main() {
     
     # Ab hier: Nur noch Service-Modus
 
+    # Multi-Drive: Module einmalig laden, dann ein Worker pro Laufwerk
+    daemon_load_modules
+
+    # Observer-Bus (MQTT etc.) vor allen Workern starten - sie erben ihn
+    common_register_observers
+    api_bus_start
+
+    # Kopier-Logs: Katalog abgleichen, alte Logs packen/löschen
+    logging_apply_retention &
+
+    # Nachbearbeitung (MD5, Metadaten) läuft entkoppelt von den Laufwerken
+    common_start_postprocess_workers
+    if [[ "${MULTI_DRIVE:-false}" == "true" ]]; then
+        run_drive_supervisor
+    fi
+
     # Starte State Machine (läuft endlos)
     # Die State Machine kümmert sich selbst um Laufwerk-Erkennung und Retry-Logik
     run_state_machine
@@ -514,10 +663,16 @@ cleanup_service() {
     #-- Laufwerksmonitor stoppen --------------------------------------------
     drivestat_stop_monitor
 
+    #-- Nachbearbeitung stoppen (offene Jobs werden beim Start fortgesetzt) -
+    common_stop_postprocess_workers
+
     # MQTT: Offline setzen
     if [[ "$SUPPORT_MQTT" == "true" ]]; then
         mqtt_cleanup
     fi
+
+    #-- Observer-Bus stoppen (Dispatcher + Senken) --------------------------
+    api_bus_stop
     
     # Töte alle laufenden Kopierprozesse (dvdbackup, ddrescue, etc.)
     pkill -P $$ 2>/dev/null  # Töte alle Child-Prozesse
@@ -525,6 +680,10 @@ cleanup_service() {
 
     # Jetzt cleanup durchführen
     common_cleanup_disc_operation "interrupted"
+    api_live_flush force
+    api_persist force
+    settings_flush_defaults
+    log_flush
     exit 0
 }
 